@@ -0,0 +1,6 @@
+"""
+Stage microbenchmarks for floorplan preprocessing.
+
+Run with:
+    python -m src bench --sizes 1,4,16
+"""
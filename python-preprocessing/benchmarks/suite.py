@@ -0,0 +1,309 @@
+"""
+Stage microbenchmark suite.
+
+Times each preprocessing stage on synthetic warehouse floorplans
+(tests/fixtures/color_boundary_fixtures.create_warehouse_floorplan) at a
+range of sizes, records peak memory, and compares against JSON
+baselines so regressions beyond a tolerance fail the run.
+
+Peak memory is measured with tracemalloc (src.memory_budget) in a
+separate run (tracing slows Python-heavy stages, so it is kept out of
+the timed runs). It counts NumPy arrays, including those returned by
+OpenCV, but not OpenCV's internal scratch buffers.
+"""
+
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import gc
+import json
+import platform
+import time
+
+import cv2
+import numpy as np
+
+from src.memory_budget import MB, measure_peak_memory
+from src.color_boundary.detector import ColorBoundaryDetector
+from src.edge_detection import process_edges
+from src.region_segmentation import process_segmentation
+from src.line_detection import process_lines
+from src.travel_lane_detection import detect_travel_lanes_standalone
+from src.tiling.tiler import ImageTiler
+from src.tiling.models import TileZoneResult, Zone
+from src.tiling.merging import merge_zones
+from tests.fixtures.color_boundary_fixtures import create_warehouse_floorplan
+
+
+DEFAULT_SIZES = (1.0, 4.0, 16.0)
+DEFAULT_TOLERANCE = 0.25
+# Timing noise floor: slowdowns smaller than this never count as regressions
+MIN_TIME_DELTA_MS = 5.0
+MIN_MEMORY_DELTA_MB = 1.0
+WARMUP_MEGAPIXELS = 0.1
+
+
+@dataclass
+class BenchmarkStage:
+    """
+    A benchmarked stage.
+
+    Attributes:
+        name: Stage name
+        run: Timed function, called with the output of setup
+        setup: Untimed preparation from the floorplan image (default: identity)
+    """
+    name: str
+    run: Callable[[Any], Any]
+    setup: Optional[Callable[[np.ndarray], Any]] = None
+
+    def prepare(self, image: np.ndarray) -> Any:
+        """Run the untimed setup."""
+        return self.setup(image) if self.setup else image
+
+
+def _tile_zone_results(image: np.ndarray, spacing: int = 300, size: int = 200) -> List[TileZoneResult]:
+    """Per-tile zone results with duplicates in overlaps, as tiled detection yields."""
+    tiler = ImageTiler(tile_size=2048, overlap=256)
+    height, width = image.shape[:2]
+    results = []
+    for i, (x1, y1, x2, y2) in enumerate(tiler._calculate_grid_boundaries(width, height)):
+        zones = []
+        for zy in range(0, height - size, spacing):
+            for zx in range(0, width - size, spacing):
+                # Zones fully inside the tile, in tile coordinates
+                if zx >= x1 and zy >= y1 and zx + size <= x2 and zy + size <= y2:
+                    lx, ly = zx - x1, zy - y1
+                    zones.append(Zone(
+                        id=f"z{len(zones)}",
+                        zone_type="racking_area",
+                        polygon=[(lx, ly), (lx + size, ly), (lx + size, ly + size), (lx, ly + size)],
+                    ))
+        results.append(TileZoneResult(tile_id=f"tile_{i}", zones=zones, bounds=(x1, y1, x2, y2)))
+    return results
+
+
+STAGES: Dict[str, BenchmarkStage] = {
+    stage.name: stage
+    for stage in [
+        BenchmarkStage("color_boundary", lambda img: ColorBoundaryDetector().detect(img)),
+        BenchmarkStage("edges", process_edges),
+        BenchmarkStage("segmentation", process_segmentation),
+        BenchmarkStage("lines", process_lines),
+        BenchmarkStage("travel_lanes", detect_travel_lanes_standalone),
+        BenchmarkStage("tiling", lambda img: ImageTiler(tile_size=2048, overlap=256).create_tiles(img)),
+        BenchmarkStage("merging", merge_zones, setup=_tile_zone_results),
+    ]
+}
+
+
+@dataclass
+class StageResult:
+    """Timing and memory of one stage at one size."""
+    stage: str
+    megapixels: float
+    width: int
+    height: int
+    time_ms: float  # Best of repeats
+    peak_memory_mb: float
+    repeats: int
+
+    @property
+    def key(self) -> str:
+        """Baseline key (stage@size)."""
+        return f"{self.stage}@{self.megapixels:g}MP"
+
+    @property
+    def throughput_mp_s(self) -> float:
+        """Megapixels processed per second."""
+        actual_mp = self.width * self.height / 1e6
+        return actual_mp / (self.time_ms / 1000) if self.time_ms > 0 else float("inf")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        d = asdict(self)
+        d["throughput_mp_s"] = round(self.throughput_mp_s, 3)
+        return d
+
+
+@dataclass
+class Regression:
+    """A metric that exceeded its baseline by more than the tolerance."""
+    key: str
+    metric: str  # "time_ms" or "peak_memory_mb"
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Current / baseline."""
+        return self.current / self.baseline if self.baseline > 0 else float("inf")
+
+    def __str__(self) -> str:
+        return f"{self.key} {self.metric}: {self.baseline:.1f} -> {self.current:.1f} ({self.ratio:.2f}x)"
+
+
+def measure_stage(stage: BenchmarkStage, image: np.ndarray, megapixels: float, repeats: int = 3) -> StageResult:
+    """
+    Benchmark one stage on one image.
+
+    Args:
+        stage: Stage to run
+        image: Synthetic floorplan
+        megapixels: Nominal size label
+        repeats: Timed runs (best is kept)
+
+    Returns:
+        StageResult
+    """
+    data = stage.prepare(image)
+
+    times = []
+    for _ in range(max(1, repeats)):
+        gc.collect()
+        start = time.perf_counter()
+        stage.run(data)
+        times.append((time.perf_counter() - start) * 1000)
+
+    gc.collect()
+    _, memory = measure_peak_memory(stage.run, data)
+
+    height, width = image.shape[:2]
+    return StageResult(
+        stage=stage.name,
+        megapixels=megapixels,
+        width=width,
+        height=height,
+        time_ms=min(times),
+        peak_memory_mb=memory.peak_bytes / MB,
+        repeats=len(times),
+    )
+
+
+def run_benchmarks(
+    sizes: Sequence[float] = DEFAULT_SIZES,
+    stages: Optional[Sequence[str]] = None,
+    repeats: int = 3,
+    seed: int = 0,
+    progress: Optional[Callable[[StageResult], None]] = None,
+) -> List[StageResult]:
+    """
+    Benchmark stages across floorplan sizes.
+
+    Args:
+        sizes: Floorplan sizes in megapixels (1 to 200 is the intended range)
+        stages: Stage names (default: all in STAGES)
+        repeats: Timed runs per stage and size
+        seed: Floorplan generator seed
+        progress: Optional callback after each measurement
+
+    Returns:
+        List of StageResult, ordered by size then stage
+
+    Raises:
+        ValueError: If a stage name is unknown or a size is not positive
+    """
+    names = list(stages) if stages else list(STAGES)
+    unknown = [n for n in names if n not in STAGES]
+    if unknown:
+        raise ValueError(f"Unknown stage(s): {unknown}. Available: {list(STAGES)}")
+    if any(mp <= 0 for mp in sizes):
+        raise ValueError("Benchmark sizes must be positive")
+
+    # Pay one-time costs (lazy imports, OpenCV dispatch) outside the timings
+    warmup = create_warehouse_floorplan(megapixels=WARMUP_MEGAPIXELS, seed=seed)
+    for name in names:
+        STAGES[name].run(STAGES[name].prepare(warmup))
+
+    results = []
+    for mp in sizes:
+        image = create_warehouse_floorplan(megapixels=mp, seed=seed)
+        for name in names:
+            result = measure_stage(STAGES[name], image, mp, repeats)
+            results.append(result)
+            if progress:
+                progress(result)
+        del image
+    return results
+
+
+def save_baseline(results: List[StageResult], path: str) -> None:
+    """Write results as a JSON baseline."""
+    data = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "opencv": cv2.__version__,
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+        },
+        "results": {r.key: r.to_dict() for r in results},
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def load_baseline(path: str) -> Dict[str, StageResult]:
+    """Read a JSON baseline into StageResults keyed by stage@size."""
+    with open(path) as f:
+        data = json.load(f)
+    baseline = {}
+    for key, r in data["results"].items():
+        r = {k: v for k, v in r.items() if k != "throughput_mp_s"}
+        baseline[key] = StageResult(**r)
+    return baseline
+
+
+def compare_to_baseline(
+    results: List[StageResult],
+    baseline: Dict[str, StageResult],
+    tolerance: float = DEFAULT_TOLERANCE,
+    memory_tolerance: Optional[float] = None,
+    min_time_delta_ms: float = MIN_TIME_DELTA_MS,
+) -> List[Regression]:
+    """
+    Find stages slower or hungrier than baseline beyond a tolerance.
+
+    Results without a baseline entry are skipped. Differences below the
+    noise floors (min_time_delta_ms, MIN_MEMORY_DELTA_MB) are ignored.
+
+    Args:
+        results: Current results
+        baseline: Baseline results keyed by stage@size
+        tolerance: Allowed relative slowdown (0.25 = 25%)
+        memory_tolerance: Allowed relative memory growth (default: tolerance)
+        min_time_delta_ms: Absolute slowdown below which time never regresses
+
+    Returns:
+        List of Regression
+    """
+    if memory_tolerance is None:
+        memory_tolerance = tolerance
+
+    regressions = []
+    for r in results:
+        base = baseline.get(r.key)
+        if base is None:
+            continue
+        if (
+            r.time_ms > base.time_ms * (1 + tolerance)
+            and r.time_ms - base.time_ms > min_time_delta_ms
+        ):
+            regressions.append(Regression(r.key, "time_ms", base.time_ms, r.time_ms))
+        if (
+            r.peak_memory_mb > base.peak_memory_mb * (1 + memory_tolerance)
+            and r.peak_memory_mb - base.peak_memory_mb > MIN_MEMORY_DELTA_MB
+        ):
+            regressions.append(Regression(r.key, "peak_memory_mb", base.peak_memory_mb, r.peak_memory_mb))
+    return regressions
+
+
+def format_table(results: List[StageResult]) -> str:
+    """Human-readable results table."""
+    lines = [f"{'stage':<16}{'size':>8}{'time ms':>12}{'MP/s':>10}{'peak MB':>10}"]
+    for r in results:
+        lines.append(
+            f"{r.stage:<16}{r.megapixels:>6g}MP{r.time_ms:>12.1f}"
+            f"{r.throughput_mp_s:>10.2f}{r.peak_memory_mb:>10.1f}"
+        )
+    return "\n".join(lines)
@@ -5,12 +5,18 @@ Provides REST endpoints for preprocessing floorplan images
 before sending to Gemini for zone detection.
 """
 
-import json
+import time
+
+# Taken before the heavy imports so the startup profile includes them
+STARTED = time.monotonic()
+
 import logging
-from typing import Optional, Any
-from fastapi import FastAPI, HTTPException, UploadFile, File
+import threading
+from contextlib import asynccontextmanager
+from typing import Optional
+from fastapi import FastAPI, HTTPException, UploadFile, File, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 import cv2
 import numpy as np
@@ -19,38 +25,82 @@ import os
 import tempfile
 from datetime import datetime
 
+from dataclasses import asdict, replace
+
 from src.pipeline import (
     preprocess_floorplan,
     PreprocessingConfig,
-    image_from_base64,
+    image_bytes_from_base64,
+    decode_floorplan_image,
     result_to_json,
     draw_aisles_visualization,
+    build_line_store,
 )
+from src.concurrency import get_governor
+from src.hint_budget import HintBudget
+from src.image_probe import DEFAULT_MAX_PIXELS, ImageTooLargeError
+from src.result_encoding import JSON_MEDIA_TYPE, encode_result, negotiate_encoding, negotiate_format
 from src.coverage_input import CoverageBoundary, load_coverage_from_json
+from src.line_detection import AISLE_DETECTORS
+from src.image_sessions import (
+    ImageSessionStore,
+    DEFAULT_TTL_SECONDS,
+    DEFAULT_MAX_BYTES,
+    session_summary,
+    roi_tuple,
+    crop_roi,
+)
+from src.warmup import StartupProfile, warm_up
 
+startup = StartupProfile(started=STARTED)
+startup.imports_done()
 
-class NumpyEncoder(json.JSONEncoder):
-    """Custom JSON encoder that handles numpy types"""
-    def default(self, obj: Any) -> Any:
-        if isinstance(obj, np.integer):
-            return int(obj)
-        if isinstance(obj, np.floating):
-            return float(obj)
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-        if isinstance(obj, np.bool_):
-            return bool(obj)
-        return super().default(obj)
+
+def encoded_response(output: dict, http_request: Request) -> Response:
+    """
+    Serialize a result in the format and encoding negotiated from the request headers.
+
+    JSON is the default; compact JSON and .npz are selected through Accept,
+    gzip/brotli through Accept-Encoding.
+    """
+    media_type = negotiate_format(http_request.headers.get("accept"))
+    encoding = negotiate_encoding(http_request.headers.get("accept-encoding"))
+    body, applied = encode_result(output, media_type, encoding)
+    headers = {"Vary": "Accept, Accept-Encoding"}
+    if applied:
+        headers["Content-Encoding"] = applied
+    return Response(content=body, media_type=media_type, headers=headers)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def _warm_up() -> None:
+    warm_up(startup)
+    if startup.error:
+        logger.warning(f"Warm-up failed: {startup.error}")
+    logger.info(
+        f"Ready: imports {startup.import_ms:.0f} ms, warm-up {startup.warmup_ms:.0f} ms"
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up in the background: /health answers at once, /ready once warm."""
+    if os.environ.get("PREPROCESS_WARMUP", "1") == "0":
+        startup.ready = True
+    else:
+        threading.Thread(target=_warm_up, name="warm-up", daemon=True).start()
+    yield
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Floorplan Preprocessing API",
     description="Image preprocessing service to augment Gemini AI analysis for warehouse floorplan zone detection",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware for frontend access
@@ -72,10 +122,24 @@ class CoverageBoundaryModel(BaseModel):
     margin: int = 0
 
 
+class ImageUploadRequest(BaseModel):
+    """Request body for storing an image under a session handle"""
+    image: str  # Base64-encoded image (with or without data URL prefix)
+
+
 class Base64ImageRequest(BaseModel):
     """Request body for base64-encoded image preprocessing"""
-    image: str  # Base64-encoded image (with or without data URL prefix)
+    # Either the base64 image or a handle returned by POST /images
+    image: Optional[str] = None  # Base64-encoded image (with or without data URL prefix)
+    image_handle: Optional[str] = None
+    # Optional region of interest {x, y, width, height} in full-image pixels;
+    # results (and coverage boundaries) are relative to its top-left corner
+    roi: Optional[dict] = None
     include_visualizations: bool = False
+    # Visualization encoding: "png", "jpeg" or "webp"; optional preview size limit
+    visualization_format: str = "png"
+    visualization_max_dimension: Optional[int] = None
+    visualization_quality: Optional[int] = None  # JPEG/WebP only
     save_aisle_visualization: bool = True  # Save aisle detection visualization to temp folder
 
     # Optional coverage boundaries for constrained travel lane detection
@@ -90,7 +154,43 @@ class Base64ImageRequest(BaseModel):
     min_region_area: int = 5000
     min_line_length: int = 30
     line_cluster_distance: float = 100.0
+    aisle_detectors: Optional[dict] = None  # name -> enabled, e.g. {"line_pair": false}
+    # Peak-memory budget; larger runs analyse a downscaled copy (default: server budget)
+    memory_budget_mb: Optional[float] = None
+    # Gemini hint size limits, e.g. {"max_bytes": 20000, "max_vertices": 24}
+    hint_budget: Optional[dict] = None
+    # Time budget; optional stages are skipped once it is spent (see "deadline" in the response)
+    deadline_ms: Optional[float] = None
+    # Drawing scale; finer drawings are analysed at the canonical resolution (see "scale")
+    pixels_per_meter: Optional[float] = None
+    estimate_scale: bool = False
+    # Decode at 1/2, 1/4 or 1/8 resolution instead of rejecting JPEGs above
+    # the server's pixel ceiling, and whenever the memory budget or drawing
+    # scale would downsample at least that much anyway. Results are still in
+    # original pixels (see "decode" in the response)
+    reduce_oversized: bool = False
+
+
+# Server-wide memory budget for preprocessing runs (unset: no budget)
+DEFAULT_MEMORY_BUDGET_MB = (
+    float(os.environ["PREPROCESS_MEMORY_BUDGET_MB"])
+    if os.environ.get("PREPROCESS_MEMORY_BUDGET_MB")
+    else None
+)
+
+# Largest image decoded at full resolution; headers are probed before decoding
+MAX_IMAGE_PIXELS = int(os.environ.get("PREPROCESS_MAX_PIXELS", DEFAULT_MAX_PIXELS))
 
+# Decoded images kept server-side so editing sessions upload once
+image_sessions = ImageSessionStore(
+    ttl_seconds=float(os.environ.get("PREPROCESS_SESSION_TTL_SECONDS", DEFAULT_TTL_SECONDS)),
+    max_bytes=int(os.environ.get("PREPROCESS_SESSION_MAX_MB", DEFAULT_MAX_BYTES // 2**20)) * 2**20,
+)
+
+# Split PREPROCESS_CORE_BUDGET (default: all cores) across WEB_CONCURRENCY
+# server processes, request thread pools and OpenCV
+governor = get_governor()
+governor.apply()
 
 # Directory for saving visualizations
 VISUALIZATION_DIR = os.path.join(tempfile.gettempdir(), "floorplan_preprocessing")
@@ -101,16 +201,27 @@ class HealthResponse(BaseModel):
     """Health check response"""
     status: str
     version: str
+    ready: bool  # Warm-up finished (see /ready)
 
 
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
-    """Health check endpoint"""
-    return HealthResponse(status="healthy", version="1.0.0")
+    """Liveness check: the process is up (possibly still warming up)"""
+    return HealthResponse(status="healthy", version="1.0.0", ready=startup.ready)
+
+
+@app.get("/ready")
+async def readiness_check():
+    """
+    Readiness check: 200 once the warm-up has run, 503 before.
+
+    The body is the startup profile (import and warm-up timings).
+    """
+    return JSONResponse(startup.to_dict(), status_code=200 if startup.ready else 503)
 
 
 @app.post("/preprocess")
-async def preprocess_base64(request: Base64ImageRequest):
+async def preprocess_base64(request: Base64ImageRequest, http_request: Request):
     """
     Preprocess a base64-encoded floorplan image.
 
@@ -119,17 +230,13 @@ async def preprocess_base64(request: Base64ImageRequest):
     - Region segmentation (dense vs sparse areas)
     - Line detection (racking rows, aisles)
     - Gemini hints (structured suggestions for AI)
+
+    Send Accept: application/vnd.floorplan.compact+json or
+    application/vnd.floorplan.npz for a compact response.
     """
     try:
         logger.info("Received preprocessing request")
 
-        # Decode image
-        image = image_from_base64(request.image)
-        if image is None:
-            raise HTTPException(status_code=400, detail="Failed to decode image")
-
-        logger.info(f"Image decoded: {image.shape[1]}x{image.shape[0]}")
-
         # Create config from request
         config = PreprocessingConfig(
             use_color_detection=request.use_color_detection,
@@ -138,19 +245,103 @@ async def preprocess_base64(request: Base64ImageRequest):
             min_region_area=request.min_region_area,
             min_line_length=request.min_line_length,
             line_cluster_distance=request.line_cluster_distance,
+            aisle_detectors=request.aisle_detectors,
+            memory_budget_mb=(
+                request.memory_budget_mb
+                if request.memory_budget_mb is not None
+                else DEFAULT_MEMORY_BUDGET_MB
+            ),
+            hint_budget=HintBudget.from_dict(request.hint_budget or {}),
+            deadline_ms=request.deadline_ms,
+            pixels_per_meter=request.pixels_per_meter,
+            estimate_scale=request.estimate_scale,
         )
 
+        # Resolve image: stored session (no upload/decode) or inline base64
+        session = None
+        decoded = None
+        roi = roi_tuple(request.roi)
+        if request.image_handle:
+            session = image_sessions.get(request.image_handle)
+            if session is None:
+                raise HTTPException(status_code=404, detail="Unknown or expired image handle")
+            image = session.image
+        elif request.image:
+            # The header is checked against the pixel ceiling before decoding
+            decoded = decode_floorplan_image(
+                image_bytes_from_base64(request.image),
+                config,
+                max_pixels=MAX_IMAGE_PIXELS,
+                reduce_oversized=request.reduce_oversized,
+            )
+            image = decoded.image
+            if image is None:
+                raise HTTPException(status_code=400, detail="Failed to decode image")
+            logger.info(f"Image decoded: {image.shape[1]}x{image.shape[0]} (1/{decoded.reduction})")
+        else:
+            raise HTTPException(status_code=400, detail="Provide image or image_handle")
+
+        # A reduced decode works in its own pixels: scale inputs given in original pixels
+        reduction = decoded.reduction if decoded is not None else 1
+        if reduction > 1:
+            if roi is not None:
+                roi = tuple(round(v / reduction) for v in roi)
+            if config.pixels_per_meter is not None:
+                config = replace(config, pixels_per_meter=config.pixels_per_meter / reduction)
+
+        x0 = y0 = 0
+        if roi is not None:
+            image, (x0, y0) = crop_roi(image, roi)
+
         # Parse coverage boundaries if provided
         coverage_boundaries = None
         if request.coverage_boundaries:
             coverage_boundaries = load_coverage_from_json(request.coverage_boundaries)
             logger.info(f"Loaded {len(coverage_boundaries)} coverage boundaries")
+            if reduction > 1:
+                coverage_boundaries = [
+                    replace(
+                        b,
+                        points=[(round(x / reduction), round(y / reduction)) for x, y in b.points],
+                        margin=round(b.margin / reduction),
+                    )
+                    for b in coverage_boundaries
+                ]
+            if roi is not None:
+                coverage_boundaries = [
+                    replace(b, points=[(x - x0, y - y0) for x, y in b.points])
+                    for b in coverage_boundaries
+                ]
+
+        # Reuse Hough segments computed earlier in this session. The pipeline
+        # calls this with the image it analyses, after any downscaling, and
+        # only once line detection is within its deadline
+        line_store = None
+        if session is not None:
+            roi_key = (x0, y0) + image.shape[:2] if roi is not None else None
+
+            def session_line_store(analysed: np.ndarray, analysis_config: PreprocessingConfig):
+                return session.feature(
+                    ("line_store", roi_key, analysed.shape[:2], min(analysis_config.min_line_length, 30)),
+                    lambda _: build_line_store(analysed, analysis_config),
+                )
+
+            line_store = session_line_store
+
+        # Run preprocessing; results come back in original pixels
+        result = preprocess_floorplan(
+            image, config, coverage_boundaries, line_store=line_store, decode_reduction=reduction,
+        )
 
-        # Run preprocessing
-        result = preprocess_floorplan(image, config, coverage_boundaries)
-
-        # Convert to JSON
-        output = result_to_json(result, include_visualizations=request.include_visualizations)
+        # Convert to JSON (compact formats read NumPy point arrays directly)
+        output = result_to_json(
+            result,
+            include_visualizations=request.include_visualizations,
+            visualization_format=request.visualization_format,
+            visualization_max_dimension=request.visualization_max_dimension,
+            visualization_quality=request.visualization_quality,
+            native_types=negotiate_format(http_request.headers.get("accept")) == JSON_MEDIA_TYPE,
+        )
 
         num_aisles = len(result.line_data.get('aisle_candidates', []))
         num_travel_lanes = len(result.travel_lane_suggestions or [])
@@ -174,48 +365,122 @@ async def preprocess_base64(request: Base64ImageRequest):
                 result.line_data.get('aisle_candidates', []),
                 visualization_path,
                 content_boundary=result.content_boundary,
+                scale=1 / reduction,
             )
             logger.info(f"Saved aisle visualization to: {visualization_path}")
             output["aisle_visualization_path"] = visualization_path
 
-        # Use custom encoder to handle numpy types
-        json_str = json.dumps(output, cls=NumpyEncoder)
-        return JSONResponse(content=json.loads(json_str))
-
+        if roi is not None:
+            output["roi"] = {
+                "x": x0 * reduction,
+                "y": y0 * reduction,
+                "width": image.shape[1] * reduction,
+                "height": image.shape[0] * reduction,
+            }
+        if reduction > 1:
+            output["decode"] = decoded.to_dict()
+
+        return encoded_response(output, http_request)
+
+    except HTTPException:
+        raise
+    except ImageTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Preprocessing error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/images")
+async def create_image_session(request: ImageUploadRequest):
+    """
+    Decode an image once and store it under a handle.
+
+    Pass the returned handle as image_handle to /preprocess (optionally
+    with an roi) instead of re-sending the base64 image. Handles expire
+    after ttl_seconds of inactivity or when the memory cap is reached.
+    """
+    try:
+        image = decode_floorplan_image(
+            image_bytes_from_base64(request.image), max_pixels=MAX_IMAGE_PIXELS,
+        ).image
+    except ImageTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    if image is None:
+        raise HTTPException(status_code=400, detail="Failed to decode image")
+    try:
+        session = image_sessions.put(image)
+    except ValueError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    logger.info(f"Stored image session {session.handle}: {image.shape[1]}x{image.shape[0]}")
+    return session_summary(session, image_sessions)
+
+
+@app.get("/images/{handle}")
+async def get_image_session(handle: str):
+    """Describe a stored image session (also refreshes its TTL)."""
+    session = image_sessions.get(handle)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired image handle")
+    return session_summary(session, image_sessions)
+
+
+@app.delete("/images/{handle}")
+async def delete_image_session(handle: str):
+    """Release a stored image session."""
+    if not image_sessions.delete(handle):
+        raise HTTPException(status_code=404, detail="Unknown or expired image handle")
+    return {"deleted": handle}
+
+
 @app.post("/preprocess/upload")
 async def preprocess_upload(
+    http_request: Request,
     file: UploadFile = File(...),
     include_visualizations: bool = False,
     save_aisle_visualization: bool = True,
+    visualization_format: str = "png",
+    visualization_max_dimension: Optional[int] = None,
+    visualization_quality: Optional[int] = None,
+    reduce_oversized: bool = False,
 ):
     """
     Preprocess an uploaded floorplan image file.
 
-    Accepts JPEG, PNG image files.
+    Accepts JPEG, PNG and TIFF image files. Images above the pixel ceiling
+    are rejected with 413, or (JPEG only) decoded at reduced resolution
+    with reduce_oversized; results are still in original pixels.
     """
     try:
         logger.info(f"Received file upload: {file.filename}")
 
-        # Read file contents
+        # Read file contents; the header is checked before decoding
         contents = await file.read()
-        nparr = np.frombuffer(contents, np.uint8)
-        image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+        config = PreprocessingConfig(memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB)
+        decoded = decode_floorplan_image(
+            contents, config, max_pixels=MAX_IMAGE_PIXELS, reduce_oversized=reduce_oversized,
+        )
+        image = decoded.image
 
         if image is None:
             raise HTTPException(status_code=400, detail="Failed to decode uploaded image")
 
-        logger.info(f"Image decoded: {image.shape[1]}x{image.shape[0]}")
+        logger.info(f"Image decoded: {image.shape[1]}x{image.shape[0]} (1/{decoded.reduction})")
 
-        # Run preprocessing with default config
-        result = preprocess_floorplan(image)
+        # Run preprocessing with default config; results come back in original pixels
+        result = preprocess_floorplan(image, config, decode_reduction=decoded.reduction)
 
-        # Convert to JSON
-        output = result_to_json(result, include_visualizations=include_visualizations)
+        # Convert to JSON (compact formats read NumPy point arrays directly)
+        output = result_to_json(
+            result,
+            include_visualizations=include_visualizations,
+            visualization_format=visualization_format,
+            visualization_max_dimension=visualization_max_dimension,
+            visualization_quality=visualization_quality,
+            native_types=negotiate_format(http_request.headers.get("accept")) == JSON_MEDIA_TYPE,
+        )
 
         num_aisles = len(result.line_data.get('aisle_candidates', []))
         num_travel_lanes = len(result.travel_lane_suggestions or [])
@@ -239,14 +504,20 @@ async def preprocess_upload(
                 result.line_data.get('aisle_candidates', []),
                 visualization_path,
                 content_boundary=result.content_boundary,
+                scale=1 / decoded.reduction,
             )
             logger.info(f"Saved aisle visualization to: {visualization_path}")
             output["aisle_visualization_path"] = visualization_path
 
-        # Use custom encoder to handle numpy types
-        json_str = json.dumps(output, cls=NumpyEncoder)
-        return JSONResponse(content=json.loads(json_str))
+        if decoded.reduction > 1:
+            output["decode"] = decoded.to_dict()
+
+        return encoded_response(output, http_request)
 
+    except HTTPException:
+        raise
+    except ImageTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
     except Exception as e:
         logger.error(f"Preprocessing error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -263,6 +534,13 @@ async def get_default_config():
         "min_region_area": config.min_region_area,
         "min_line_length": config.min_line_length,
         "line_cluster_distance": config.line_cluster_distance,
+        "aisle_detectors": {name: True for name in AISLE_DETECTORS},
+        "memory_budget_mb": DEFAULT_MEMORY_BUDGET_MB,
+        "hint_budget": asdict(config.hint_budget),
+        "estimate_scale": config.estimate_scale,
+        "canonical_pixels_per_meter": config.canonical_pixels_per_meter,
+        "max_image_pixels": MAX_IMAGE_PIXELS,
+        "concurrency": governor.allocation(),
     }
 
 
@@ -5,16 +5,51 @@ Provides image preprocessing capabilities to augment Gemini AI analysis
 for warehouse floorplan zone detection.
 """
 
-from .edge_detection import process_edges, EdgeDetectionResult
-from .region_segmentation import process_segmentation, SegmentationResult, RegionType
-from .line_detection import process_lines, LineDetectionResult
-from .pipeline import (
-    preprocess_floorplan,
-    PreprocessingConfig,
-    PreprocessingResult,
-    image_from_base64,
-    result_to_json,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .edge_detection import process_edges, EdgeDetectionResult
+    from .region_segmentation import process_segmentation, SegmentationResult, RegionType
+    from .line_detection import process_lines, LineDetectionResult
+    from .pipeline import (
+        preprocess_floorplan,
+        PreprocessingConfig,
+        PreprocessingResult,
+        image_from_base64,
+        result_to_json,
+    )
+
+# Re-exports are imported on first access (PEP 562), so importing a light
+# submodule such as src.cli or src.concurrency does not load the pipeline
+# and SciPy. The server imports and warms the pipeline at startup.
+_EXPORTS = {
+    "process_edges": "edge_detection",
+    "EdgeDetectionResult": "edge_detection",
+    "process_segmentation": "region_segmentation",
+    "SegmentationResult": "region_segmentation",
+    "RegionType": "region_segmentation",
+    "process_lines": "line_detection",
+    "LineDetectionResult": "line_detection",
+    "preprocess_floorplan": "pipeline",
+    "PreprocessingConfig": "pipeline",
+    "PreprocessingResult": "pipeline",
+    "image_from_base64": "pipeline",
+    "result_to_json": "pipeline",
+}
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     "process_edges",
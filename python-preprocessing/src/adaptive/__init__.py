@@ -9,6 +9,8 @@ from .closed_region import ClosedRegionDetector, ClosedRegionResult
 from .fast_track import FastTrackDecision, FastTrackEvaluator
 from .decision_engine import ProcessingMode, ProcessingDecision, DecisionEngine
 from .config_selector import AdaptiveConfig, ConfigSelector
+from .triage import ImageTriage, TriageResult
+from .cost_model import CostModel, CostEstimate, CostCoefficients, TimingRecord
 
 __all__ = [
     "ClosedRegionDetector",
@@ -20,4 +22,10 @@ __all__ = [
     "DecisionEngine",
     "AdaptiveConfig",
     "ConfigSelector",
+    "ImageTriage",
+    "TriageResult",
+    "CostModel",
+    "CostEstimate",
+    "CostCoefficients",
+    "TimingRecord",
 ]
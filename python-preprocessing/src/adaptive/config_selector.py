@@ -33,6 +33,9 @@ class AdaptiveConfig:
     tile_size: int = 2048
     tile_overlap: int = 256
 
+    # Memory budget in MB; runs estimated to exceed it are tiled (None: no budget)
+    memory_budget_mb: Optional[float] = None
+
     # Phase 0 settings
     phase0_enabled: bool = True
     phase0_colors: List[str] = field(default_factory=lambda: ["orange", "yellow", "blue"])
@@ -57,6 +60,7 @@ class AdaptiveConfig:
             "tile_enabled": self.tile_enabled,
             "tile_size": self.tile_size,
             "tile_overlap": self.tile_overlap,
+            "memory_budget_mb": self.memory_budget_mb,
             "phase0_enabled": self.phase0_enabled,
             "phase0_colors": self.phase0_colors,
             "min_zone_area": self.min_zone_area,
@@ -79,6 +83,7 @@ class AdaptiveConfig:
             tile_enabled=data.get("tile_enabled", False),
             tile_size=data.get("tile_size", 2048),
             tile_overlap=data.get("tile_overlap", 256),
+            memory_budget_mb=data.get("memory_budget_mb"),
             phase0_enabled=data.get("phase0_enabled", True),
             phase0_colors=data.get("phase0_colors", ["orange", "yellow", "blue"]),
             min_zone_area=data.get("min_zone_area", 1000),
@@ -0,0 +1,162 @@
+"""
+Cost model for processing modes.
+
+Predicts wall time and peak memory of each ProcessingMode as a linear
+function of image megapixels. Defaults were calibrated from timings of
+FloorplanProcessor on synthetic floorplans (1-26 MP, tracemalloc peaks);
+calibrate() refits the coefficients from recorded timings.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterable, List, Optional
+import json
+import numpy as np
+
+from .decision_engine import ProcessingMode
+
+
+@dataclass
+class CostCoefficients:
+    """Linear cost coefficients for one mode: cost = base + per_megapixel * MP."""
+    time_base_ms: float
+    time_per_mp_ms: float
+    memory_base_mb: float
+    memory_per_mp_mb: float
+
+    def to_dict(self) -> Dict[str, float]:
+        """Convert to dictionary."""
+        return {
+            "time_base_ms": self.time_base_ms,
+            "time_per_mp_ms": self.time_per_mp_ms,
+            "memory_base_mb": self.memory_base_mb,
+            "memory_per_mp_mb": self.memory_per_mp_mb,
+        }
+
+
+@dataclass
+class CostEstimate:
+    """Predicted cost of processing an image in one mode."""
+    mode: ProcessingMode
+    time_ms: float
+    peak_memory_mb: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "mode": self.mode.value,
+            "time_ms": round(self.time_ms, 1),
+            "peak_memory_mb": round(self.peak_memory_mb, 1),
+        }
+
+
+@dataclass
+class TimingRecord:
+    """One observed processing run, used for calibration."""
+    mode: ProcessingMode
+    megapixels: float
+    time_ms: float
+    peak_memory_mb: float
+
+
+def _default_coefficients() -> Dict[ProcessingMode, CostCoefficients]:
+    # Full-resolution Phase 0 dominates every mode (~37 ms and ~7.6 MB per MP)
+    return {
+        ProcessingMode.FAST_TRACK: CostCoefficients(5.0, 37.0, 1.0, 7.6),
+        ProcessingMode.STANDARD: CostCoefficients(5.0, 37.0, 1.0, 7.6),
+        ProcessingMode.TILED: CostCoefficients(10.0, 40.0, 1.0, 7.6),
+        ProcessingMode.HYBRID: CostCoefficients(10.0, 40.0, 1.0, 7.6),
+    }
+
+
+@dataclass
+class CostModel:
+    """
+    Per-mode linear time and memory model.
+
+    Example:
+        >>> model = CostModel()
+        >>> model.predict(ProcessingMode.STANDARD, 4000, 3000).time_ms
+    """
+    coefficients: Dict[ProcessingMode, CostCoefficients] = field(
+        default_factory=_default_coefficients
+    )
+
+    def predict(self, mode: ProcessingMode, width: int, height: int) -> CostEstimate:
+        """
+        Predict cost for one mode.
+
+        Args:
+            mode: Processing mode
+            width: Image width in pixels
+            height: Image height in pixels
+
+        Returns:
+            CostEstimate
+        """
+        c = self.coefficients[mode]
+        mp = width * height / 1e6
+        return CostEstimate(
+            mode=mode,
+            time_ms=c.time_base_ms + c.time_per_mp_ms * mp,
+            peak_memory_mb=c.memory_base_mb + c.memory_per_mp_mb * mp,
+        )
+
+    def predict_all(self, width: int, height: int) -> Dict[ProcessingMode, CostEstimate]:
+        """Predict cost for every mode with coefficients."""
+        return {mode: self.predict(mode, width, height) for mode in self.coefficients}
+
+    def calibrate(self, records: Iterable[TimingRecord]) -> "CostModel":
+        """
+        Refit coefficients from recorded timings.
+
+        Modes need at least two records at different sizes to be refit;
+        other modes keep their current coefficients.
+
+        Args:
+            records: Observed runs
+
+        Returns:
+            New CostModel
+        """
+        by_mode: Dict[ProcessingMode, List[TimingRecord]] = {}
+        for record in records:
+            by_mode.setdefault(record.mode, []).append(record)
+
+        coefficients = dict(self.coefficients)
+        for mode, mode_records in by_mode.items():
+            mp = np.array([r.megapixels for r in mode_records], dtype=np.float64)
+            if len(np.unique(mp)) < 2:
+                continue
+            t_slope, t_base = np.polyfit(mp, [r.time_ms for r in mode_records], 1)
+            m_slope, m_base = np.polyfit(mp, [r.peak_memory_mb for r in mode_records], 1)
+            # Costs never shrink with size; clamp noise-driven negative fits
+            coefficients[mode] = CostCoefficients(
+                time_base_ms=max(0.0, float(t_base)),
+                time_per_mp_ms=max(0.0, float(t_slope)),
+                memory_base_mb=max(0.0, float(m_base)),
+                memory_per_mp_mb=max(0.0, float(m_slope)),
+            )
+        return CostModel(coefficients=coefficients)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (keyed by mode value)."""
+        return {mode.value: c.to_dict() for mode, c in self.coefficients.items()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CostModel":
+        """Create from dictionary; missing modes keep defaults."""
+        coefficients = _default_coefficients()
+        for mode_value, c in data.items():
+            coefficients[ProcessingMode(mode_value)] = CostCoefficients(**c)
+        return cls(coefficients=coefficients)
+
+    @classmethod
+    def from_json(cls, path: str) -> "CostModel":
+        """Load coefficients from a JSON file."""
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+    def save(self, path: str) -> None:
+        """Save coefficients to a JSON file."""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
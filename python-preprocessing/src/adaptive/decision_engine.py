@@ -13,9 +13,15 @@ if TYPE_CHECKING:
     from ..color_boundary.models import ColorBoundaryResult
     from .closed_region import ClosedRegionResult
     from .fast_track import FastTrackDecision
+    from .triage import TriageResult
+    from .cost_model import CostModel
+    from ..memory_budget import MemoryEstimator
 
 logger = logging.getLogger(__name__)
 
+# Memory-budget tiling never goes below this tile size
+MIN_MEMORY_TILE_SIZE = 512
+
 
 class ProcessingMode(Enum):
     """Available processing modes."""
@@ -32,6 +38,7 @@ class ProcessingDecision:
     confidence: float
     should_tile: bool
     tile_count: int = 1
+    tile_size: Optional[int] = None  # Set when a memory budget shrinks tiles
     reasoning: List[str] = field(default_factory=list)
     fast_track_decision: Optional["FastTrackDecision"] = None
     metrics: Dict[str, Any] = field(default_factory=dict)
@@ -43,6 +50,7 @@ class ProcessingDecision:
             "confidence": self.confidence,
             "should_tile": self.should_tile,
             "tile_count": self.tile_count,
+            "tile_size": self.tile_size,
             "reasoning": self.reasoning,
             "fast_track_eligible": (
                 self.fast_track_decision.eligible
@@ -61,6 +69,13 @@ class DecisionEngine:
     - Phase 0 boundary quality (for fast-track eligibility)
     - Closed region analysis (required for fast-track)
     - Layout complexity
+    - Thumbnail triage (when full-resolution analysis is not available yet)
+
+    Every decision carries the cost model's predicted time and peak memory
+    for each mode in its metrics. With a memory budget, images whose
+    estimated preprocessing peak (see memory_budget.MemoryEstimator)
+    exceeds the budget are tiled even below the dimension threshold, with
+    tiles small enough to fit.
 
     Processing modes:
     - FAST_TRACK: Skip detailed analysis, use Phase 0 directly
@@ -81,6 +96,9 @@ class DecisionEngine:
         tile_size: int = 2048,
         fast_track_min_coverage: float = 0.3,
         fast_track_min_closed_ratio: float = 0.5,
+        cost_model: Optional["CostModel"] = None,
+        memory_budget_mb: Optional[float] = None,
+        memory_estimator: Optional["MemoryEstimator"] = None,
     ):
         """
         Initialize decision engine.
@@ -90,11 +108,20 @@ class DecisionEngine:
             tile_size: Target tile size
             fast_track_min_coverage: Min coverage for fast-track
             fast_track_min_closed_ratio: Min closed ratio for fast-track
+            cost_model: Time/memory predictor (default: calibrated CostModel)
+            memory_budget_mb: Default memory budget in MB (None: no budget)
+            memory_estimator: Peak-memory estimator (default: MemoryEstimator())
         """
+        from .cost_model import CostModel  # cost_model imports ProcessingMode
+        from ..memory_budget import MemoryEstimator
+
         self.dimension_threshold = dimension_threshold
         self.tile_size = tile_size
         self.fast_track_min_coverage = fast_track_min_coverage
         self.fast_track_min_closed_ratio = fast_track_min_closed_ratio
+        self.cost_model = cost_model or CostModel()
+        self.memory_budget_mb = memory_budget_mb
+        self.memory_estimator = memory_estimator or MemoryEstimator()
 
     def decide(
         self,
@@ -103,6 +130,8 @@ class DecisionEngine:
         closed_region_result: Optional["ClosedRegionResult"] = None,
         fast_track_decision: Optional["FastTrackDecision"] = None,
         force_mode: Optional[ProcessingMode] = None,
+        triage: Optional["TriageResult"] = None,
+        memory_budget_mb: Optional[float] = None,
     ) -> ProcessingDecision:
         """
         Decide optimal processing mode.
@@ -113,6 +142,9 @@ class DecisionEngine:
             closed_region_result: Closed region analysis
             fast_track_decision: Pre-computed fast-track decision
             force_mode: Force a specific mode (overrides auto-detection)
+            triage: Thumbnail triage, used for fast-track eligibility when
+                neither fast_track_decision nor closed_region_result is given
+            memory_budget_mb: Memory budget in MB (default: the engine's)
 
         Returns:
             ProcessingDecision with recommended mode
@@ -123,16 +155,27 @@ class DecisionEngine:
             "image_width": width,
             "image_height": height,
         }
+        if triage is not None:
+            metrics["triage"] = triage.to_dict()
+            metrics["complexity"] = triage.complexity.value
+
+        if memory_budget_mb is None:
+            memory_budget_mb = self.memory_budget_mb
+        memory_tile_size = self._memory_tile_size(width, height, memory_budget_mb, metrics)
 
         # Handle forced mode
         if force_mode is not None:
             reasoning.append(f"Mode forced to {force_mode.value}")
             should_tile = force_mode == ProcessingMode.TILED
+            self._add_cost_metrics(metrics, force_mode, width, height)
             return ProcessingDecision(
                 mode=force_mode,
                 confidence=1.0,
                 should_tile=should_tile,
-                tile_count=self._estimate_tile_count(width, height) if should_tile else 1,
+                tile_count=(
+                    self._estimate_tile_count(width, height, memory_tile_size) if should_tile else 1
+                ),
+                tile_size=memory_tile_size if should_tile else None,
                 reasoning=reasoning,
                 metrics=metrics,
             )
@@ -142,17 +185,27 @@ class DecisionEngine:
         needs_tiling = max_dim > self.dimension_threshold
 
         if needs_tiling:
-            tile_count = self._estimate_tile_count(width, height)
-            metrics["estimated_tile_count"] = tile_count
             reasoning.append(
                 f"Image dimension {max_dim}px exceeds threshold {self.dimension_threshold}px"
             )
+        if memory_tile_size is not None:
+            needs_tiling = True
+            reasoning.append(
+                f"Estimated peak memory {metrics['estimated_peak_memory_mb']:.0f}MB exceeds "
+                f"budget {memory_budget_mb:.0f}MB; tiles of {memory_tile_size}px"
+            )
+        if needs_tiling:
+            metrics["estimated_tile_count"] = self._estimate_tile_count(
+                width, height, memory_tile_size
+            )
 
         # Check fast-track eligibility
         fast_track_eligible = False
+        fast_track_confidence = None
 
         if fast_track_decision is not None:
             fast_track_eligible = fast_track_decision.eligible
+            fast_track_confidence = fast_track_decision.confidence
             metrics["fast_track_confidence"] = fast_track_decision.confidence
 
             if fast_track_eligible:
@@ -177,6 +230,19 @@ class DecisionEngine:
                     f"closed regions ({closed_region_result.closure_ratio:.1%} closure ratio)"
                 )
 
+        elif triage is not None:
+            # Thumbnail estimate (full-resolution Phase 0 not run yet)
+            fast_track_eligible = triage.fast_track_likely
+            fast_track_confidence = triage.fast_track_decision.confidence
+            metrics["fast_track_confidence"] = fast_track_confidence
+            reasoning.append(
+                f"Triage ({triage.image_width}x{triage.image_height} at "
+                f"{triage.scale:.2f}x): fast-track "
+                f"{'likely' if fast_track_eligible else 'unlikely'}, "
+                f"{triage.complexity.value} layout"
+                + (", no color" if triage.colorless else "")
+            )
+
         # Add Phase 0 metrics
         if phase0_result is not None:
             boundary_count = len(phase0_result.boundaries)
@@ -204,13 +270,15 @@ class DecisionEngine:
                 # Small image with good Phase 0 - fast track
                 mode = ProcessingMode.FAST_TRACK
                 reasoning.append("Using fast-track: good Phase 0 coverage")
-                confidence = fast_track_decision.confidence if fast_track_decision else 0.85
+                confidence = fast_track_confidence if fast_track_confidence is not None else 0.85
             else:
                 # Small image, need standard processing
                 mode = ProcessingMode.STANDARD
                 reasoning.append("Using standard processing")
                 confidence = 0.9
 
+        self._add_cost_metrics(metrics, mode, width, height)
+
         logger.info(f"Decision: {mode.value} (confidence: {confidence:.2f})")
         for reason in reasoning:
             logger.debug(f"  - {reason}")
@@ -219,20 +287,68 @@ class DecisionEngine:
             mode=mode,
             confidence=confidence,
             should_tile=needs_tiling,
-            tile_count=self._estimate_tile_count(width, height) if needs_tiling else 1,
+            tile_count=(
+                self._estimate_tile_count(width, height, memory_tile_size) if needs_tiling else 1
+            ),
+            tile_size=memory_tile_size if needs_tiling else None,
             reasoning=reasoning,
             fast_track_decision=fast_track_decision,
             metrics=metrics,
         )
 
-    def _estimate_tile_count(self, width: int, height: int) -> int:
+    def _add_cost_metrics(
+        self,
+        metrics: Dict[str, Any],
+        mode: ProcessingMode,
+        width: int,
+        height: int,
+    ) -> None:
+        """Add predicted cost of every mode, and of the chosen one, to metrics."""
+        predictions = self.cost_model.predict_all(width, height)
+        metrics["predicted_cost"] = {m.value: e.to_dict() for m, e in predictions.items()}
+        if mode in predictions:
+            metrics["predicted_time_ms"] = round(predictions[mode].time_ms, 1)
+            metrics["predicted_peak_memory_mb"] = round(predictions[mode].peak_memory_mb, 1)
+
+    def _memory_tile_size(
+        self,
+        width: int,
+        height: int,
+        memory_budget_mb: Optional[float],
+        metrics: Dict[str, Any],
+    ) -> Optional[int]:
+        """
+        Tile size that keeps the estimated peak within a memory budget.
+
+        Adds the budget and estimated peak to metrics.
+
+        Returns:
+            None without a budget or when the whole image fits, else a tile
+            size no larger than the engine's tile_size
+        """
+        if memory_budget_mb is None:
+            return None
+        estimated = self.memory_estimator.estimate_peak_mb(width, height)
+        metrics["memory_budget_mb"] = memory_budget_mb
+        metrics["estimated_peak_memory_mb"] = round(estimated, 1)
+        if estimated <= memory_budget_mb:
+            return None
+
+        # A tile may hold as many pixels as a coarse pass that fits the budget
+        scale = self.memory_estimator.scale_for_budget(width, height, memory_budget_mb)
+        tile_size = min(self.tile_size, max(MIN_MEMORY_TILE_SIZE, int(scale * (width * height) ** 0.5)))
+        metrics["memory_tile_size"] = tile_size
+        return tile_size
+
+    def _estimate_tile_count(self, width: int, height: int, tile_size: Optional[int] = None) -> int:
         """Estimate number of tiles needed."""
-        if width <= self.tile_size and height <= self.tile_size:
+        tile_size = tile_size or self.tile_size
+        if width <= tile_size and height <= tile_size:
             return 1
 
         # Calculate grid size
-        cols = (width + self.tile_size - 1) // self.tile_size
-        rows = (height + self.tile_size - 1) // self.tile_size
+        cols = (width + tile_size - 1) // tile_size
+        rows = (height + tile_size - 1) // tile_size
 
         return cols * rows
 
@@ -0,0 +1,226 @@
+"""
+Thumbnail triage for processing mode selection.
+
+Runs Phase 0 color detection and closed region analysis on a small
+thumbnail so the decision engine can pick a mode before paying for
+full-resolution Phase 0. Thumbnail metrics are approximations: area
+ratios survive downscaling, but thin boundaries can blur out, so only
+decisive outcomes (colorless, confidently fast-track, or a thumbnail
+that is already full resolution) are used without the full-res pass.
+The colorless check itself reads full-resolution saturation, since a
+thin colored line averaged into a thumbnail can fall below any fixed
+threshold.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
+import time
+import numpy as np
+import cv2
+
+from ..color_boundary.detector import ColorBoundaryDetector
+from ..color_boundary.models import ColorBoundaryResult
+from .closed_region import ClosedRegionDetector
+from .fast_track import FastTrackEvaluator, FastTrackDecision
+from .config_selector import ImageComplexity, estimate_complexity
+
+
+# Pixels converted to HSV at a time when measuring full-resolution saturation
+SATURATION_STRIP_PIXELS = 4_000_000
+
+
+def max_saturation(image: np.ndarray) -> int:
+    """
+    Maximum HSV saturation of a BGR image at full resolution.
+
+    Converts row strips of about SATURATION_STRIP_PIXELS at a time, so
+    no full-size HSV copy is allocated.
+
+    Args:
+        image: BGR image
+
+    Returns:
+        Maximum saturation (0-255)
+    """
+    height, width = image.shape[:2]
+    rows = max(1, SATURATION_STRIP_PIXELS // max(1, width))
+    peak = 0
+    for y in range(0, height, rows):
+        hsv = cv2.cvtColor(image[y:y + rows], cv2.COLOR_BGR2HSV)
+        peak = max(peak, int(hsv[:, :, 1].max()))
+    return peak
+
+
+@dataclass
+class TriageResult:
+    """Approximate image metrics from a thumbnail."""
+    image_width: int
+    image_height: int
+    scale: float  # Thumbnail size / full size (1.0 = not downscaled)
+    coverage_ratio: float
+    boundary_count: int
+    closed_region_count: int
+    closure_ratio: float
+    max_saturation: int  # Full resolution
+    colorless: bool
+    complexity: ImageComplexity
+    fast_track_decision: FastTrackDecision
+    time_ms: float
+    phase0_result: Optional[ColorBoundaryResult] = None  # Thumbnail-scale
+
+    @property
+    def is_full_resolution(self) -> bool:
+        """True if the thumbnail is the image itself (metrics are exact)."""
+        return self.scale >= 1.0
+
+    @property
+    def fast_track_likely(self) -> bool:
+        """Thumbnail analysis says the image qualifies for fast-track."""
+        return self.fast_track_decision.eligible
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "scale": round(self.scale, 4),
+            "coverage_ratio": round(float(self.coverage_ratio), 4),
+            "boundary_count": self.boundary_count,
+            "closed_region_count": self.closed_region_count,
+            "closure_ratio": round(float(self.closure_ratio), 4),
+            "max_saturation": self.max_saturation,
+            "colorless": self.colorless,
+            "complexity": self.complexity.value,
+            "fast_track_likely": self.fast_track_likely,
+            "fast_track_confidence": round(float(self.fast_track_decision.confidence), 4),
+            "time_ms": round(self.time_ms, 2),
+        }
+
+
+class ImageTriage:
+    """
+    Cheap pre-decision analysis on a downscaled image.
+
+    Example:
+        >>> triage = ImageTriage().run(image)
+        >>> if triage.colorless:
+        ...     skip_phase0()
+    """
+
+    def __init__(
+        self,
+        max_dimension: int = 512,
+        colorless_saturation: int = 20,
+        decisive_confidence: float = 0.85,
+        color_detector: Optional[ColorBoundaryDetector] = None,
+        fast_track_evaluator: Optional[FastTrackEvaluator] = None,
+    ):
+        """
+        Initialize triage.
+
+        Args:
+            max_dimension: Longest thumbnail side in pixels
+            colorless_saturation: Max full-resolution HSV saturation for an
+                image to count as colorless
+            decisive_confidence: Fast-track confidence above which the
+                thumbnail decision is trusted without a full-res check
+            color_detector: Phase 0 detector (min_contour_area is rescaled)
+            fast_track_evaluator: Evaluator applied to thumbnail results
+        """
+        self.max_dimension = max_dimension
+        self.colorless_saturation = colorless_saturation
+        self.decisive_confidence = decisive_confidence
+        self.color_detector = color_detector or ColorBoundaryDetector()
+        self.fast_track_evaluator = fast_track_evaluator or FastTrackEvaluator()
+
+    def thumbnail(self, image: np.ndarray) -> Tuple[np.ndarray, float]:
+        """
+        Downscale so the longest side is at most max_dimension.
+
+        Returns:
+            (thumbnail, scale) where scale = thumbnail size / image size
+        """
+        height, width = image.shape[:2]
+        scale = min(1.0, self.max_dimension / max(width, height))
+        if scale >= 1.0:
+            return image, 1.0
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        return cv2.resize(image, size, interpolation=cv2.INTER_AREA), scale
+
+    def run(self, image: np.ndarray) -> TriageResult:
+        """
+        Triage an image.
+
+        Args:
+            image: Full-resolution BGR image
+
+        Returns:
+            TriageResult with approximate metrics
+        """
+        start = time.perf_counter()
+        height, width = image.shape[:2]
+        thumb, scale = self.thumbnail(image)
+        # Not from the thumbnail: area averaging dilutes thin colored lines
+        saturation = max_saturation(image)
+        colorless = saturation < self.colorless_saturation
+
+        if colorless:
+            phase0 = ColorBoundaryResult(
+                boundaries=[],
+                combined_mask=np.zeros(thumb.shape[:2], dtype=np.uint8),
+                coverage_ratio=0.0,
+                image_shape=thumb.shape[:2],
+            )
+        else:
+            # Same detector settings, with the area threshold at thumbnail scale
+            detector = self.color_detector
+            if scale < 1.0:
+                detector = ColorBoundaryDetector(
+                    config=detector.config,
+                    min_contour_area=max(1, int(detector.min_contour_area * scale * scale)),
+                    epsilon_factor=detector.epsilon_factor,
+                    close_iterations=detector.close_iterations,
+                    open_iterations=detector.open_iterations,
+                    kernel_size=detector.kernel_size,
+                )
+            phase0 = detector.detect(thumb)
+
+        thumb_h, thumb_w = thumb.shape[:2]
+        closed = ClosedRegionDetector(
+            closure_threshold=max(1.0, 10.0 * scale),
+        ).analyze(phase0, image_size=(thumb_w, thumb_h))
+        # Judge size limits on the full image, everything else on the thumbnail
+        fast_track = self.fast_track_evaluator.evaluate(
+            phase0, closed, image_dimensions=(width, height),
+        )
+        complexity = estimate_complexity(
+            len(phase0.boundaries), phase0.coverage_ratio, closed.closure_ratio,
+        )
+
+        return TriageResult(
+            image_width=width,
+            image_height=height,
+            scale=scale,
+            coverage_ratio=phase0.coverage_ratio,
+            boundary_count=len(phase0.boundaries),
+            closed_region_count=closed.closed_region_count,
+            closure_ratio=closed.closure_ratio,
+            max_saturation=saturation,
+            colorless=colorless,
+            complexity=complexity,
+            fast_track_decision=fast_track,
+            time_ms=(time.perf_counter() - start) * 1000,
+            phase0_result=phase0,
+        )
+
+    def is_decisive(self, triage: TriageResult) -> bool:
+        """
+        Whether the decision can be made from the triage alone.
+
+        True if the thumbnail is full resolution, the image has no color
+        (Phase 0 would find nothing), or fast-track is confidently likely.
+        """
+        if triage.is_full_resolution or triage.colorless:
+            return True
+        return (
+            triage.fast_track_likely
+            and triage.fast_track_decision.confidence >= self.decisive_confidence
+        )
@@ -7,6 +7,7 @@ Task 2.8: Add CLI Command for Phase 0
 Usage:
     python -m src color_boundary detect <image_path> [--output json|visual]
     python -m src phase0 <image_path> [--output json|visual] [--fast-track-threshold 0.8]
+    python -m src bench [--sizes 1,4,16] [--baseline baseline.json] [--save-baseline out.json]
     python -m src --help
 """
 
@@ -110,6 +111,65 @@ def setup_argparse() -> argparse.ArgumentParser:
         help="Minimum contour area in pixels (default: 1000)",
     )
 
+    # bench command
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help="Benchmark preprocessing stages on synthetic floorplans",
+    )
+    bench_parser.add_argument(
+        "--sizes",
+        type=str,
+        default="1,4,16",
+        help="Comma-separated floorplan sizes in megapixels, up to 200 (default: 1,4,16)",
+    )
+    bench_parser.add_argument(
+        "--stages",
+        type=str,
+        default=None,
+        help="Comma-separated stages to run (default: all)",
+    )
+    bench_parser.add_argument(
+        "--repeats",
+        type=int,
+        default=3,
+        help="Timed runs per stage, best is kept (default: 3)",
+    )
+    bench_parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Floorplan generator seed (default: 0)",
+    )
+    bench_parser.add_argument(
+        "--baseline",
+        type=str,
+        help="Baseline JSON to compare against; exits 1 on regression",
+    )
+    bench_parser.add_argument(
+        "--save-baseline",
+        type=str,
+        help="Write results as a baseline JSON file",
+    )
+    bench_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative regression vs baseline (default: 0.25)",
+    )
+    bench_parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=5.0,
+        help="Ignore slowdowns smaller than this many ms (default: 5.0)",
+    )
+    bench_parser.add_argument(
+        "--output",
+        "-o",
+        choices=["json", "table"],
+        default="table",
+        help="Output format (default: table)",
+    )
+
     return parser
 
 
@@ -308,6 +368,63 @@ def cmd_phase0(args) -> int:
     return 0
 
 
+def cmd_bench(args) -> int:
+    """Handle bench command - time stages and compare against a baseline."""
+    from benchmarks.suite import (
+        run_benchmarks,
+        save_baseline,
+        load_baseline,
+        compare_to_baseline,
+        format_table,
+    )
+
+    try:
+        sizes = [float(s) for s in args.sizes.split(",") if s.strip()]
+        stages = [s.strip() for s in args.stages.split(",")] if args.stages else None
+        progress = None
+        if args.output == "table":
+            progress = lambda r: print(
+                f"  {r.stage} @ {r.megapixels:g}MP: {r.time_ms:.1f}ms", file=sys.stderr
+            )
+        results = run_benchmarks(sizes, stages, repeats=args.repeats, seed=args.seed, progress=progress)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    regressions = []
+    if args.baseline:
+        if not Path(args.baseline).exists():
+            print(f"Error: Baseline not found: {args.baseline}", file=sys.stderr)
+            return 1
+        regressions = compare_to_baseline(
+            results,
+            load_baseline(args.baseline),
+            args.tolerance,
+            min_time_delta_ms=args.min_delta_ms,
+        )
+
+    if args.save_baseline:
+        save_baseline(results, args.save_baseline)
+
+    if args.output == "json":
+        print(json.dumps({
+            "results": [r.to_dict() for r in results],
+            "regressions": [
+                {"key": r.key, "metric": r.metric, "baseline": r.baseline,
+                 "current": r.current, "ratio": round(r.ratio, 3)}
+                for r in regressions
+            ],
+        }, indent=2))
+    else:
+        print(format_table(results))
+        if args.save_baseline:
+            print(f"Baseline saved to: {args.save_baseline}")
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+
+    return 1 if regressions else 0
+
+
 def main() -> int:
     """Main entry point."""
     parser = setup_argparse()
@@ -327,6 +444,9 @@ def main() -> int:
     if args.command == "phase0":
         return cmd_phase0(args)
 
+    if args.command == "bench":
+        return cmd_bench(args)
+
     return 0
 
 
@@ -8,6 +8,8 @@ from dataclasses import dataclass, field
 from typing import List, Tuple, Dict, Any, Optional
 import numpy as np
 
+from ..result_encoding import PointList
+
 
 @dataclass
 class DetectedBoundary:
@@ -32,11 +34,19 @@ class DetectedBoundary:
         return {
             "color": self.color,
             "area": int(self.area),
-            "polygon": [{"x": int(x), "y": int(y)} for x, y in self.polygon],
+            "polygon": PointList(self.polygon),
             "confidence": round(float(self.confidence), 3),
             "vertex_count": len(self.polygon),
         }
 
+    def scale(self, factor: float) -> "DetectedBoundary":
+        """Scale contour, polygon and area by factor in place."""
+        if factor != 1.0:
+            self.contour = np.rint(self.contour * factor).astype(self.contour.dtype)
+            self.polygon = [(int(round(x * factor)), int(round(y * factor))) for x, y in self.polygon]
+            self.area = int(round(self.area * factor * factor))
+        return self
+
     def is_closed(self) -> bool:
         """
         Check if this boundary forms a closed region.
@@ -88,7 +98,7 @@ class ColorBoundaryResult:
         return {
             "detected_colored_boundaries": [
                 {
-                    "polygon": [{"x": int(x), "y": int(y)} for x, y in b.polygon],
+                    "polygon": PointList(b.polygon),
                     "color": b.color,
                     "area_px": int(b.area),
                     "confidence": round(float(b.confidence), 3),
@@ -99,6 +109,14 @@ class ColorBoundaryResult:
             "has_predefined_zones": self.coverage_ratio > 0.1,
         }
 
+    def scale(self, factor: float) -> "ColorBoundaryResult":
+        """Scale boundaries and image_shape by factor in place (not the mask)."""
+        if factor != 1.0:
+            for boundary in self.boundaries:
+                boundary.scale(factor)
+            self.image_shape = tuple(int(round(v * factor)) for v in self.image_shape)
+        return self
+
     def get_boundaries_by_color(self, color: str) -> List[DetectedBoundary]:
         """Get all boundaries of a specific color."""
         return [b for b in self.boundaries if b.color == color]
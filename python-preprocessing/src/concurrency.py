@@ -0,0 +1,239 @@
+"""
+CPU Concurrency Governor
+
+Parallelism comes from several layers that do not know about each other:
+server processes (uvicorn workers), PipelineRunner workers, TileProcessor
+tile pools, the aisle detector and travel lane pools, and OpenCV's own
+thread pool. Left alone each layer sizes itself to the whole machine and
+they oversubscribe each other.
+
+ConcurrencyGovernor takes a core budget and splits it down the nesting:
+
+- The budget is divided evenly across server processes
+- Each parallel region (a thread pool) gets at most as many workers as
+  the calling thread has cores, and each worker inherits an equal share
+- OpenCV's thread count follows the smallest share of any running worker,
+  so a worker never runs a wide cv2 pool on top of its siblings
+
+Example:
+    >>> governor = get_governor()
+    >>> with governor.parallel_region("tiles", requested=8) as region:
+    ...     with ThreadPoolExecutor(max_workers=region.workers) as pool:
+    ...         results = list(pool.map(region.wrap(process_tile), tiles))
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import cv2
+
+
+# Environment overrides (the server and CLI read them at startup)
+CORE_BUDGET_ENV = "PREPROCESS_CORE_BUDGET"
+PROCESSES_ENV = "WEB_CONCURRENCY"  # uvicorn's worker count
+
+
+def available_cores() -> int:
+    """Cores this process may run on (CPU affinity aware)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _env_int(name: str) -> Optional[int]:
+    value = os.environ.get(name)
+    return int(value) if value else None
+
+
+@dataclass
+class ParallelRegion:
+    """Workers granted to one thread pool and the cores each worker gets."""
+    name: str
+    requested: int
+    workers: int
+    threads_per_worker: int
+    governor: "ConcurrencyGovernor"
+
+    def wrap(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wrap a pool task so it runs with this region's per-worker share.
+
+        Nested regions started inside the task see the smaller share, and
+        OpenCV is limited to it while the task runs.
+        """
+        share = self.threads_per_worker
+
+        def run(*args, **kwargs):
+            with self.governor._worker_share(share):
+                return fn(*args, **kwargs)
+
+        return run
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert to dictionary."""
+        return {
+            "requested": self.requested,
+            "workers": self.workers,
+            "threads_per_worker": self.threads_per_worker,
+        }
+
+
+class ConcurrencyGovernor:
+    """
+    Splits a core budget across processes, nested thread pools and OpenCV.
+
+    Thread-safe; one governor is shared by the whole process (get_governor).
+    """
+
+    def __init__(self, core_budget: Optional[int] = None, processes: int = 1):
+        """
+        Initialize the governor.
+
+        Args:
+            core_budget: Cores for all processes together (default: available cores)
+            processes: Server processes sharing the budget
+
+        Raises:
+            ValueError: If core_budget or processes is below 1
+        """
+        core_budget = core_budget if core_budget is not None else available_cores()
+        if core_budget < 1:
+            raise ValueError("core_budget must be at least 1")
+        if processes < 1:
+            raise ValueError("processes must be at least 1")
+        self.core_budget = core_budget
+        self.processes = processes
+        self.cores_per_process = max(1, core_budget // processes)
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._active: Dict[int, int] = {}  # Worker token -> core share
+        self._next_token = 0
+        self._opencv_threads: Optional[int] = None
+        self._regions: Dict[str, ParallelRegion] = {}
+
+    @classmethod
+    def from_env(cls) -> "ConcurrencyGovernor":
+        """Create from PREPROCESS_CORE_BUDGET and WEB_CONCURRENCY."""
+        return cls(core_budget=_env_int(CORE_BUDGET_ENV), processes=_env_int(PROCESSES_ENV) or 1)
+
+    def current_share(self) -> int:
+        """Cores available to the calling thread."""
+        return getattr(self._local, "share", self.cores_per_process)
+
+    @contextmanager
+    def parallel_region(self, name: str, requested: int) -> Iterator[ParallelRegion]:
+        """
+        Size a thread pool from the calling thread's core share.
+
+        Args:
+            name: Region name reported in metrics (e.g. "tiles")
+            requested: Workers the caller would like
+
+        Yields:
+            ParallelRegion with the granted worker count; submit tasks
+            through region.wrap so nested regions and OpenCV adapt
+        """
+        share = self.current_share()
+        workers = max(1, min(requested, share))
+        region = ParallelRegion(
+            name=name,
+            requested=requested,
+            workers=workers,
+            threads_per_worker=max(1, share // workers),
+            governor=self,
+        )
+        with self._lock:
+            self._regions[name] = region
+        yield region
+
+    @contextmanager
+    def _worker_share(self, share: int) -> Iterator[None]:
+        previous = getattr(self._local, "share", None)
+        self._local.share = share
+        with self._lock:
+            token = self._next_token
+            self._next_token += 1
+            self._active[token] = share
+            self._apply_opencv_threads()
+        try:
+            yield
+        finally:
+            with self._lock:
+                del self._active[token]
+                self._apply_opencv_threads()
+            if previous is None:
+                del self._local.share
+            else:
+                self._local.share = previous
+
+    def _apply_opencv_threads(self) -> None:
+        # cv2.setNumThreads is process-wide: use the smallest running share
+        threads = min(self._active.values(), default=self.cores_per_process)
+        if threads != self._opencv_threads:
+            cv2.setNumThreads(threads)
+            self._opencv_threads = threads
+
+    def apply(self) -> None:
+        """Set OpenCV's thread count for the current (idle) state."""
+        with self._lock:
+            self._opencv_threads = None
+            self._apply_opencv_threads()
+
+    @property
+    def opencv_threads(self) -> int:
+        """OpenCV thread count currently set by the governor."""
+        return self._opencv_threads or self.cores_per_process
+
+    def allocation(self) -> Dict[str, Any]:
+        """
+        Report the core split for metrics.
+
+        Returns:
+            Dict with the budget, per-process cores, OpenCV threads and
+            the last allocation of each named region
+        """
+        with self._lock:
+            regions = {name: region.to_dict() for name, region in self._regions.items()}
+        return {
+            "core_budget": self.core_budget,
+            "processes": self.processes,
+            "cores_per_process": self.cores_per_process,
+            "opencv_threads": self.opencv_threads,
+            "regions": regions,
+        }
+
+
+_governor: Optional[ConcurrencyGovernor] = None
+_governor_lock = threading.Lock()
+
+
+def get_governor() -> ConcurrencyGovernor:
+    """Return the process-wide governor (created from the environment on first use)."""
+    global _governor
+    with _governor_lock:
+        if _governor is None:
+            _governor = ConcurrencyGovernor.from_env()
+        return _governor
+
+
+def configure_governor(core_budget: Optional[int] = None, processes: int = 1) -> ConcurrencyGovernor:
+    """
+    Replace the process-wide governor and apply its OpenCV thread count.
+
+    Args:
+        core_budget: Cores for all processes together (default: available cores)
+        processes: Server processes sharing the budget
+
+    Returns:
+        The new governor
+    """
+    global _governor
+    governor = ConcurrencyGovernor(core_budget=core_budget, processes=processes)
+    with _governor_lock:
+        _governor = governor
+    governor.apply()
+    return governor
@@ -140,9 +140,85 @@ def coverage_to_mask(
     return mask
 
 
+def coverage_bounding_box(
+    boundary: CoverageBoundary,
+    image_shape: Tuple[int, int],
+) -> Tuple[int, int, int, int]:
+    """
+    Get the margin-expanded bounding box of a coverage boundary.
+
+    Args:
+        boundary: The coverage boundary
+        image_shape: (height, width) of the target image
+
+    Returns:
+        (x_min, y_min, x_max, y_max) clipped to the image, max exclusive.
+        Empty (x_max <= x_min) if the boundary lies outside the image.
+    """
+    h, w = image_shape[:2]
+
+    points = np.array(boundary.points)
+    x_min, y_min = points.min(axis=0)
+    x_max, y_max = points.max(axis=0)
+
+    # Apply margin (+1 so the max vertex row/column is included)
+    margin = boundary.margin
+    x_min = max(0, int(x_min) - margin)
+    y_min = max(0, int(y_min) - margin)
+    x_max = min(w, int(x_max) + margin + 1)
+    y_max = min(h, int(y_max) + margin + 1)
+
+    return x_min, y_min, x_max, y_max
+
+
+def coverage_to_local_mask(
+    boundary: CoverageBoundary,
+    image_shape: Tuple[int, int],
+    expand_margin: bool = True,
+) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """
+    Convert a coverage boundary to a mask covering only its bounding box.
+
+    Equivalent to cropping coverage_to_mask() to coverage_bounding_box(),
+    without allocating a full-image mask.
+
+    Args:
+        boundary: The coverage boundary
+        image_shape: (height, width) of the target image
+        expand_margin: Whether to expand the boundary by its margin value
+
+    Returns:
+        Tuple of (local_mask, offset) where offset is (x, y) of the top-left corner
+    """
+    if len(boundary.points) < 3:
+        return np.zeros((0, 0), dtype=np.uint8), (0, 0)
+
+    x_min, y_min, x_max, y_max = coverage_bounding_box(boundary, image_shape)
+    local_h, local_w = max(0, y_max - y_min), max(0, x_max - x_min)
+    mask = np.zeros((local_h, local_w), dtype=np.uint8)
+    if local_h == 0 or local_w == 0:
+        return mask, (x_min, y_min)
+
+    points = np.array(boundary.points, dtype=np.int32) - np.array([x_min, y_min], dtype=np.int32)
+
+    if expand_margin and boundary.margin > 0:
+        hull = cv2.convexHull(points)
+        cv2.fillPoly(mask, [hull], 255)
+        kernel = cv2.getStructuringElement(
+            cv2.MORPH_ELLIPSE,
+            (boundary.margin * 2 + 1, boundary.margin * 2 + 1)
+        )
+        mask = cv2.dilate(mask, kernel)
+    else:
+        cv2.fillPoly(mask, [points], 255)
+
+    return mask, (x_min, y_min)
+
+
 def clip_image_to_coverage(
     image: np.ndarray,
     boundary: CoverageBoundary,
+    copy: bool = True,
 ) -> Tuple[np.ndarray, Tuple[int, int]]:
     """
     Clip an image to a coverage boundary's bounding box.
@@ -150,31 +226,22 @@ def clip_image_to_coverage(
     Args:
         image: The source image (BGR or grayscale)
         boundary: The coverage boundary
+        copy: If False, return a view into image instead of a copy
 
     Returns:
         Tuple of (clipped_image, offset) where offset is (x, y) of the top-left corner
     """
     if len(boundary.points) < 3:
-        return image.copy(), (0, 0)
+        return (image.copy() if copy else image), (0, 0)
 
-    h, w = image.shape[:2]
-
-    # Get bounding box of the points
-    points = np.array(boundary.points)
-    x_min, y_min = points.min(axis=0)
-    x_max, y_max = points.max(axis=0)
-
-    # Apply margin
-    margin = boundary.margin
-    x_min = max(0, x_min - margin)
-    y_min = max(0, y_min - margin)
-    x_max = min(w, x_max + margin)
-    y_max = min(h, y_max + margin)
+    x_min, y_min, x_max, y_max = coverage_bounding_box(boundary, image.shape)
 
     # Clip the image
-    clipped = image[int(y_min):int(y_max), int(x_min):int(x_max)].copy()
+    clipped = image[y_min:y_max, x_min:x_max]
+    if copy:
+        clipped = clipped.copy()
 
-    return clipped, (int(x_min), int(y_min))
+    return clipped, (x_min, y_min)
 
 
 def filter_2d_coverage_boundaries(
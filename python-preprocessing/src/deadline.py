@@ -0,0 +1,115 @@
+"""
+Request Deadlines with Graceful Degradation
+
+A pathological image (e.g. a scanned photo with millions of Canny edges)
+can keep HoughLinesP and the aisle detectors busy for minutes, while an
+interactive caller needs a bounded answer more than every detector.
+
+A Deadline carries one request's time budget through the pipeline.
+Stages check it cooperatively between units of work:
+
+- Once LOW_VALUE_CUTOFF of the budget is spent, low-value work (see
+  LOW_VALUE_AISLE_DETECTORS) is skipped
+- Once the budget is spent, every remaining optional stage is skipped and
+  running detectors stop at their next unit of work with whatever they
+  have found
+- Everything skipped or cut short is recorded for the response
+
+Example:
+    >>> deadline = Deadline(2000)
+    >>> if deadline.allows("segmentation"):
+    ...     segmentation = process_segmentation(image)
+    >>> deadline.to_dict()["skipped"]
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+
+# Aisle detectors dropped first when time runs short (least value per ms)
+LOW_VALUE_AISLE_DETECTORS = ("gradient_edges", "whitespace")
+
+# Fraction of the budget after which low-value work is skipped
+LOW_VALUE_CUTOFF = 0.5
+
+
+class Deadline:
+    """
+    Cooperative time budget for one request.
+
+    A Deadline without a budget never expires, so stages can check it
+    unconditionally.
+    """
+
+    def __init__(self, budget_ms: Optional[float] = None):
+        """
+        Start the clock.
+
+        Args:
+            budget_ms: Time budget in milliseconds (None: unlimited)
+
+        Raises:
+            ValueError: If budget_ms is not positive
+        """
+        if budget_ms is not None and budget_ms <= 0:
+            raise ValueError("deadline_ms must be positive")
+        self.budget_ms = budget_ms
+        self._started = time.monotonic()
+        self.skipped: List[str] = []
+        self.truncated: List[str] = []
+
+    @property
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the deadline started."""
+        return (time.monotonic() - self._started) * 1000
+
+    @property
+    def remaining_ms(self) -> Optional[float]:
+        """Milliseconds left (None when unlimited, never negative)."""
+        if self.budget_ms is None:
+            return None
+        return max(0.0, self.budget_ms - self.elapsed_ms)
+
+    @property
+    def expired(self) -> bool:
+        """Whether the budget is spent."""
+        return self.budget_ms is not None and self.elapsed_ms >= self.budget_ms
+
+    def allows(self, stage: str, low_value: bool = False) -> bool:
+        """
+        Check whether a stage should still run, recording it as skipped if not.
+
+        Args:
+            stage: Stage name reported when skipped
+            low_value: Skip once LOW_VALUE_CUTOFF of the budget is spent
+
+        Returns:
+            True if the stage should run
+        """
+        if self.budget_ms is None:
+            return True
+        limit = self.budget_ms * (LOW_VALUE_CUTOFF if low_value else 1.0)
+        if self.elapsed_ms < limit:
+            return True
+        self.skip(stage)
+        return False
+
+    def skip(self, stage: str) -> None:
+        """Record a stage that did not run."""
+        if stage not in self.skipped:
+            self.skipped.append(stage)
+
+    def truncate(self, stage: str) -> None:
+        """Record a stage that returned partial results."""
+        if stage not in self.truncated:
+            self.truncated.append(stage)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "deadline_ms": self.budget_ms,
+            "elapsed_ms": round(self.elapsed_ms, 1),
+            "expired": self.expired,
+            "skipped": list(self.skipped),
+            "truncated": list(self.truncated),
+        }
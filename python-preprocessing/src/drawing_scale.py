@@ -0,0 +1,180 @@
+"""
+Drawing Scale Normalization
+
+Pixel constants across the pipeline (travel lane widths, aisle widths,
+morphology kernels, density windows) were tuned for drawings at roughly
+CANONICAL_PIXELS_PER_METER. A high-DPI export of the same drawing does
+several times the work and its features no longer match the heuristics.
+
+When the drawing scale is known (pixels_per_meter) or estimated from its
+stroke width, the pipeline analyses a copy resampled down to the canonical
+resolution and maps results back, so a 600 DPI export costs the same as a
+150 DPI one. Drawings below the canonical resolution are not upsampled;
+their pixel thresholds, detector width bands and morphology kernels are
+scaled down to the same physical size instead.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import cv2
+import numpy as np
+
+
+# Resolution the pixel constants are tuned for (25 mm per pixel)
+CANONICAL_PIXELS_PER_METER = 40.0
+
+# Typical line weight, in pixels, of a drawing at the canonical resolution
+CANONICAL_STROKE_PX = 2.0
+
+# Ink pixels a sample needs before its stroke width is trusted
+MIN_STROKE_SAMPLE_PIXELS = 500
+
+
+def meters_to_pixels(meters: float, pixels_per_meter: float = CANONICAL_PIXELS_PER_METER) -> int:
+    """
+    Convert a physical length to pixels (at least 1).
+
+    Args:
+        meters: Length in meters
+        pixels_per_meter: Resolution of the image being analysed
+
+    Returns:
+        Length in pixels
+    """
+    return max(1, round(meters * pixels_per_meter))
+
+
+def scale_kernel_size(size: int, scale: float) -> int:
+    """
+    Scale a canonical morphology kernel or window size.
+
+    Args:
+        size: Size in canonical pixels
+        scale: Parameter scale (see DrawingScale.parameter_scale)
+
+    Returns:
+        Odd size of at least 3 pixels
+    """
+    scaled = max(3, round(size * scale))
+    return scaled if scaled % 2 else scaled + 1
+
+
+@dataclass
+class DrawingScale:
+    """Resolution of a drawing and how it was determined"""
+    pixels_per_meter: Optional[float]  # None when unknown
+    source: str  # "input", "estimated" or "unknown"
+    canonical_pixels_per_meter: float = CANONICAL_PIXELS_PER_METER
+
+    @property
+    def normalization_scale(self) -> float:
+        """Resampling factor down to the canonical resolution (never above 1)."""
+        if self.pixels_per_meter is None:
+            return 1.0
+        return min(1.0, self.canonical_pixels_per_meter / self.pixels_per_meter)
+
+    def parameter_scale(self, analysis_scale: float) -> float:
+        """
+        Factor for canonical pixel constants when analysing at analysis_scale.
+
+        With a known scale, constants keep their physical size; without one
+        they follow the resampling (the pre-normalization behaviour).
+
+        Args:
+            analysis_scale: Scale of the analysed copy relative to the input
+
+        Returns:
+            Multiplier for pixel-valued parameters
+        """
+        if self.pixels_per_meter is None:
+            return analysis_scale
+        return self.pixels_per_meter * analysis_scale / self.canonical_pixels_per_meter
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "pixels_per_meter": (
+                round(self.pixels_per_meter, 3) if self.pixels_per_meter is not None else None
+            ),
+            "source": self.source,
+            "canonical_pixels_per_meter": self.canonical_pixels_per_meter,
+        }
+
+
+def estimate_stroke_width(image: np.ndarray, sample_size: int = 1024) -> Optional[float]:
+    """
+    Median line weight of the drawing, from a central sample.
+
+    Ink is separated with Otsu's threshold; the distance transform along
+    each stroke's ridge is half its width.
+
+    Args:
+        image: BGR or grayscale image
+        sample_size: Side of the central square sampled (full resolution)
+
+    Returns:
+        Stroke width in pixels, or None if the sample has too little ink
+    """
+    h, w = image.shape[:2]
+    y0, x0 = max(0, (h - sample_size) // 2), max(0, (w - sample_size) // 2)
+    crop = image[y0:y0 + sample_size, x0:x0 + sample_size]
+    gray = cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY) if crop.ndim == 3 else crop
+
+    _, ink = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    if cv2.countNonZero(ink) < MIN_STROKE_SAMPLE_PIXELS:
+        return None
+    dist = cv2.distanceTransform(ink, cv2.DIST_L2, 3)
+    ridge = (dist >= cv2.dilate(dist, np.ones((3, 3), np.uint8))) & (ink > 0)
+    return float(2 * np.median(dist[ridge]))
+
+
+def estimate_pixels_per_meter(
+    image: np.ndarray,
+    canonical_pixels_per_meter: float = CANONICAL_PIXELS_PER_METER,
+) -> Optional[float]:
+    """
+    Estimate drawing resolution from its stroke width.
+
+    Strokes thicker than CANONICAL_STROKE_PX mean a proportionally finer
+    export. Thinner strokes cannot be told apart from a thin pen, so the
+    estimate never goes below the canonical resolution.
+
+    Args:
+        image: BGR or grayscale image
+        canonical_pixels_per_meter: Canonical resolution
+
+    Returns:
+        Estimated pixels per meter, or None if no strokes were found
+    """
+    stroke = estimate_stroke_width(image)
+    if stroke is None:
+        return None
+    return canonical_pixels_per_meter * max(1.0, stroke / CANONICAL_STROKE_PX)
+
+
+def resolve_drawing_scale(
+    image: np.ndarray,
+    pixels_per_meter: Optional[float] = None,
+    estimate: bool = False,
+    canonical_pixels_per_meter: float = CANONICAL_PIXELS_PER_METER,
+) -> DrawingScale:
+    """
+    Drawing scale from the caller, an estimate, or unknown.
+
+    Args:
+        image: Input image (only read when estimating)
+        pixels_per_meter: Known scale, e.g. from the floorplan's mm per pixel
+        estimate: Estimate the scale when pixels_per_meter is not given
+        canonical_pixels_per_meter: Canonical resolution
+
+    Returns:
+        DrawingScale
+    """
+    if pixels_per_meter is not None:
+        return DrawingScale(pixels_per_meter, "input", canonical_pixels_per_meter)
+    if estimate:
+        estimated = estimate_pixels_per_meter(image, canonical_pixels_per_meter)
+        if estimated is not None:
+            return DrawingScale(estimated, "estimated", canonical_pixels_per_meter)
+    return DrawingScale(None, "unknown", canonical_pixels_per_meter)
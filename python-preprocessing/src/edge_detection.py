@@ -10,6 +10,8 @@ import numpy as np
 from typing import List, Tuple, Dict, Any
 from dataclasses import dataclass
 
+from .result_encoding import PointList
+
 
 @dataclass
 class BoundaryLine:
@@ -268,10 +270,7 @@ def edge_result_to_dict(result: EdgeDetectionResult) -> Dict[str, Any]:
         ],
         "contours": [
             {
-                "vertices": [
-                    {"x": int(pt[0][0]), "y": int(pt[0][1])}
-                    for pt in contour
-                ],
+                "vertices": PointList(contour),
                 "area": int(cv2.contourArea(contour)),
                 "perimeter": round(cv2.arcLength(contour, True), 2),
             }
@@ -0,0 +1,233 @@
+"""
+Size-Budgeted Gemini Hints
+
+generate_gemini_hints and the Phase 0 merge copy every significant contour,
+region, line cluster, aisle and colored boundary into the hints, with full
+vertex lists. On dense drawings that reaches hundreds of KB of prompt.
+apply_hint_budget ranks each category by significance, keeps the top K,
+simplifies polygons to a vertex budget and then drops the lowest-ranked
+items until the hints fit a byte (or approximate token) budget. What was
+cut is reported under hints["truncation"].
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+# Rough prompt-token size of JSON text
+BYTES_PER_TOKEN = 4
+
+
+def _area(item: Dict[str, Any]) -> float:
+    return float(item.get("area", 0))
+
+
+def _aisle_score(item: Dict[str, Any]) -> float:
+    # Two-sided validated aisles first, then confidence, then length
+    box = item.get("bounding_box", {})
+    length = max(box.get("width", 0), box.get("height", 0))
+    return (
+        (1.0 if item.get("two_sided_validated") else 0.0)
+        + float(item.get("confidence", 0.5))
+        + length * 1e-6
+    )
+
+
+# (path in the hints, significance score, polygon/polyline key, closed)
+HINT_CATEGORIES: Tuple[Tuple[Tuple[str, ...], Callable[[Dict[str, Any]], float], Optional[str], bool], ...] = (
+    (("detected_boundaries", "suggested_zone_polygons"), _area, "vertices", True),
+    (("detected_colored_boundaries",), lambda b: _area(b) * float(b.get("confidence", 1.0)), "polygon", True),
+    (("region_analysis", "dense_regions"), lambda r: _area(r) * (0.5 + float(r.get("density_score", 0))), None, True),
+    (("region_analysis", "sparse_regions"), _area, None, True),
+    (("racking_analysis", "racking_sections"), lambda c: float(c.get("line_count", 0)), None, True),
+    (("racking_analysis", "detected_aisles"), _aisle_score, "centerline", False),
+)
+
+
+@dataclass
+class HintBudget:
+    """Limits applied to Gemini hints (None disables a limit)"""
+    max_items_per_category: Optional[int] = 25
+    max_vertices: Optional[int] = 32  # Per polygon / polyline
+    max_bytes: Optional[int] = 48_000  # Serialized (compact) JSON size
+    max_tokens: Optional[int] = None  # Approximate, BYTES_PER_TOKEN bytes each
+
+    def __post_init__(self):
+        for name in ("max_items_per_category", "max_bytes", "max_tokens"):
+            value = getattr(self, name)
+            if value is not None and value < 0:
+                raise ValueError(f"{name} must be non-negative")
+        if self.max_vertices is not None and self.max_vertices < 3:
+            raise ValueError("max_vertices must be at least 3")
+
+    @property
+    def byte_limit(self) -> Optional[int]:
+        """Effective byte limit from max_bytes and max_tokens."""
+        limits = [] if self.max_bytes is None else [self.max_bytes]
+        if self.max_tokens is not None:
+            limits.append(self.max_tokens * BYTES_PER_TOKEN)
+        return min(limits) if limits else None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HintBudget":
+        """Create from a dict of field overrides (unknown keys raise ValueError)."""
+        unknown = set(data) - set(cls.__dataclass_fields__)
+        if unknown:
+            raise ValueError(f"Unknown hint budget fields: {sorted(unknown)}")
+        return cls(**data)
+
+    @classmethod
+    def unlimited(cls) -> "HintBudget":
+        """Budget that keeps every item and vertex."""
+        return cls(max_items_per_category=None, max_vertices=None, max_bytes=None)
+
+
+def simplify_polygon(points: List[Any], max_vertices: int, closed: bool = True) -> List[Any]:
+    """
+    Simplify a polygon or polyline to at most max_vertices points.
+
+    Uses Douglas-Peucker with the smallest tolerance (found by bisection)
+    that meets the budget; points keep their input form ({x, y} dicts or
+    [x, y] pairs).
+
+    Args:
+        points: Vertices as {"x", "y"} dicts or (x, y) pairs
+        max_vertices: Vertex budget (at least 3)
+        closed: Whether the shape is a closed polygon
+
+    Returns:
+        The original list if within budget, else the simplified vertices
+    """
+    if len(points) <= max_vertices:
+        return points
+    as_dicts = isinstance(points[0], dict)
+    coords = np.array(
+        [(p["x"], p["y"]) for p in points] if as_dicts else [tuple(p[:2]) for p in points],
+        dtype=np.float32,
+    ).reshape(-1, 1, 2)
+    span = float(np.ptp(coords.reshape(-1, 2), axis=0).max()) or 1.0
+
+    low, high = 0.0, span
+    best = None
+    for _ in range(20):
+        epsilon = (low + high) / 2
+        approx = cv2.approxPolyDP(coords, epsilon, closed)
+        if len(approx) <= max_vertices:
+            best, high = approx, epsilon
+        else:
+            low = epsilon
+    if best is None or len(best) > max_vertices:
+        best = coords[np.linspace(0, len(coords) - 1, max_vertices).round().astype(int)]
+
+    simplified = [(int(round(x)), int(round(y))) for x, y in best.reshape(-1, 2)]
+    if as_dicts:
+        return [{"x": x, "y": y} for x, y in simplified]
+    return [list(p) if isinstance(points[0], list) else p for p in simplified]
+
+
+def _size(value: Any) -> int:
+    return len(json.dumps(value, separators=(",", ":"), default=_json_default))
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _get_list(hints: Dict[str, Any], path: Tuple[str, ...]) -> Optional[list]:
+    node: Any = hints
+    for key in path:
+        if not isinstance(node, dict) or key not in node:
+            return None
+        node = node[key]
+    return node if isinstance(node, list) else None
+
+
+def _set_list(hints: Dict[str, Any], path: Tuple[str, ...], items: list) -> None:
+    node = hints
+    for key in path[:-1]:
+        node[key] = dict(node[key])
+        node = node[key]
+    node[path[-1]] = items
+
+
+def apply_hint_budget(hints: Dict[str, Any], budget: Optional[HintBudget] = None) -> Dict[str, Any]:
+    """
+    Rank, simplify and truncate hint categories to fit a budget.
+
+    Items in each category are sorted by significance (area, density,
+    line count, confidence and two-sided validation). The top
+    max_items_per_category are kept and their polygons simplified to
+    max_vertices. If the hints still exceed the byte limit, the
+    lowest-ranked item of the largest category is dropped until they fit.
+
+    Args:
+        hints: Hints from generate_gemini_hints / fast-track generation
+        budget: Limits to apply (default HintBudget())
+
+    Returns:
+        New hints dict (the input is not modified) with a "truncation"
+        report: per-category total/kept counts, simplified polygon count,
+        final size and whether anything was cut
+    """
+    budget = budget or HintBudget()
+    result = dict(hints)
+    categories: Dict[str, Dict[str, Any]] = {}
+    ranked: Dict[Tuple[str, ...], list] = {}
+    simplified = 0
+
+    for path, score, shape_key, closed in HINT_CATEGORIES:
+        items = _get_list(result, path)
+        if items is None:
+            continue
+        order = sorted(items, key=score, reverse=True)
+        if budget.max_items_per_category is not None:
+            order = order[:budget.max_items_per_category]
+        if shape_key is not None and budget.max_vertices is not None:
+            for i, item in enumerate(order):
+                shape = item.get(shape_key)
+                if shape and len(shape) > budget.max_vertices:
+                    order[i] = {**item, shape_key: simplify_polygon(shape, budget.max_vertices, closed)}
+                    simplified += 1
+        ranked[path] = order
+        categories[path[-1]] = {"total": len(items), "kept": len(order)}
+
+    limit = budget.byte_limit
+    report = {
+        "truncated": True,
+        "categories": categories,
+        "simplified_polygons": simplified,
+        "max_vertices": budget.max_vertices,
+        "byte_limit": limit,
+        "bytes": limit or 0,
+    }
+    result["truncation"] = report
+
+    if limit is not None and ranked:
+        # Drop from the tail of the largest category until the hints fit
+        item_sizes = {path: [_size(item) + 1 for item in items] for path, items in ranked.items()}
+        for path in ranked:
+            _set_list(result, path, [])
+        size = _size(result) + sum(sum(sizes) for sizes in item_sizes.values())
+        while size > limit:
+            path = max(item_sizes, key=lambda p: sum(item_sizes[p]))
+            if not item_sizes[path]:
+                break
+            size -= item_sizes[path].pop()
+            ranked[path].pop()
+        for path, items in ranked.items():
+            categories[path[-1]]["kept"] = len(items)
+
+    for path, items in ranked.items():
+        _set_list(result, path, items)
+
+    report["truncated"] = simplified > 0 or any(c["kept"] < c["total"] for c in categories.values())
+    report["bytes"] = _size(result)
+    return result
@@ -0,0 +1,305 @@
+"""
+Header-Only Image Probing
+
+cv2.imdecode allocates the full BGR image before anything knows its size:
+a 30000x30000 PNG costs 2.7 GB just to learn it should have been tiled or
+rejected. probe_image_header reads the PNG, JPEG or TIFF header (no pixel
+data) for the dimensions, channel count and bit depth, so callers can
+enforce a pixel ceiling, pick a memory-budget analysis scale and choose a
+reduced-resolution decode before decoding.
+
+Reduced decoding (cv2.IMREAD_REDUCED_COLOR_2/4/8) is native for JPEG:
+libjpeg scales during the inverse DCT, so the full image never exists.
+For PNG and TIFF OpenCV decodes at full size and then resizes, so a
+reduction cannot get them under the pixel ceiling: they are rejected
+instead.
+
+Example:
+    >>> info = probe_image_header(data)
+    >>> reduction = choose_reduction(info, max_pixels=DEFAULT_MAX_PIXELS)
+    >>> image = decode_image(data, reduction)
+"""
+
+import struct
+from dataclasses import dataclass
+import os
+from typing import Any, Dict, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+
+# Default pixel ceiling: 16384 x 16384 (about 805 MB decoded as BGR)
+DEFAULT_MAX_PIXELS = 16384 * 16384
+
+# Reduction factors OpenCV can decode at, and their imdecode flags
+REDUCTION_FACTORS = (1, 2, 4, 8)
+_DECODE_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+# Bytes read from a file before falling back to the whole file
+PROBE_HEAD_BYTES = 64 * 1024
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PNG_CHANNELS = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}  # By IHDR color type (3: palette)
+# JPEG start-of-frame markers (C4, C8 and CC are DHT, JPG and DAC)
+_JPEG_SOF = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+_TIFF_TYPE_SIZES = {3: ("H", 2), 4: ("I", 4)}  # SHORT, LONG
+
+Buffer = Union[bytes, bytearray, memoryview, np.ndarray]
+
+
+class ImageTooLargeError(ValueError):
+    """Raised when an image exceeds the pixel ceiling."""
+
+
+@dataclass
+class ImageInfo:
+    """Image properties read from the file header."""
+    format: str  # "png", "jpeg" or "tiff"
+    width: int
+    height: int
+    channels: int  # Stored color channels (palette PNGs count as 3)
+    bit_depth: int  # Bits per channel
+
+    @property
+    def pixels(self) -> int:
+        """Pixel count."""
+        return self.width * self.height
+
+    @property
+    def native_reduction(self) -> bool:
+        """Whether reduced decoding skips the full-size image (JPEG only)."""
+        return self.format == "jpeg"
+
+    def reduced_size(self, factor: int) -> Tuple[int, int]:
+        """(width, height) decoded with a reduction factor (upper bound)."""
+        return -(-self.width // factor), -(-self.height // factor)
+
+    def decoded_mb(self, factor: int = 1) -> float:
+        """Size of the decoded 8-bit BGR image in MiB."""
+        width, height = self.reduced_size(factor)
+        return width * height * 3 / 2**20
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "format": self.format,
+            "width": self.width,
+            "height": self.height,
+            "channels": self.channels,
+            "bit_depth": self.bit_depth,
+            "decoded_mb": round(self.decoded_mb(), 1),
+        }
+
+
+@dataclass
+class DecodedImage:
+    """A decoded image with its probed header and decode reduction."""
+    image: Optional[np.ndarray]  # None if the data could not be decoded
+    info: Optional[ImageInfo]  # None for formats that cannot be probed
+    reduction: int = 1  # Decoded at 1/reduction of the original size per side
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "reduction": self.reduction,
+            "width": self.image.shape[1] if self.image is not None else None,
+            "height": self.image.shape[0] if self.image is not None else None,
+            "original": self.info.to_dict() if self.info is not None else None,
+        }
+
+
+def _probe_png(data: memoryview) -> Optional[ImageInfo]:
+    if len(data) < 26 or bytes(data[12:16]) != b"IHDR":
+        return None
+    width, height = struct.unpack(">II", data[16:24])
+    channels = _PNG_CHANNELS.get(data[25])
+    if channels is None:
+        return None
+    return ImageInfo("png", width, height, channels, data[24])
+
+
+def _probe_jpeg(data: memoryview) -> Optional[ImageInfo]:
+    i = 2
+    while i + 4 <= len(data):
+        if data[i] != 0xFF:
+            return None
+        marker = data[i + 1]
+        if marker == 0xFF:  # Fill byte
+            i += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:  # Markers without a length
+            i += 2
+            continue
+        if marker in _JPEG_SOF:
+            if i + 10 > len(data):
+                return None
+            precision, height, width, components = struct.unpack(">BHHB", data[i + 4:i + 10])
+            return ImageInfo("jpeg", width, height, components, precision)
+        if marker == 0xDA:  # Start of scan without a frame header
+            return None
+        i += 2 + struct.unpack(">H", data[i + 2:i + 4])[0]
+    return None
+
+
+def _probe_tiff(data: memoryview) -> Optional[ImageInfo]:
+    order = "<" if bytes(data[:2]) == b"II" else ">"
+    if len(data) < 8 or struct.unpack(order + "H", data[2:4])[0] != 42:  # 43 is BigTIFF
+        return None
+    offset = struct.unpack(order + "I", data[4:8])[0]
+    if offset + 2 > len(data):
+        return None
+    count = struct.unpack(order + "H", data[offset:offset + 2])[0]
+    tags: Dict[int, int] = {}
+    for entry in range(offset + 2, min(offset + 2 + 12 * count, len(data) - 11), 12):
+        tag, type_, n = struct.unpack(order + "HHI", data[entry:entry + 8])
+        if type_ not in _TIFF_TYPE_SIZES or tag not in (256, 257, 258, 277):
+            continue
+        code, size = _TIFF_TYPE_SIZES[type_]
+        at = entry + 8
+        if n * size > 4:  # Values stored elsewhere: read the first
+            at = struct.unpack(order + "I", data[entry + 8:entry + 12])[0]
+            if at + size > len(data):
+                continue
+        tags[tag] = struct.unpack(order + code, data[at:at + size])[0]
+    if 256 not in tags or 257 not in tags:
+        return None
+    return ImageInfo("tiff", tags[256], tags[257], tags.get(277, 1), tags.get(258, 1))
+
+
+def probe_image_header(data: Buffer) -> Optional[ImageInfo]:
+    """
+    Read dimensions, channels and bit depth from an encoded image header.
+
+    Args:
+        data: Encoded image bytes (PNG, JPEG or TIFF; the start is enough
+            for PNG, JPEG needs everything up to its frame header and TIFF
+            its first IFD)
+
+    Returns:
+        ImageInfo, or None for other formats and truncated or invalid headers
+    """
+    # Zero-copy view: the encoded buffer can be tens of MB
+    array = data.reshape(-1) if isinstance(data, np.ndarray) else np.frombuffer(data, np.uint8)
+    view = memoryview(array)
+    head = bytes(view[:8])
+    if head == _PNG_SIGNATURE:
+        info = _probe_png(view)
+    elif head[:2] == b"\xff\xd8":
+        info = _probe_jpeg(view)
+    elif head[:4] in (b"II*\x00", b"MM\x00*"):
+        info = _probe_tiff(view)
+    else:
+        return None
+    if info is None or info.width == 0 or info.height == 0:
+        return None
+    return info
+
+
+def probe_image_file(path: Union[str, os.PathLike]) -> Optional[ImageInfo]:
+    """
+    Probe an image file, reading only its head where that suffices.
+
+    Args:
+        path: Image file path
+
+    Returns:
+        ImageInfo, or None if the file is missing or not a probeable image
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(PROBE_HEAD_BYTES)
+            info = probe_image_header(head)
+            if info is None and len(head) == PROBE_HEAD_BYTES:
+                # Large JPEG metadata or a TIFF IFD past the head
+                info = probe_image_header(head + f.read())
+    except OSError:
+        return None
+    return info
+
+
+def check_pixel_limit(info: ImageInfo, max_pixels: Optional[int]) -> None:
+    """
+    Reject an image above the pixel ceiling.
+
+    Args:
+        info: Probed image
+        max_pixels: Pixel ceiling (None: unlimited)
+
+    Raises:
+        ImageTooLargeError: If the image has more than max_pixels pixels
+    """
+    if max_pixels is not None and info.pixels > max_pixels:
+        raise ImageTooLargeError(
+            f"Image is {info.width}x{info.height} ({info.pixels / 1e6:.0f} MP), above the "
+            f"{max_pixels / 1e6:.0f} MP limit; tile it or request a reduced decode"
+        )
+
+
+def choose_reduction(
+    info: ImageInfo,
+    max_pixels: Optional[int] = None,
+    analysis_scale: float = 1.0,
+) -> int:
+    """
+    Pick the decode reduction factor for an image.
+
+    The analysis scale (e.g. from a memory budget or drawing-scale
+    normalization) allows reductions it would downsample to anyway; the
+    pixel ceiling may require a larger one. Only JPEG reduces while
+    decoding, so other formats above the ceiling are rejected rather than
+    decoded at full size.
+
+    Args:
+        info: Probed image
+        max_pixels: Pixel ceiling for the decoded image (None: unlimited)
+        analysis_scale: Scale the pipeline would analyse the full image at
+
+    Returns:
+        One of REDUCTION_FACTORS
+
+    Raises:
+        ImageTooLargeError: If even the largest reduction exceeds max_pixels,
+            or a format without native reduction exceeds it at full size
+    """
+    if not info.native_reduction and max_pixels is not None and info.pixels > max_pixels:
+        raise ImageTooLargeError(
+            f"Image is {info.width}x{info.height} ({info.pixels / 1e6:.0f} MP), above the "
+            f"{max_pixels / 1e6:.0f} MP limit; only JPEG can be decoded reduced, so tile it "
+            f"or send a JPEG"
+        )
+    factor = max(f for f in REDUCTION_FACTORS if f * analysis_scale <= 1.0 + 1e-9)
+    for f in REDUCTION_FACTORS:
+        width, height = info.reduced_size(f)
+        if f >= factor and (max_pixels is None or width * height <= max_pixels):
+            return f
+    raise ImageTooLargeError(
+        f"Image is {info.width}x{info.height}; even a 1/{REDUCTION_FACTORS[-1]} decode "
+        f"exceeds the {max_pixels / 1e6:.0f} MP limit"
+    )
+
+
+def decode_image(data: Buffer, reduction: int = 1) -> Optional[np.ndarray]:
+    """
+    Decode an encoded image to 8-bit BGR, optionally at reduced resolution.
+
+    Args:
+        data: Encoded image bytes
+        reduction: One of REDUCTION_FACTORS
+
+    Returns:
+        BGR image (about 1/reduction of the original size per side), or
+        None if the data cannot be decoded
+
+    Raises:
+        ValueError: If reduction is not in REDUCTION_FACTORS
+    """
+    if reduction not in _DECODE_FLAGS:
+        raise ValueError(f"reduction must be one of {REDUCTION_FACTORS}")
+    array = data.reshape(-1) if isinstance(data, np.ndarray) else np.frombuffer(data, np.uint8)
+    return cv2.imdecode(array, _DECODE_FLAGS[reduction])
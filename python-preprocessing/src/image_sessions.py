@@ -0,0 +1,263 @@
+"""
+Image Sessions for Floorplan Preprocessing
+
+Keeps decoded floorplan images server-side under opaque handles so an
+editing session uploads the image once. Later requests reference the
+handle (optionally with a region of interest) instead of re-sending
+base64 pixels, and derived features such as the Hough line store
+are computed lazily once per session.
+
+Sessions expire after a TTL of inactivity, and the store evicts the least
+recently used sessions when the total memory footprint exceeds its cap.
+"""
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+
+
+DEFAULT_TTL_SECONDS = 15 * 60
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def estimate_nbytes(value: Any) -> int:
+    """
+    Approximate memory held by a cached value.
+
+    Counts NumPy arrays directly and the arrays held as attributes of
+    dataclass-like objects (e.g. HoughLineStore). Other values count as 0.
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_nbytes(v) for v in value)
+    if hasattr(value, "__dict__"):
+        return sum(v.nbytes for v in vars(value).values() if isinstance(v, np.ndarray))
+    return 0
+
+
+@dataclass
+class ImageSession:
+    """
+    A decoded image stored under a handle.
+
+    Attributes:
+        handle: Opaque session identifier
+        image: Decoded BGR image (treat as read-only)
+        created_at: Creation time (time.monotonic)
+        last_access: Last access time (time.monotonic)
+        features: Lazily computed derived features, keyed by name/params
+    """
+    handle: str
+    image: np.ndarray
+    created_at: float
+    last_access: float
+    features: Dict[Hashable, Any] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def nbytes(self) -> int:
+        """Image plus cached feature memory."""
+        return self.image.nbytes + sum(estimate_nbytes(v) for v in self.features.values())
+
+    def feature(self, key: Hashable, factory: Callable[[np.ndarray], Any]) -> Any:
+        """
+        Get a derived feature, computing it from the image on first use.
+
+        Args:
+            key: Cache key (include any parameters the feature depends on)
+            factory: Function computing the feature from the image
+
+        Returns:
+            Cached or freshly computed feature
+        """
+        with self._lock:
+            if key not in self.features:
+                self.features[key] = factory(self.image)
+            return self.features[key]
+
+
+class ImageSessionStore:
+    """
+    Thread-safe TTL + memory-capped store of ImageSessions.
+
+    Example:
+        store = ImageSessionStore(ttl_seconds=900, max_bytes=256 * 2**20)
+        session = store.put(image)
+        same = store.get(session.handle)
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            ttl_seconds: Seconds of inactivity before a session expires
+            max_bytes: Memory cap across all sessions (images + features)
+            clock: Time source, injectable for tests
+        """
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._sessions: "OrderedDict[str, ImageSession]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._evict_expired()
+            return len(self._sessions)
+
+    def __contains__(self, handle: str) -> bool:
+        with self._lock:
+            self._evict_expired()
+            return handle in self._sessions
+
+    @property
+    def total_bytes(self) -> int:
+        """Current memory footprint of all live sessions."""
+        with self._lock:
+            return sum(s.nbytes for s in self._sessions.values())
+
+    def put(self, image: np.ndarray) -> ImageSession:
+        """
+        Store an image under a new handle.
+
+        Args:
+            image: Decoded image (stored as-is, not copied)
+
+        Returns:
+            The new ImageSession
+
+        Raises:
+            ValueError: If the image alone exceeds the memory cap
+        """
+        if image.nbytes > self.max_bytes:
+            raise ValueError(
+                f"Image needs {image.nbytes} bytes, above the session cap of {self.max_bytes}"
+            )
+        now = self._clock()
+        session = ImageSession(
+            handle=secrets.token_urlsafe(16),
+            image=image,
+            created_at=now,
+            last_access=now,
+        )
+        with self._lock:
+            self._evict_expired()
+            self._sessions[session.handle] = session
+            self._enforce_cap(keep=session.handle)
+        return session
+
+    def get(self, handle: str) -> Optional[ImageSession]:
+        """
+        Look up a session and refresh its TTL.
+
+        Returns:
+            The ImageSession, or None if unknown or expired
+        """
+        with self._lock:
+            self._evict_expired()
+            session = self._sessions.get(handle)
+            if session is None:
+                return None
+            session.last_access = self._clock()
+            self._sessions.move_to_end(handle)
+            # Features computed since the last lookup count toward the cap
+            self._enforce_cap(keep=handle)
+            return session
+
+    def delete(self, handle: str) -> bool:
+        """Drop a session. Returns True if it existed."""
+        with self._lock:
+            return self._sessions.pop(handle, None) is not None
+
+    def stats(self) -> Dict[str, Any]:
+        """Session count and memory usage."""
+        with self._lock:
+            self._evict_expired()
+            return {
+                "sessions": len(self._sessions),
+                "total_bytes": sum(s.nbytes for s in self._sessions.values()),
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+    def _evict_expired(self) -> None:
+        """Remove sessions idle for longer than the TTL (caller holds lock)."""
+        cutoff = self._clock() - self.ttl_seconds
+        # OrderedDict is in access order, so expired sessions are at the front
+        while self._sessions:
+            handle, session = next(iter(self._sessions.items()))
+            if session.last_access > cutoff:
+                break
+            del self._sessions[handle]
+
+    def _enforce_cap(self, keep: Optional[str] = None) -> None:
+        """Evict least recently used sessions until under the cap (caller holds lock)."""
+        total = sum(s.nbytes for s in self._sessions.values())
+        for handle in list(self._sessions):
+            if total <= self.max_bytes:
+                break
+            if handle == keep:
+                continue
+            total -= self._sessions.pop(handle).nbytes
+
+
+def session_summary(session: ImageSession, store: ImageSessionStore) -> Dict[str, Any]:
+    """JSON-serializable description of a session for API responses."""
+    h, w = session.image.shape[:2]
+    return {
+        "handle": session.handle,
+        "width": w,
+        "height": h,
+        "bytes": session.nbytes,
+        "ttl_seconds": store.ttl_seconds,
+    }
+
+
+def roi_tuple(roi: Optional[Dict[str, Any]]) -> Optional[Tuple[int, int, int, int]]:
+    """Parse an {x, y, width, height} dict into a tuple (None passes through)."""
+    if roi is None:
+        return None
+    try:
+        return (int(roi["x"]), int(roi["y"]), int(roi["width"]), int(roi["height"]))
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid ROI {roi!r}: expected x, y, width, height") from e
+
+
+def crop_roi(
+    image: np.ndarray,
+    roi: Tuple[int, int, int, int],
+) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """
+    View of a region of interest, clipped to the image.
+
+    Args:
+        image: Full image
+        roi: (x, y, width, height) in image pixels
+
+    Returns:
+        Tuple of (view into image, (x0, y0) offset of the view)
+
+    Raises:
+        ValueError: If the clipped region is empty
+    """
+    x, y, width, height = roi
+    h, w = image.shape[:2]
+    x0, y0 = max(0, x), max(0, y)
+    x1, y1 = min(w, x + width), min(h, y + height)
+    if x1 <= x0 or y1 <= y0:
+        raise ValueError(f"ROI {roi} does not overlap the image")
+    return image[y0:y1, x0:x1], (x0, y0)
@@ -7,10 +7,21 @@ Also identifies gaps between line clusters (aisles).
 
 import cv2
 import numpy as np
-from typing import List, Tuple, Dict, Any, Optional
-from dataclasses import dataclass
+from scipy.ndimage import gaussian_filter1d
+from scipy.signal import find_peaks
+from typing import List, Tuple, Dict, Any, Optional, Callable
+from dataclasses import dataclass, field
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import inspect
 import math
+import time
+
+from .concurrency import get_governor
+from .deadline import Deadline, LOW_VALUE_AISLE_DETECTORS
+from .drawing_scale import scale_kernel_size
+from .line_store import HoughLineStore
+from .result_encoding import PointList
 
 # Type alias for use in function annotations
 Dict = dict  # Ensure Dict works with subscript
@@ -26,17 +37,82 @@ class LineSegment:
     midpoint: Tuple[int, int]
 
 
+# Columnar line storage: one record per segment, angles in 0-180 degrees
+LINE_DTYPE = np.dtype([
+    ("x1", np.int32),
+    ("y1", np.int32),
+    ("x2", np.int32),
+    ("y2", np.int32),
+    ("angle", np.float64),
+    ("length", np.float64),
+    ("mid_x", np.int32),
+    ("mid_y", np.int32),
+])
+
+
+def lines_to_array(segments: np.ndarray) -> np.ndarray:
+    """
+    Build a LINE_DTYPE array from raw (N, 4) x1, y1, x2, y2 segments.
+
+    Angles, lengths and midpoints are computed for all segments at once.
+    """
+    segments = np.asarray(segments, dtype=np.int32).reshape(-1, 4)
+    lines = np.empty(len(segments), dtype=LINE_DTYPE)
+    lines["x1"], lines["y1"] = segments[:, 0], segments[:, 1]
+    lines["x2"], lines["y2"] = segments[:, 2], segments[:, 3]
+
+    dx = (segments[:, 2] - segments[:, 0]).astype(np.float64)
+    dy = (segments[:, 3] - segments[:, 1]).astype(np.float64)
+    # Calculate angle (0 = horizontal, 90 = vertical), normalized to 0-180
+    angle = np.degrees(np.arctan2(dy, dx))
+    lines["angle"] = np.where(angle < 0, angle + 180, angle)
+    lines["length"] = np.sqrt(dx * dx + dy * dy)
+    lines["mid_x"] = (segments[:, 0] + segments[:, 2]) // 2
+    lines["mid_y"] = (segments[:, 1] + segments[:, 3]) // 2
+    return lines
+
+
+def array_to_line_segments(lines: np.ndarray) -> List[LineSegment]:
+    """Create LineSegment views of a LINE_DTYPE array (for serialization)."""
+    return [
+        LineSegment(
+            start=(x1, y1),
+            end=(x2, y2),
+            angle=angle,
+            length=length,
+            midpoint=(mx, my),
+        )
+        for x1, y1, x2, y2, angle, length, mx, my in lines.tolist()
+    ]
+
+
+def line_segments_to_array(lines: List[LineSegment]) -> np.ndarray:
+    """Pack LineSegment objects into a LINE_DTYPE array."""
+    arr = np.empty(len(lines), dtype=LINE_DTYPE)
+    for i, line in enumerate(lines):
+        arr[i] = (
+            line.start[0], line.start[1], line.end[0], line.end[1],
+            line.angle, line.length, line.midpoint[0], line.midpoint[1],
+        )
+    return arr
+
+
 @dataclass
 class LineCluster:
     """A group of parallel lines (likely a racking section)"""
     id: int
-    lines: List[LineSegment]
+    line_array: np.ndarray  # LINE_DTYPE records of the member lines
     dominant_angle: float  # Average angle of lines
     orientation: str  # "horizontal" or "vertical"
     bounding_box: Tuple[int, int, int, int]  # x, y, w, h
     average_spacing: float  # Average distance between lines
     line_count: int
 
+    @property
+    def lines(self) -> List[LineSegment]:
+        """Member lines as LineSegment objects (built on access)."""
+        return array_to_line_segments(self.line_array)
+
 
 @dataclass
 class AisleCandidate:
@@ -128,34 +204,55 @@ def validate_aisle_two_sided(
 @dataclass
 class LineDetectionResult:
     """Results from line detection"""
-    all_lines: List[LineSegment]
+    line_array: np.ndarray  # LINE_DTYPE records of all detected lines
     line_clusters: List[LineCluster]
     aisle_candidates: List[AisleCandidate]
-    orientation_map: np.ndarray  # Visualization of line orientations
+    image_shape: Tuple[int, int]  # (height, width) the lines were detected in
+    detector_stats: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # Per aisle detector
 
+    @property
+    def orientation_map(self) -> np.ndarray:
+        """Visualization of line orientations (drawn on access)."""
+        return create_orientation_map(self.image_shape, self.line_clusters)
 
-def detect_lines(
+    @property
+    def all_lines(self) -> List[LineSegment]:
+        """All detected lines as LineSegment objects (built on access)."""
+        return array_to_line_segments(self.line_array)
+
+
+def detect_line_array(
     image: np.ndarray,
     min_line_length: int = 30,
     max_line_gap: int = 10,
     threshold: int = 50,
-) -> List[LineSegment]:
+    line_store: Optional[HoughLineStore] = None,
+) -> np.ndarray:
     """
-    Detect all line segments in the image.
+    Detect all line segments in the image as a LINE_DTYPE array.
 
     Args:
         image: BGR or grayscale image
         min_line_length: Minimum line length to detect
         max_line_gap: Maximum gap to bridge
         threshold: Hough accumulator threshold
+        line_store: Optional precomputed segments for this image; used instead of
+            re-running Hough when its parameters are at least as loose
 
     Returns:
-        List of LineSegment objects
+        Structured array with fields x1, y1, x2, y2, angle, length, mid_x, mid_y
     """
+    if line_store is not None and line_store.covers(threshold, min_line_length, max_line_gap):
+        # A stricter accumulator threshold is approximated by segment length
+        min_length = min_line_length
+        if threshold > line_store.threshold:
+            min_length = max(min_line_length, threshold)
+        return lines_to_array(line_store.filter(min_length=min_length))
+
     if len(image.shape) == 3:
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
     else:
-        gray = image.copy()
+        gray = image
 
     # Edge detection
     edges = cv2.Canny(gray, 50, 150, apertureSize=3)
@@ -171,34 +268,42 @@ def detect_lines(
     )
 
     if lines is None:
-        return []
+        return np.empty(0, dtype=LINE_DTYPE)
 
-    segments = []
-    for line in lines:
-        x1, y1, x2, y2 = line[0]
+    return lines_to_array(lines)
 
-        # Calculate angle (0 = horizontal, 90 = vertical)
-        angle = math.degrees(math.atan2(y2 - y1, x2 - x1))
-        # Normalize to 0-180
-        if angle < 0:
-            angle += 180
 
-        length = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
-        midpoint = ((x1 + x2) // 2, (y1 + y2) // 2)
+def detect_lines(
+    image: np.ndarray,
+    min_line_length: int = 30,
+    max_line_gap: int = 10,
+    threshold: int = 50,
+    line_store: Optional[HoughLineStore] = None,
+) -> List[LineSegment]:
+    """
+    Detect all line segments in the image.
 
-        segments.append(LineSegment(
-            start=(x1, y1),
-            end=(x2, y2),
-            angle=angle,
-            length=length,
-            midpoint=midpoint,
-        ))
+    Args:
+        image: BGR or grayscale image
+        min_line_length: Minimum line length to detect
+        max_line_gap: Maximum gap to bridge
+        threshold: Hough accumulator threshold
+        line_store: Optional precomputed Hough segments for this image
 
-    return segments
+    Returns:
+        List of LineSegment objects
+    """
+    return array_to_line_segments(detect_line_array(
+        image,
+        min_line_length=min_line_length,
+        max_line_gap=max_line_gap,
+        threshold=threshold,
+        line_store=line_store,
+    ))
 
 
 def cluster_parallel_lines(
-    lines: List[LineSegment],
+    lines,
     angle_tolerance: float = 10.0,
     distance_threshold: float = 100.0,
 ) -> List[LineCluster]:
@@ -206,44 +311,37 @@ def cluster_parallel_lines(
     Group lines into clusters based on angle similarity and proximity.
 
     Args:
-        lines: List of detected lines
+        lines: LINE_DTYPE array or list of LineSegment objects
         angle_tolerance: Max angle difference for same cluster (degrees)
         distance_threshold: Max distance between lines in same cluster
 
     Returns:
         List of LineCluster objects
     """
-    if not lines:
+    if not isinstance(lines, np.ndarray):
+        lines = line_segments_to_array(lines)
+    if len(lines) == 0:
         return []
 
     # First, group by angle (horizontal vs vertical vs diagonal)
-    horizontal_lines = []  # angle close to 0 or 180
-    vertical_lines = []    # angle close to 90
-    diagonal_lines = []    # other angles
-
-    for line in lines:
-        # Normalize angle to 0-90 range for comparison
-        norm_angle = line.angle if line.angle <= 90 else 180 - line.angle
-
-        if norm_angle < 20:
-            horizontal_lines.append(line)
-        elif norm_angle > 70:
-            vertical_lines.append(line)
-        else:
-            diagonal_lines.append(line)
+    # Normalize angle to 0-90 range for comparison
+    angle = lines["angle"]
+    norm_angle = np.where(angle <= 90, angle, 180 - angle)
+    horizontal_lines = lines[norm_angle < 20]   # angle close to 0 or 180
+    vertical_lines = lines[norm_angle > 70]     # angle close to 90
 
     clusters = []
     cluster_id = 0
 
     # Process horizontal lines
-    if horizontal_lines:
+    if len(horizontal_lines):
         h_clusters = _cluster_by_position(horizontal_lines, "horizontal", distance_threshold)
         for c in h_clusters:
             cluster_id += 1
             clusters.append(_create_cluster(cluster_id, c, "horizontal"))
 
     # Process vertical lines
-    if vertical_lines:
+    if len(vertical_lines):
         v_clusters = _cluster_by_position(vertical_lines, "vertical", distance_threshold)
         for c in v_clusters:
             cluster_id += 1
@@ -253,83 +351,72 @@ def cluster_parallel_lines(
 
 
 def _cluster_by_position(
-    lines: List[LineSegment],
+    lines: np.ndarray,
     orientation: str,
     distance_threshold: float,
-) -> List[List[LineSegment]]:
+) -> List[np.ndarray]:
     """
     Cluster lines by their position (for grouping parallel lines).
 
     For horizontal lines, cluster by Y position.
     For vertical lines, cluster by X position.
+
+    Lines are visited in position order and join the current cluster while
+    within distance_threshold of its running mean position.
     """
-    if not lines:
+    if len(lines) == 0:
         return []
 
     # Sort by position
-    if orientation == "horizontal":
-        sorted_lines = sorted(lines, key=lambda l: l.midpoint[1])
-        get_pos = lambda l: l.midpoint[1]
-    else:
-        sorted_lines = sorted(lines, key=lambda l: l.midpoint[0])
-        get_pos = lambda l: l.midpoint[0]
+    key = "mid_y" if orientation == "horizontal" else "mid_x"
+    sorted_lines = lines[np.argsort(lines[key], kind="stable")]
+    positions = sorted_lines[key].tolist()
 
     clusters = []
-    current_cluster = [sorted_lines[0]]
+    start = 0
+    total = positions[0]
 
-    for line in sorted_lines[1:]:
+    for i in range(1, len(positions)):
         # Check if this line is close to the current cluster
-        cluster_pos = np.mean([get_pos(l) for l in current_cluster])
-        line_pos = get_pos(line)
-
-        if abs(line_pos - cluster_pos) < distance_threshold:
-            current_cluster.append(line)
+        cluster_pos = total / (i - start)
+        if abs(positions[i] - cluster_pos) < distance_threshold:
+            total += positions[i]
         else:
-            if len(current_cluster) >= 3:  # Minimum lines for a valid cluster
-                clusters.append(current_cluster)
-            current_cluster = [line]
+            if i - start >= 3:  # Minimum lines for a valid cluster
+                clusters.append(sorted_lines[start:i])
+            start = i
+            total = positions[i]
 
     # Don't forget the last cluster
-    if len(current_cluster) >= 3:
-        clusters.append(current_cluster)
+    if len(positions) - start >= 3:
+        clusters.append(sorted_lines[start:])
 
     return clusters
 
 
 def _create_cluster(
     cluster_id: int,
-    lines: List[LineSegment],
+    lines: np.ndarray,
     orientation: str,
 ) -> LineCluster:
-    """Create a LineCluster from a list of lines."""
+    """Create a LineCluster from a LINE_DTYPE array of member lines."""
     # Calculate bounding box
-    all_x = []
-    all_y = []
-    for line in lines:
-        all_x.extend([line.start[0], line.end[0]])
-        all_y.extend([line.start[1], line.end[1]])
-
-    x_min, x_max = min(all_x), max(all_x)
-    y_min, y_max = min(all_y), max(all_y)
+    x_min = int(min(lines["x1"].min(), lines["x2"].min()))
+    x_max = int(max(lines["x1"].max(), lines["x2"].max()))
+    y_min = int(min(lines["y1"].min(), lines["y2"].min()))
+    y_max = int(max(lines["y1"].max(), lines["y2"].max()))
 
     # Calculate average angle
-    avg_angle = np.mean([line.angle for line in lines])
+    avg_angle = float(np.mean(lines["angle"]))
 
     # Calculate average spacing
-    if orientation == "horizontal":
-        positions = sorted([line.midpoint[1] for line in lines])
-    else:
-        positions = sorted([line.midpoint[0] for line in lines])
-
-    if len(positions) > 1:
-        spacings = [positions[i+1] - positions[i] for i in range(len(positions) - 1)]
-        avg_spacing = np.mean(spacings)
-    else:
-        avg_spacing = 0
+    key = "mid_y" if orientation == "horizontal" else "mid_x"
+    positions = np.sort(lines[key])
+    avg_spacing = float(np.mean(np.diff(positions))) if len(positions) > 1 else 0
 
     return LineCluster(
         id=cluster_id,
-        lines=lines,
+        line_array=lines,
         dominant_angle=avg_angle,
         orientation=orientation,
         bounding_box=(x_min, y_min, x_max - x_min, y_max - y_min),
@@ -463,6 +550,7 @@ def detect_aisles_from_brightness_profile(
     min_aisle_width: int = 8,
     max_aisle_width: int = 80,
     min_racking_band_height: int = 100,
+    deadline: Optional[Deadline] = None,
 ) -> List[AisleCandidate]:
     """
     Detect aisles using 1D brightness profiling with precise peak finding.
@@ -483,6 +571,8 @@ def detect_aisles_from_brightness_profile(
         min_aisle_width: Minimum aisle width in pixels (default 8 - narrow aisles are common)
         max_aisle_width: Maximum aisle width in pixels
         min_racking_band_height: Minimum height of racking region to analyze
+        deadline: Optional request deadline; once it expires the bands not
+            yet analyzed are skipped and the aisles found so far returned
 
     Returns:
         List of AisleCandidate objects with precise positions
@@ -528,6 +618,9 @@ def detect_aisles_from_brightness_profile(
 
     # Step 2: For each racking band, compute column brightness profile
     for band_start, band_end in racking_bands:
+        if deadline is not None and deadline.expired:
+            deadline.truncate("aisle_detectors.brightness_profile")
+            return aisles
         # Extract band region
         band = gray[band_start:band_end, :]
         band_height = band_end - band_start
@@ -537,12 +630,9 @@ def detect_aisles_from_brightness_profile(
 
         # Apply moderate Gaussian smoothing to reduce noise while preserving narrow aisles
         # sigma=3 smooths over ~9 pixel window - enough to remove noise but keep narrow aisles
-        from scipy.ndimage import gaussian_filter1d
         smoothed = gaussian_filter1d(col_brightness, sigma=3)
 
         # Find local maxima (brightness peaks = aisle centers)
-        from scipy.signal import find_peaks
-
         # Calculate adaptive prominence based on signal range
         # This helps detect aisles in both high-contrast and low-contrast regions
         signal_range = np.max(smoothed) - np.min(smoothed)
@@ -662,16 +752,17 @@ def detect_aisles_from_brightness_profile(
         racking_bands_h.append((start, w))
 
     for band_start, band_end in racking_bands_h:
+        if deadline is not None and deadline.expired:
+            deadline.truncate("aisle_detectors.brightness_profile")
+            return aisles
         band = gray[:, band_start:band_end]
         band_width = band_end - band_start
 
         row_brightness = np.mean(band, axis=1)
 
-        from scipy.ndimage import gaussian_filter1d
         # Use same stronger smoothing as vertical detection
         smoothed = gaussian_filter1d(row_brightness, sigma=5)
 
-        from scipy.signal import find_peaks
         # Same stricter parameters as vertical
         peaks, peak_props = find_peaks(
             smoothed,
@@ -747,6 +838,7 @@ def detect_aisles_from_gradient_edges(
     min_aisle_width: int = 8,
     max_aisle_width: int = 80,
     min_aisle_length: int = 100,
+    deadline: Optional[Deadline] = None,
 ) -> List[AisleCandidate]:
     """
     Detect aisles by finding pairs of opposing gradient edges.
@@ -763,6 +855,8 @@ def detect_aisles_from_gradient_edges(
         min_aisle_width: Minimum aisle width in pixels
         max_aisle_width: Maximum aisle width in pixels
         min_aisle_length: Minimum length to be considered an aisle
+        deadline: Optional request deadline; once it expires the bands not
+            yet analyzed are skipped and the aisles found so far returned
 
     Returns:
         List of AisleCandidate objects
@@ -815,6 +909,9 @@ def detect_aisles_from_gradient_edges(
         return aisles
 
     for band_start, band_end in racking_bands:
+        if deadline is not None and deadline.expired:
+            deadline.truncate("aisle_detectors.gradient_edges")
+            return aisles
         # Compute gradient profile within this band
         band_gradient = sobel_x[band_start:band_end, :]
 
@@ -822,11 +919,9 @@ def detect_aisles_from_gradient_edges(
         avg_gradient = np.mean(band_gradient, axis=0)
 
         # Smooth to reduce noise
-        from scipy.ndimage import gaussian_filter1d
         smoothed_grad = gaussian_filter1d(avg_gradient, sigma=3)
 
         # Find positive peaks (left edges: dark -> light)
-        from scipy.signal import find_peaks
         left_edges, left_props = find_peaks(smoothed_grad, distance=min_aisle_width, prominence=5)
 
         # Find negative peaks (right edges: light -> dark)
@@ -899,13 +994,14 @@ def detect_aisles_from_gradient_edges(
         racking_bands_h.append((racking_cols[start_idx], racking_cols[-1]))
 
     for band_start, band_end in racking_bands_h:
+        if deadline is not None and deadline.expired:
+            deadline.truncate("aisle_detectors.gradient_edges")
+            return aisles
         band_gradient = sobel_y[:, band_start:band_end]
         avg_gradient = np.mean(band_gradient, axis=1)
 
-        from scipy.ndimage import gaussian_filter1d
         smoothed_grad = gaussian_filter1d(avg_gradient, sigma=3)
 
-        from scipy.signal import find_peaks
         top_edges, _ = find_peaks(smoothed_grad, distance=min_aisle_width, prominence=5)
         bottom_edges, _ = find_peaks(-smoothed_grad, distance=min_aisle_width, prominence=5)
 
@@ -1338,6 +1434,7 @@ def detect_travel_lanes_morphological(
     min_width: int = 40,
     min_length: int = 200,
     whiteness_threshold: int = 200,
+    param_scale: float = 1.0,
 ) -> List[AisleCandidate]:
     """
     Detect travel lanes using morphological operations.
@@ -1353,6 +1450,8 @@ def detect_travel_lanes_morphological(
         min_width: Minimum width of travel lane
         min_length: Minimum length of travel lane
         whiteness_threshold: Brightness threshold for "white" pixels
+        param_scale: Factor for the canonical kernel sizes
+            (see DrawingScale.parameter_scale)
 
     Returns:
         List of AisleCandidate objects representing travel lanes
@@ -1374,11 +1473,13 @@ def detect_travel_lanes_morphological(
 
     # Morphological closing to connect nearby white regions
     # This helps bridge small gaps in travel lanes
-    kernel_close = cv2.getStructuringElement(cv2.MORPH_RECT, (15, 15))
+    close_size = scale_kernel_size(15, param_scale)
+    kernel_close = cv2.getStructuringElement(cv2.MORPH_RECT, (close_size, close_size))
     closed = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel_close)
 
     # Morphological opening to remove small noise
-    kernel_open = cv2.getStructuringElement(cv2.MORPH_RECT, (10, 10))
+    open_size = scale_kernel_size(10, param_scale)
+    kernel_open = cv2.getStructuringElement(cv2.MORPH_RECT, (open_size, open_size))
     opened = cv2.morphologyEx(closed, cv2.MORPH_OPEN, kernel_open)
 
     # Find contours of white regions
@@ -1446,31 +1547,40 @@ def detect_travel_lanes_morphological(
     return travel_lanes
 
 
-def detect_aisles(
-    image: np.ndarray,
-    line_clusters: List[LineCluster],
-    min_aisle_width: int = 20,
-    max_aisle_width: int = 200,
-) -> List[AisleCandidate]:
-    """
-    Detect aisles using multiple methods:
-    1. Gaps between line clusters
-    2. White space analysis for internal aisles
+# Aisle detector registry: name -> fn(gray, line_clusters, min_aisle_width, max_aisle_width).
+# Registration order is the order candidates are merged (and numbered) in.
+AisleDetector = Callable[[np.ndarray, List[LineCluster], int, int], List[AisleCandidate]]
+AISLE_DETECTORS: Dict[str, AisleDetector] = {}
 
-    Args:
-        image: Original image (for dimensions)
-        line_clusters: Detected line clusters
-        min_aisle_width: Minimum width to consider as aisle
-        max_aisle_width: Maximum width to consider as aisle
 
-    Returns:
-        List of AisleCandidate objects (deduplicated)
+def register_aisle_detector(name: str) -> Callable[[AisleDetector], AisleDetector]:
     """
-    h, w = image.shape[:2]
-    aisles = []
-    aisle_id = 0
+    Register an aisle detector under a name.
+
+    Detectors receive the shared grayscale image and line clusters, must not
+    modify them, and return AisleCandidate objects (ids are reassigned).
+    Detectors with a ``deadline`` keyword also receive the request Deadline
+    and should return what they have found once it expires; detectors with
+    a ``param_scale`` keyword receive the factor for their canonical pixel
+    constants (see DrawingScale.parameter_scale).
+    """
+    def decorator(fn: AisleDetector) -> AisleDetector:
+        if name in AISLE_DETECTORS:
+            raise ValueError(f"Aisle detector '{name}' is already registered")
+        AISLE_DETECTORS[name] = fn
+        return fn
+    return decorator
+
 
-    # Method 1: Gaps between line clusters
+@register_aisle_detector("cluster_gaps")
+def _detect_cluster_gap_aisles(
+    gray: np.ndarray,
+    line_clusters: List[LineCluster],
+    min_aisle_width: int,
+    max_aisle_width: int,
+) -> List[AisleCandidate]:
+    """Gaps between line clusters."""
+    aisles = []
     h_clusters = [c for c in line_clusters if c.orientation == "horizontal"]
     v_clusters = [c for c in line_clusters if c.orientation == "vertical"]
 
@@ -1486,7 +1596,6 @@ def detect_aisles(
             gap_width = gap_end - gap_start
 
             if min_aisle_width <= gap_width <= max_aisle_width:
-                aisle_id += 1
                 centerline_y = (gap_start + gap_end) // 2
 
                 # Aisle spans the full width where both clusters exist
@@ -1497,7 +1606,7 @@ def detect_aisles(
                 )
 
                 aisles.append(AisleCandidate(
-                    id=aisle_id,
+                    id=0,
                     centerline=[(x_start, centerline_y), (x_end, centerline_y)],
                     width=gap_width,
                     orientation="horizontal",
@@ -1517,7 +1626,6 @@ def detect_aisles(
             gap_width = gap_end - gap_start
 
             if min_aisle_width <= gap_width <= max_aisle_width:
-                aisle_id += 1
                 centerline_x = (gap_start + gap_end) // 2
 
                 # Aisle spans the full height where both clusters exist
@@ -1528,7 +1636,7 @@ def detect_aisles(
                 )
 
                 aisles.append(AisleCandidate(
-                    id=aisle_id,
+                    id=0,
                     centerline=[(centerline_x, y_start), (centerline_x, y_end)],
                     width=gap_width,
                     orientation="vertical",
@@ -1536,115 +1644,109 @@ def detect_aisles(
                     adjacent_clusters=[c1.id, c2.id],
                 ))
 
-    # Method 2: NEW - Brightness profile with precise peak finding (PRIMARY METHOD)
-    # Uses 1D column brightness analysis with scipy peak detection
-    # This gives PIXEL-ACCURATE positions (no bucket rounding)
-    # KEY: min_aisle_width=8 to catch narrow aisles in dense racking
-    profile_aisles = detect_aisles_from_brightness_profile(
-        image,
-        min_aisle_width=8,  # Narrow aisles are common in dense racking
-        max_aisle_width=80,
-        min_racking_band_height=80,
-    )
+    return aisles
 
-    # Add profile-detected aisles (highest accuracy)
-    for p_aisle in profile_aisles:
-        aisle_id += 1
-        aisles.append(AisleCandidate(
-            id=aisle_id,
-            centerline=p_aisle.centerline,
-            width=p_aisle.width,
-            orientation=p_aisle.orientation,
-            bounding_box=p_aisle.bounding_box,
-            adjacent_clusters=[],
-            confidence=p_aisle.confidence,
-            detection_method="brightness_profile",
-            line_density_left=p_aisle.line_density_left,
-            line_density_right=p_aisle.line_density_right,
-        ))
 
-    # Method 3: NEW - Gradient edge detection (SECONDARY METHOD)
-    # Finds opposing gradient pairs (dark->light and light->dark transitions)
-    # Provides additional validation and catches aisles missed by brightness
-    gradient_aisles = detect_aisles_from_gradient_edges(
-        image,
-        min_aisle_width=8,  # Match brightness profile constraint
-        max_aisle_width=80,
-        min_aisle_length=80,
-    )
+def _px(value: int, param_scale: float) -> int:
+    """A canonical pixel constant at the analysed image's scale (at least 1)."""
+    return max(1, round(value * param_scale))
 
-    # Add gradient-detected aisles
-    for g_aisle in gradient_aisles:
-        aisle_id += 1
-        aisles.append(AisleCandidate(
-            id=aisle_id,
-            centerline=g_aisle.centerline,
-            width=g_aisle.width,
-            orientation=g_aisle.orientation,
-            bounding_box=g_aisle.bounding_box,
-            adjacent_clusters=[],
-            confidence=g_aisle.confidence,
-            detection_method="gradient_edges",
-            line_density_left=g_aisle.line_density_left,
-            line_density_right=g_aisle.line_density_right,
-        ))
-
-    # Method 4: Line-pair detection (edge-density based)
-    # Focus on corridors bounded by dark lines on both sides
-    line_pair_aisles = detect_aisles_from_line_pairs(
-        image,
-        min_aisle_width=8,  # Match other methods
-        max_aisle_width=80,
-        min_aisle_length=100,
-        scan_window=30,
-    )
 
-    # Add line-pair aisles with renumbered IDs
-    for lp_aisle in line_pair_aisles:
-        aisle_id += 1
-        aisles.append(AisleCandidate(
-            id=aisle_id,
-            centerline=lp_aisle.centerline,
-            width=lp_aisle.width,
-            orientation=lp_aisle.orientation,
-            bounding_box=lp_aisle.bounding_box,
+def _relabel(aisles: List[AisleCandidate], method: str) -> List[AisleCandidate]:
+    """Copy detector output into fresh candidates tagged with a method name."""
+    return [
+        AisleCandidate(
+            id=0,
+            centerline=a.centerline,
+            width=a.width,
+            orientation=a.orientation,
+            bounding_box=a.bounding_box,
             adjacent_clusters=[],
-            confidence=lp_aisle.confidence,
-            detection_method="line_pair",
-            line_density_left=lp_aisle.line_density_left,
-            line_density_right=lp_aisle.line_density_right,
-        ))
+            confidence=a.confidence,
+            detection_method=method,
+            line_density_left=a.line_density_left,
+            line_density_right=a.line_density_right,
+        )
+        for a in aisles
+    ]
 
-    # Method 4: White space analysis for TRAVEL LANES (wider corridors)
+
+@register_aisle_detector("brightness_profile")
+def _detect_brightness_profile_aisles(
+    gray, line_clusters, min_aisle_width, max_aisle_width, deadline=None, param_scale=1.0,
+):
+    """Brightness profile with precise peak finding (primary method)."""
+    # Uses 1D column brightness analysis with scipy peak detection
+    # This gives PIXEL-ACCURATE positions (no bucket rounding)
+    # KEY: min_aisle_width=8 to catch narrow aisles in dense racking
+    return _relabel(detect_aisles_from_brightness_profile(
+        gray,
+        min_aisle_width=_px(8, param_scale),  # Narrow aisles are common in dense racking
+        max_aisle_width=_px(80, param_scale),
+        min_racking_band_height=_px(80, param_scale),
+        deadline=deadline,
+    ), "brightness_profile")
+
+
+@register_aisle_detector("gradient_edges")
+def _detect_gradient_edge_aisles(
+    gray, line_clusters, min_aisle_width, max_aisle_width, deadline=None, param_scale=1.0,
+):
+    """Opposing gradient pairs (secondary method)."""
+    # Finds opposing gradient pairs (dark->light and light->dark transitions)
+    # Provides additional validation and catches aisles missed by brightness
+    return _relabel(detect_aisles_from_gradient_edges(
+        gray,
+        min_aisle_width=_px(8, param_scale),  # Match brightness profile constraint
+        max_aisle_width=_px(80, param_scale),
+        min_aisle_length=_px(80, param_scale),
+        deadline=deadline,
+    ), "gradient_edges")
+
+
+@register_aisle_detector("line_pair")
+def _detect_line_pair_aisles(gray, line_clusters, min_aisle_width, max_aisle_width, param_scale=1.0):
+    """Corridors bounded by dark lines on both sides (edge-density based)."""
+    return _relabel(detect_aisles_from_line_pairs(
+        gray,
+        min_aisle_width=_px(8, param_scale),  # Match other methods
+        max_aisle_width=_px(80, param_scale),
+        min_aisle_length=_px(100, param_scale),
+        scan_window=_px(30, param_scale),
+    ), "line_pair")
+
+
+@register_aisle_detector("whitespace")
+def _detect_whitespace_travel_lanes(gray, line_clusters, min_aisle_width, max_aisle_width, param_scale=1.0):
+    """White space analysis for travel lanes (wider corridors)."""
     # Travel lanes are typically 50-300px wide, much wider than racking aisles
     whitespace_aisles = detect_aisles_from_whitespace(
-        image,
-        min_aisle_width=50,   # Travel lanes are wider
-        max_aisle_width=300,  # Can be quite wide
-        min_aisle_length=300, # Should be substantial length
+        gray,
+        min_aisle_width=_px(50, param_scale),   # Travel lanes are wider
+        max_aisle_width=_px(300, param_scale),  # Can be quite wide
+        min_aisle_length=_px(300, param_scale), # Should be substantial length
     )
-
-    # Add whitespace aisles with travel_lane detection method
-    for ws_aisle in whitespace_aisles:
-        aisle_id += 1
-        aisles.append(AisleCandidate(
-            id=aisle_id,
-            centerline=ws_aisle.centerline,
-            width=ws_aisle.width,
-            orientation=ws_aisle.orientation,
-            bounding_box=ws_aisle.bounding_box,
+    return [
+        AisleCandidate(
+            id=0,
+            centerline=ws.centerline,
+            width=ws.width,
+            orientation=ws.orientation,
+            bounding_box=ws.bounding_box,
             adjacent_clusters=[],
             confidence=0.5,
             detection_method="travel_lane",
-        ))
-
-    # Method 5: Morphological travel lane detection
-    # Uses dilation/erosion to find large connected whitespace regions
-    travel_lanes = detect_travel_lanes_morphological(image)
-    for tl in travel_lanes:
-        aisle_id += 1
-        aisles.append(AisleCandidate(
-            id=aisle_id,
+        )
+        for ws in whitespace_aisles
+    ]
+
+
+@register_aisle_detector("travel_lane_morph")
+def _detect_morphological_travel_lanes(gray, line_clusters, min_aisle_width, max_aisle_width, param_scale=1.0):
+    """Dilation/erosion to find large connected whitespace regions."""
+    return [
+        AisleCandidate(
+            id=0,
             centerline=tl.centerline,
             width=tl.width,
             orientation=tl.orientation,
@@ -1652,14 +1754,151 @@ def detect_aisles(
             adjacent_clusters=[],
             confidence=tl.confidence,
             detection_method="travel_lane_morph",
-        ))
+        )
+        for tl in detect_travel_lanes_morphological(
+            gray,
+            min_width=_px(40, param_scale),
+            min_length=_px(200, param_scale),
+            param_scale=param_scale,
+        )
+    ]
 
-    # Apply two-sided validation to all aisles
-    # This filters out false positives that don't have dark content on both sides
+
+def resolve_aisle_detectors(toggles: Optional[Dict[str, bool]] = None) -> List[str]:
+    """
+    Names of enabled aisle detectors, in registration order.
+
+    Args:
+        toggles: Optional name -> enabled map; unlisted detectors stay enabled
+
+    Returns:
+        List of enabled detector names
+    """
+    toggles = toggles or {}
+    unknown = set(toggles) - set(AISLE_DETECTORS)
+    if unknown:
+        raise ValueError(
+            f"Unknown aisle detector(s): {sorted(unknown)}. "
+            f"Available: {list(AISLE_DETECTORS)}"
+        )
+    return [name for name in AISLE_DETECTORS if toggles.get(name, True)]
+
+
+def detect_aisles(
+    image: np.ndarray,
+    line_clusters: List[LineCluster],
+    min_aisle_width: int = 20,
+    max_aisle_width: int = 200,
+    detectors: Optional[Dict[str, bool]] = None,
+    max_workers: int = 4,
+) -> List[AisleCandidate]:
+    """
+    Detect aisles using the registered detectors (see AISLE_DETECTORS).
+
+    Args:
+        image: Original image (for dimensions)
+        line_clusters: Detected line clusters
+        min_aisle_width: Minimum width to consider as aisle
+        max_aisle_width: Maximum width to consider as aisle
+        detectors: Optional name -> enabled toggles (default: all enabled)
+        max_workers: Maximum detectors run concurrently
+
+    Returns:
+        List of AisleCandidate objects (deduplicated)
+    """
+    aisles, _ = detect_aisles_with_stats(
+        image, line_clusters, min_aisle_width, max_aisle_width, detectors, max_workers
+    )
+    return aisles
+
+
+def detect_aisles_with_stats(
+    image: np.ndarray,
+    line_clusters: List[LineCluster],
+    min_aisle_width: int = 20,
+    max_aisle_width: int = 200,
+    detectors: Optional[Dict[str, bool]] = None,
+    max_workers: int = 4,
+    deadline: Optional[Deadline] = None,
+    param_scale: float = 1.0,
+) -> Tuple[List[AisleCandidate], Dict[str, Dict[str, Any]]]:
+    """
+    Detect aisles and report per-detector timing and candidate counts.
+
+    Enabled detectors run concurrently on a shared grayscale image. Their
+    candidates are merged in registration order, numbered, validated for
+    dark content on both sides and deduplicated.
+
+    With a deadline, low-value detectors are skipped once half the budget
+    is spent. Detectors that accept the deadline stop at their next unit of
+    work when it expires and return the aisles found so far; every started
+    detector is waited for, so none outlives the call.
+
+    param_scale multiplies the detectors' own canonical pixel constants
+    (width bands, minimum lengths, kernels) for images analysed at another
+    resolution; min_aisle_width and max_aisle_width are used as given.
+
+    Returns:
+        Tuple of (aisles, stats) where stats maps detector name to
+        {"time_ms": float, "candidates": int} (plus "truncated": True for
+        partial results), or {"skipped": True}
+    """
+    deadline = deadline or Deadline()
+    names = [
+        name for name in resolve_aisle_detectors(detectors)
+        if name not in LOW_VALUE_AISLE_DETECTORS
+        or deadline.allows(f"aisle_detectors.{name}", low_value=True)
+    ]
+
+    # Shared input for all detectors
     if len(image.shape) == 3:
-        gray_for_validation = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
     else:
-        gray_for_validation = image
+        gray = image
+
+    def run(name: str) -> Optional[Tuple[List[AisleCandidate], float]]:
+        # Queued detectors that would start after the deadline are skipped
+        if not deadline.allows(f"aisle_detectors.{name}"):
+            return None
+        detector = AISLE_DETECTORS[name]
+        accepted = inspect.signature(detector).parameters
+        kwargs = {
+            key: value
+            for key, value in (("deadline", deadline), ("param_scale", param_scale))
+            if key in accepted
+        }
+        start = time.perf_counter()
+        found = detector(gray, line_clusters, min_aisle_width, max_aisle_width, **kwargs)
+        return found, (time.perf_counter() - start) * 1000
+
+    with get_governor().parallel_region("aisle_detectors", max(1, min(max_workers, len(names)))) as region:
+        if region.workers == 1:
+            results = {name: run(name) for name in names}
+        else:
+            # Waits for every detector: those taking the deadline stop early
+            with ThreadPoolExecutor(max_workers=region.workers) as executor:
+                futures = {name: executor.submit(region.wrap(run), name) for name in names}
+            results = {name: future.result() for name, future in futures.items()}
+    outputs = {name: output for name, output in results.items() if output is not None}
+
+    aisles = []
+    stats: Dict[str, Dict[str, Any]] = {}
+    for name in resolve_aisle_detectors(detectors):
+        if name not in outputs:
+            stats[name] = {"skipped": True}
+            deadline.truncate("aisle_detectors")
+            continue
+        found, elapsed_ms = outputs[name]
+        stats[name] = {"time_ms": round(elapsed_ms, 2), "candidates": len(found)}
+        if f"aisle_detectors.{name}" in deadline.truncated:
+            stats[name]["truncated"] = True
+        for aisle in found:
+            aisle.id = len(aisles) + 1
+            aisles.append(aisle)
+
+    # Apply two-sided validation to all aisles
+    # This filters out false positives that don't have dark content on both sides
+    gray_for_validation = gray
 
     validated_aisles = []
     for aisle in aisles:
@@ -1700,25 +1939,27 @@ def detect_aisles(
     # TUNED: Reduced merge distance from 20px to 15px for more distinct aisles
     deduped_aisles = deduplicate_aisles(validated_aisles, merge_distance=15)
 
-    return deduped_aisles
+    return deduped_aisles, stats
 
 
 def create_orientation_map(
     image_shape: Tuple[int, int],
     line_clusters: List[LineCluster],
+    scale: float = 1.0,
 ) -> np.ndarray:
     """
     Create a visualization of line orientations.
 
     Args:
-        image_shape: (height, width)
+        image_shape: (height, width) of the image the clusters come from
         line_clusters: Detected clusters
+        scale: Output scale; < 1 draws a preview directly at reduced size
 
     Returns:
         Color image with clusters visualized by orientation
     """
     h, w = image_shape
-    vis = np.zeros((h, w, 3), dtype=np.uint8)
+    vis = np.zeros((max(1, round(h * scale)), max(1, round(w * scale)), 3), dtype=np.uint8)
 
     for cluster in line_clusters:
         # Color by orientation
@@ -1729,11 +1970,17 @@ def create_orientation_map(
 
         # Draw bounding box
         x, y, cw, ch = cluster.bounding_box
+        if scale != 1.0:
+            x, y, cw, ch = (int(round(v * scale)) for v in (x, y, cw, ch))
         cv2.rectangle(vis, (x, y), (x + cw, y + ch), color, 2)
 
         # Draw lines
-        for line in cluster.lines:
-            cv2.line(vis, line.start, line.end, color, 1)
+        la = cluster.line_array
+        if len(la):
+            pts = np.stack([la["x1"], la["y1"], la["x2"], la["y2"]], axis=1).reshape(-1, 2, 2)
+            if scale != 1.0:
+                pts = np.round(pts * scale).astype(np.int32)
+            cv2.polylines(vis, list(pts), False, color, 1)
 
     return vis
 
@@ -1742,6 +1989,13 @@ def process_lines(
     image: np.ndarray,
     min_line_length: int = 30,
     distance_threshold: float = 100.0,
+    line_store: Optional[HoughLineStore] = None,
+    aisle_detectors: Optional[Dict[str, bool]] = None,
+    aisle_detector_workers: int = 4,
+    deadline: Optional[Deadline] = None,
+    min_aisle_width: int = 20,
+    max_aisle_width: int = 200,
+    param_scale: float = 1.0,
 ) -> LineDetectionResult:
     """
     Main line detection pipeline.
@@ -1750,27 +2004,42 @@ def process_lines(
         image: BGR image
         min_line_length: Minimum line length to detect
         distance_threshold: Distance for clustering
+        line_store: Optional precomputed Hough segments for this image
+        aisle_detectors: Optional name -> enabled toggles for aisle detectors
+        aisle_detector_workers: Maximum aisle detectors run concurrently
+        deadline: Optional request deadline (see detect_aisles_with_stats)
+        min_aisle_width: Minimum aisle width passed to the aisle detectors
+        max_aisle_width: Maximum aisle width passed to the aisle detectors
+        param_scale: Factor for the aisle detectors' canonical pixel
+            constants (see detect_aisles_with_stats)
 
     Returns:
         LineDetectionResult
     """
     # Detect all lines
-    lines = detect_lines(image, min_line_length=min_line_length)
+    lines = detect_line_array(image, min_line_length=min_line_length, line_store=line_store)
 
     # Cluster parallel lines
     clusters = cluster_parallel_lines(lines, distance_threshold=distance_threshold)
 
     # Detect aisles
-    aisles = detect_aisles(image, clusters)
-
-    # Create visualization
-    orientation_map = create_orientation_map(image.shape[:2], clusters)
+    aisles, detector_stats = detect_aisles_with_stats(
+        image,
+        clusters,
+        min_aisle_width=min_aisle_width,
+        max_aisle_width=max_aisle_width,
+        detectors=aisle_detectors,
+        max_workers=aisle_detector_workers,
+        deadline=deadline,
+        param_scale=param_scale,
+    )
 
     return LineDetectionResult(
-        all_lines=lines,
+        line_array=lines,
         line_clusters=clusters,
         aisle_candidates=aisles,
-        orientation_map=orientation_map,
+        image_shape=image.shape[:2],
+        detector_stats=detector_stats,
     )
 
 
@@ -1798,7 +2067,7 @@ def line_result_to_dict(result: LineDetectionResult) -> Dict[str, Any]:
                 "id": int(aisle.id),
                 "orientation": aisle.orientation,
                 "width": round(float(aisle.width), 2),
-                "centerline": [{"x": int(p[0]), "y": int(p[1])} for p in aisle.centerline],
+                "centerline": PointList(aisle.centerline),
                 "bounding_box": {
                     "x": int(aisle.bounding_box[0]),
                     "y": int(aisle.bounding_box[1]),
@@ -1817,7 +2086,7 @@ def line_result_to_dict(result: LineDetectionResult) -> Dict[str, Any]:
             for aisle in result.aisle_candidates
         ],
         "stats": {
-            "total_lines": len(result.all_lines),
+            "total_lines": len(result.line_array),
             "total_clusters": len(result.line_clusters),
             "horizontal_clusters": len([c for c in result.line_clusters if c.orientation == "horizontal"]),
             "vertical_clusters": len([c for c in result.line_clusters if c.orientation == "vertical"]),
@@ -1827,5 +2096,6 @@ def line_result_to_dict(result: LineDetectionResult) -> Dict[str, Any]:
             "brightness_profile_aisles": len([a for a in result.aisle_candidates if a.detection_method == "brightness_profile"]),
             "gradient_edges_aisles": len([a for a in result.aisle_candidates if a.detection_method == "gradient_edges"]),
             "line_pair_aisles": len([a for a in result.aisle_candidates if a.detection_method == "line_pair"]),
+            "aisle_detectors": result.detector_stats,
         }
     }
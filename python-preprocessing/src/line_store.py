@@ -0,0 +1,123 @@
+"""
+Hough Line Store for Floorplan Preprocessing
+
+Runs Canny + probabilistic Hough once per image and keeps the segments,
+so line detection can filter them by length instead of re-running the
+transform. The pipeline builds one store per image, and image sessions
+cache it so repeated requests on the same image skip the Hough pass.
+
+HoughLinesP does not report accumulator votes. A segment of length L is
+supported by roughly L collinear edge pixels, so a caller that wants a
+stricter accumulator threshold filters on a minimum length of at least
+that threshold.
+"""
+
+from dataclasses import dataclass, field
+from typing import Tuple
+
+import cv2
+import numpy as np
+
+from .density_maps import to_gray
+
+
+# line_detection.detect_lines defaults
+DEFAULT_THRESHOLD = 50
+DEFAULT_MIN_LINE_LENGTH = 30
+DEFAULT_MAX_LINE_GAP = 10
+
+
+@dataclass
+class HoughLineStore:
+    """
+    Line segments extracted once from an image.
+
+    Attributes:
+        segments: (N, 4) int32 array of x1, y1, x2, y2
+        image_shape: (height, width) of the source image
+        threshold: Hough accumulator threshold used
+        min_line_length: Minimum segment length used
+        max_line_gap: Maximum gap used
+    """
+    segments: np.ndarray
+    image_shape: Tuple[int, int]
+    threshold: int = DEFAULT_THRESHOLD
+    min_line_length: int = DEFAULT_MIN_LINE_LENGTH
+    max_line_gap: int = DEFAULT_MAX_LINE_GAP
+    lengths: np.ndarray = field(init=False, repr=False)
+    angles: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.segments = np.asarray(self.segments, dtype=np.int32).reshape(-1, 4)
+        dx = (self.segments[:, 2] - self.segments[:, 0]).astype(np.float64)
+        dy = (self.segments[:, 3] - self.segments[:, 1]).astype(np.float64)
+        self.lengths = np.sqrt(dx * dx + dy * dy)
+        # 0 = horizontal, 90 = vertical, normalized to 0-180
+        angles = np.degrees(np.arctan2(dy, dx))
+        self.angles = np.where(angles < 0, angles + 180, angles)
+
+    @classmethod
+    def from_image(
+        cls,
+        image: np.ndarray,
+        threshold: int = DEFAULT_THRESHOLD,
+        min_line_length: int = DEFAULT_MIN_LINE_LENGTH,
+        max_line_gap: int = DEFAULT_MAX_LINE_GAP,
+    ) -> "HoughLineStore":
+        """
+        Extract line segments from an image.
+
+        Args:
+            image: BGR or grayscale image
+            threshold: Hough accumulator threshold
+            min_line_length: Minimum line length to detect
+            max_line_gap: Maximum gap to bridge
+
+        Returns:
+            HoughLineStore with all detected segments
+        """
+        edges = cv2.Canny(to_gray(image), 50, 150, apertureSize=3)
+        lines = cv2.HoughLinesP(
+            edges,
+            rho=1,
+            theta=np.pi / 180,
+            threshold=threshold,
+            minLineLength=min_line_length,
+            maxLineGap=max_line_gap,
+        )
+        segments = np.zeros((0, 4), dtype=np.int32) if lines is None else lines
+        return cls(
+            segments=segments,
+            image_shape=image.shape[:2],
+            threshold=threshold,
+            min_line_length=min_line_length,
+            max_line_gap=max_line_gap,
+        )
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    def covers(
+        self,
+        threshold: int,
+        min_line_length: float,
+        max_line_gap: int,
+    ) -> bool:
+        """Whether this store is at least as loose as the given parameters."""
+        return (
+            self.threshold <= threshold
+            and self.min_line_length <= min_line_length
+            and self.max_line_gap >= max_line_gap
+        )
+
+    def filter(self, min_length: float = 0.0) -> np.ndarray:
+        """
+        Segments at least min_length long, as an (M, 4) int32 array.
+
+        Args:
+            min_length: Keep segments at least this long
+
+        Returns:
+            (M, 4) array of x1, y1, x2, y2
+        """
+        return self.segments[self.lengths >= min_length]
@@ -0,0 +1,310 @@
+"""
+Peak-Memory Accounting for Floorplan Preprocessing
+
+Measures the peak memory of pipeline stages with tracemalloc and
+estimates the peak of a whole run from per-megapixel stage costs, so a
+memory budget can force tiling or coarse-to-fine processing before a
+large image is touched.
+
+NumPy reports its data buffers to tracemalloc under its own domain
+(np.lib.tracemalloc_domain), so measured peaks include arrays returned
+by OpenCV; OpenCV's internal scratch buffers are not counted. The NumPy
+domain is also used to measure what a stage leaves resident (its output
+arrays), which accumulates across stages.
+"""
+
+import logging
+import threading
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MB = 2**20
+
+# Pipeline stages in execution order (see pipeline.preprocess_floorplan)
+PIPELINE_STAGES = (
+    "phase0", "boundary", "edges", "segmentation", "line_store", "lines", "travel_lanes",
+)
+
+# Coarse-to-fine never analyses below this fraction of the original side length
+MIN_ANALYSIS_SCALE = 0.125
+
+# tracemalloc is process-global: one measurement at a time (nesting is per thread)
+_PROFILE_LOCK = threading.RLock()
+
+
+@dataclass
+class PeakMemory:
+    """
+    Memory used while running one function.
+
+    Attributes:
+        peak_bytes: Peak traced allocation above the level at the start
+        retained_numpy_bytes: NumPy array bytes still alive afterwards
+    """
+    peak_bytes: int
+    retained_numpy_bytes: int
+
+    @property
+    def peak_mb(self) -> float:
+        """Peak in MiB."""
+        return self.peak_bytes / MB
+
+    def to_dict(self) -> Dict[str, float]:
+        """Convert to dictionary (MiB)."""
+        return {
+            "peak_mb": round(self.peak_bytes / MB, 2),
+            "retained_numpy_mb": round(self.retained_numpy_bytes / MB, 2),
+        }
+
+
+def _numpy_bytes(snapshot: tracemalloc.Snapshot) -> int:
+    numpy_only = snapshot.filter_traces([tracemalloc.DomainFilter(True, np.lib.tracemalloc_domain)])
+    return sum(stat.size for stat in numpy_only.statistics("filename"))
+
+
+def measure_peak_memory(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Tuple[Any, PeakMemory]:
+    """
+    Call a function and measure its peak memory with tracemalloc.
+
+    Starts tracing if it is not already running (and stops it again
+    afterwards). When nested inside another measurement the outer peak
+    is reset, so the outer peak only covers what follows.
+
+    tracemalloc has one process-wide peak, so concurrent measurements
+    are serialized: a measurement in another thread waits for this one.
+    Allocations by unrelated threads running meanwhile are still counted.
+
+    Args:
+        fn: Function to call
+        *args: Positional arguments for fn
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        Tuple of (fn's return value, PeakMemory)
+    """
+    with _PROFILE_LOCK:
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        try:
+            numpy_before = _numpy_bytes(tracemalloc.take_snapshot()) if was_tracing else 0
+            tracemalloc.reset_peak()
+            start, _ = tracemalloc.get_traced_memory()
+            result = fn(*args, **kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+            numpy_after = _numpy_bytes(tracemalloc.take_snapshot())
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+    return result, PeakMemory(
+        peak_bytes=max(0, peak - start),
+        retained_numpy_bytes=max(0, numpy_after - numpy_before),
+    )
+
+
+@dataclass
+class StageMemoryCost:
+    """Per-megapixel memory cost of one stage."""
+    peak_mb_per_mp: float  # Transient peak above what was resident before the stage
+    retained_mb_per_mp: float = 0.0  # Arrays kept resident for later stages
+
+    def to_dict(self) -> Dict[str, float]:
+        """Convert to dictionary."""
+        return {
+            "peak_mb_per_mp": self.peak_mb_per_mp,
+            "retained_mb_per_mp": self.retained_mb_per_mp,
+        }
+
+
+def _default_stage_costs() -> Dict[str, StageMemoryCost]:
+    # tracemalloc peaks on synthetic warehouse floorplans (1-4 MP,
+    # tests/fixtures/color_boundary_fixtures.create_warehouse_floorplan);
+    # lines is the 4 MP rate (it also has a ~5 MB fixed cost). Retained is
+    # what the pipeline keeps: the Phase 0 mask, the bit-packed boundary
+    # mask and the uint8 density map (see visualizations.LazyVisualizations)
+    return {
+        "phase0": StageMemoryCost(7.6, 0.95),
+        "boundary": StageMemoryCost(4.8, 0.0),
+        "edges": StageMemoryCost(6.7, 0.12),
+        "segmentation": StageMemoryCost(14.3, 0.95),
+        "line_store": StageMemoryCost(1.9, 0.0),
+        "lines": StageMemoryCost(40.1, 0.0),
+        "travel_lanes": StageMemoryCost(10.5, 0.0),
+    }
+
+
+@dataclass
+class MemoryEstimator:
+    """
+    Estimates the peak memory of a preprocessing run from its image size.
+
+    Stages run one after another: each adds its transient peak on top of
+    the input image and the outputs retained by earlier stages. When the
+    analysis runs on a downscaled copy (scale < 1), stages listed in
+    full_resolution_stages still see the original image.
+
+    Example:
+        >>> estimator = MemoryEstimator()
+        >>> estimator.estimate_peak_mb(16000, 12000)
+        >>> estimator.scale_for_budget(16000, 12000, budget_mb=4096)
+    """
+    stage_costs: Dict[str, StageMemoryCost] = field(default_factory=_default_stage_costs)
+    stages: Sequence[str] = PIPELINE_STAGES
+    full_resolution_stages: Sequence[str] = ("phase0",)
+    channels: int = 3
+
+    def estimate_peak_bytes(self, width: int, height: int, scale: float = 1.0) -> int:
+        """
+        Estimate the peak bytes of a run.
+
+        Args:
+            width: Image width in pixels
+            height: Image height in pixels
+            scale: Analysis scale for stages not in full_resolution_stages
+
+        Returns:
+            Estimated peak bytes, including the input image
+        """
+        pixels = width * height
+        resident = pixels * self.channels
+        if scale < 1.0:
+            resident += int(pixels * scale * scale) * self.channels  # Downscaled copy
+        peak = resident
+        for name in self.stages:
+            cost = self.stage_costs.get(name)
+            if cost is None:
+                continue
+            stage_scale = 1.0 if name in self.full_resolution_stages else scale
+            mp = pixels * stage_scale * stage_scale / 1e6
+            peak = max(peak, resident + cost.peak_mb_per_mp * mp * MB)
+            resident += cost.retained_mb_per_mp * mp * MB
+        return int(peak)
+
+    def estimate_peak_mb(self, width: int, height: int, scale: float = 1.0) -> float:
+        """Estimate the peak of a run in MiB."""
+        return self.estimate_peak_bytes(width, height, scale) / MB
+
+    def stage_estimates_mb(self, width: int, height: int) -> Dict[str, float]:
+        """Full-resolution transient peak of each stage in MiB."""
+        mp = width * height / 1e6
+        return {
+            name: round(self.stage_costs[name].peak_mb_per_mp * mp, 1)
+            for name in self.stages
+            if name in self.stage_costs
+        }
+
+    def scale_for_budget(self, width: int, height: int, budget_mb: float) -> float:
+        """
+        Largest analysis scale whose estimated peak fits a budget.
+
+        Args:
+            width: Image width in pixels
+            height: Image height in pixels
+            budget_mb: Memory budget in MiB
+
+        Returns:
+            Scale in [MIN_ANALYSIS_SCALE, 1]; 1.0 if the full-resolution run
+            fits, MIN_ANALYSIS_SCALE if nothing does
+        """
+        if self.estimate_peak_mb(width, height) <= budget_mb:
+            return 1.0
+        if self.estimate_peak_mb(width, height, MIN_ANALYSIS_SCALE) > budget_mb:
+            logger.warning(
+                f"Memory budget {budget_mb:.0f} MB cannot be met for {width}x{height}; "
+                f"analysing at minimum scale {MIN_ANALYSIS_SCALE}"
+            )
+            return MIN_ANALYSIS_SCALE
+
+        # The estimate grows monotonically with scale
+        low, high = MIN_ANALYSIS_SCALE, 1.0
+        for _ in range(20):
+            mid = (low + high) / 2
+            if self.estimate_peak_mb(width, height, mid) <= budget_mb:
+                low = mid
+            else:
+                high = mid
+        return low
+
+    def calibrate(self, profiles: Iterable[Tuple[float, Dict[str, PeakMemory]]]) -> "MemoryEstimator":
+        """
+        Refit per-megapixel costs from measured stage profiles.
+
+        Each stage's cost is the least-squares slope through the origin of
+        its measurements against megapixels. Stages without measurements
+        keep their current costs. Profiles count a stage's whole output as
+        retained, an upper bound on what the pipeline keeps resident.
+
+        Args:
+            profiles: (megapixels, {stage: PeakMemory}) pairs, e.g. from
+                PreprocessingResult.memory_profile
+
+        Returns:
+            New MemoryEstimator
+        """
+        samples: Dict[str, list] = {}
+        for mp, profile in profiles:
+            for name, measurement in profile.items():
+                samples.setdefault(name, []).append((mp, measurement))
+
+        costs = dict(self.stage_costs)
+        for name, points in samples.items():
+            mp = np.array([p[0] for p in points], dtype=np.float64)
+            denominator = float(np.dot(mp, mp))
+            if denominator == 0:
+                continue
+            peak = np.array([p[1].peak_bytes for p in points], dtype=np.float64) / MB
+            retained = np.array([p[1].retained_numpy_bytes for p in points], dtype=np.float64) / MB
+            costs[name] = StageMemoryCost(
+                peak_mb_per_mp=float(np.dot(mp, peak)) / denominator,
+                retained_mb_per_mp=float(np.dot(mp, retained)) / denominator,
+            )
+        return MemoryEstimator(
+            stage_costs=costs,
+            stages=self.stages,
+            full_resolution_stages=self.full_resolution_stages,
+            channels=self.channels,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert stage costs to dictionary."""
+        return {name: cost.to_dict() for name, cost in self.stage_costs.items()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MemoryEstimator":
+        """Create from dictionary; missing stages keep defaults."""
+        costs = _default_stage_costs()
+        for name, cost in data.items():
+            costs[name] = StageMemoryCost(**cost)
+        return cls(stage_costs=costs)
+
+
+def profile_stage(
+    profile: Optional[Dict[str, PeakMemory]],
+    name: str,
+    fn: Callable[..., Any],
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """
+    Run a stage, recording its PeakMemory in profile when profiling.
+
+    Args:
+        profile: Dict to record into, or None to just call fn
+        name: Stage name
+        fn: Stage function
+        *args: Positional arguments for fn
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        fn's return value
+    """
+    if profile is None:
+        return fn(*args, **kwargs)
+    result, measurement = measure_peak_memory(fn, *args, **kwargs)
+    profile[name] = measurement
+    return result
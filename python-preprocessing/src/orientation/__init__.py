@@ -6,7 +6,12 @@ Handles multi-orientation detection and correction for floorplan images.
 
 from .models import OrientationHint, OrientationResult
 from .detector import OrientationDetector
-from .correction import rotate_image, correct_orientation
+from .correction import (
+    rotate_image,
+    correct_orientation,
+    correct_orientation_view,
+    OrientationTransform,
+)
 
 __all__ = [
     "OrientationHint",
@@ -14,4 +19,6 @@ __all__ = [
     "OrientationDetector",
     "rotate_image",
     "correct_orientation",
+    "correct_orientation_view",
+    "OrientationTransform",
 ]
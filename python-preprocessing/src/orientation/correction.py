@@ -2,9 +2,15 @@
 Image rotation correction utilities.
 
 Task 5.3: Implement Rotation Correction for Tiles
+
+OrientationTransform carries a correction as an affine map next to the
+image instead of producing a rotated copy: quarter turns are NumPy views
+(np.rot90), and results are mapped back with one matrix product over all
+polygon vertices rather than point by point.
 """
 
-from typing import Tuple, List, Optional
+from dataclasses import dataclass
+from typing import Tuple, List, Optional, Sequence
 import numpy as np
 import cv2
 
@@ -198,3 +204,153 @@ def transform_coordinates_after_rotation(
     inverse_degrees = (360 - degrees) % 360
     rotated_size = get_rotated_dimensions(original_size[0], original_size[1], degrees)
     return rotate_point(point, inverse_degrees, rotated_size)
+
+
+@dataclass(frozen=True)
+class OrientationTransform:
+    """
+    Affine map between original and oriented (rotated) image coordinates.
+
+    Quarter turns match rotate_image / rotate_point exactly; other angles
+    match rotate_image with expand=True.
+
+    Example:
+        >>> transform = OrientationTransform(90, width, height)
+        >>> view = transform.apply(image)  # No pixel copy
+        >>> polygons = transform.polygons_to_original(detected_polygons)
+    """
+    degrees: int
+    width: int  # Original image width
+    height: int  # Original image height
+
+    @classmethod
+    def from_result(cls, result: OrientationResult, width: int, height: int) -> "OrientationTransform":
+        """Transform applying an orientation result's correction."""
+        degrees = result.correction_degrees if result.needs_correction else 0
+        return cls(degrees % 360, width, height)
+
+    @property
+    def is_identity(self) -> bool:
+        """Whether the transform leaves coordinates unchanged."""
+        return self.degrees % 360 == 0
+
+    @property
+    def oriented_size(self) -> Tuple[int, int]:
+        """(width, height) of the oriented image."""
+        return get_rotated_dimensions(self.width, self.height, self.degrees)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """2x3 affine matrix mapping original to oriented coordinates."""
+        w, h = self.width, self.height
+        degrees = self.degrees % 360
+        if degrees == 0:
+            return np.array([[1, 0, 0], [0, 1, 0]], dtype=np.float64)
+        if degrees == 90:
+            return np.array([[0, -1, h - 1], [1, 0, 0]], dtype=np.float64)
+        if degrees == 180:
+            return np.array([[-1, 0, w - 1], [0, -1, h - 1]], dtype=np.float64)
+        if degrees == 270:
+            return np.array([[0, 1, 0], [-1, 0, w - 1]], dtype=np.float64)
+        # Same matrix as rotate_image(expand=True)
+        matrix = cv2.getRotationMatrix2D((w // 2, h // 2), -degrees, 1.0)
+        new_width, new_height = self.oriented_size
+        matrix[0, 2] += (new_width - w) / 2
+        matrix[1, 2] += (new_height - h) / 2
+        return matrix
+
+    @property
+    def inverse(self) -> np.ndarray:
+        """2x3 affine matrix mapping oriented to original coordinates."""
+        return cv2.invertAffineTransform(self.matrix)
+
+    def apply(self, image: np.ndarray) -> np.ndarray:
+        """
+        Orient an image.
+
+        Args:
+            image: Original image (H, W) or (H, W, C)
+
+        Returns:
+            The image itself for 0 degrees, a rotated NumPy view (no copy)
+            for quarter turns, else a warped copy
+        """
+        degrees = self.degrees % 360
+        if degrees == 0:
+            return image
+        if degrees % 90 == 0:
+            # np.rot90 turns counter-clockwise for positive k
+            return np.rot90(image, k=-(degrees // 90))
+        return cv2.warpAffine(image, self.matrix, self.oriented_size)
+
+    def to_oriented(self, points: np.ndarray) -> np.ndarray:
+        """
+        Map original-image points into the oriented image.
+
+        Args:
+            points: Array-like of (x, y) points, shape (N, 2)
+
+        Returns:
+            Array of shape (N, 2); integer input stays integer (rounded)
+        """
+        return _apply_affine(self.matrix, points)
+
+    def to_original(self, points: np.ndarray) -> np.ndarray:
+        """
+        Map oriented-image points back to the original image.
+
+        Args:
+            points: Array-like of (x, y) points, shape (N, 2)
+
+        Returns:
+            Array of shape (N, 2); integer input stays integer (rounded)
+        """
+        return _apply_affine(self.inverse, points)
+
+    def polygons_to_original(self, polygons: Sequence[Sequence[Tuple[int, int]]]) -> List[np.ndarray]:
+        """
+        Map many polygons back to the original image in one batch.
+
+        Args:
+            polygons: Polygons as sequences of (x, y) vertices
+
+        Returns:
+            List of (N_i, 2) arrays, one per polygon
+        """
+        if not polygons:
+            return []
+        lengths = [len(p) for p in polygons]
+        flat = np.concatenate(
+            [np.asarray(p).reshape(-1, 2) for p in polygons if len(p)]
+            or [np.empty((0, 2), dtype=np.int64)]
+        )
+        return np.split(self.to_original(flat), np.cumsum(lengths)[:-1])
+
+
+def _apply_affine(matrix: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Apply a 2x3 affine matrix to an (N, 2) point array."""
+    pts = np.asarray(points).reshape(-1, 2)
+    mapped = pts @ matrix[:, :2].T + matrix[:, 2]
+    if np.issubdtype(pts.dtype, np.integer):
+        return np.rint(mapped).astype(pts.dtype)
+    return mapped
+
+
+def correct_orientation_view(
+    image: np.ndarray,
+    result: OrientationResult,
+) -> Tuple[np.ndarray, OrientationTransform]:
+    """
+    Orientation correction without copying the image.
+
+    Args:
+        image: Input image
+        result: Orientation detection result
+
+    Returns:
+        Tuple of (oriented image, usually a view; transform to map
+        results back with to_original / polygons_to_original)
+    """
+    height, width = image.shape[:2]
+    transform = OrientationTransform.from_result(result, width, height)
+    return transform.apply(image), transform
@@ -14,6 +14,13 @@ if TYPE_CHECKING:
     from ..color_boundary.models import ColorBoundaryResult
 
 
+# Line orientation only needs a coarse edge map: longest side analysed
+LINE_ANALYSIS_MAX_SIDE = 1024
+
+# Angle histogram bin width in degrees (angles folded into [0, 180))
+ANGLE_BIN_DEGREES = 5
+
+
 class OrientationDetector:
     """
     Detects image orientation using multiple signals.
@@ -93,40 +100,45 @@ class OrientationDetector:
         Detect orientation from dominant line directions.
 
         Uses Hough transform to find dominant lines and their directions.
+        The Hough pass runs on an edge map downsampled to
+        LINE_ANALYSIS_MAX_SIDE, with length and vote thresholds scaled
+        to match; only directions matter, not positions.
         """
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if len(image.shape) == 3 else image
+        scale = min(1.0, LINE_ANALYSIS_MAX_SIDE / max(gray.shape[:2]))
+        if scale < 1.0:
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
         edges = cv2.Canny(gray, 50, 150, apertureSize=3)
 
         # Detect lines
+        min_length = max(20, round(100 * scale))
         lines = cv2.HoughLinesP(
             edges,
             rho=1,
             theta=np.pi / 180,
-            threshold=100,
-            minLineLength=100,
-            maxLineGap=10,
+            threshold=min_length,
+            minLineLength=min_length,
+            maxLineGap=max(2, round(10 * scale)),
         )
 
         if lines is None or len(lines) < 5:
             return None
 
-        # Analyze line angles
-        angles = []
-        for line in lines:
-            x1, y1, x2, y2 = line[0]
-            angle = np.arctan2(y2 - y1, x2 - x1) * 180 / np.pi
-            angles.append(angle)
-
-        angles = np.array(angles)
+        # Angle histogram, folded into [0, 180)
+        lines = np.asarray(lines).reshape(-1, 4).astype(np.float64)
+        angles = np.degrees(np.arctan2(lines[:, 3] - lines[:, 1], lines[:, 2] - lines[:, 0])) % 180
+        bins = 180 // ANGLE_BIN_DEGREES
+        histogram = np.bincount(
+            np.minimum((angles // ANGLE_BIN_DEGREES).astype(np.intp), bins - 1), minlength=bins
+        )
+        centers = (np.arange(bins) + 0.5) * ANGLE_BIN_DEGREES
 
-        # Count lines in different directions
-        horizontal = np.sum(np.abs(angles) < 15) + np.sum(np.abs(angles) > 165)
-        vertical = np.sum((np.abs(angles) > 75) & (np.abs(angles) < 105))
+        # Count lines within 15 degrees of horizontal and vertical
+        horizontal = int(histogram[(centers < 15) | (centers > 165)].sum())
+        vertical = int(histogram[np.abs(centers - 90) < 15].sum())
 
         # Determine orientation based on line dominance
         total = len(angles)
-        if total == 0:
-            return None
 
         h_ratio = horizontal / total
         v_ratio = vertical / total
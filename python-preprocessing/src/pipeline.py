@@ -7,15 +7,45 @@ to produce comprehensive hints for the Gemini AI model.
 
 import cv2
 import numpy as np
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+from typing import Callable, Dict, Any, Optional, List, Mapping, Union
+from dataclasses import dataclass, replace
 import base64
-import io
-from PIL import Image
 
 from .edge_detection import process_edges, edge_result_to_dict
-from .region_segmentation import process_segmentation, segmentation_result_to_dict, RegionType
-from .line_detection import process_lines, line_result_to_dict, AisleCandidate
+from .region_segmentation import (
+    process_segmentation,
+    segmentation_result_to_dict,
+    RegionType,
+    SegmentationResult,
+)
+from .line_detection import (
+    process_lines,
+    line_result_to_dict,
+    resolve_aisle_detectors,
+    AisleCandidate,
+    LineDetectionResult,
+    LINE_DTYPE,
+)
+from .deadline import Deadline
+from .drawing_scale import (
+    CANONICAL_PIXELS_PER_METER,
+    DrawingScale,
+    meters_to_pixels,
+    resolve_drawing_scale,
+)
+from .line_store import HoughLineStore
+from .hint_budget import HintBudget, apply_hint_budget
+from .image_probe import (
+    DecodedImage,
+    ImageInfo,
+    check_pixel_limit,
+    choose_reduction,
+    decode_image,
+    probe_image_header,
+)
+from .memory_budget import MemoryEstimator, PeakMemory, profile_stage
+from .result_encoding import PointList
+from .visualizations import LazyVisualizations, VISUALIZATION_NAMES, downscale, encode_image, pack_mask
 from .boundary_detection import detect_floorplan_boundary, ContentBoundary
 from .config.phase0_config import Phase0Config
 from .color_boundary.detector import ColorBoundaryDetector
@@ -28,7 +58,6 @@ from .color_boundary.fast_track import (
 from .coverage_input import (
     CoverageBoundary,
     load_coverage_from_json,
-    coverage_to_mask,
     filter_2d_coverage_boundaries,
     get_coverage_union_mask,
 )
@@ -36,6 +65,7 @@ from .travel_lane_detection import (
     TravelLaneSuggestion,
     detect_travel_lanes_standalone,
     detect_travel_lanes_within_coverage,
+    detect_travel_lanes_in_coverage_areas,
 )
 
 
@@ -56,11 +86,49 @@ class PreprocessingConfig:
     # Line detection
     min_line_length: int = 30
     line_cluster_distance: float = 100.0
+    min_aisle_width: int = 20  # Gap limits for aisles between line clusters
+    max_aisle_width: int = 200
+
+    # Aisle detectors (see line_detection.AISLE_DETECTORS); None enables all
+    aisle_detectors: Optional[Dict[str, bool]] = None
+    aisle_detector_workers: int = 4
+
+    # Memory (see memory_budget): runs whose estimated peak exceeds the
+    # budget analyse a downscaled copy; None disables the budget
+    memory_budget_mb: Optional[float] = None
+    profile_memory: bool = False  # Record per-stage tracemalloc peaks (slower)
+
+    # Gemini hint size limits (see hint_budget); HintBudget.unlimited() keeps everything
+    hint_budget: HintBudget = None  # Will default in __post_init__
+
+    # Time budget (see deadline): once spent, optional stages are skipped
+    # and the response lists them; None waits for every stage
+    deadline_ms: Optional[float] = None
+
+    # Drawing scale (see drawing_scale): finer drawings are analysed at the
+    # canonical resolution, and pixel parameters above are canonical pixels
+    pixels_per_meter: Optional[float] = None  # Known scale, e.g. 1000 / mm per pixel
+    estimate_scale: bool = False  # Estimate from stroke width when not given
+    canonical_pixels_per_meter: float = CANONICAL_PIXELS_PER_METER
 
     def __post_init__(self):
         """Initialize default Phase0Config if not provided."""
         if self.phase0_config is None:
             self.phase0_config = Phase0Config.default()
+        if self.hint_budget is None:
+            self.hint_budget = HintBudget()
+        # Fail fast on unknown detector names
+        resolve_aisle_detectors(self.aisle_detectors)
+        if self.aisle_detector_workers < 1:
+            raise ValueError("aisle_detector_workers must be at least 1")
+        if self.memory_budget_mb is not None and self.memory_budget_mb <= 0:
+            raise ValueError("memory_budget_mb must be positive")
+        if self.deadline_ms is not None and self.deadline_ms <= 0:
+            raise ValueError("deadline_ms must be positive")
+        if self.pixels_per_meter is not None and self.pixels_per_meter <= 0:
+            raise ValueError("pixels_per_meter must be positive")
+        if self.canonical_pixels_per_meter <= 0:
+            raise ValueError("canonical_pixels_per_meter must be positive")
 
 
 @dataclass
@@ -70,11 +138,16 @@ class PreprocessingResult:
     segmentation_data: Dict[str, Any]
     line_data: Dict[str, Any]
     gemini_hints: Dict[str, Any]
-    visualizations: Dict[str, np.ndarray]
+    visualizations: Mapping[str, np.ndarray]  # Rendered on access (LazyVisualizations)
     content_boundary: Optional[ContentBoundary] = None  # Detected floorplan boundary
     phase0_result: Optional[ColorBoundaryResult] = None  # Phase 0 color detection result
     fast_track: bool = False  # True if fast-track mode was used
     travel_lane_suggestions: List[TravelLaneSuggestion] = None  # Travel lane detections
+    analysis_scale: float = 1.0  # < 1 when scale normalization or a memory budget downsampled
+    estimated_peak_mb: Optional[float] = None  # Set when a memory budget is configured
+    memory_profile: Optional[Dict[str, PeakMemory]] = None  # Set when profile_memory is on
+    deadline: Optional[Dict[str, Any]] = None  # Set when deadline_ms is configured
+    drawing_scale: Optional[DrawingScale] = None  # Known or estimated drawing resolution
 
     def __post_init__(self):
         if self.travel_lane_suggestions is None:
@@ -176,6 +249,8 @@ def generate_gemini_hints(
             "width": aisle["width"],
             "centerline": aisle["centerline"],
             "bounding_box": aisle["bounding_box"],
+            "confidence": aisle.get("confidence"),
+            "two_sided_validated": aisle.get("two_sided_validated", False),
             "suggestion": f"{aisle['orientation'].capitalize()} aisle path between racking",
         })
 
@@ -271,10 +346,117 @@ def filter_margin_aisles(
     return filtered
 
 
+def analysis_scale(
+    image_shape: tuple,
+    config: PreprocessingConfig,
+    estimator: Optional[MemoryEstimator] = None,
+) -> float:
+    """
+    Scale at which the pipeline analyses an image under the config's
+    memory budget and known drawing scale.
+
+    An estimated drawing scale (config.estimate_scale) needs the pixels
+    and is applied by preprocess_floorplan on top of this.
+
+    Args:
+        image_shape: Image shape (height, width[, channels])
+        config: Pipeline configuration
+        estimator: Memory estimator (default: MemoryEstimator())
+
+    Returns:
+        1.0 when neither a budget nor a drawing finer than the canonical
+        resolution calls for downsampling, else the smaller of the two
+        scales
+    """
+    scale = DrawingScale(
+        config.pixels_per_meter, "input", config.canonical_pixels_per_meter,
+    ).normalization_scale
+    if config.memory_budget_mb is None:
+        return scale
+    h, w = image_shape[:2]
+    return min(scale, (estimator or MemoryEstimator()).scale_for_budget(w, h, config.memory_budget_mb))
+
+
+# Travel lane size limits (40, 200 and 100 px at the canonical resolution)
+TRAVEL_LANE_MIN_WIDTH_M = 1.0
+TRAVEL_LANE_MIN_LENGTH_M = 5.0
+COVERAGE_LANE_MIN_LENGTH_M = 2.5  # Coverage areas are already constrained
+
+
+def _scale_config(config: PreprocessingConfig, scale: float) -> PreprocessingConfig:
+    """Pixel-valued parameters adjusted for analysis at scale."""
+    return replace(
+        config,
+        density_window=max(3, round(config.density_window * scale)),
+        min_region_area=max(1, int(config.min_region_area * scale * scale)),
+        min_line_length=max(5, round(config.min_line_length * scale)),
+        line_cluster_distance=config.line_cluster_distance * scale,
+        min_aisle_width=max(1, round(config.min_aisle_width * scale)),
+        max_aisle_width=max(1, round(config.max_aisle_width * scale)),
+    )
+
+
+# Result dict keys holding lengths and areas in pixels
+_LINEAR_KEYS = {
+    "x", "y", "width", "height", "length", "perimeter",
+    "average_spacing", "average_line_spacing", "average_width",
+}
+_AREA_KEYS = {"area", "total_dense_area", "total_sparse_area"}
+
+
+def scale_result_coordinates(data: Any, factor: float) -> Any:
+    """
+    Scale pixel coordinates, lengths and areas in a stage result dict.
+
+    Args:
+        data: Result dict (e.g. from edge_result_to_dict), list or value
+        factor: Scale factor (1 / analysis scale maps back to full resolution)
+
+    Returns:
+        New structure with scaled values; other values are unchanged
+    """
+    if isinstance(data, dict):
+        scaled = {}
+        for key, value in data.items():
+            if key in _LINEAR_KEYS and isinstance(value, (int, float)) and not isinstance(value, bool):
+                scaled[key] = _scale_number(value, factor)
+            elif key in _AREA_KEYS and isinstance(value, (int, float)) and not isinstance(value, bool):
+                scaled[key] = _scale_number(value, factor * factor)
+            else:
+                scaled[key] = scale_result_coordinates(value, factor)
+        return scaled
+    if isinstance(data, PointList):
+        return PointList(np.rint(data.array * factor))
+    if isinstance(data, list):
+        return [scale_result_coordinates(item, factor) for item in data]
+    return data
+
+
+def _scale_number(value, factor: float):
+    if isinstance(value, (int, np.integer)):
+        return int(round(value * factor))
+    return float(value) * factor
+
+
+def build_line_store(image: np.ndarray, config: Optional[PreprocessingConfig] = None) -> HoughLineStore:
+    """Hough segments for line detection, reusable across requests on one image."""
+    if config is None:
+        config = PreprocessingConfig()
+    return HoughLineStore.from_image(
+        image,
+        min_line_length=min(config.min_line_length, 30),
+    )
+
+
 def preprocess_floorplan(
     image: np.ndarray,
     config: Optional[PreprocessingConfig] = None,
     coverage_boundaries: Optional[List[CoverageBoundary]] = None,
+    line_store: Optional[
+        Union[HoughLineStore, Callable[[np.ndarray, PreprocessingConfig], HoughLineStore]]
+    ] = None,
+    memory_estimator: Optional[MemoryEstimator] = None,
+    decode_reduction: int = 1,
 ) -> PreprocessingResult:
     """
     Run the complete preprocessing pipeline on a floorplan image.
@@ -285,14 +467,49 @@ def preprocess_floorplan(
         coverage_boundaries: Optional list of coverage boundaries for constrained travel lane detection.
             If provided, travel lanes are detected within 2D coverage areas.
             If not provided, travel lanes are detected anywhere in the image.
+        line_store: Optional precomputed Hough segments for this image, or a
+            function building them from the analysed image and config (e.g. a
+            lookup in an image session cache). A function is only called if
+            line detection runs, after any downscaling. Rebuilt if it does
+            not match the analysed image or is stricter than the config needs
+        memory_estimator: Peak-memory estimator for config.memory_budget_mb
+            (default: MemoryEstimator())
+        decode_reduction: Reduction the image was decoded at
+            (DecodedImage.reduction); results are mapped back to the
+            original image's pixels. coverage_boundaries and config are in
+            the decoded image's pixels
+
+    When config.memory_budget_mb is set and the estimated peak exceeds it,
+    Phase 0 still runs at full resolution but the later stages analyse a
+    downscaled copy (coarse-to-fine); their coordinates are mapped back to
+    full resolution, while visualizations stay at the analysis scale. A
+    reduced decode is mapped back the same way, Phase 0 included.
+
+    When config.deadline_ms is set, Phase 0, boundary and edge detection
+    always run. Segmentation, line detection and travel lanes are skipped
+    once the budget is spent, and low-value aisle detectors once half of
+    it is. result.deadline lists what was skipped or truncated.
 
     Returns:
         PreprocessingResult with all analysis data and visualizations
     """
     if config is None:
         config = PreprocessingConfig()
+    if decode_reduction < 1:
+        raise ValueError("decode_reduction must be at least 1")
 
     h, w = image.shape[:2]
+    original_h, original_w = h * decode_reduction, w * decode_reduction
+    deadline = Deadline(config.deadline_ms)
+    profile: Optional[Dict[str, PeakMemory]] = {} if config.profile_memory else None
+    estimated_peak_mb = None
+    drawing = resolve_drawing_scale(
+        image, config.pixels_per_meter, config.estimate_scale, config.canonical_pixels_per_meter,
+    )
+    estimator = memory_estimator or MemoryEstimator()
+    scale = min(analysis_scale(image.shape, config, estimator), drawing.normalization_scale)
+    if config.memory_budget_mb is not None:
+        estimated_peak_mb = round(estimator.estimate_peak_mb(w, h, scale), 1)
 
     # Phase 0: Color boundary detection (IMP-01)
     phase0_result = None
@@ -302,14 +519,17 @@ def preprocess_floorplan(
         detector = ColorBoundaryDetector(
             min_contour_area=config.phase0_config.min_contour_area,
         )
-        phase0_result = detector.detect(image)
+        phase0_result = profile_stage(profile, "phase0", detector.detect, image)
 
         # Check if fast-track mode should be used
-        if should_fast_track(phase0_result, config.phase0_config):
-            fast_track = True
+        fast_track = should_fast_track(phase0_result, config.phase0_config)
+        # Reported in original pixels (later stages only read it via the hints)
+        phase0_result.scale(decode_reduction)
+        if fast_track:
             # Generate fast-track hints and return early
             gemini_hints = create_fast_track_hints(phase0_result)
-            gemini_hints["image_dimensions"] = {"width": w, "height": h}
+            gemini_hints["image_dimensions"] = {"width": original_w, "height": original_h}
+            gemini_hints = apply_hint_budget(gemini_hints, config.hint_budget)
 
             return PreprocessingResult(
                 edge_data={},
@@ -320,33 +540,99 @@ def preprocess_floorplan(
                 content_boundary=None,
                 phase0_result=phase0_result,
                 fast_track=True,
+                estimated_peak_mb=estimated_peak_mb,
+                memory_profile=profile,
+                deadline=deadline.to_dict() if config.deadline_ms is not None else None,
+                drawing_scale=drawing,
             )
 
+    # Coarse-to-fine: analyse a downscaled copy at the canonical resolution
+    # or when over the memory budget; pixel parameters, detector constants
+    # and morphology kernels keep their physical size
+    param_scale = drawing.parameter_scale(scale)
+    analysis_ppm = config.canonical_pixels_per_meter * param_scale
+    lane_min_width = meters_to_pixels(TRAVEL_LANE_MIN_WIDTH_M, analysis_ppm)
+    lane_min_length = meters_to_pixels(
+        COVERAGE_LANE_MIN_LENGTH_M if coverage_boundaries else TRAVEL_LANE_MIN_LENGTH_M,
+        analysis_ppm,
+    )
+    if param_scale != 1.0:
+        config = _scale_config(config, param_scale)
+    if scale < 1.0:
+        image = cv2.resize(
+            image,
+            (max(1, round(w * scale)), max(1, round(h * scale))),
+            interpolation=cv2.INTER_AREA,
+        )
+        if coverage_boundaries:
+            coverage_boundaries = [
+                replace(
+                    b,
+                    points=[(round(x * scale), round(y * scale)) for x, y in b.points],
+                    margin=round(b.margin * scale),
+                )
+                for b in coverage_boundaries
+            ]
+
     # Stage 0: Detect floorplan content boundary
-    content_boundary = detect_floorplan_boundary(image)
+    content_boundary = profile_stage(profile, "boundary", detect_floorplan_boundary, image)
 
     # Stage 1: Edge Detection
-    edge_result = process_edges(
+    edge_result = profile_stage(
+        profile, "edges", process_edges,
         image,
         use_color_detection=config.use_color_detection,
         use_canny=config.use_canny,
     )
     edge_data = edge_result_to_dict(edge_result)
+    # Keep only compact visualization sources past each stage
+    boundary_bits = pack_mask(edge_result.boundary_mask)
+    del edge_result
 
     # Stage 2: Region Segmentation
-    segmentation_result = process_segmentation(
-        image,
-        density_window=config.density_window,
-        min_region_area=config.min_region_area,
-    )
+    if deadline.allows("segmentation"):
+        segmentation_result = profile_stage(
+            profile, "segmentation", process_segmentation,
+            image,
+            density_window=config.density_window,
+            min_region_area=config.min_region_area,
+        )
+    else:
+        segmentation_result = SegmentationResult(regions=[], density_map=None, labeled_mask=None)
     segmentation_data = segmentation_result_to_dict(segmentation_result)
-
-    # Stage 3: Line Detection
-    line_result = process_lines(
-        image,
-        min_line_length=config.min_line_length,
-        distance_threshold=config.line_cluster_distance,
-    )
+    density_map = segmentation_result.density_map
+    del segmentation_result
+
+    # Stage 3: Line Detection (Hough segments from a cached store if given)
+    if deadline.allows("lines"):
+        if callable(line_store):
+            line_store = profile_stage(profile, "line_store", line_store, image, config)
+        if (
+            line_store is None
+            or tuple(line_store.image_shape) != image.shape[:2]
+            or not line_store.covers(50, min(config.min_line_length, 30), 10)
+        ):
+            line_store = profile_stage(profile, "line_store", build_line_store, image, config)
+        line_result = profile_stage(
+            profile, "lines", process_lines,
+            image,
+            min_line_length=config.min_line_length,
+            distance_threshold=config.line_cluster_distance,
+            min_aisle_width=config.min_aisle_width,
+            max_aisle_width=config.max_aisle_width,
+            param_scale=param_scale,
+            line_store=line_store,
+            aisle_detectors=config.aisle_detectors,
+            aisle_detector_workers=config.aisle_detector_workers,
+            deadline=deadline,
+        )
+    else:
+        line_result = LineDetectionResult(
+            line_array=np.zeros(0, dtype=LINE_DTYPE),
+            line_clusters=[],
+            aisle_candidates=[],
+            image_shape=image.shape[:2],
+        )
     line_data = line_result_to_dict(line_result)
 
     # Stage 4: Filter margin aisles (LEGACY - kept for backward compatibility)
@@ -365,46 +651,67 @@ def preprocess_floorplan(
     # Travel lanes are main corridors, distinct from aisles (which are now programmatic from TDOA)
     travel_lane_suggestions: List[TravelLaneSuggestion] = []
 
-    if coverage_boundaries:
-        # Constrained mode: detect travel lanes within 2D coverage areas only
-        boundaries_2d = filter_2d_coverage_boundaries(coverage_boundaries)
-        for boundary in boundaries_2d:
-            mask = coverage_to_mask(boundary, (h, w))
-            lanes = detect_travel_lanes_within_coverage(
-                image, mask,
-                coverage_uid=boundary.uid,
-                min_width=40,
-                min_length=100,
+    if deadline.allows("travel_lanes"):
+        if coverage_boundaries:
+            # Constrained mode: detect travel lanes within 2D coverage areas only
+            # Each area runs on its clipped bounding box, in parallel
+            boundaries_2d = filter_2d_coverage_boundaries(coverage_boundaries)
+            travel_lane_suggestions = profile_stage(
+                profile, "travel_lanes", detect_travel_lanes_in_coverage_areas,
+                image,
+                boundaries_2d,
+                min_width=lane_min_width,
+                min_length=lane_min_length,
+                param_scale=param_scale,
             )
-            travel_lane_suggestions.extend(lanes)
-    else:
-        # Standalone mode: detect travel lanes anywhere in the image
-        travel_lane_suggestions = detect_travel_lanes_standalone(
-            image,
-            min_width=40,
-            min_length=200,
+        else:
+            # Standalone mode: detect travel lanes anywhere in the image
+            travel_lane_suggestions = profile_stage(
+                profile, "travel_lanes", detect_travel_lanes_standalone,
+                image,
+                min_width=lane_min_width,
+                min_length=lane_min_length,
+                param_scale=param_scale,
+            )
+
+    # Map coarse results (and a reduced decode) back to original coordinates
+    if scale < 1.0 or decode_reduction > 1:
+        sx, sy = original_w / image.shape[1], original_h / image.shape[0]
+        factor = (sx + sy) / 2
+        edge_data = scale_result_coordinates(edge_data, factor)
+        segmentation_data = scale_result_coordinates(segmentation_data, factor)
+        line_data = scale_result_coordinates(line_data, factor)
+        content_boundary = replace(
+            content_boundary,
+            x=round(content_boundary.x * sx),
+            y=round(content_boundary.y * sy),
+            width=round(content_boundary.width * sx),
+            height=round(content_boundary.height * sy),
         )
+        travel_lane_suggestions = [lane.scale(factor) for lane in travel_lane_suggestions]
 
     # Generate Gemini hints (with content boundary)
     gemini_hints = generate_gemini_hints(
         edge_data,
         segmentation_data,
         line_data,
-        image_width=w,
-        image_height=h,
+        image_width=original_w,
+        image_height=original_h,
         content_boundary=content_boundary,
     )
 
     # Merge Phase 0 color boundaries into hints if present (Task 2.7)
     if phase0_result is not None and len(phase0_result.boundaries) > 0:
         gemini_hints = merge_color_boundaries_into_hints(gemini_hints, phase0_result)
-
-    # Create visualizations
-    visualizations = {
-        "boundary_mask": edge_result.boundary_mask,
-        "density_map": segmentation_result.density_map,
-        "orientation_map": line_result.orientation_map,
-    }
+    gemini_hints = apply_hint_budget(gemini_hints, config.hint_budget)
+
+    # Visualizations are rendered only if accessed
+    visualizations = LazyVisualizations(
+        image.shape[:2],
+        boundary_bits=boundary_bits,
+        density_map=density_map,
+        line_clusters=line_result.line_clusters,
+    )
 
     return PreprocessingResult(
         edge_data=edge_data,
@@ -416,36 +723,93 @@ def preprocess_floorplan(
         phase0_result=phase0_result,
         fast_track=fast_track,
         travel_lane_suggestions=travel_lane_suggestions,
+        analysis_scale=scale,
+        estimated_peak_mb=estimated_peak_mb,
+        memory_profile=profile,
+        deadline=deadline.to_dict() if config.deadline_ms is not None else None,
+        drawing_scale=drawing,
     )
 
 
-def image_from_base64(base64_string: str) -> np.ndarray:
-    """Decode a base64 image string to numpy array"""
+def image_bytes_from_base64(base64_string: str) -> bytes:
+    """Decode a base64 string (with or without data URL prefix) to encoded image bytes"""
     # Remove data URL prefix if present
     if "," in base64_string:
         base64_string = base64_string.split(",")[1]
+    return base64.b64decode(base64_string)
 
-    img_bytes = base64.b64decode(base64_string)
-    img_array = np.frombuffer(img_bytes, dtype=np.uint8)
-    image = cv2.imdecode(img_array, cv2.IMREAD_COLOR)
 
-    return image
+def decode_floorplan_image(
+    data: bytes,
+    config: Optional[PreprocessingConfig] = None,
+    max_pixels: Optional[int] = None,
+    reduce_oversized: bool = False,
+) -> DecodedImage:
+    """
+    Decode encoded image bytes, checking the header before allocating pixels.
 
+    PNG, JPEG and TIFF headers are probed first, so an image above
+    max_pixels is rejected (or reduced) without decoding it. Other formats
+    are checked after decoding.
 
-def numpy_to_base64(image: np.ndarray, format: str = "png") -> str:
-    """Encode a numpy array image to base64 string"""
-    # Convert BGR to RGB for PIL
-    if len(image.shape) == 3:
-        image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-    else:
-        image_rgb = image
+    Args:
+        data: Encoded image bytes
+        config: Pipeline configuration; with reduce_oversized, its memory
+            budget and drawing scale allow the reductions the analysis would
+            downsample to anyway
+        max_pixels: Pixel ceiling (None: unlimited)
+        reduce_oversized: Decode a JPEG above max_pixels at 1/2, 1/4 or 1/8
+            resolution instead of rejecting it (PNG and TIFF would be decoded
+            at full size first, so they are still rejected)
+
+    Returns:
+        DecodedImage (image is None if the data cannot be decoded); pass its
+        reduction to preprocess_floorplan as decode_reduction to get results
+        in original pixels, and divide a known config.pixels_per_meter by it
+
+    Raises:
+        ImageTooLargeError: If the image exceeds max_pixels and cannot be
+            reduced enough, or is not a JPEG
+    """
+    info = probe_image_header(data)
+    reduction = 1
+    if info is not None and reduce_oversized:
+        scale = analysis_scale((info.height, info.width), config or PreprocessingConfig())
+        reduction = choose_reduction(info, max_pixels, scale)
+    elif info is not None:
+        check_pixel_limit(info, max_pixels)
+
+    image = decode_image(data, reduction)
+    if image is not None and info is None:
+        check_pixel_limit(ImageInfo("unknown", image.shape[1], image.shape[0], 3, 8), max_pixels)
+    return DecodedImage(image, info, reduction)
 
-    pil_image = Image.fromarray(image_rgb)
-    buffer = io.BytesIO()
-    pil_image.save(buffer, format=format.upper())
-    buffer.seek(0)
 
-    return base64.b64encode(buffer.read()).decode("utf-8")
+def image_from_base64(base64_string: str, max_pixels: Optional[int] = None) -> np.ndarray:
+    """Decode a base64 image string to numpy array (None if undecodable)"""
+    return decode_floorplan_image(image_bytes_from_base64(base64_string), max_pixels=max_pixels).image
+
+
+def numpy_to_base64(
+    image: np.ndarray,
+    format: str = "png",
+    quality: Optional[int] = None,
+    max_dimension: Optional[int] = None,
+) -> str:
+    """
+    Encode a numpy array image (BGR or grayscale) to a base64 string.
+
+    Args:
+        image: uint8 image
+        format: "png", "jpeg"/"jpg" or "webp"
+        quality: JPEG/WebP quality 1-100
+        max_dimension: Optional longer-side limit; larger images are downscaled
+
+    Returns:
+        Base64-encoded image
+    """
+    encoded = encode_image(downscale(image, max_dimension), format, quality)
+    return base64.b64encode(encoded).decode("utf-8")
 
 
 def convert_numpy_types(obj: Any) -> Any:
@@ -468,13 +832,36 @@ def convert_numpy_types(obj: Any) -> Any:
         return obj
 
 
-def result_to_json(result: PreprocessingResult, include_visualizations: bool = False) -> Dict[str, Any]:
-    """Convert PreprocessingResult to JSON-serializable dict"""
+def result_to_json(
+    result: PreprocessingResult,
+    include_visualizations: bool = False,
+    visualization_format: str = "png",
+    visualization_max_dimension: Optional[int] = None,
+    visualization_quality: Optional[int] = None,
+    native_types: bool = True,
+) -> Dict[str, Any]:
+    """
+    Convert PreprocessingResult to JSON-serializable dict.
+
+    Args:
+        result: Pipeline result
+        include_visualizations: Render and embed the visualization planes
+        visualization_format: "png", "jpeg"/"jpg" or "webp"
+        visualization_max_dimension: Optional longer-side limit for previews
+        visualization_quality: JPEG/WebP quality 1-100
+        native_types: Convert NumPy values to Python types. The compact
+            encoders in result_encoding accept NumPy values and read point
+            arrays from PointList directly, so they skip the conversion.
+
+    Returns:
+        JSON-serializable dict
+    """
+    convert = convert_numpy_types if native_types else (lambda data: data)
     output = {
-        "edge_detection": convert_numpy_types(result.edge_data),
-        "region_segmentation": convert_numpy_types(result.segmentation_data),
-        "line_detection": convert_numpy_types(result.line_data),
-        "gemini_hints": convert_numpy_types(result.gemini_hints),
+        "edge_detection": convert(result.edge_data),
+        "region_segmentation": convert(result.segmentation_data),
+        "line_detection": convert(result.line_data),
+        "gemini_hints": convert(result.gemini_hints),
         "fast_track": result.fast_track,
         "travel_lane_suggestions": [
             lane.to_dict() for lane in (result.travel_lane_suggestions or [])
@@ -487,23 +874,57 @@ def result_to_json(result: PreprocessingResult, include_visualizations: bool = F
 
     # Include Phase 0 result if present
     if result.phase0_result:
-        output["phase0"] = convert_numpy_types(result.phase0_result.to_dict())
+        output["phase0"] = convert(result.phase0_result.to_dict())
+
+    if result.estimated_peak_mb is not None or result.memory_profile is not None:
+        output["memory"] = {
+            "analysis_scale": round(result.analysis_scale, 4),
+            "estimated_peak_mb": result.estimated_peak_mb,
+            "stages": {
+                name: m.to_dict() for name, m in (result.memory_profile or {}).items()
+            },
+        }
+
+    if result.deadline is not None:
+        output["deadline"] = result.deadline
+
+    if result.drawing_scale is not None and result.drawing_scale.pixels_per_meter is not None:
+        output["scale"] = {
+            **result.drawing_scale.to_dict(),
+            "analysis_scale": round(result.analysis_scale, 4),
+        }
 
     if include_visualizations:
         output["visualizations"] = {
-            "boundary_mask": numpy_to_base64(result.visualizations["boundary_mask"]),
-            "density_map": numpy_to_base64(result.visualizations["density_map"]),
-            "orientation_map": numpy_to_base64(result.visualizations["orientation_map"]),
+            name: numpy_to_base64(
+                _render_visualization(result.visualizations, name, visualization_max_dimension),
+                format=visualization_format,
+                quality=visualization_quality,
+            )
+            for name in VISUALIZATION_NAMES
+            if name in result.visualizations
         }
 
     return output
 
 
+def _render_visualization(
+    visualizations: Mapping[str, np.ndarray],
+    name: str,
+    max_dimension: Optional[int],
+) -> np.ndarray:
+    """Render a visualization, as a preview when max_dimension is set."""
+    if isinstance(visualizations, LazyVisualizations):
+        return visualizations.render(name, max_dimension)
+    return downscale(visualizations[name], max_dimension)
+
+
 def draw_aisles_visualization(
     image: np.ndarray,
     aisles: list,
     output_path: str,
     content_boundary: Optional[ContentBoundary] = None,
+    scale: float = 1.0,
 ) -> str:
     """
     Draw detected aisles on the image and save to a file.
@@ -519,6 +940,8 @@ def draw_aisles_visualization(
         aisles: List of aisle dicts from line_data["aisle_candidates"]
         output_path: Path to save the visualization
         content_boundary: Optional content boundary to display
+        scale: Factor from result coordinates to image pixels (e.g.
+            1 / reduction for a reduced decode)
 
     Returns:
         Path to the saved visualization
@@ -528,6 +951,17 @@ def draw_aisles_visualization(
 
     logger = logging.getLogger(__name__)
 
+    if scale != 1.0:
+        aisles = scale_result_coordinates(aisles, scale)
+        if content_boundary:
+            content_boundary = replace(
+                content_boundary,
+                x=round(content_boundary.x * scale),
+                y=round(content_boundary.y * scale),
+                width=round(content_boundary.width * scale),
+                height=round(content_boundary.height * scale),
+            )
+
     # Create a copy to draw on
     vis = image.copy()
     h, w = vis.shape[:2]
@@ -13,6 +13,8 @@ from typing import Dict, Any, Optional, List
 from pathlib import Path
 import pickle
 
+import numpy as np
+
 
 @dataclass
 class CacheKey:
@@ -92,6 +94,41 @@ class CacheKey:
             version=version,
         )
 
+    @classmethod
+    def from_pixels(
+        cls,
+        pixels: np.ndarray,
+        config: Dict[str, Any],
+        version: str = "1.0",
+    ) -> "CacheKey":
+        """
+        Create cache key from decoded pixels (e.g. one tile, overlap included).
+
+        Views such as tile crops are hashed row by row without copying.
+
+        Args:
+            pixels: Image array (H, W) or (H, W, C)
+            config: Processing configuration
+            version: Version identifier
+
+        Returns:
+            CacheKey instance
+        """
+        digest = hashlib.sha256(f"{pixels.shape}{pixels.dtype}".encode())
+        if pixels.flags.c_contiguous:
+            digest.update(pixels)
+        else:
+            for row in pixels:
+                digest.update(np.ascontiguousarray(row))
+        config_str = json.dumps(config, sort_keys=True)
+        config_hash = hashlib.md5(config_str.encode()).hexdigest()
+
+        return cls(
+            image_hash=digest.hexdigest(),
+            config_hash=config_hash,
+            version=version,
+        )
+
 
 @dataclass
 class CacheEntry:
@@ -12,9 +12,14 @@ import cv2
 import logging
 
 from ..color_boundary.detector import ColorBoundaryDetector
+from ..color_boundary.models import ColorBoundaryResult
 from ..adaptive.closed_region import ClosedRegionDetector
 from ..adaptive.fast_track import FastTrackEvaluator
 from ..adaptive.decision_engine import DecisionEngine, ProcessingMode
+from ..adaptive.triage import ImageTriage
+from ..concurrency import get_governor
+from ..image_probe import ImageTooLargeError, check_pixel_limit, probe_image_file
+from ..adaptive.cost_model import CostModel
 from ..adaptive.config_selector import ConfigSelector, AdaptiveConfig
 from ..tiling.processor import TileProcessor
 from ..tiling.models import TilingConfig
@@ -77,6 +82,9 @@ class FloorplanProcessor:
         config: Optional[AdaptiveConfig] = None,
         cache: Optional[ResultCache] = None,
         zone_processor: Optional[Callable] = None,
+        cost_model: Optional[CostModel] = None,
+        triage: Optional[ImageTriage] = None,
+        max_pixels: Optional[int] = None,
     ):
         """
         Initialize processor.
@@ -85,16 +93,25 @@ class FloorplanProcessor:
             config: Processing configuration
             cache: Optional result cache
             zone_processor: Optional custom zone processing function
+            cost_model: Optional calibrated cost model for decision metrics
+            triage: Optional thumbnail triage (default ImageTriage())
+            max_pixels: Pixel ceiling for process_file, checked from the
+                file header before decoding (None: unlimited)
         """
         self.config = config or AdaptiveConfig()
         self.cache = cache
         self.zone_processor = zone_processor
+        self.max_pixels = max_pixels
 
         # Initialize components
         self.color_detector = ColorBoundaryDetector()
         self.closed_region_detector = ClosedRegionDetector()
         self.fast_track_evaluator = FastTrackEvaluator()
-        self.decision_engine = DecisionEngine()
+        self.decision_engine = DecisionEngine(cost_model=cost_model)
+        self.triage = triage or ImageTriage(
+            color_detector=self.color_detector,
+            fast_track_evaluator=self.fast_track_evaluator,
+        )
         self.config_selector = ConfigSelector()
         self.validator = ZoneValidator()
 
@@ -125,48 +142,85 @@ class FloorplanProcessor:
         metrics["image_height"] = height
 
         try:
-            # Phase 0: Color boundary detection
-            phase0_start = time.time()
-            phase0_result = self.color_detector.detect(image)
-            phase0_time = (time.time() - phase0_start) * 1000
-            metrics["phase0_time_ms"] = phase0_time
-
-            # Analyze closed regions
-            closed_result = self.closed_region_detector.analyze(
-                phase0_result,
-                image_size=(width, height),
-            )
-            metrics["closed_region_count"] = closed_result.closed_region_count
-            metrics["closure_ratio"] = closed_result.closure_ratio
-
-            # Evaluate fast-track eligibility
-            fast_track_decision = self.fast_track_evaluator.evaluate(
-                phase0_result,
-                closed_result,
-                image_dimensions=(width, height),
-            )
-            metrics["fast_track_eligible"] = fast_track_decision.eligible
-
-            # Decide processing mode
-            decision = self.decision_engine.decide(
-                image_dimensions=(width, height),
-                phase0_result=phase0_result,
-                closed_region_result=closed_result,
-                fast_track_decision=fast_track_decision,
-            )
+            # Triage on a thumbnail before any full-resolution work
+            triage = self.triage.run(image)
+            metrics["triage_time_ms"] = triage.time_ms
+
+            if self.triage.is_decisive(triage):
+                # Decide from the triage; full-res Phase 0 only feeds the chosen mode
+                decision = self.decision_engine.decide(
+                    image_dimensions=(width, height),
+                    triage=triage,
+                    memory_budget_mb=config.memory_budget_mb,
+                )
+                phase0_start = time.time()
+                if triage.is_full_resolution:
+                    phase0_result = triage.phase0_result
+                elif triage.colorless:
+                    # Nothing for Phase 0 to find
+                    phase0_result = ColorBoundaryResult(
+                        boundaries=[],
+                        combined_mask=np.zeros((height, width), dtype=np.uint8),
+                        coverage_ratio=0.0,
+                        image_shape=(height, width),
+                    )
+                else:
+                    phase0_result = self.color_detector.detect(image)
+                metrics["phase0_time_ms"] = (time.time() - phase0_start) * 1000
+                metrics["phase0_skipped"] = triage.colorless and not triage.is_full_resolution
+                metrics["closed_region_count"] = triage.closed_region_count
+                metrics["closure_ratio"] = triage.closure_ratio
+                metrics["fast_track_eligible"] = triage.fast_track_likely
+            else:
+                # Phase 0: Color boundary detection
+                phase0_start = time.time()
+                phase0_result = self.color_detector.detect(image)
+                phase0_time = (time.time() - phase0_start) * 1000
+                metrics["phase0_time_ms"] = phase0_time
+
+                # Analyze closed regions
+                closed_result = self.closed_region_detector.analyze(
+                    phase0_result,
+                    image_size=(width, height),
+                )
+                metrics["closed_region_count"] = closed_result.closed_region_count
+                metrics["closure_ratio"] = closed_result.closure_ratio
+
+                # Evaluate fast-track eligibility
+                fast_track_decision = self.fast_track_evaluator.evaluate(
+                    phase0_result,
+                    closed_result,
+                    image_dimensions=(width, height),
+                )
+                metrics["fast_track_eligible"] = fast_track_decision.eligible
+
+                # Decide processing mode
+                decision = self.decision_engine.decide(
+                    image_dimensions=(width, height),
+                    phase0_result=phase0_result,
+                    closed_region_result=closed_result,
+                    fast_track_decision=fast_track_decision,
+                    triage=triage,
+                    memory_budget_mb=config.memory_budget_mb,
+                )
             metrics["processing_mode"] = decision.mode.value
+            metrics["decision"] = decision.metrics
 
             # Process based on mode
             if decision.mode == ProcessingMode.FAST_TRACK:
                 zones = self._fast_track_process(phase0_result, config)
             elif decision.mode == ProcessingMode.TILED:
-                zones = self._tiled_process(image, phase0_result, config)
+                zones = self._tiled_process(
+                    image, phase0_result, config, decision.tile_size,
+                    metrics=metrics, use_cache=use_cache,
+                )
             elif decision.mode == ProcessingMode.HYBRID:
                 zones = self._hybrid_process(image, phase0_result, config)
             else:
                 zones = self._standard_process(image, phase0_result, config)
 
             metrics["zone_count"] = len(zones)
+            metrics["concurrency"] = get_governor().allocation()
 
             # Validate zones
             validation_result = None
@@ -258,19 +312,34 @@ class FloorplanProcessor:
         image: np.ndarray,
         phase0_result: "ColorBoundaryResult",
         config: AdaptiveConfig,
+        tile_size: Optional[int] = None,
+        metrics: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
     ) -> List[Dict[str, Any]]:
-        """Tiled processing for large images."""
+        """
+        Tiled processing for large images (tile_size overrides config.tile_size).
+
+        A tile_size from the decision (e.g. a memory budget) is honoured for
+        any image larger than it, not only above the dimension threshold.
+        With a cache, per-tile zones are reused for tiles whose pixels are
+        unchanged (e.g. a revised drawing); metrics report tiles reused.
+        """
         tiling_config = TilingConfig(
-            tile_size=config.tile_size,
+            dimension_threshold=tile_size or TilingConfig.dimension_threshold,
+            tile_size=tile_size or config.tile_size,
             overlap=config.tile_overlap,
             merge_iou_threshold=config.merge_iou_threshold,
+            skip_blank_tiles=True,  # Empty margins yield no zones
         )
 
-        tile_processor = TileProcessor(config=tiling_config)
+        tile_processor = TileProcessor(
+            config=tiling_config,
+            cache=self.cache if use_cache else None,
+            cache_context=config.to_dict(),
+        )
 
         # Define tile processing function
         def process_tile(tile):
-            from ..tiling.models import Zone
             # Simple zone extraction from tile
             zones = []
             # In production, this would do actual detection
@@ -282,6 +351,9 @@ class FloorplanProcessor:
             phase0_boundaries=phase0_result,
         )
 
+        if metrics is not None:
+            metrics.update(tile_processor.tile_stats)
+
         # Convert to dict format
         zones = []
         for mz in merged_zones:
@@ -343,6 +415,10 @@ class FloorplanProcessor:
         """
         Process an image file.
 
+        The PNG, JPEG or TIFF header is probed first. An image above
+        max_pixels is not decoded; the failed result carries the probe and
+        the dimension-only decision (mode, tiling) in its metrics.
+
         Args:
             image_path: Path to image file
             use_cache: Whether to use caching
@@ -366,6 +442,24 @@ class FloorplanProcessor:
                     metrics={"cached": True},
                 )
 
+        # Check the header before allocating the image
+        info = probe_image_file(image_path)
+        if info is not None:
+            try:
+                check_pixel_limit(info, self.max_pixels)
+            except ImageTooLargeError as e:
+                decision = self.decision_engine.decide(
+                    (info.width, info.height), memory_budget_mb=self.config.memory_budget_mb,
+                )
+                return ProcessingResult(
+                    success=False,
+                    zones=[],
+                    processing_mode=decision.mode,
+                    processing_time_ms=0,
+                    metrics={"probe": info.to_dict(), "decision": decision.to_dict()},
+                    errors=[str(e)],
+                )
+
         # Load and process image
         image = cv2.imread(image_path)
         if image is None:
@@ -377,7 +471,10 @@ class FloorplanProcessor:
                 errors=[f"Failed to load image: {image_path}"],
             )
 
-        result = self.process(image, use_cache=False)
+        # A whole-image miss can still reuse unchanged tiles
+        result = self.process(image, use_cache=use_cache)
+        if info is not None:
+            result.metrics["probe"] = info.to_dict()
 
         # Cache result
         if use_cache and self.cache and result.success:
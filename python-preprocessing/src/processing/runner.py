@@ -18,6 +18,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from .processor import FloorplanProcessor, ProcessingResult
 from .cache import ResultCache
 from ..adaptive.config_selector import AdaptiveConfig
+from ..concurrency import configure_governor, get_governor
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +76,7 @@ class BatchResult:
     total_time_ms: float
     results: List[Dict[str, Any]] = field(default_factory=list)
     errors: List[Dict[str, Any]] = field(default_factory=list)
+    concurrency: Optional[Dict[str, Any]] = None  # Core split used (ConcurrencyGovernor)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -86,6 +88,7 @@ class BatchResult:
             "success_rate": self.successful / self.total_files if self.total_files > 0 else 0,
             "results": self.results,
             "errors": self.errors,
+            "concurrency": self.concurrency,
         }
 
 
@@ -202,6 +205,7 @@ class PipelineRunner:
             total_time_ms=total_time,
             results=results,
             errors=errors,
+            concurrency=get_governor().allocation(),
         )
 
     def _create_processor(self) -> FloorplanProcessor:
@@ -295,13 +299,14 @@ class PipelineRunner:
         errors = []
         completed = 0
 
-        with ThreadPoolExecutor(max_workers=self.config.parallel_workers) as executor:
+        with get_governor().parallel_region("runner", self.config.parallel_workers) as region, \
+                ThreadPoolExecutor(max_workers=region.workers) as executor:
             # Submit all jobs
             futures = {}
             for filepath in files:
                 processor = self._create_processor()
                 future = executor.submit(
-                    processor.process_file,
+                    region.wrap(processor.process_file),
                     filepath,
                     self.config.use_cache,
                 )
@@ -452,6 +457,13 @@ Examples:
         help="Number of parallel workers (default: 1)",
     )
 
+    parser.add_argument(
+        "--cores",
+        type=int,
+        default=None,
+        help="Core budget split across workers, tiles and OpenCV (default: all available)",
+    )
+
     parser.add_argument(
         "--no-cache",
         action="store_true",
@@ -507,6 +519,9 @@ def main(args: Optional[List[str]] = None) -> int:
         format="%(asctime)s - %(levelname)s - %(message)s",
     )
 
+    if parsed.cores is not None:
+        configure_governor(core_budget=parsed.cores)
+
     # Create config
     config = PipelineConfig(
         input_paths=parsed.inputs,
@@ -13,6 +13,9 @@ from typing import List, Tuple, Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from .density_maps import box_mean, normalize_density, gradient_magnitude_max, to_gray
+from .result_encoding import PointList
+
 
 class RegionType(str, Enum):
     DENSE = "dense"  # Racking/storage areas with parallel lines
@@ -56,22 +59,16 @@ def compute_local_density(
     Returns:
         Density map (0-255, higher = more dense)
     """
-    if len(image.shape) == 3:
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    else:
-        gray = image.copy()
+    gray = to_gray(image)
 
     # Threshold to get binary image (dark lines become white)
     _, binary = cv2.threshold(gray, 200, 255, cv2.THRESH_BINARY_INV)
 
-    # Use box filter to compute local density
-    kernel = np.ones((window_size, window_size), np.float32) / (window_size * window_size)
-    density = cv2.filter2D(binary.astype(np.float32), -1, kernel)
+    # Box filter (running sums, O(1) per pixel) to compute local density
+    density = box_mean(binary, window_size)
 
     # Normalize to 0-255
-    density = cv2.normalize(density, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
-
-    return density
+    return normalize_density(density)
 
 
 def compute_line_density(
@@ -88,30 +85,16 @@ def compute_line_density(
     Returns:
         Line density map
     """
-    if len(image.shape) == 3:
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-    else:
-        gray = image.copy()
-
-    # Apply Sobel to detect vertical lines (common in racking)
-    sobel_x = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=3)
-    sobel_x = np.abs(sobel_x)
-
-    # Apply Sobel to detect horizontal lines
-    sobel_y = cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=3)
-    sobel_y = np.abs(sobel_y)
+    gray = to_gray(image)
 
-    # Combine (take max of vertical and horizontal)
-    combined = np.maximum(sobel_x, sobel_y)
+    # Sobel x/y (vertical and horizontal racking lines), max of magnitudes
+    combined = gradient_magnitude_max(gray)
 
     # Smooth with box filter
-    kernel = np.ones((window_size, window_size), np.float32) / (window_size * window_size)
-    density = cv2.filter2D(combined, -1, kernel)
+    density = box_mean(combined, window_size)
 
     # Normalize
-    density = cv2.normalize(density, None, 0, 255, cv2.NORM_MINMAX).astype(np.uint8)
-
-    return density
+    return normalize_density(density)
 
 
 def segment_by_density(
@@ -197,17 +180,10 @@ def detect_racking_orientation(
         return None
 
     # Count horizontal vs vertical lines
-    horizontal = 0
-    vertical = 0
-
-    for line in lines:
-        x1, y1, x2, y2 = line[0]
-        angle = np.degrees(np.arctan2(abs(y2 - y1), abs(x2 - x1)))
-
-        if angle < 30:  # Near horizontal
-            horizontal += 1
-        elif angle > 60:  # Near vertical
-            vertical += 1
+    lines = np.asarray(lines).reshape(-1, 4).astype(np.float64)
+    angle = np.degrees(np.arctan2(np.abs(lines[:, 3] - lines[:, 1]), np.abs(lines[:, 2] - lines[:, 0])))
+    horizontal = int(np.sum(angle < 30))  # Near horizontal
+    vertical = int(np.sum(angle > 60))  # Near vertical
 
     if horizontal > vertical * 1.5:
         return "horizontal"
@@ -293,10 +269,7 @@ def segmentation_result_to_dict(result: SegmentationResult) -> Dict[str, Any]:
                     "width": int(region.bounding_box[2]),
                     "height": int(region.bounding_box[3]),
                 },
-                "vertices": [
-                    {"x": int(pt[0][0]), "y": int(pt[0][1])}
-                    for pt in region.contour
-                ],
+                "vertices": PointList(region.contour),
                 "area": int(region.area),
                 "density_score": round(float(region.density_score), 3),
                 "region_type": region.region_type.value,
@@ -0,0 +1,366 @@
+"""
+Compact Encodings for Preprocessing Results
+
+The default JSON response spells out every contour vertex, region vertex
+and centerline point as {"x": ..., "y": ...}. Two compact formats are
+negotiated through the Accept header:
+
+- COMPACT_JSON_MEDIA_TYPE: the same document with every point list
+  replaced by a delta-encoded flat list, {"$xy": [x0, y0, dx1, dy1, ...]}
+  for point dicts and {"$pairs": [...]} for [x, y] pairs, and lists of
+  records sharing the same keys stored as {"$rows": [keys, row, row, ...]}
+- NPZ_MEDIA_TYPE: a NumPy .npz container holding all point lists as one
+  int32 (N, 2) "coords" array with "offsets" (and "kinds"), plus the
+  remaining document as UTF-8 JSON in "document" with {"$ref": i}
+  placeholders
+
+Both decode back to the plain JSON document (expand_compact, decode_npz).
+Stage results build their point lists as PointList, which keeps the int32
+coordinate array it was made from, so both compact formats take the
+coordinates straight from NumPy instead of re-reading every point dict.
+Responses can additionally be gzip or (if the optional brotli package is
+installed) brotli compressed, negotiated through Accept-Encoding.
+"""
+
+import gzip
+import io
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import brotli
+except ImportError:  # Optional: brotli compression is offered only when installed
+    brotli = None
+
+
+JSON_MEDIA_TYPE = "application/json"
+COMPACT_JSON_MEDIA_TYPE = "application/vnd.floorplan.compact+json"
+NPZ_MEDIA_TYPE = "application/vnd.floorplan.npz"
+RESPONSE_FORMATS = (JSON_MEDIA_TYPE, COMPACT_JSON_MEDIA_TYPE, NPZ_MEDIA_TYPE)
+
+# Bodies smaller than this are sent uncompressed
+MIN_COMPRESS_BYTES = 1024
+
+_XY = "$xy"
+_PAIRS = "$pairs"
+_ROWS = "$rows"
+_REF = "$ref"
+
+
+class PointList(list):
+    """
+    A [{"x": x, "y": y}, ...] point list that keeps its int32 (N, 2) array.
+
+    It is an ordinary list in JSON documents. compact_result and
+    encode_npz read .array instead of the point dicts. Operations that
+    build new lists (e.g. scaling) return plain lists unless they carry
+    the array over.
+    """
+    __slots__ = ("array",)
+
+    def __init__(self, points: Any = ()):
+        """
+        Args:
+            points: (N, 2) array-like of x, y (cast to int32, truncating)
+        """
+        array = np.asarray(points)
+        array = (array if array.size else np.empty((0, 2))).reshape(-1, 2).astype(np.int32)
+        super().__init__({"x": x, "y": y} for x, y in array.tolist())
+        self.array = array
+
+
+def _parse_header(header: Optional[str]) -> List[Tuple[str, float]]:
+    """Parse an Accept-style header into (value, q) pairs, highest q first."""
+    entries = []
+    for position, part in enumerate((header or "").split(",")):
+        fields = [f.strip() for f in part.split(";")]
+        if not fields[0]:
+            continue
+        q = 1.0
+        for param in fields[1:]:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        entries.append((fields[0].lower(), q, position))
+    entries.sort(key=lambda e: (-e[1], e[2]))
+    return [(value, q) for value, q, _ in entries if q > 0]
+
+
+def negotiate_format(accept: Optional[str]) -> str:
+    """
+    Pick the response media type from an Accept header.
+
+    Args:
+        accept: Accept header value (None or "*/*" selects JSON)
+
+    Returns:
+        One of RESPONSE_FORMATS; JSON unless a compact format is preferred
+    """
+    for media_type, _ in _parse_header(accept):
+        if media_type in RESPONSE_FORMATS:
+            return media_type
+        if media_type in ("*/*", "application/*"):
+            return JSON_MEDIA_TYPE
+    return JSON_MEDIA_TYPE
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick a content encoding from an Accept-Encoding header.
+
+    Args:
+        accept_encoding: Accept-Encoding header value
+
+    Returns:
+        "br" (if brotli is installed), "gzip", or None for identity
+    """
+    available = ("br", "gzip") if brotli is not None else ("gzip",)
+    for coding, _ in _parse_header(accept_encoding):
+        if coding in available:
+            return coding
+        if coding == "*":
+            return available[0]
+    return None
+
+
+def compress(body: bytes, encoding: Optional[str]) -> bytes:
+    """Compress a body with "gzip" or "br" (None returns it unchanged)."""
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6)
+    if encoding == "br":
+        if brotli is None:
+            raise ValueError("brotli is not installed")
+        return brotli.compress(body, quality=5)
+    if encoding is None:
+        return body
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, (int, np.integer)) and not isinstance(value, (bool, np.bool_))
+
+
+def _point_list_kind(value: list) -> Optional[str]:
+    """Classify a list as integer point dicts, integer [x, y] pairs, or neither."""
+    first = value[0]
+    if isinstance(first, dict):
+        if all(
+            isinstance(p, dict) and len(p) == 2 and _is_int(p.get("x")) and _is_int(p.get("y"))
+            for p in value
+        ):
+            return _XY
+    elif isinstance(first, (list, tuple)):
+        if all(isinstance(p, (list, tuple)) and len(p) == 2 and _is_int(p[0]) and _is_int(p[1]) for p in value):
+            return _PAIRS
+    return None
+
+
+def _points_array(value: list, kind: str) -> np.ndarray:
+    if kind == _XY:
+        return np.array([(p["x"], p["y"]) for p in value], dtype=np.int64).reshape(-1, 2)
+    return np.array(value, dtype=np.int64).reshape(-1, 2)
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize NumPy scalars and arrays left in a document."""
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        return float(obj)
+    if isinstance(obj, np.bool_):
+        return bool(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _delta_encode(points: np.ndarray) -> List[int]:
+    deltas = points.copy()
+    deltas[1:] -= points[:-1]
+    return deltas.ravel().tolist()
+
+
+def _delta_decode(flat: List[int]) -> np.ndarray:
+    return np.cumsum(np.asarray(flat, dtype=np.int64).reshape(-1, 2), axis=0)
+
+
+def compact_result(data: Any) -> Any:
+    """
+    Delta-encode integer point lists and store same-keyed record lists as rows.
+
+    Args:
+        data: JSON document (e.g. from pipeline.result_to_json)
+
+    Returns:
+        Compact document; expand_compact restores the original
+    """
+    if isinstance(data, dict):
+        return {key: compact_result(value) for key, value in data.items()}
+    if isinstance(data, PointList) and data:
+        return {_XY: _delta_encode(data.array.astype(np.int64))}
+    if isinstance(data, (list, tuple)):
+        if data:
+            kind = _point_list_kind(data)
+            if kind is not None:
+                return {kind: _delta_encode(_points_array(data, kind))}
+            if len(data) > 1 and isinstance(data[0], dict):
+                keys = list(data[0])
+                if all(isinstance(item, dict) and list(item) == keys for item in data):
+                    rows = [[compact_result(item[key]) for key in keys] for item in data]
+                    return {_ROWS: [keys] + rows}
+        return [compact_result(item) for item in data]
+    return data
+
+
+def expand_compact(data: Any) -> Any:
+    """
+    Restore a document produced by compact_result.
+
+    Args:
+        data: Compact document
+
+    Returns:
+        Plain JSON document (point pairs come back as lists)
+    """
+    if isinstance(data, dict):
+        if len(data) == 1 and (_XY in data or _PAIRS in data):
+            kind, flat = next(iter(data.items()))
+            points = _delta_decode(flat).tolist()
+            if kind == _XY:
+                return [{"x": x, "y": y} for x, y in points]
+            return points
+        if len(data) == 1 and _ROWS in data:
+            keys, *rows = data[_ROWS]
+            return [
+                {key: expand_compact(value) for key, value in zip(keys, row)}
+                for row in rows
+            ]
+        return {key: expand_compact(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [expand_compact(item) for item in data]
+    return data
+
+
+def encode_npz(data: Dict[str, Any]) -> bytes:
+    """
+    Encode a result document as an .npz container with flat coordinate arrays.
+
+    Args:
+        data: JSON document (e.g. from pipeline.result_to_json)
+
+    Returns:
+        Compressed .npz bytes; decode_npz restores the document
+    """
+    chunks: List[np.ndarray] = []
+    kinds: List[int] = []
+
+    def extract(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {key: extract(v) for key, v in value.items()}
+        if isinstance(value, PointList) and value:
+            chunks.append(value.array)
+            kinds.append(0)
+            return {_REF: len(chunks) - 1}
+        if isinstance(value, (list, tuple)):
+            if value:
+                kind = _point_list_kind(value)
+                if kind is not None:
+                    chunks.append(_points_array(value, kind))
+                    kinds.append(0 if kind == _XY else 1)
+                    return {_REF: len(chunks) - 1}
+            return [extract(item) for item in value]
+        return value
+
+    document = extract(data)
+    lengths = np.array([len(c) for c in chunks], dtype=np.int64)
+    offsets = np.zeros(len(chunks) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    coords = (
+        np.concatenate(chunks).astype(np.int32)
+        if chunks else np.empty((0, 2), dtype=np.int32)
+    )
+
+    buffer = io.BytesIO()
+    np.savez_compressed(
+        buffer,
+        document=np.frombuffer(_dumps(document), dtype=np.uint8),
+        coords=coords,
+        offsets=offsets,
+        kinds=np.array(kinds, dtype=np.uint8),
+    )
+    return buffer.getvalue()
+
+
+def decode_npz(body: bytes) -> Dict[str, Any]:
+    """
+    Decode an .npz container produced by encode_npz.
+
+    Args:
+        body: .npz bytes
+
+    Returns:
+        Plain JSON document
+    """
+    with np.load(io.BytesIO(body), allow_pickle=False) as archive:
+        document = json.loads(archive["document"].tobytes().decode("utf-8"))
+        coords = archive["coords"]
+        offsets = archive["offsets"]
+        kinds = archive["kinds"]
+
+    def restore(value: Any) -> Any:
+        if isinstance(value, dict):
+            if len(value) == 1 and _REF in value:
+                i = value[_REF]
+                points = coords[offsets[i]:offsets[i + 1]].tolist()
+                if kinds[i] == 0:
+                    return [{"x": x, "y": y} for x, y in points]
+                return points
+            return {key: restore(v) for key, v in value.items()}
+        if isinstance(value, list):
+            return [restore(item) for item in value]
+        return value
+
+    return restore(document)
+
+
+def _dumps(data: Any) -> bytes:
+    return json.dumps(data, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+
+def encode_result(
+    data: Dict[str, Any],
+    media_type: str = JSON_MEDIA_TYPE,
+    encoding: Optional[str] = None,
+) -> Tuple[bytes, Optional[str]]:
+    """
+    Serialize a result document in a negotiated format and encoding.
+
+    Small bodies and .npz containers (already deflated) are not compressed.
+
+    Args:
+        data: JSON-serializable document (NumPy scalars are converted)
+        media_type: One of RESPONSE_FORMATS
+        encoding: Requested content encoding ("gzip", "br") or None
+
+    Returns:
+        Tuple of (response body, content encoding applied or None)
+
+    Raises:
+        ValueError: If the media type or encoding is unsupported
+    """
+    if media_type == JSON_MEDIA_TYPE:
+        body = _dumps(data)
+    elif media_type == COMPACT_JSON_MEDIA_TYPE:
+        body = _dumps(compact_result(data))
+    elif media_type == NPZ_MEDIA_TYPE:
+        return encode_npz(data), None
+    else:
+        raise ValueError(f"Unsupported response format: {media_type}. Available: {list(RESPONSE_FORMATS)}")
+    if encoding is None or len(body) < MIN_COMPRESS_BYTES:
+        return body, None
+    return compress(body, encoding), encoding
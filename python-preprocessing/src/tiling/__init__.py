@@ -10,6 +10,7 @@ from .tiler import ImageTiler
 from .transforms import tile_to_original, transform_polygon, original_to_tile
 from .iou import calculate_iou, calculate_iou_fast, zones_overlap
 from .merging import merge_zones, MergedZone, find_merge_candidates
+from .scheduling import TileCostModel, CostProgress
 from .processor import TileProcessor, ProcessingProgress
 
 __all__ = [
@@ -33,6 +34,9 @@ __all__ = [
     "merge_zones",
     "MergedZone",
     "find_merge_candidates",
+    # Scheduling
+    "TileCostModel",
+    "CostProgress",
     # Processor
     "TileProcessor",
     "ProcessingProgress",
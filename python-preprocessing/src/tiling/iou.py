@@ -5,6 +5,7 @@ Task 4.1: Implement IoU Calculation for Zone Matching
 """
 
 from typing import List, Tuple, Optional
+import cv2
 import numpy as np
 
 
@@ -24,8 +25,6 @@ def polygon_to_mask(
     Returns:
         Binary mask (0s and 1s) as numpy array
     """
-    import cv2
-
     mask = np.zeros((height, width), dtype=np.uint8)
     if len(polygon) < 3:
         return mask
@@ -6,6 +6,7 @@ Task 4.2: Implement Zone Merging Strategy
 
 from typing import List, Dict, Any, Tuple, Optional
 from dataclasses import dataclass, field
+import cv2
 import numpy as np
 
 from .iou import calculate_iou, polygon_bounding_box, calculate_iou_fast
@@ -124,8 +125,6 @@ def merge_polygons(
     Returns:
         Merged polygon vertices
     """
-    import cv2
-
     if not polygons:
         return []
 
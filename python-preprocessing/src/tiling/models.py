@@ -44,11 +44,13 @@ class ImageTile:
         image: Tile pixel data (numpy array, BGR)
         bounds: (x1, y1, x2, y2) in original image coordinates
         overlap_regions: List of overlap regions with adjacent tiles
+        grid_index: (row, col) for grid tiles, None for smart-boundary tiles
     """
     id: str
     image: np.ndarray
     bounds: Tuple[int, int, int, int]  # (x1, y1, x2, y2) in original image
     overlap_regions: List[OverlapRegion] = field(default_factory=list)
+    grid_index: Optional[Tuple[int, int]] = None
 
     @property
     def x1(self) -> int:
@@ -98,6 +100,7 @@ class ImageTile:
             "width": self.width,
             "height": self.height,
             "overlap_regions": [r.to_dict() for r in self.overlap_regions],
+            "grid_index": list(self.grid_index) if self.grid_index else None,
         }
 
 
@@ -167,6 +170,9 @@ class TilingConfig:
     smart_boundaries: bool = True  # Use Phase 0 for smart splits
     merge_iou_threshold: float = 0.3  # IoU threshold for merging zones
     max_parallel_tiles: int = 4  # Max concurrent tile processing
+    cost_ordering: bool = True  # Process the most expensive tiles first
+    skip_blank_tiles: bool = False  # Return no zones for nearly blank tiles
+    blank_ink_fraction: float = 0.001  # Ink fraction at or below which a tile is blank
 
     def __post_init__(self):
         """Validate configuration."""
@@ -176,6 +182,8 @@ class TilingConfig:
             raise ValueError(f"merge_iou_threshold must be 0-1, got {self.merge_iou_threshold}")
         if self.max_parallel_tiles < 1:
             raise ValueError(f"max_parallel_tiles must be >= 1, got {self.max_parallel_tiles}")
+        if self.blank_ink_fraction < 0 or self.blank_ink_fraction > 1:
+            raise ValueError(f"blank_ink_fraction must be 0-1, got {self.blank_ink_fraction}")
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -187,6 +195,9 @@ class TilingConfig:
             "smart_boundaries": self.smart_boundaries,
             "merge_iou_threshold": self.merge_iou_threshold,
             "max_parallel_tiles": self.max_parallel_tiles,
+            "cost_ordering": self.cost_ordering,
+            "skip_blank_tiles": self.skip_blank_tiles,
+            "blank_ink_fraction": self.blank_ink_fraction,
         }
 
     @classmethod
@@ -200,4 +211,7 @@ class TilingConfig:
             smart_boundaries=data.get("smart_boundaries", True),
             merge_iou_threshold=data.get("merge_iou_threshold", 0.3),
             max_parallel_tiles=data.get("max_parallel_tiles", 4),
+            cost_ordering=data.get("cost_ordering", True),
+            skip_blank_tiles=data.get("skip_blank_tiles", False),
+            blank_ink_fraction=data.get("blank_ink_fraction", 0.001),
         )
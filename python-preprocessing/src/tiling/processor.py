@@ -6,18 +6,21 @@ Task 4.5: Implement Parallel Tile Processing
 Task 4.6: Add Progress Tracking for Tiled Processing
 """
 
-from typing import List, Callable, Optional, Any, Dict, TYPE_CHECKING
-from dataclasses import dataclass, field
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Callable, Optional, Any, Dict, Iterable, Iterator, Tuple, TYPE_CHECKING
+from dataclasses import dataclass, field, replace
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import numpy as np
 
 from .models import ImageTile, TileZoneResult, TilingConfig, Zone
 from .tiler import ImageTiler
 from .merging import merge_zones, deduplicate_zones, MergedZone
 from .smart_boundaries import create_smart_boundaries
+from .scheduling import CostProgress, TileCostModel
+from ..concurrency import get_governor
 
 if TYPE_CHECKING:
     from ..color_boundary.models import ColorBoundaryResult
+    from ..processing.cache import ResultCache
 
 
 @dataclass
@@ -28,6 +31,7 @@ class ProcessingProgress:
     current_tile: Optional[str] = None
     status: str = "pending"  # pending, processing, merging, complete, error
     error_message: Optional[str] = None
+    eta_seconds: Optional[float] = None  # Estimated from tile costs
 
     @property
     def progress_percent(self) -> float:
@@ -45,6 +49,7 @@ class ProcessingProgress:
             "status": self.status,
             "progress_percent": self.progress_percent,
             "error_message": self.error_message,
+            "eta_seconds": self.eta_seconds,
         }
 
 
@@ -59,7 +64,7 @@ class TileProcessor:
     Handles:
     - Deciding whether to tile
     - Creating tiles with smart boundaries
-    - Processing tiles (sequentially or in parallel)
+    - Processing tiles (sequentially or in parallel), most expensive first
     - Merging results
 
     Example:
@@ -71,6 +76,8 @@ class TileProcessor:
         self,
         config: Optional[TilingConfig] = None,
         progress_callback: Optional[Callable[[ProcessingProgress], None]] = None,
+        cache: Optional["ResultCache"] = None,
+        cache_context: Optional[Dict[str, Any]] = None,
     ):
         """
         Initialize the tile processor.
@@ -78,11 +85,22 @@ class TileProcessor:
         Args:
             config: Tiling configuration
             progress_callback: Optional callback for progress updates
+            cache: Optional result cache for per-tile zones; tiles whose
+                pixels (overlap included) are unchanged are not reprocessed
+            cache_context: Settings that affect process_fn output, hashed
+                into tile cache keys with the tiling config
         """
         self.config = config or TilingConfig()
         self.progress_callback = progress_callback
         self.tiler = ImageTiler(config=self.config)
+        self.cache = cache
+        self.cache_context = cache_context or {}
         self._progress = ProcessingProgress(total_tiles=0, completed_tiles=0)
+        self._cost_progress: Optional[CostProgress] = None
+        self.tile_costs: Dict[str, float] = {}
+        self.tile_stats: Dict[str, int] = {
+            "tiles": 0, "tiles_reused": 0, "tiles_blank": 0, "tiles_processed": 0,
+        }
 
     def should_tile(self, image: np.ndarray) -> bool:
         """
@@ -113,10 +131,34 @@ class TileProcessor:
         Returns:
             List of ImageTile objects
         """
+        _, tiles = self.iter_tiles(image, phase0_boundaries)
+        return [replace(tile, image=tile.image.copy()) for tile in tiles]
+
+    def iter_tiles(
+        self,
+        image: np.ndarray,
+        phase0_boundaries: Optional["ColorBoundaryResult"] = None,
+        costs: Optional[TileCostModel] = None,
+    ) -> Tuple[int, Iterator[ImageTile]]:
+        """
+        Plan tiles and yield them lazily as views into the image.
+
+        Estimated costs are kept in tile_costs (tile id -> cost, in tile
+        index order). With a cost model and config.cost_ordering, tiles are
+        yielded most expensive first so a heavy tile never starts last.
+
+        Args:
+            image: Input image
+            phase0_boundaries: Optional Phase 0 results for smart boundaries
+            costs: Optional cost model (default cost: tile area)
+
+        Returns:
+            Tuple of (tile count, iterator of ImageTile objects)
+        """
         height, width = image.shape[:2]
+        smart = self.config.smart_boundaries and phase0_boundaries is not None
 
-        if self.config.smart_boundaries and phase0_boundaries is not None:
-            # Use smart boundaries
+        if smart:
             boundaries = create_smart_boundaries(
                 width=width,
                 height=height,
@@ -124,22 +166,38 @@ class TileProcessor:
                 tile_size=self.config.tile_size,
                 overlap=self.config.overlap,
             )
+        else:
+            rows, cols = self.tiler.grid_shape(width, height)
+            boundaries = [
+                self.tiler.tile_bounds(row, col, width, height)
+                for row in range(rows) for col in range(cols)
+            ]
 
-            # Create tiles from boundaries
-            tiles = []
-            for i, (x1, y1, x2, y2) in enumerate(boundaries):
-                tile_image = image[y1:y2, x1:x2].copy()
-                tile = ImageTile(
+        estimates = [
+            costs.cost(b) if costs is not None else float((b[2] - b[0]) * (b[3] - b[1]))
+            for b in boundaries
+        ]
+        self.tile_costs = {f"tile_{i}": cost for i, cost in enumerate(estimates)}
+        order = None
+        if costs is not None and self.config.cost_ordering:
+            # Longest first; ties keep tile index order
+            order = sorted(range(len(boundaries)), key=lambda i: -estimates[i])
+
+        if smart:
+            tiles = (
+                ImageTile(
                     id=f"tile_{i}",
-                    image=tile_image,
+                    image=image[y1:y2, x1:x2],
                     bounds=(x1, y1, x2, y2),
                     overlap_regions=[],  # TODO: Calculate overlaps
                 )
-                tiles.append(tile)
-            return tiles
-        else:
-            # Use grid-based tiling
-            return self.tiler.create_tiles(image)
+                for i in (order or range(len(boundaries)))
+                for x1, y1, x2, y2 in [boundaries[i]]
+            )
+            return len(boundaries), tiles
+
+        # Use grid-based tiling
+        return len(boundaries), self.tiler.iter_tiles(image, order=order)
 
     def process(
         self,
@@ -186,35 +244,119 @@ class TileProcessor:
                 for i, z in enumerate(zones)
             ]
 
-        # Create tiles
-        tiles = self.create_tiles(image, phase0_boundaries)
-        self._update_progress(len(tiles), 0, "processing")
+        # Stream tiles (most expensive first): only tiles in flight are held
+        costs = None
+        if self.config.cost_ordering or self.config.skip_blank_tiles:
+            costs = TileCostModel(image)
+        total, tiles = self.iter_tiles(image, phase0_boundaries, costs)
+        self._cost_progress = CostProgress(self.tile_costs.values())
+        self._update_progress(total, 0, "processing")
+
+        blank: Dict[str, TileZoneResult] = {}
+        reused: Dict[str, TileZoneResult] = {}
+        fresh: Dict[str, List[Zone]] = {}
+        keys: Dict[str, Any] = {}
+        if self.config.skip_blank_tiles:
+            tiles = self._skip_blank_tiles(tiles, costs, blank)
+        if self.cache is not None:
+            tiles = self._skip_cached_tiles(tiles, reused, keys)
+            process_fn = self._recording(process_fn, fresh)
 
         # Process tiles
-        if parallel and len(tiles) > 1:
-            tile_results = self._process_parallel(tiles, process_fn)
+        if parallel and total > 1:
+            tile_results = self._process_parallel(tiles, total, process_fn)
         else:
-            tile_results = self._process_sequential(tiles, process_fn)
+            tile_results = self._process_sequential(tiles, total, process_fn)
+
+        self.tile_stats = {
+            "tiles": total,
+            "tiles_reused": len(reused),
+            "tiles_blank": len(blank),
+            "tiles_processed": total - len(reused) - len(blank),
+        }
+        # Store only tiles that processed successfully
+        for tile_id, zones in fresh.items():
+            self.cache.set(keys[tile_id], {"zones": zones})
+
+        # Merge in tile index order, whatever order tiles ran in
+        by_id = {r.tile_id: r for r in tile_results}
+        by_id.update(reused)
+        by_id.update(blank)
+        tile_results = [by_id[tile_id] for tile_id in self.tile_costs if tile_id in by_id]
 
         # Merge results
-        self._update_progress(len(tiles), len(tiles), "merging")
+        self._update_progress(total, total, "merging")
         merged = merge_zones(tile_results, self.config.merge_iou_threshold)
 
         # Deduplicate
         final_zones = deduplicate_zones(merged, iou_threshold=0.9)
 
-        self._update_progress(len(tiles), len(tiles), "complete")
+        self._update_progress(total, total, "complete")
         return final_zones
 
+    def _tile_cache_key(self, tile: ImageTile) -> Any:
+        """Cache key from the tile's pixels, the tiling config and cache_context."""
+        # Deferred: src.processing imports this module
+        from ..processing.cache import CacheKey
+
+        return CacheKey.from_pixels(tile.image, {
+            "tile_size": self.config.tile_size,
+            "overlap": self.config.overlap,
+            "smart_boundaries": self.config.smart_boundaries,
+            "context": self.cache_context,
+        })
+
+    def _skip_blank_tiles(
+        self,
+        tiles: Iterable[ImageTile],
+        costs: TileCostModel,
+        blank: Dict[str, TileZoneResult],
+    ) -> Iterator[ImageTile]:
+        """Yield only tiles with ink; nearly blank tiles get no zones."""
+        for tile in tiles:
+            if costs.ink_fraction(tile.bounds) <= self.config.blank_ink_fraction:
+                blank[tile.id] = TileZoneResult(tile_id=tile.id, zones=[], bounds=tile.bounds)
+                self._cost_progress.skip(self.tile_costs[tile.id])
+                continue
+            yield tile
+
+    def _skip_cached_tiles(
+        self,
+        tiles: Iterable[ImageTile],
+        reused: Dict[str, TileZoneResult],
+        keys: Dict[str, Any],
+    ) -> Iterator[ImageTile]:
+        """Yield only tiles without cached zones, collecting cache hits."""
+        for tile in tiles:
+            key = self._tile_cache_key(tile)
+            cached = self.cache.get(key)
+            if cached is not None:
+                reused[tile.id] = TileZoneResult(tile_id=tile.id, zones=cached["zones"], bounds=tile.bounds)
+                self._cost_progress.skip(self.tile_costs[tile.id])
+                continue
+            keys[tile.id] = key
+            yield tile
+
+    @staticmethod
+    def _recording(process_fn: TileProcessorFn, fresh: Dict[str, List[Zone]]) -> TileProcessorFn:
+        """Wrap process_fn to record zones of tiles that processed without error."""
+        def run(tile: ImageTile) -> List[Zone]:
+            zones = process_fn(tile)
+            fresh[tile.id] = zones
+            return zones
+
+        return run
+
     def _process_sequential(
         self,
-        tiles: List[ImageTile],
+        tiles: Iterable[ImageTile],
+        total: int,
         process_fn: TileProcessorFn,
     ) -> List[TileZoneResult]:
         """Process tiles sequentially."""
         results = []
         for i, tile in enumerate(tiles):
-            self._update_progress(len(tiles), i, "processing", tile.id)
+            self._update_progress(total, i, "processing", tile.id)
             try:
                 zones = process_fn(tile)
                 results.append(TileZoneResult(
@@ -223,51 +365,63 @@ class TileProcessor:
                     bounds=tile.bounds,
                 ))
             except Exception as e:
-                self._update_progress(len(tiles), i, "error", tile.id, str(e))
+                self._update_progress(total, i, "error", tile.id, str(e))
                 # Continue processing other tiles
                 results.append(TileZoneResult(
                     tile_id=tile.id,
                     zones=[],
                     bounds=tile.bounds,
                 ))
+            self._cost_progress.complete(self.tile_costs.get(tile.id, 0.0))
 
         return results
 
     def _process_parallel(
         self,
-        tiles: List[ImageTile],
+        tiles: Iterable[ImageTile],
+        total: int,
         process_fn: TileProcessorFn,
     ) -> List[TileZoneResult]:
-        """Process tiles in parallel using ThreadPoolExecutor."""
-        results = [None] * len(tiles)
-        completed = 0
-
-        with ThreadPoolExecutor(max_workers=self.config.max_parallel_tiles) as executor:
-            future_to_idx = {
-                executor.submit(process_fn, tile): i
-                for i, tile in enumerate(tiles)
-            }
-
-            for future in as_completed(future_to_idx):
-                idx = future_to_idx[future]
-                tile = tiles[idx]
-                completed += 1
+        """
+        Process tiles in parallel using ThreadPoolExecutor.
 
-                try:
-                    zones = future.result()
+        Tiles are pulled from the stream only as workers free up, so at
+        most one tile per worker is in flight.
+        """
+        results: List[Optional[TileZoneResult]] = [None] * total
+        completed = 0
+        tile_iter = enumerate(tiles)
+
+        with get_governor().parallel_region("tiles", self.config.max_parallel_tiles) as region, \
+                ThreadPoolExecutor(max_workers=region.workers) as executor:
+            task = region.wrap(process_fn)
+            in_flight: Dict[Any, Tuple[int, ImageTile]] = {}
+
+            def submit_next() -> None:
+                for idx, tile in tile_iter:
+                    in_flight[executor.submit(task, tile)] = (idx, tile)
+                    return
+
+            for _ in range(region.workers):
+                submit_next()
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    idx, tile = in_flight.pop(future)
+                    completed += 1
+                    self._cost_progress.complete(self.tile_costs.get(tile.id, 0.0))
+                    try:
+                        zones = future.result()
+                    except Exception:
+                        zones = []
                     results[idx] = TileZoneResult(
                         tile_id=tile.id,
                         zones=zones,
                         bounds=tile.bounds,
                     )
-                    self._update_progress(len(tiles), completed, "processing", tile.id)
-                except Exception as e:
-                    results[idx] = TileZoneResult(
-                        tile_id=tile.id,
-                        zones=[],
-                        bounds=tile.bounds,
-                    )
-                    self._update_progress(len(tiles), completed, "processing", tile.id)
+                    self._update_progress(total, completed, "processing", tile.id)
+                    submit_next()
 
         return [r for r in results if r is not None]
 
@@ -280,12 +434,16 @@ class TileProcessor:
         error: Optional[str] = None,
     ):
         """Update progress and notify callback."""
+        eta = None
+        if status == "processing" and self._cost_progress is not None:
+            eta = self._cost_progress.eta_seconds
         self._progress = ProcessingProgress(
             total_tiles=total,
             completed_tiles=completed,
             current_tile=current_tile,
             status=status,
             error_message=error,
+            eta_seconds=eta,
         )
 
         if self.progress_callback:
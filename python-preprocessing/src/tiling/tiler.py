@@ -7,7 +7,7 @@ Task 3.4: Implement Tile Creation from Image
 """
 
 import numpy as np
-from typing import List, Tuple, Optional, TYPE_CHECKING
+from typing import Iterable, Iterator, List, Tuple, Optional, TYPE_CHECKING
 
 from .models import ImageTile, OverlapRegion, TilingConfig
 
@@ -22,8 +22,7 @@ class ImageTiler:
     Example:
         >>> tiler = ImageTiler(tile_size=2048, overlap=256)
         >>> if tiler.should_tile(image):
-        ...     tiles = tiler.create_tiles(image)
-        ...     for tile in tiles:
+        ...     for tile in tiler.iter_tiles(image):
         ...         process(tile)
     """
 
@@ -69,6 +68,40 @@ class ImageTiler:
         height, width = image.shape[:2]
         return width > self.max_dimension or height > self.max_dimension
 
+    @property
+    def step(self) -> int:
+        """Distance between the starts of adjacent tiles."""
+        return self.tile_size - self.overlap
+
+    def grid_shape(self, width: int, height: int) -> Tuple[int, int]:
+        """
+        Number of tile rows and columns for given dimensions.
+
+        Args:
+            width: Image width
+            height: Image height
+
+        Returns:
+            Tuple of (rows, cols)
+        """
+        return -(-height // self.step), -(-width // self.step)
+
+    def tile_bounds(self, row: int, col: int, width: int, height: int) -> Tuple[int, int, int, int]:
+        """
+        Bounds of the tile at a grid position.
+
+        Args:
+            row: Grid row
+            col: Grid column
+            width: Image width
+            height: Image height
+
+        Returns:
+            (x1, y1, x2, y2) in image coordinates
+        """
+        x1, y1 = col * self.step, row * self.step
+        return (x1, y1, min(x1 + self.tile_size, width), min(y1 + self.tile_size, height))
+
     def _calculate_grid_boundaries(
         self,
         width: int,
@@ -82,71 +115,63 @@ class ImageTiler:
             height: Image height
 
         Returns:
-            List of (x1, y1, x2, y2) tile boundaries
+            List of (x1, y1, x2, y2) tile boundaries, row by row
         """
-        # Calculate effective step (how much we advance between tile starts)
-        step = self.tile_size - self.overlap
-
-        boundaries = []
-
-        # Generate grid
-        y = 0
-        row = 0
-        while y < height:
-            x = 0
-            col = 0
-            while x < width:
-                # Calculate tile bounds
-                x1 = x
-                y1 = y
-                x2 = min(x + self.tile_size, width)
-                y2 = min(y + self.tile_size, height)
-
-                boundaries.append((x1, y1, x2, y2))
-
-                # Move to next column
-                x += step
-                col += 1
-
-                # If we've reached the end but the last tile is too small,
-                # adjust to ensure full coverage
-                if x >= width and x2 < width:
-                    break
+        rows, cols = self.grid_shape(width, height)
+        return [
+            self.tile_bounds(row, col, width, height)
+            for row in range(rows)
+            for col in range(cols)
+        ]
+
+    def neighbors(self, row: int, col: int, width: int, height: int) -> Iterator[Tuple[int, int]]:
+        """
+        Grid positions of the tiles overlapping the tile at (row, col).
 
-            # Move to next row
-            y += step
-            row += 1
+        Tiles d steps apart overlap while d * step < tile_size, so only a
+        fixed window around the tile is checked, whatever the grid size.
 
-            if y >= height and y2 < height:
-                break
+        Args:
+            row: Grid row
+            col: Grid column
+            width: Image width
+            height: Image height
 
-        return boundaries
+        Yields:
+            (row, col) of each overlapping tile, in tile index order
+        """
+        rows, cols = self.grid_shape(width, height)
+        reach = (self.tile_size - 1) // self.step
+        for r in range(max(0, row - reach), min(rows, row + reach + 1)):
+            for c in range(max(0, col - reach), min(cols, col + reach + 1)):
+                if (r, c) != (row, col):
+                    yield r, c
 
     def _calculate_overlap_regions(
         self,
-        tile_bounds: Tuple[int, int, int, int],
-        all_boundaries: List[Tuple[int, int, int, int]],
-        tile_index: int,
+        row: int,
+        col: int,
+        width: int,
+        height: int,
     ) -> List[OverlapRegion]:
         """
-        Calculate overlap regions between a tile and its neighbors.
+        Calculate overlap regions between a tile and its grid neighbors.
 
         Args:
-            tile_bounds: (x1, y1, x2, y2) of current tile
-            all_boundaries: List of all tile boundaries
-            tile_index: Index of current tile
+            row: Grid row of the tile
+            col: Grid column of the tile
+            width: Image width
+            height: Image height
 
         Returns:
             List of OverlapRegion objects
         """
-        x1, y1, x2, y2 = tile_bounds
+        x1, y1, x2, y2 = self.tile_bounds(row, col, width, height)
+        cols = self.grid_shape(width, height)[1]
         overlaps = []
 
-        for i, other_bounds in enumerate(all_boundaries):
-            if i == tile_index:
-                continue
-
-            ox1, oy1, ox2, oy2 = other_bounds
+        for r, c in self.neighbors(row, col, width, height):
+            ox1, oy1, ox2, oy2 = self.tile_bounds(r, c, width, height)
 
             # Check for overlap
             inter_x1 = max(x1, ox1)
@@ -156,59 +181,69 @@ class ImageTiler:
 
             if inter_x1 < inter_x2 and inter_y1 < inter_y2:
                 # Convert to tile-local coordinates
-                local_x1 = inter_x1 - x1
-                local_y1 = inter_y1 - y1
-                local_x2 = inter_x2 - x1
-                local_y2 = inter_y2 - y1
-
                 overlaps.append(OverlapRegion(
-                    adjacent_tile_id=f"tile_{i}",
-                    region=(local_x1, local_y1, local_x2, local_y2),
+                    adjacent_tile_id=f"tile_{r * cols + c}",
+                    region=(inter_x1 - x1, inter_y1 - y1, inter_x2 - x1, inter_y2 - y1),
                 ))
 
         return overlaps
 
-    def create_tiles(
+    def iter_tiles(
         self,
         image: np.ndarray,
-        phase0_boundaries: Optional["ColorBoundaryResult"] = None,
-    ) -> List[ImageTile]:
+        copy: bool = False,
+        order: Optional[Iterable[int]] = None,
+    ) -> Iterator[ImageTile]:
         """
-        Create tiles from an image.
+        Yield tiles one at a time, in tile index order unless order is given.
+
+        Tile images are NumPy views into the source unless copy is set, so
+        iterating costs no pixel memory; only tiles a caller keeps (or
+        copies) add to the peak.
 
         Args:
             image: Input image (H, W, C)
-            phase0_boundaries: Optional Phase 0 results for smart boundary alignment
+            copy: Give each tile its own copy of the pixels
+            order: Tile indices (row * cols + col) to yield, in this order
 
-        Returns:
-            List of ImageTile objects
+        Yields:
+            ImageTile objects with grid_index and overlap regions
         """
         height, width = image.shape[:2]
+        rows, cols = self.grid_shape(width, height)
 
-        # Calculate boundaries (grid-based for now)
-        # Smart boundaries are handled in smart_boundaries.py
-        boundaries = self._calculate_grid_boundaries(width, height)
-
-        # Create tiles
-        tiles = []
-        for i, bounds in enumerate(boundaries):
+        for index in (range(rows * cols) if order is None else order):
+            row, col = divmod(index, cols)
+            bounds = self.tile_bounds(row, col, width, height)
             x1, y1, x2, y2 = bounds
+            pixels = image[y1:y2, x1:x2]
+            yield ImageTile(
+                id=f"tile_{index}",
+                image=pixels.copy() if copy else pixels,
+                bounds=bounds,
+                overlap_regions=self._calculate_overlap_regions(row, col, width, height),
+                grid_index=(row, col),
+            )
 
-            # Extract tile pixels
-            tile_image = image[y1:y2, x1:x2].copy()
+    def create_tiles(
+        self,
+        image: np.ndarray,
+        phase0_boundaries: Optional["ColorBoundaryResult"] = None,
+    ) -> List[ImageTile]:
+        """
+        Create all tiles from an image, each with its own copy of the pixels.
 
-            # Calculate overlap regions
-            overlaps = self._calculate_overlap_regions(bounds, boundaries, i)
+        Prefer iter_tiles for large images: it yields views on demand.
 
-            tile = ImageTile(
-                id=f"tile_{i}",
-                image=tile_image,
-                bounds=bounds,
-                overlap_regions=overlaps,
-            )
-            tiles.append(tile)
+        Args:
+            image: Input image (H, W, C)
+            phase0_boundaries: Optional Phase 0 results for smart boundary alignment
 
-        return tiles
+        Returns:
+            List of ImageTile objects
+        """
+        # Smart boundaries are handled in smart_boundaries.py
+        return list(self.iter_tiles(image, copy=True))
 
     def get_tile_count(self, width: int, height: int) -> int:
         """
@@ -224,5 +259,5 @@ class ImageTiler:
         if width <= self.max_dimension and height <= self.max_dimension:
             return 1
 
-        boundaries = self._calculate_grid_boundaries(width, height)
-        return len(boundaries)
+        rows, cols = self.grid_shape(width, height)
+        return rows * cols
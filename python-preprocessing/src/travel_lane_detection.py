@@ -13,10 +13,19 @@ Travel lanes are large, continuous whitespace corridors that:
 
 import cv2
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Dict, Any, Optional
 from dataclasses import dataclass
 
-from .coverage_input import CoverageBoundary, coverage_to_mask
+from .concurrency import get_governor
+from .coverage_input import (
+    CoverageBoundary,
+    coverage_to_local_mask,
+    clip_image_to_coverage,
+)
+from .density_maps import box_mean
+from .drawing_scale import scale_kernel_size
+from .result_encoding import PointList
 
 
 @dataclass
@@ -43,7 +52,7 @@ class TravelLaneSuggestion:
         return {
             "id": self.id,
             "coverage_uid": self.coverage_uid,
-            "centerline": [{"x": int(p[0]), "y": int(p[1])} for p in self.centerline],
+            "centerline": PointList(self.centerline),
             "width_profile": [float(w) for w in self.width_profile],
             "average_width": float(self.average_width),
             "bounding_box": {
@@ -57,11 +66,29 @@ class TravelLaneSuggestion:
             "orientation": self.orientation,
         }
 
+    def translate(self, dx: int, dy: int) -> "TravelLaneSuggestion":
+        """Shift centerline and bounding box by (dx, dy) in place."""
+        if dx or dy:
+            self.centerline = [(int(p[0]) + dx, int(p[1]) + dy) for p in self.centerline]
+            x, y, bw, bh = self.bounding_box
+            self.bounding_box = (int(x) + dx, int(y) + dy, int(bw), int(bh))
+        return self
+
+    def scale(self, factor: float) -> "TravelLaneSuggestion":
+        """Scale centerline, widths and bounding box by factor in place."""
+        if factor != 1.0:
+            self.centerline = [(int(round(p[0] * factor)), int(round(p[1] * factor))) for p in self.centerline]
+            self.width_profile = [float(w) * factor for w in self.width_profile]
+            self.average_width = float(self.average_width) * factor
+            self.bounding_box = tuple(int(round(v * factor)) for v in self.bounding_box)
+        return self
+
 
 def detect_travel_lanes_standalone(
     image: np.ndarray,
     min_width: int = 40,
     min_length: int = 200,
+    param_scale: float = 1.0,
 ) -> List[TravelLaneSuggestion]:
     """
     Detect travel lanes anywhere in the image (no coverage constraints).
@@ -72,6 +99,8 @@ def detect_travel_lanes_standalone(
         image: BGR image
         min_width: Minimum width of travel lane (pixels)
         min_length: Minimum length of travel lane (pixels)
+        param_scale: Factor for the canonical kernel sizes
+            (see DrawingScale.parameter_scale)
 
     Returns:
         List of TravelLaneSuggestion objects
@@ -79,11 +108,11 @@ def detect_travel_lanes_standalone(
     lanes = []
 
     # Method 1: Morphological detection (most reliable)
-    morph_lanes = detect_via_morphological(image, min_width, min_length)
+    morph_lanes = detect_via_morphological(image, min_width, min_length, param_scale=param_scale)
     lanes.extend(morph_lanes)
 
     # Method 2: Sparse region detection
-    sparse_lanes = detect_via_sparse_regions(image, min_width, min_length)
+    sparse_lanes = detect_via_sparse_regions(image, min_width, min_length, param_scale=param_scale)
     lanes.extend(sparse_lanes)
 
     # Deduplicate overlapping lanes
@@ -98,6 +127,7 @@ def detect_travel_lanes_within_coverage(
     coverage_uid: str = "",
     min_width: int = 40,
     min_length: int = 100,
+    param_scale: float = 1.0,
 ) -> List[TravelLaneSuggestion]:
     """
     Detect travel lanes constrained to a coverage area.
@@ -108,6 +138,8 @@ def detect_travel_lanes_within_coverage(
         coverage_uid: UID of the coverage boundary
         min_width: Minimum width of travel lane (pixels)
         min_length: Minimum length of travel lane (pixels)
+        param_scale: Factor for the canonical kernel sizes
+            (see DrawingScale.parameter_scale)
 
     Returns:
         List of TravelLaneSuggestion objects
@@ -122,13 +154,17 @@ def detect_travel_lanes_within_coverage(
     lanes = []
 
     # Method 1: Morphological detection
-    morph_lanes = detect_via_morphological(masked_image, min_width, min_length, coverage_mask)
+    morph_lanes = detect_via_morphological(
+        masked_image, min_width, min_length, coverage_mask, param_scale=param_scale,
+    )
     for lane in morph_lanes:
         lane.coverage_uid = coverage_uid
     lanes.extend(morph_lanes)
 
     # Method 2: Sparse region detection
-    sparse_lanes = detect_via_sparse_regions(masked_image, min_width, min_length, coverage_mask)
+    sparse_lanes = detect_via_sparse_regions(
+        masked_image, min_width, min_length, coverage_mask, param_scale=param_scale,
+    )
     for lane in sparse_lanes:
         lane.coverage_uid = coverage_uid
     lanes.extend(sparse_lanes)
@@ -145,11 +181,68 @@ def detect_travel_lanes_within_coverage(
     return lanes
 
 
+def detect_travel_lanes_in_coverage_areas(
+    image: np.ndarray,
+    boundaries: List[CoverageBoundary],
+    min_width: int = 40,
+    min_length: int = 100,
+    max_workers: int = 4,
+    param_scale: float = 1.0,
+) -> List[TravelLaneSuggestion]:
+    """
+    Detect travel lanes in several coverage areas, each on its own crop.
+
+    Every boundary is processed on a view of its bounding box with a
+    local mask, so cost scales with the coverage area rather than the
+    full image. Areas are independent and run on a thread pool (OpenCV
+    releases the GIL); lanes are mapped back to full-image coordinates
+    and returned in boundary order.
+
+    Args:
+        image: BGR image (full size)
+        boundaries: Coverage boundaries to search (typically 2D only)
+        min_width: Minimum width of travel lane (pixels)
+        min_length: Minimum length of travel lane (pixels)
+        max_workers: Maximum number of coverage areas processed concurrently
+        param_scale: Factor for the canonical kernel sizes
+            (see DrawingScale.parameter_scale)
+
+    Returns:
+        List of TravelLaneSuggestion objects in full-image coordinates
+    """
+    def process(boundary: CoverageBoundary) -> List[TravelLaneSuggestion]:
+        local_mask, (dx, dy) = coverage_to_local_mask(boundary, image.shape)
+        if local_mask.size == 0 or not local_mask.any():
+            return []
+        crop, _ = clip_image_to_coverage(image, boundary, copy=False)
+        lanes = detect_travel_lanes_within_coverage(
+            crop, local_mask,
+            coverage_uid=boundary.uid,
+            min_width=min_width,
+            min_length=min_length,
+            param_scale=param_scale,
+        )
+        return [lane.translate(dx, dy) for lane in lanes]
+
+    if not boundaries:
+        return []
+
+    with get_governor().parallel_region("travel_lanes", min(max_workers, len(boundaries))) as region:
+        if region.workers == 1:
+            results = [process(b) for b in boundaries]
+        else:
+            with ThreadPoolExecutor(max_workers=region.workers) as executor:
+                results = list(executor.map(region.wrap(process), boundaries))
+
+    return [lane for lanes in results for lane in lanes]
+
+
 def detect_via_morphological(
     image: np.ndarray,
     min_width: int = 40,
     min_length: int = 200,
     mask: Optional[np.ndarray] = None,
+    param_scale: float = 1.0,
 ) -> List[TravelLaneSuggestion]:
     """
     Detect travel lanes using morphological operations.
@@ -158,6 +251,8 @@ def detect_via_morphological(
     1. Thresholds to find light areas (whitespace)
     2. Uses morphological closing to connect nearby regions
     3. Finds elongated rectangular contours
+
+    Kernel sizes are canonical pixels, multiplied by param_scale.
     """
     if len(image.shape) == 3:
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
@@ -179,11 +274,13 @@ def detect_via_morphological(
         binary = cv2.bitwise_and(binary, mask)
 
     # Morphological closing to connect nearby white regions
-    kernel_close = cv2.getStructuringElement(cv2.MORPH_RECT, (15, 15))
+    close_size = scale_kernel_size(15, param_scale)
+    kernel_close = cv2.getStructuringElement(cv2.MORPH_RECT, (close_size, close_size))
     closed = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel_close)
 
     # Morphological opening to remove small noise
-    kernel_open = cv2.getStructuringElement(cv2.MORPH_RECT, (10, 10))
+    open_size = scale_kernel_size(10, param_scale)
+    kernel_open = cv2.getStructuringElement(cv2.MORPH_RECT, (open_size, open_size))
     opened = cv2.morphologyEx(closed, cv2.MORPH_OPEN, kernel_open)
 
     # Find contours
@@ -251,11 +348,14 @@ def detect_via_sparse_regions(
     min_width: int = 40,
     min_length: int = 200,
     mask: Optional[np.ndarray] = None,
+    param_scale: float = 1.0,
 ) -> List[TravelLaneSuggestion]:
     """
     Detect travel lanes by finding sparse (low-density) regions.
 
     Travel lanes typically have low edge density and high brightness.
+    The density window floor and cleanup kernel are canonical pixels,
+    multiplied by param_scale.
     """
     if len(image.shape) == 3:
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
@@ -275,9 +375,8 @@ def detect_via_sparse_regions(
         gray = cv2.bitwise_and(gray, mask)
 
     # Compute local density using a window
-    window_size = max(min_width, 30)
-    kernel = np.ones((window_size, window_size), np.float32) / (window_size * window_size)
-    density_map = cv2.filter2D(edges.astype(np.float32), -1, kernel)
+    window_size = max(min_width, scale_kernel_size(30, param_scale))
+    density_map = box_mean(edges, window_size)
 
     # Low density = potential travel lane
     density_threshold = 10  # Low edge count per window
@@ -291,7 +390,8 @@ def detect_via_sparse_regions(
     combined = cv2.bitwise_and(low_density, bright)
 
     # Clean up with morphological operations
-    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
+    clean_size = scale_kernel_size(5, param_scale)
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (clean_size, clean_size))
     combined = cv2.morphologyEx(combined, cv2.MORPH_OPEN, kernel)
     combined = cv2.morphologyEx(combined, cv2.MORPH_CLOSE, kernel)
 
@@ -388,6 +488,9 @@ def detect_via_skeletonization(
     # Find connected components
     num_labels, labels, stats, centroids = cv2.connectedComponentsWithStats(opened, connectivity=8)
 
+    # Zero margin around each component ROI
+    pad = 2
+
     for i in range(1, num_labels):  # Skip background (0)
         x, y, comp_w, comp_h, area = stats[i]
 
@@ -412,14 +515,19 @@ def detect_via_skeletonization(
         if width < min_width or length < min_length:
             continue
 
-        # Create a mask for this component
-        comp_mask = (labels == i).astype(np.uint8) * 255
+        # Work inside the component's padded bounding box only. The zero
+        # border keeps thinning and the distance transform identical to a
+        # full-frame pass while costing O(component) instead of O(image).
+        x0, y0 = max(0, x - pad), max(0, y - pad)
+        x1, y1 = min(w, x + comp_w + pad), min(h, y + comp_h + pad)
+        comp_mask = (labels[y0:y1, x0:x1] == i).astype(np.uint8) * 255
 
         # Compute skeleton (medial axis)
         skeleton = cv2.ximgproc.thinning(comp_mask) if hasattr(cv2, 'ximgproc') else comp_mask
 
-        # Find skeleton points for centerline
+        # Find skeleton points for centerline (offset back to image coordinates)
         skeleton_points = np.column_stack(np.where(skeleton > 0))
+        skeleton_points += (y0, x0)
         if len(skeleton_points) < 2:
             # Fallback: use bounding box center
             if orientation == "horizontal":
@@ -451,8 +559,8 @@ def detect_via_skeletonization(
         width_profile = []
         for point in centerline:
             px, py = point
-            if 0 <= py < h and 0 <= px < w:
-                width_profile.append(dist_transform[py, px] * 2)  # Diameter
+            if y0 <= py < y1 and x0 <= px < x1:
+                width_profile.append(dist_transform[py - y0, px - x0] * 2)  # Diameter
             else:
                 width_profile.append(float(width))
 
@@ -0,0 +1,170 @@
+"""
+Lazy Visualization Planes for Preprocessing Results
+
+Pipeline visualizations (boundary mask, density map, orientation map) are
+rarely requested, but as full-resolution planes they cost several bytes
+per pixel for every request. LazyVisualizations keeps only compact source
+data and renders a plane when it is accessed:
+
+- boundary_mask: stored bit-packed (1 bit per pixel)
+- density_map: the uint8 combined density the segmentation produced
+- orientation_map: drawn from the line clusters on demand
+
+Planes can be rendered as downscaled previews and encoded as PNG, JPEG
+or WebP.
+"""
+
+from typing import Iterator, List, Mapping, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .line_detection import LineCluster, create_orientation_map
+
+
+VISUALIZATION_NAMES = ("boundary_mask", "density_map", "orientation_map")
+
+# Format name -> (OpenCV extension, quality flag or None)
+IMAGE_FORMATS = {
+    "png": (".png", None),
+    "jpeg": (".jpg", cv2.IMWRITE_JPEG_QUALITY),
+    "jpg": (".jpg", cv2.IMWRITE_JPEG_QUALITY),
+    "webp": (".webp", cv2.IMWRITE_WEBP_QUALITY),
+}
+
+
+def pack_mask(mask: np.ndarray) -> np.ndarray:
+    """Bit-pack the nonzero pixels of a 2D mask."""
+    return np.packbits(mask.ravel() > 0)
+
+
+def unpack_mask(bits: np.ndarray, shape: Tuple[int, int]) -> np.ndarray:
+    """Unpack a bit-packed mask to a 0/255 uint8 image."""
+    count = shape[0] * shape[1]
+    return (np.unpackbits(bits, count=count).reshape(shape) * 255).astype(np.uint8)
+
+
+def preview_scale(image_shape: Tuple[int, ...], max_dimension: Optional[int]) -> float:
+    """Scale that fits the longer side within max_dimension (never upscales)."""
+    if not max_dimension:
+        return 1.0
+    return min(1.0, max_dimension / max(image_shape[:2]))
+
+
+def downscale(image: np.ndarray, max_dimension: Optional[int]) -> np.ndarray:
+    """Downscale an image so its longer side is at most max_dimension."""
+    scale = preview_scale(image.shape, max_dimension)
+    if scale >= 1.0:
+        return image
+    h, w = image.shape[:2]
+    size = (max(1, round(w * scale)), max(1, round(h * scale)))
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+
+def encode_image(image: np.ndarray, format: str = "png", quality: Optional[int] = None) -> bytes:
+    """
+    Encode a BGR or grayscale image.
+
+    Args:
+        image: uint8 image
+        format: "png", "jpeg"/"jpg" or "webp"
+        quality: JPEG/WebP quality 1-100 (ignored for PNG)
+
+    Returns:
+        Encoded image bytes
+
+    Raises:
+        ValueError: If the format is unsupported or encoding fails
+    """
+    key = format.lower()
+    if key not in IMAGE_FORMATS:
+        raise ValueError(f"Unsupported image format: {format}. Available: {sorted(IMAGE_FORMATS)}")
+    ext, quality_flag = IMAGE_FORMATS[key]
+    params = [quality_flag, int(quality)] if quality_flag is not None and quality is not None else []
+    ok, buffer = cv2.imencode(ext, image, params)
+    if not ok:
+        raise ValueError(f"Failed to encode image as {format}")
+    return buffer.tobytes()
+
+
+class LazyVisualizations(Mapping):
+    """
+    Read-only mapping of visualization name to image, rendered on access.
+
+    Example:
+        >>> vis = LazyVisualizations((h, w), pack_mask(mask), density_map=density)
+        >>> vis["boundary_mask"]  # Full resolution
+        >>> vis.render("density_map", max_dimension=1024)  # Preview
+    """
+
+    def __init__(
+        self,
+        image_shape: Tuple[int, int],
+        boundary_bits: Optional[np.ndarray] = None,
+        density_map: Optional[np.ndarray] = None,
+        line_clusters: Optional[List[LineCluster]] = None,
+    ):
+        """
+        Initialize from the stage outputs.
+
+        Args:
+            image_shape: (height, width) of the analysed image
+            boundary_bits: Edge detection boundary mask, bit-packed by pack_mask
+            density_map: uint8 combined density map (kept as is)
+            line_clusters: Line clusters for the orientation map
+        """
+        self.image_shape = tuple(image_shape[:2])
+        self._boundary_bits = boundary_bits
+        self._density_map = density_map
+        self._line_clusters = line_clusters
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of stored source arrays."""
+        total = 0
+        if self._boundary_bits is not None:
+            total += self._boundary_bits.nbytes
+        if self._density_map is not None:
+            total += self._density_map.nbytes
+        return total
+
+    def render(self, name: str, max_dimension: Optional[int] = None) -> np.ndarray:
+        """
+        Render one visualization.
+
+        Args:
+            name: One of VISUALIZATION_NAMES
+            max_dimension: Optional longer-side limit for a downscaled preview
+
+        Returns:
+            uint8 image (grayscale, or BGR for orientation_map)
+
+        Raises:
+            KeyError: If the visualization is not available
+        """
+        if name not in self:
+            raise KeyError(name)
+        if name == "orientation_map":
+            # Drawn straight at preview size, no full-resolution canvas
+            scale = preview_scale(self.image_shape, max_dimension)
+            return create_orientation_map(self.image_shape, self._line_clusters, scale=scale)
+        if name == "boundary_mask":
+            return downscale(unpack_mask(self._boundary_bits, self.image_shape), max_dimension)
+        return downscale(self._density_map, max_dimension)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.render(name)
+
+    def __iter__(self) -> Iterator[str]:
+        sources = {
+            "boundary_mask": self._boundary_bits,
+            "density_map": self._density_map,
+            "orientation_map": self._line_clusters,
+        }
+        return (name for name in VISUALIZATION_NAMES if sources[name] is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, name: object) -> bool:
+        return name in tuple(iter(self))
@@ -0,0 +1,178 @@
+"""
+Service Warm-Up
+
+The first request through a fresh worker pays one-off costs that later
+requests do not: OpenCV and SciPy initialise kernels and thread pools on
+first call, NumPy and the image codecs allocate their scratch buffers, and
+the first Hough pass, distance transform and encoder each take several
+times their steady-state latency. Under autoscaling every new worker
+would hand those costs to a real user.
+
+warm_up() runs a small synthetic floorplan through every pipeline stage
+(probed decoding, standalone and coverage-constrained travel lanes, all
+aisle detectors, visualizations and every response format) so the costs
+are paid before the worker reports ready. StartupProfile records how long
+the imports and the warm-up took.
+
+Example:
+    >>> profile = StartupProfile(started=STARTED)
+    >>> profile.imports_done()
+    >>> warm_up(profile)
+    >>> profile.to_dict()["ready"]
+    True
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+import cv2
+import numpy as np
+
+from .coverage_input import CoverageBoundary
+from .drawing_scale import resolve_drawing_scale
+from .pipeline import (
+    PreprocessingConfig,
+    decode_floorplan_image,
+    preprocess_floorplan,
+    result_to_json,
+)
+from .result_encoding import RESPONSE_FORMATS, encode_result
+from .visualizations import encode_image
+
+
+# Synthetic floorplan size: large enough to produce lines, aisles and lanes
+WARMUP_WIDTH = 640
+WARMUP_HEIGHT = 480
+
+
+def synthetic_floorplan(width: int = WARMUP_WIDTH, height: int = WARMUP_HEIGHT) -> np.ndarray:
+    """
+    Draw a small warehouse floorplan: an outer wall, two blocks of racking
+    rows separated by a cross aisle, and a colored zone outline.
+
+    Args:
+        width: Image width in pixels
+        height: Image height in pixels
+
+    Returns:
+        BGR image
+    """
+    image = np.full((height, width, 3), 255, dtype=np.uint8)
+    margin = max(10, min(width, height) // 24)
+    cv2.rectangle(image, (margin, margin), (width - margin, height - margin), (0, 0, 0), 3)
+
+    # Racking rows (filled bars) with aisles between them
+    row_width, pitch = max(8, width // 32), max(20, width // 12)
+    block_height = (height - 2 * margin) * 2 // 5
+    for top in (2 * margin, height - 2 * margin - block_height):
+        for x in range(2 * margin, width - 2 * margin - row_width, pitch):
+            cv2.rectangle(image, (x, top), (x + row_width, top + block_height), (40, 40, 40), -1)
+            cv2.rectangle(image, (x, top), (x + row_width, top + block_height), (0, 0, 0), 1)
+
+    # A colored zone boundary for Phase 0
+    cv2.rectangle(
+        image, (margin * 3, margin * 3), (width // 2, height // 2), (0, 0, 255), 2,
+    )
+    return image
+
+
+def _coverage_boundary(width: int, height: int) -> CoverageBoundary:
+    return CoverageBoundary(
+        uid="warmup",
+        coverage_type="2D",
+        shape="POLYGON",
+        points=[(0, 0), (width - 1, 0), (width - 1, height - 1), (0, height - 1)],
+        margin=0,
+    )
+
+
+class StartupProfile:
+    """
+    Import and warm-up timings of a worker, and whether it is ready.
+
+    Pass the time.monotonic() taken before the heavy imports so import
+    time is included.
+    """
+
+    def __init__(self, started: Optional[float] = None):
+        """
+        Start the startup clock.
+
+        Args:
+            started: time.monotonic() at process start (default: now)
+        """
+        self._started = started if started is not None else time.monotonic()
+        self.import_ms: Optional[float] = None
+        self.warmup_ms: Optional[float] = None
+        self.stages: Dict[str, float] = {}
+        self.ready = False
+        self.error: Optional[str] = None
+
+    def imports_done(self) -> None:
+        """Record the time spent up to now as import time."""
+        self.import_ms = (time.monotonic() - self._started) * 1000
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "ready": self.ready,
+            "import_ms": round(self.import_ms, 1) if self.import_ms is not None else None,
+            "warmup_ms": round(self.warmup_ms, 1) if self.warmup_ms is not None else None,
+            "stages": {name: round(ms, 1) for name, ms in self.stages.items()},
+            "error": self.error,
+        }
+
+
+def warm_up(
+    profile: Optional[StartupProfile] = None,
+    width: int = WARMUP_WIDTH,
+    height: int = WARMUP_HEIGHT,
+) -> StartupProfile:
+    """
+    Run a synthetic floorplan through every stage, then mark the profile ready.
+
+    A failing warm-up is recorded in profile.error and the worker is still
+    marked ready: the service can serve requests, only without the warm-up.
+
+    Args:
+        profile: Profile to record into (default: a new one)
+        width: Synthetic image width
+        height: Synthetic image height
+
+    Returns:
+        The profile, with warm-up timings per step
+    """
+    profile = profile or StartupProfile()
+    if profile.import_ms is None:
+        profile.imports_done()
+    image = synthetic_floorplan(width, height)
+    started = time.monotonic()
+
+    def timed(name: str, fn, *args, **kwargs):
+        step_started = time.monotonic()
+        result = fn(*args, **kwargs)
+        profile.stages[name] = (time.monotonic() - step_started) * 1000
+        return result
+
+    try:
+        for fmt in ("png", "jpeg"):
+            encoded = encode_image(image, fmt)
+            timed(f"decode_{fmt}", decode_floorplan_image, encoded, reduce_oversized=True)
+        # Estimated separately: a resampled pipeline run would warm less
+        timed("drawing_scale", resolve_drawing_scale, image, estimate=True)
+        config = PreprocessingConfig()
+        result = timed("pipeline", preprocess_floorplan, image, config)
+        timed(
+            "pipeline_coverage", preprocess_floorplan,
+            image, config, [_coverage_boundary(width, height)],
+        )
+        output = timed("visualizations", result_to_json, result, include_visualizations=True)
+        for media_type in RESPONSE_FORMATS:
+            name = media_type.rsplit("/", 1)[-1].replace("vnd.floorplan.", "")
+            timed(f"encode_{name}", encode_result, output, media_type, "gzip")
+    except Exception as e:  # Warm-up is best effort
+        profile.error = str(e)
+
+    profile.warmup_ms = (time.monotonic() - started) * 1000
+    profile.ready = True
+    return profile
@@ -13,6 +13,45 @@ import cv2
 from .types import ZoneType, ZONE_PROPERTIES, ZoneProperties
 
 
+# Hue histogram: 12 buckets of 15 degrees over OpenCV's 0-180 hue range
+HUE_BUCKETS = 12
+HUE_BUCKET_WIDTH = 180 // HUE_BUCKETS
+
+HUE_NAMES = [
+    "red", "orange", "yellow", "yellow-green",
+    "green", "cyan", "blue", "purple",
+    "magenta", "pink", "red", "red"
+]
+
+
+def _color_features_from_stats(
+    mean_hsv: np.ndarray,
+    std_hue: float,
+    hue_hist: np.ndarray,
+) -> Dict[str, Any]:
+    """Build color features from HSV means, hue std and hue histogram."""
+    dominant_color = HUE_NAMES[int(np.argmax(hue_hist))]
+
+    # Saturation level
+    mean_sat = mean_hsv[1]
+    if mean_sat < 30:
+        saturation_level = "low"
+    elif mean_sat < 100:
+        saturation_level = "medium"
+    else:
+        saturation_level = "high"
+
+    return {
+        "color_valid": True,
+        "mean_hue": float(mean_hsv[0]),
+        "mean_saturation": float(mean_hsv[1]),
+        "mean_value": float(mean_hsv[2]),
+        "std_hue": float(std_hue),
+        "dominant_color": dominant_color,
+        "saturation_level": saturation_level,
+    }
+
+
 @dataclass
 class ClassificationResult:
     """Result of zone classification."""
@@ -86,20 +125,84 @@ class ZoneClassifier:
         Returns:
             ClassificationResult with type and confidence
         """
+        geo_features = None
+        if self.use_geometry and polygon:
+            geo_features = self._extract_geometry_features(polygon)
+
+        color_features = None
+        if self.use_color and image_region is not None and image_region.size > 0:
+            color_features = self._extract_color_features(image_region)
+
+        return self._build_result(geo_features, color_features, context)
+
+    def classify_batch(
+        self,
+        image: Optional[np.ndarray],
+        polygons: List[List[Tuple[int, int]]],
+        contexts: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ) -> List[ClassificationResult]:
+        """
+        Classify many zones of one image at once.
+
+        The image is converted to HSV once. Color statistics are taken
+        over the pixels inside each polygon (not its bounding box), using
+        masks local to each polygon's bounding box. Geometry is computed
+        with vectorized shoelace and perimeter math over all vertices.
+
+        Args:
+            image: Full image (BGR), may be None to skip color features
+            polygons: Zone polygons in image pixel coordinates
+            contexts: Optional per-polygon context dicts (same length as polygons)
+
+        Returns:
+            List of ClassificationResult, one per polygon, in input order
+        """
+        if contexts is not None and len(contexts) != len(polygons):
+            raise ValueError(
+                f"contexts length ({len(contexts)}) must match polygons length ({len(polygons)})"
+            )
+
+        n = len(polygons)
+        geo_list: List[Optional[Dict[str, Any]]] = [None] * n
+        color_list: List[Optional[Dict[str, Any]]] = [None] * n
+
+        if self.use_geometry:
+            batch_geo = self._extract_geometry_features_batch(polygons)
+            for i, polygon in enumerate(polygons):
+                if polygon:
+                    geo_list[i] = batch_geo[i]
+
+        if self.use_color and image is not None and image.size > 0:
+            color_list = self._extract_color_features_batch(image, polygons)
+
+        return [
+            self._build_result(
+                geo_list[i],
+                color_list[i],
+                contexts[i] if contexts is not None else None,
+            )
+            for i in range(n)
+        ]
+
+    def _build_result(
+        self,
+        geo_features: Optional[Dict[str, Any]],
+        color_features: Optional[Dict[str, Any]],
+        context: Optional[Dict[str, Any]],
+    ) -> ClassificationResult:
+        """Combine extracted features into a scored classification."""
         features = {}
         scores: Dict[ZoneType, float] = {t: 0.0 for t in ZoneType}
 
         # Geometry-based features
-        if self.use_geometry and polygon:
-            geo_features = self._extract_geometry_features(polygon)
+        if geo_features is not None:
             features.update(geo_features)
             geo_scores = self._score_from_geometry(geo_features)
             for zone_type, score in geo_scores.items():
                 scores[zone_type] += score * 0.5
 
         # Color-based features
-        if self.use_color and image_region is not None and image_region.size > 0:
-            color_features = self._extract_color_features(image_region)
+        if color_features is not None:
             features.update(color_features)
             color_scores = self._score_from_color(color_features)
             for zone_type, score in color_scores.items():
@@ -205,36 +308,119 @@ class ZoneClassifier:
         std_hsv = np.std(hsv, axis=(0, 1))
 
         # Dominant hue bucket
-        hue = hsv[:, :, 0].flatten()
-        hist, _ = np.histogram(hue, bins=12, range=(0, 180))
-        dominant_hue_bucket = int(np.argmax(hist))
-
-        # Color name mapping
-        hue_names = [
-            "red", "orange", "yellow", "yellow-green",
-            "green", "cyan", "blue", "purple",
-            "magenta", "pink", "red", "red"
-        ]
-        dominant_color = hue_names[dominant_hue_bucket]
-
-        # Saturation level
-        mean_sat = mean_hsv[1]
-        if mean_sat < 30:
-            saturation_level = "low"
-        elif mean_sat < 100:
-            saturation_level = "medium"
-        else:
-            saturation_level = "high"
+        hist = np.bincount(
+            (hsv[:, :, 0].ravel() // HUE_BUCKET_WIDTH).astype(np.intp),
+            minlength=HUE_BUCKETS,
+        )[:HUE_BUCKETS]
 
-        return {
-            "color_valid": True,
-            "mean_hue": float(mean_hsv[0]),
-            "mean_saturation": float(mean_hsv[1]),
-            "mean_value": float(mean_hsv[2]),
-            "std_hue": float(std_hsv[0]),
-            "dominant_color": dominant_color,
-            "saturation_level": saturation_level,
-        }
+        return _color_features_from_stats(mean_hsv, std_hsv[0], hist)
+
+    def _extract_geometry_features_batch(
+        self,
+        polygons: List[List[Tuple[int, int]]],
+    ) -> List[Dict[str, Any]]:
+        """Extract geometric features for many polygons with array math."""
+        results: List[Dict[str, Any]] = [{"valid": False} for _ in polygons]
+        valid = [i for i, poly in enumerate(polygons) if len(poly) >= 3]
+        if not valid:
+            return results
+
+        counts = np.array([len(polygons[i]) for i in valid], dtype=np.intp)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        pts = np.concatenate(
+            [np.asarray(polygons[i], dtype=np.float64).reshape(-1, 2) for i in valid]
+        ).astype(np.float32).astype(np.float64)
+        xs, ys = pts[:, 0], pts[:, 1]
+
+        # Index of the next vertex, wrapping within each polygon
+        nxt = np.arange(len(pts)) + 1
+        nxt[starts + counts - 1] = starts
+
+        # Shoelace area and closed perimeter
+        cross = xs * ys[nxt] - xs[nxt] * ys
+        area = np.abs(np.add.reduceat(cross, starts)) / 2.0
+        seg = np.hypot(xs[nxt] - xs, ys[nxt] - ys)
+        perimeter = np.add.reduceat(seg, starts)
+
+        # Bounding boxes (same convention as cv2.boundingRect)
+        x_min = np.floor(np.minimum.reduceat(xs, starts))
+        x_max = np.floor(np.maximum.reduceat(xs, starts))
+        y_min = np.floor(np.minimum.reduceat(ys, starts))
+        y_max = np.floor(np.maximum.reduceat(ys, starts))
+        w = (x_max - x_min + 1).astype(np.int64)
+        h = (y_max - y_min + 1).astype(np.int64)
+        bbox_area = w * h
+
+        aspect_ratio = np.where(h > 0, w / np.maximum(h, 1), 1.0)
+        rectangularity = np.where(bbox_area > 0, area / np.maximum(bbox_area, 1), 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            compactness = np.where(
+                perimeter > 0, (4 * np.pi * area) / perimeter ** 2, 0.0
+            )
+
+        for k, i in enumerate(valid):
+            # Vertex simplification has no closed form; one C call per polygon
+            poly_pts = pts[starts[k]:starts[k] + counts[k]].astype(np.float32)
+            simplified = cv2.approxPolyDP(poly_pts, 0.02 * perimeter[k], closed=True)
+
+            results[i] = {
+                "valid": True,
+                "area": float(area[k]),
+                "width": int(w[k]),
+                "height": int(h[k]),
+                "aspect_ratio": float(aspect_ratio[k]),
+                "rectangularity": float(rectangularity[k]),
+                "compactness": float(compactness[k]),
+                "perimeter": float(perimeter[k]),
+                "n_vertices": int(counts[k]),
+                "n_simplified_vertices": len(simplified),
+            }
+
+        return results
+
+    def _extract_color_features_batch(
+        self,
+        image: np.ndarray,
+        polygons: List[List[Tuple[int, int]]],
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Extract masked color features for many polygons.
+
+        The image is converted to HSV once; each polygon is then rasterized
+        into a mask the size of its bounding box, and cv2.meanStdDev and
+        cv2.calcHist gather its statistics from the shared HSV view. Cost
+        per polygon is bounded by its own size, and overlapping or nested
+        polygons each see all of their pixels.
+
+        Returns:
+            Color feature dict per polygon, or None for polygons covering no pixels
+        """
+        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+        height, width = hsv.shape[:2]
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(polygons)
+        for i, polygon in enumerate(polygons):
+            if len(polygon) < 3:
+                continue
+            pts = np.asarray(polygon, dtype=np.int32).reshape(-1, 2)
+            x1 = max(0, int(pts[:, 0].min()))
+            y1 = max(0, int(pts[:, 1].min()))
+            x2 = min(width, int(pts[:, 0].max()) + 1)
+            y2 = min(height, int(pts[:, 1].max()) + 1)
+            if x2 <= x1 or y2 <= y1:
+                continue
+
+            mask = np.zeros((y2 - y1, x2 - x1), dtype=np.uint8)
+            cv2.fillPoly(mask, [pts - (x1, y1)], 255)
+            if not cv2.countNonZero(mask):
+                continue
+
+            region = hsv[y1:y2, x1:x2]
+            mean_hsv, std_hsv = cv2.meanStdDev(region, mask=mask)
+            hist = cv2.calcHist([region], [0], mask, [HUE_BUCKETS], [0, 180]).ravel()
+            results[i] = _color_features_from_stats(mean_hsv.ravel(), std_hsv[0, 0], hist)
+
+        return results
 
     def _score_from_geometry(
         self,
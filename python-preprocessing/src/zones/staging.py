@@ -148,8 +148,9 @@ class StagingAreaDetector:
             cv2.CHAIN_APPROX_SIMPLE,
         )
 
-        # Process candidates
-        candidates = []
+        # Collect candidates passing the area filter
+        polygons: List[List[Tuple[int, int]]] = []
+        areas: List[float] = []
         for contour in contours:
             area = cv2.contourArea(contour)
 
@@ -160,13 +161,16 @@ class StagingAreaDetector:
             # Simplify contour to polygon
             epsilon = 0.02 * cv2.arcLength(contour, True)
             approx = cv2.approxPolyDP(contour, epsilon, True)
-            polygon = [(int(pt[0][0]), int(pt[0][1])) for pt in approx]
+            polygons.append([(int(pt[0][0]), int(pt[0][1])) for pt in approx])
+            areas.append(area)
 
-            # Calculate features
-            features = self._calculate_features(
-                polygon, area, width, height, image
-            )
+        # Calculate features for all candidates at once, reusing the HSV image
+        features_list = self._calculate_features_batch(
+            polygons, areas, width, height, hsv
+        )
 
+        candidates = []
+        for polygon, area, features in zip(polygons, areas, features_list):
             # Calculate confidence score
             confidence = self._calculate_confidence(features)
 
@@ -198,57 +202,124 @@ class StagingAreaDetector:
         image_width: int,
         image_height: int,
         image: np.ndarray,
+        hsv: Optional[np.ndarray] = None,
     ) -> Dict[str, Any]:
-        """Calculate features for a candidate region."""
-        if len(polygon) < 3:
-            return {"valid": False}
+        """
+        Calculate features for a single candidate region.
 
-        pts = np.array(polygon, dtype=np.float32)
+        If hsv is not given, only the candidate's bounding box is converted.
+        """
+        if hsv is None and len(polygon) >= 3:
+            x1, y1, x2, y2 = _clipped_bounds(
+                np.array(polygon, dtype=np.int32), image_width, image_height
+            )
+            if x2 <= x1 or y2 <= y1:
+                # Entirely outside the image: geometry only, no color to sample
+                crop_hsv = np.zeros((0, 0, 3), dtype=np.uint8)
+            else:
+                crop_hsv = cv2.cvtColor(image[y1:y2, x1:x2], cv2.COLOR_BGR2HSV)
+            local = [(px - x1, py - y1) for px, py in polygon]
+            features = self._calculate_features_batch(
+                [local], [area], image_width, image_height, crop_hsv,
+                offsets=[(x1, y1)],
+            )[0]
+            return features
+
+        return self._calculate_features_batch(
+            [polygon], [area], image_width, image_height, hsv
+        )[0]
+
+    def _calculate_features_batch(
+        self,
+        polygons: List[List[Tuple[int, int]]],
+        areas: List[float],
+        image_width: int,
+        image_height: int,
+        hsv: np.ndarray,
+        offsets: Optional[List[Tuple[int, int]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Calculate features for many candidate regions.
 
-        # Bounding box
-        x, y, w, h = cv2.boundingRect(pts)
+        Geometric features are computed as arrays over all candidates.
+        Mean hue and saturation are taken from the shared HSV image within
+        each candidate's bounding box, so the cost per candidate is bounded
+        by its own size rather than the image size.
 
-        # Distance to edges
-        dist_left = x
-        dist_right = image_width - (x + w)
-        dist_top = y
-        dist_bottom = image_height - (y + h)
-        min_edge_dist = min(dist_left, dist_right, dist_top, dist_bottom)
+        Args:
+            polygons: Candidate polygons in hsv pixel coordinates
+            areas: Contour area for each candidate
+            image_width: Full image width
+            image_height: Full image height
+            hsv: HSV image the polygons index into
+            offsets: Optional (x, y) of hsv within the full image, per candidate
 
-        # Relative position
-        center_x = x + w / 2
-        center_y = y + h / 2
-        rel_x = center_x / image_width
-        rel_y = center_y / image_height
+        Returns:
+            List of feature dicts, one per polygon
+        """
+        results: List[Dict[str, Any]] = [{"valid": False} for _ in polygons]
+        valid = [i for i, poly in enumerate(polygons) if len(poly) >= 3]
+        if not valid:
+            return results
+
+        hsv_h, hsv_w = hsv.shape[:2]
+        pts_list = [np.array(polygons[i], dtype=np.int32) for i in valid]
+        offset_arr = (
+            np.array([offsets[i] for i in valid], dtype=np.int64)
+            if offsets is not None
+            else np.zeros((len(valid), 2), dtype=np.int64)
+        )
 
-        # Aspect ratio
-        aspect_ratio = w / h if h > 0 else 1.0
+        # Bounding boxes (x, y, w, h) in full-image coordinates
+        rects = np.array([cv2.boundingRect(pts) for pts in pts_list], dtype=np.int64)
+        rects[:, :2] += offset_arr
+        x, y, w, h = rects.T
+        area = np.asarray([areas[i] for i in valid], dtype=np.float64)
 
-        # Rectangularity
-        bbox_area = w * h
-        rectangularity = area / bbox_area if bbox_area > 0 else 0.0
+        # Distance to edges
+        min_edge_dist = np.minimum.reduce([
+            x,
+            image_width - (x + w),
+            y,
+            image_height - (y + h),
+        ])
 
-        # Color analysis in region
-        mask = np.zeros((image_height, image_width), dtype=np.uint8)
-        cv2.fillPoly(mask, [pts.astype(np.int32)], 255)
-        region_hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
-        mean_hue = cv2.mean(region_hsv[:, :, 0], mask=mask)[0]
-        mean_sat = cv2.mean(region_hsv[:, :, 1], mask=mask)[0]
+        # Relative position
+        rel_x = (x + w / 2) / image_width
+        rel_y = (y + h / 2) / image_height
 
-        return {
-            "valid": True,
-            "area": float(area),
-            "width": int(w),
-            "height": int(h),
-            "aspect_ratio": float(aspect_ratio),
-            "rectangularity": float(rectangularity),
-            "min_edge_distance": int(min_edge_dist),
-            "edge_proximity": float(1.0 - min_edge_dist / (min(image_width, image_height) / 2)),
-            "rel_x": float(rel_x),
-            "rel_y": float(rel_y),
-            "mean_hue": float(mean_hue),
-            "mean_saturation": float(mean_sat),
-        }
+        # Aspect ratio and rectangularity
+        aspect_ratio = np.where(h > 0, w / np.maximum(h, 1), 1.0)
+        bbox_area = w * h
+        rectangularity = np.where(bbox_area > 0, area / np.maximum(bbox_area, 1), 0.0)
+        edge_proximity = 1.0 - min_edge_dist / (min(image_width, image_height) / 2)
+
+        for k, (i, pts) in enumerate(zip(valid, pts_list)):
+            # Color analysis within the candidate's bounding box only
+            x1, y1, x2, y2 = _clipped_bounds(pts, hsv_w, hsv_h)
+            if x2 > x1 and y2 > y1:
+                mask = np.zeros((y2 - y1, x2 - x1), dtype=np.uint8)
+                cv2.fillPoly(mask, [pts - (x1, y1)], 255)
+                mean_hue, mean_sat = cv2.mean(hsv[y1:y2, x1:x2], mask=mask)[:2]
+            else:
+                mean_hue = mean_sat = 0.0
+
+            results[i] = {
+                "valid": True,
+                "area": float(area[k]),
+                "width": int(w[k]),
+                "height": int(h[k]),
+                "aspect_ratio": float(aspect_ratio[k]),
+                "rectangularity": float(rectangularity[k]),
+                "min_edge_distance": int(min_edge_dist[k]),
+                "edge_proximity": float(edge_proximity[k]),
+                "rel_x": float(rel_x[k]),
+                "rel_y": float(rel_y[k]),
+                "mean_hue": float(mean_hue),
+                "mean_saturation": float(mean_sat),
+            }
+
+        return results
 
     def _calculate_confidence(self, features: Dict[str, Any]) -> float:
         """Calculate confidence score for a candidate."""
@@ -306,6 +377,19 @@ class StagingAreaDetector:
         return score / weights_total if weights_total > 0 else 0.0
 
 
+def _clipped_bounds(
+    pts: np.ndarray,
+    width: int,
+    height: int,
+) -> Tuple[int, int, int, int]:
+    """Bounding box (x1, y1, x2, y2) of points, max exclusive, clipped to an image."""
+    x1 = max(0, int(pts[:, 0].min()))
+    y1 = max(0, int(pts[:, 1].min()))
+    x2 = min(width, int(pts[:, 0].max()) + 1)
+    y2 = min(height, int(pts[:, 1].max()) + 1)
+    return x1, y1, x2, y2
+
+
 def detect_staging_from_boundaries(
     image: np.ndarray,
     boundaries: List[Dict[str, Any]],
@@ -325,6 +409,7 @@ def detect_staging_from_boundaries(
     total_area = width * height
 
     candidates = []
+    hsv = None  # Converted once, on the first candidate that needs it
 
     for boundary in boundaries:
         polygon = boundary.get("polygon", [])
@@ -345,8 +430,10 @@ def detect_staging_from_boundaries(
             continue
 
         # Calculate features
+        if hsv is None:
+            hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
         features = detector._calculate_features(
-            polygon, area, width, height, image
+            polygon, area, width, height, image, hsv=hsv
         )
         confidence = detector._calculate_confidence(features)
 
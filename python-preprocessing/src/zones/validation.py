@@ -13,6 +13,10 @@ import cv2
 from .types import ZoneType, ZONE_PROPERTIES
 
 
+# Slack (pixels) allowed when checking a child's bounds against its parent
+CONTAINMENT_MARGIN = 5
+
+
 class ValidationSeverity(Enum):
     """Severity levels for validation issues."""
     INFO = "info"
@@ -148,17 +152,22 @@ class ZoneValidator:
         """
         issues = []
 
+        # Areas and bounds are computed once and shared by all checks
+        areas, bounds = _zone_geometry(zones)
+
         # Individual zone validation
-        for zone in zones:
-            zone_issues = self._validate_zone(zone, image_bounds)
+        for i, zone in enumerate(zones):
+            zone_issues = self._validate_zone(
+                zone, image_bounds, area=float(areas[i]), bounds=bounds[i]
+            )
             issues.extend(zone_issues)
 
         # Cross-zone validation
-        cross_issues = self._validate_cross_zone(zones)
+        cross_issues = self._validate_cross_zone(zones, areas, bounds)
         issues.extend(cross_issues)
 
         # Check parent-child relationships
-        parent_issues = self._validate_hierarchy(zones)
+        parent_issues = self._validate_hierarchy(zones, bounds)
         issues.extend(parent_issues)
 
         # Determine overall validity
@@ -171,8 +180,10 @@ class ZoneValidator:
         self,
         zone: ZoneData,
         image_bounds: Optional[Tuple[int, int]],
+        area: Optional[float] = None,
+        bounds: Optional[np.ndarray] = None,
     ) -> List[ValidationIssue]:
-        """Validate a single zone."""
+        """Validate a single zone (area/bounds may be passed in precomputed)."""
         issues = []
 
         # Check polygon validity
@@ -187,7 +198,8 @@ class ZoneValidator:
             return issues  # Can't validate further
 
         # Check area
-        area = zone.area
+        if area is None:
+            area = zone.area
         if area <= 0:
             issues.append(ValidationIssue(
                 code="ZERO_AREA",
@@ -238,7 +250,7 @@ class ZoneValidator:
         # Check bounds within image
         if image_bounds:
             img_width, img_height = image_bounds
-            x1, y1, x2, y2 = zone.bounds
+            x1, y1, x2, y2 = bounds if bounds is not None else zone.bounds
 
             if x1 < 0 or y1 < 0 or x2 > img_width or y2 > img_height:
                 issues.append(ValidationIssue(
@@ -247,7 +259,7 @@ class ZoneValidator:
                     severity=ValidationSeverity.WARNING,
                     zone_id=zone.id,
                     details={
-                        "zone_bounds": (x1, y1, x2, y2),
+                        "zone_bounds": zone.bounds,
                         "image_size": (img_width, img_height),
                     },
                 ))
@@ -257,52 +269,111 @@ class ZoneValidator:
     def _validate_cross_zone(
         self,
         zones: List[ZoneData],
+        areas: Optional[np.ndarray] = None,
+        bounds: Optional[np.ndarray] = None,
     ) -> List[ValidationIssue]:
-        """Validate relationships between zones."""
-        issues = []
+        """
+        Validate relationships between zones.
 
-        # Check for excessive overlap between zones of same type
-        for i, zone1 in enumerate(zones):
-            for zone2 in zones[i + 1:]:
-                # Skip if different types (some overlap is OK)
-                if zone1.zone_type != zone2.zone_type:
-                    continue
+        Overlap candidates come from a sort-and-sweep over x-intervals
+        within each zone type, so only pairs whose bounding boxes overlap
+        on x are examined. Issues are reported in (i, j) zone order.
+        """
+        if areas is None or bounds is None:
+            areas, bounds = _zone_geometry(zones)
 
-                # Skip if parent-child relationship
-                if zone1.parent_id == zone2.id or zone2.parent_id == zone1.id:
+        # Group zones by type (overlap of different types is OK)
+        by_type: Dict[ZoneType, List[int]] = {}
+        for i, zone in enumerate(zones):
+            by_type.setdefault(zone.zone_type, []).append(i)
+
+        pairs: List[Tuple[int, int, float]] = []
+        for indices in by_type.values():
+            if len(indices) < 2:
+                continue
+            idx = np.asarray(indices)
+            order = idx[np.argsort(bounds[idx, 0], kind="stable")]
+            x1 = bounds[order, 0]
+            x2 = bounds[order, 2]
+            y1 = bounds[order, 1]
+            y2 = bounds[order, 3]
+            a = areas[order]
+
+            # For each zone, later zones starting before it ends overlap on x
+            ends = np.searchsorted(x1, x2, side="left")
+            for k in range(len(order)):
+                end = ends[k]
+                if end <= k + 1:
                     continue
+                cand = slice(k + 1, end)
+                inter_w = np.minimum(x2[k], x2[cand]) - x1[cand]
+                inter_h = np.minimum(y2[k], y2[cand]) - np.maximum(y1[k], y1[cand])
+                hit = (inter_w > 0) & (inter_h > 0)
+                if not hit.any():
+                    continue
+
+                smaller = np.minimum(a[k], a[cand])
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    ratio = np.where(smaller > 0, inter_w * inter_h / smaller, 0.0)
+                for off in np.flatnonzero(hit & (ratio > self.max_overlap_ratio)):
+                    i, j = int(order[k]), int(order[k + 1 + off])
+                    pairs.append((min(i, j), max(i, j), float(ratio[off])))
+
+        issues = []
+        for i, j, overlap_ratio in sorted(pairs):
+            zone1, zone2 = zones[i], zones[j]
+
+            # Skip if parent-child relationship
+            if zone1.parent_id == zone2.id or zone2.parent_id == zone1.id:
+                continue
 
-                # Calculate overlap
-                overlap_ratio = self._calculate_overlap_ratio(zone1, zone2)
-
-                if overlap_ratio > self.max_overlap_ratio:
-                    issues.append(ValidationIssue(
-                        code="EXCESSIVE_OVERLAP",
-                        message=f"Zones {zone1.id} and {zone2.id} overlap by {overlap_ratio:.0%}",
-                        severity=ValidationSeverity.WARNING,
-                        details={
-                            "zone1_id": zone1.id,
-                            "zone2_id": zone2.id,
-                            "overlap_ratio": overlap_ratio,
-                        },
-                    ))
+            issues.append(ValidationIssue(
+                code="EXCESSIVE_OVERLAP",
+                message=f"Zones {zone1.id} and {zone2.id} overlap by {overlap_ratio:.0%}",
+                severity=ValidationSeverity.WARNING,
+                details={
+                    "zone1_id": zone1.id,
+                    "zone2_id": zone2.id,
+                    "overlap_ratio": overlap_ratio,
+                },
+            ))
 
         return issues
 
     def _validate_hierarchy(
         self,
         zones: List[ZoneData],
+        bounds: Optional[np.ndarray] = None,
     ) -> List[ValidationIssue]:
         """Validate parent-child zone relationships."""
+        if bounds is None:
+            _, bounds = _zone_geometry(zones)
+
         issues = []
-        zone_map = {z.id: z for z in zones}
+        zone_map = {z.id: i for i, z in enumerate(zones)}
 
-        for zone in zones:
+        # Resolve parents, then check all containments at once
+        child_idx: List[int] = []
+        parent_idx: List[int] = []
+        for i, zone in enumerate(zones):
             if zone.parent_id is None:
                 continue
+            p = zone_map.get(zone.parent_id)
+            child_idx.append(i)
+            parent_idx.append(-1 if p is None else p)
+
+        if not child_idx:
+            return issues
 
-            parent = zone_map.get(zone.parent_id)
-            if parent is None:
+        children = np.asarray(child_idx)
+        parents = np.asarray(parent_idx)
+        contained = np.ones(len(children), dtype=bool)
+        known = parents >= 0
+        contained[known] = _bounds_contained(bounds[children[known]], bounds[parents[known]])
+
+        for i, p, ok in zip(child_idx, parent_idx, contained):
+            zone = zones[i]
+            if p < 0:
                 issues.append(ValidationIssue(
                     code="MISSING_PARENT",
                     message=f"Zone {zone.id} references non-existent parent {zone.parent_id}",
@@ -313,7 +384,8 @@ class ZoneValidator:
                 continue
 
             # Check child is contained within parent
-            if not self._is_contained(zone, parent):
+            if not ok:
+                parent = zones[p]
                 issues.append(ValidationIssue(
                     code="CHILD_OUTSIDE_PARENT",
                     message=f"Zone {zone.id} extends outside parent {parent.id}",
@@ -362,7 +434,7 @@ class ZoneValidator:
         px1, py1, px2, py2 = parent.bounds
 
         # Allow small margin for numerical errors
-        margin = 5
+        margin = CONTAINMENT_MARGIN
         return (
             cx1 >= px1 - margin and
             cy1 >= py1 - margin and
@@ -371,6 +443,39 @@ class ZoneValidator:
         )
 
 
+def _zone_geometry(zones: List[ZoneData]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute areas and bounding boxes for all zones once.
+
+    Returns:
+        Tuple of (areas, bounds): float64 arrays of shape (n,) and (n, 4),
+        matching ZoneData.area and ZoneData.bounds
+    """
+    n = len(zones)
+    areas = np.zeros(n, dtype=np.float64)
+    bounds = np.zeros((n, 4), dtype=np.float64)
+    for i, zone in enumerate(zones):
+        if not zone.polygon:
+            continue
+        pts = np.asarray(zone.polygon)
+        bounds[i, :2] = pts.min(axis=0)
+        bounds[i, 2:] = pts.max(axis=0)
+        if len(zone.polygon) >= 3:
+            areas[i] = cv2.contourArea(pts.astype(np.float32))
+    return areas, bounds
+
+
+def _bounds_contained(child: np.ndarray, parent: np.ndarray) -> np.ndarray:
+    """Vectorized ZoneValidator._is_contained over rows of (x1, y1, x2, y2)."""
+    margin = CONTAINMENT_MARGIN
+    return (
+        (child[:, 0] >= parent[:, 0] - margin) &
+        (child[:, 1] >= parent[:, 1] - margin) &
+        (child[:, 2] <= parent[:, 2] + margin) &
+        (child[:, 3] <= parent[:, 3] + margin)
+    )
+
+
 def validate_zones_quick(
     zones: List[Dict[str, Any]],
 ) -> ValidationResult:
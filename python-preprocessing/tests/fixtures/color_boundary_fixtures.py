@@ -102,6 +102,99 @@ def create_complex_boundaries(size: Tuple[int, int] = (300, 300)) -> np.ndarray:
     return image
 
 
+def _hsv_to_bgr(h: int, s: int = 255, v: int = 255) -> np.ndarray:
+    """Convert a single HSV color to a BGR pixel value."""
+    return cv2.cvtColor(np.array([[[h, s, v]]], dtype=np.uint8), cv2.COLOR_HSV2BGR)[0, 0]
+
+
+def _outline(image: np.ndarray, x1: int, y1: int, x2: int, y2: int, color: np.ndarray, thickness: int) -> None:
+    """Draw a rectangle outline with array slicing (fast at any size)."""
+    image[y1:y1 + thickness, x1:x2] = color
+    image[y2 - thickness:y2, x1:x2] = color
+    image[y1:y2, x1:x1 + thickness] = color
+    image[y1:y2, x2 - thickness:x2] = color
+
+
+def create_warehouse_floorplan(
+    megapixels: float = 1.0,
+    aspect: float = 1.5,
+    seed: int = 0,
+    block_size: Tuple[int, int] = (240, 360),
+    lane_width: int = 40,
+    margin_ratio: float = 0.04,
+) -> np.ndarray:
+    """
+    Create a synthetic warehouse floorplan of roughly the given size.
+
+    Features keep a fixed pixel scale, so larger images contain more of
+    them (like higher resolution scans of bigger sites):
+    - gray margin around the drawing area
+    - racking blocks of paired dark rack lines separated by aisles,
+      alternating horizontal/vertical orientation
+    - orange outlines around racking blocks
+    - yellow staging areas and blue travel-lane outlines
+    - white travel lanes between blocks
+
+    Args:
+        megapixels: Target size in megapixels
+        aspect: Width / height ratio
+        seed: Random seed for block orientation and staging placement
+        block_size: (height, width) of each racking block in pixels
+        lane_width: Travel lane width between blocks in pixels
+        margin_ratio: Margin width as a fraction of the shorter side
+
+    Returns:
+        BGR image
+    """
+    rng = np.random.default_rng(seed)
+    height = max(64, int(round(np.sqrt(megapixels * 1e6 / aspect))))
+    width = max(64, int(round(height * aspect)))
+
+    image = np.full((height, width, 3), 255, dtype=np.uint8)
+    margin = max(4, int(min(height, width) * margin_ratio))
+    image[:margin] = 200
+    image[-margin:] = 200
+    image[:, :margin] = 200
+    image[:, -margin:] = 200
+
+    orange = _hsv_to_bgr(15)
+    yellow = _hsv_to_bgr(30)
+    blue = _hsv_to_bgr(110)
+    rack = np.array([60, 60, 60], dtype=np.uint8)
+
+    block_h, block_w = block_size
+    pitch_y, pitch_x = block_h + lane_width, block_w + lane_width
+    x0 = y0 = margin + lane_width
+
+    for by in range(y0, height - margin - block_h + 1, pitch_y):
+        for bx in range(x0, width - margin - block_w + 1, pitch_x):
+            x2, y2 = bx + block_w, by + block_h
+            kind = rng.random()
+            if kind < 0.15:
+                # Staging area: yellow outline, empty inside
+                _outline(image, bx, by, x2, y2, yellow, 4)
+                continue
+
+            # Racking: pairs of rack lines (back-to-back racks) with aisles between
+            horizontal = kind < 0.6
+            span = (by, y2) if horizontal else (bx, x2)
+            for pos in range(span[0] + 8, span[1] - 16, 26):
+                for offset in (0, 10):
+                    p = pos + offset
+                    if horizontal:
+                        image[p:p + 2, bx + 8:x2 - 8] = rack
+                    else:
+                        image[by + 8:y2 - 8, p:p + 2] = rack
+            _outline(image, bx, by, x2, y2, orange, 3)
+
+    # Blue outlines along the main horizontal travel lanes
+    for ly in range(y0 - lane_width, height - margin - lane_width, pitch_y * 3):
+        if ly + lane_width <= height - margin:
+            _outline(image, margin, ly, width - margin, ly + lane_width, blue, 2)
+
+    return image
+
+
 def get_expected_orange_square_area(size: Tuple[int, int] = (200, 200), square_size: int = 100) -> int:
     """Get the expected area of the orange square in pixels."""
     return square_size * square_size
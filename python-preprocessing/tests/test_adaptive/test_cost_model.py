@@ -0,0 +1,66 @@
+"""Tests for the processing cost model."""
+
+import pytest
+
+from src.adaptive.cost_model import (
+    CostModel,
+    CostCoefficients,
+    TimingRecord,
+)
+from src.adaptive.decision_engine import ProcessingMode
+
+
+class TestCostModel:
+    """Tests for CostModel."""
+
+    def test_predicts_every_mode(self):
+        """Test default model covers all modes."""
+        predictions = CostModel().predict_all(4000, 3000)
+
+        assert set(predictions) == set(ProcessingMode)
+        for estimate in predictions.values():
+            assert estimate.time_ms > 0
+            assert estimate.peak_memory_mb > 0
+
+    def test_cost_grows_with_size(self):
+        """Test larger images predict higher cost."""
+        model = CostModel()
+        small = model.predict(ProcessingMode.STANDARD, 1000, 1000)
+        large = model.predict(ProcessingMode.STANDARD, 4000, 4000)
+
+        assert large.time_ms > small.time_ms
+        assert large.peak_memory_mb > small.peak_memory_mb
+
+    def test_calibrate_fits_linear_timings(self):
+        """Test calibration recovers exact linear coefficients."""
+        records = [
+            TimingRecord(ProcessingMode.STANDARD, mp, 20 + 50 * mp, 3 + 10 * mp)
+            for mp in (1.0, 4.0, 9.0)
+        ]
+        model = CostModel().calibrate(records)
+        c = model.coefficients[ProcessingMode.STANDARD]
+
+        assert c.time_base_ms == pytest.approx(20)
+        assert c.time_per_mp_ms == pytest.approx(50)
+        assert c.memory_base_mb == pytest.approx(3)
+        assert c.memory_per_mp_mb == pytest.approx(10)
+        # Uncalibrated modes keep defaults
+        assert model.coefficients[ProcessingMode.TILED] == CostModel().coefficients[ProcessingMode.TILED]
+
+    def test_calibrate_needs_two_sizes(self):
+        """Test a single size leaves the mode unchanged."""
+        records = [TimingRecord(ProcessingMode.HYBRID, 2.0, 999.0, 999.0)] * 3
+        model = CostModel().calibrate(records)
+
+        assert model.coefficients[ProcessingMode.HYBRID] == CostModel().coefficients[ProcessingMode.HYBRID]
+
+    def test_json_round_trip(self, tmp_path):
+        """Test save/load preserves coefficients."""
+        model = CostModel()
+        model.coefficients[ProcessingMode.FAST_TRACK] = CostCoefficients(1.0, 2.0, 3.0, 4.0)
+        path = tmp_path / "cost.json"
+        model.save(str(path))
+
+        loaded = CostModel.from_json(str(path))
+
+        assert loaded.coefficients == model.coefficients
@@ -274,3 +274,103 @@ class TestDecisionEngineShouldUseFastTrack:
         )
 
         assert engine.should_use_fast_track(phase0, closed) is False
+
+
+class TestDecisionEngineTriage:
+    """Tests for triage input and cost predictions."""
+
+    def test_cost_prediction_in_metrics(self):
+        """Test every decision reports predicted cost for all modes."""
+        engine = DecisionEngine()
+        decision = engine.decide(image_dimensions=(2000, 1500))
+
+        assert set(decision.metrics["predicted_cost"]) == {m.value for m in ProcessingMode}
+        expected = engine.cost_model.predict(decision.mode, 2000, 1500)
+        assert decision.metrics["predicted_time_ms"] == round(expected.time_ms, 1)
+        assert decision.metrics["predicted_peak_memory_mb"] == round(expected.peak_memory_mb, 1)
+
+    def test_forced_mode_has_prediction(self):
+        """Test forced decisions also report predicted cost."""
+        decision = DecisionEngine().decide(
+            image_dimensions=(1000, 1000),
+            force_mode=ProcessingMode.TILED,
+        )
+
+        assert "predicted_time_ms" in decision.metrics
+
+    def test_triage_drives_fast_track(self):
+        """Test a fast-track-likely triage selects FAST_TRACK without Phase 0."""
+        from src.adaptive.triage import TriageResult
+        from src.adaptive.config_selector import ImageComplexity
+
+        triage = TriageResult(
+            image_width=2000,
+            image_height=1500,
+            scale=0.25,
+            coverage_ratio=0.5,
+            boundary_count=5,
+            closed_region_count=5,
+            closure_ratio=1.0,
+            max_saturation=255,
+            colorless=False,
+            complexity=ImageComplexity.SIMPLE,
+            fast_track_decision=FastTrackDecision(eligible=True, confidence=0.92),
+            time_ms=1.0,
+        )
+        decision = DecisionEngine().decide(image_dimensions=(2000, 1500), triage=triage)
+
+        assert decision.mode == ProcessingMode.FAST_TRACK
+        assert decision.confidence == 0.92
+        assert decision.metrics["triage"]["fast_track_likely"] is True
+        assert decision.metrics["complexity"] == "simple"
+
+
+class TestDecisionEngineMemoryBudget:
+    """Tests for memory-budget-driven tiling."""
+
+    def test_no_budget_no_memory_metrics(self):
+        """Test decisions without a budget are unchanged."""
+        decision = DecisionEngine().decide(image_dimensions=(3000, 3000))
+
+        assert decision.mode == ProcessingMode.STANDARD
+        assert decision.tile_size is None
+        assert "estimated_peak_memory_mb" not in decision.metrics
+
+    def test_budget_forces_tiling_below_dimension_threshold(self):
+        """Test an image under the dimension rule is tiled when over budget."""
+        decision = DecisionEngine().decide(image_dimensions=(3000, 3000), memory_budget_mb=200)
+
+        assert decision.mode == ProcessingMode.TILED
+        assert decision.should_tile
+        assert decision.metrics["estimated_peak_memory_mb"] > 200
+        assert 512 <= decision.tile_size < 2048
+        assert decision.tile_count == decision.metrics["estimated_tile_count"] > 1
+        assert any("budget" in r for r in decision.reasoning)
+
+    def test_budget_that_fits_does_not_tile(self):
+        """Test a generous budget leaves the decision alone."""
+        decision = DecisionEngine(memory_budget_mb=4096).decide(image_dimensions=(3000, 3000))
+
+        assert decision.mode == ProcessingMode.STANDARD
+        assert decision.metrics["memory_budget_mb"] == 4096
+        assert decision.tile_size is None
+
+    def test_budget_shrinks_tiles_for_large_images(self):
+        """Test a 16k x 12k image gets tiles that fit the budget."""
+        engine = DecisionEngine(memory_budget_mb=1024)
+        decision = engine.decide(image_dimensions=(16000, 12000))
+
+        assert decision.should_tile
+        assert decision.tile_size < engine.tile_size
+        assert decision.tile_count > engine._estimate_tile_count(16000, 12000)
+
+    def test_forced_tiled_uses_memory_tile_size(self):
+        """Test forced tiling also respects the budget's tile size."""
+        decision = DecisionEngine().decide(
+            image_dimensions=(3000, 3000),
+            force_mode=ProcessingMode.TILED,
+            memory_budget_mb=200,
+        )
+
+        assert decision.tile_size is not None
+        assert decision.to_dict()["tile_size"] == decision.tile_size
@@ -0,0 +1,92 @@
+"""Tests for thumbnail triage."""
+
+import numpy as np
+import cv2
+
+from src.adaptive.triage import ImageTriage, TriageResult
+from src.adaptive.config_selector import ImageComplexity
+from src.color_boundary.detector import ColorBoundaryDetector
+
+
+def _floorplan(height, width, color=(0, 165, 255)):
+    img = np.full((height, width, 3), 255, dtype=np.uint8)
+    for i in range(4):
+        x = 100 + i * width // 5
+        cv2.rectangle(img, (x, 100), (x + width // 8, height - 100), color, -1)
+    return img
+
+
+class TestImageTriage:
+    """Tests for ImageTriage."""
+
+    def test_thumbnail_scale(self):
+        """Test thumbnails are bounded by max_dimension."""
+        triage = ImageTriage(max_dimension=256)
+        thumb, scale = triage.thumbnail(np.zeros((1000, 2000, 3), dtype=np.uint8))
+
+        assert max(thumb.shape[:2]) == 256
+        assert scale == 256 / 2000
+
+    def test_small_image_is_full_resolution(self):
+        """Test images within max_dimension are analyzed as-is and decisive."""
+        triage = ImageTriage(max_dimension=512)
+        image = _floorplan(300, 400)
+        result = triage.run(image)
+
+        assert isinstance(result, TriageResult)
+        assert result.is_full_resolution
+        assert triage.is_decisive(result)
+        full = ColorBoundaryDetector().detect(image)
+        assert result.boundary_count == len(full.boundaries)
+        assert result.coverage_ratio == full.coverage_ratio
+
+    def test_colorless_image(self):
+        """Test grayscale-content images are flagged colorless and decisive."""
+        image = np.full((2000, 3000, 3), 255, dtype=np.uint8)
+        cv2.rectangle(image, (200, 200), (2800, 1800), (30, 30, 30), 5)
+        triage = ImageTriage()
+        result = triage.run(image)
+
+        assert result.colorless
+        assert result.boundary_count == 0
+        assert not result.fast_track_likely
+        assert triage.is_decisive(result)
+
+    def test_thin_colored_line_not_colorless(self):
+        """Test a 1px colored line survives area downscaling above the threshold."""
+        image = np.full((2000, 3000, 3), 255, dtype=np.uint8)
+        cv2.line(image, (100, 1000), (2900, 1000), (0, 165, 255), 1)
+
+        assert not ImageTriage().run(image).colorless
+
+    def test_thin_line_on_large_image_not_colorless(self):
+        """Test a thin colored rectangle diluted below the threshold in the thumbnail."""
+        image = np.full((1500, 15000, 3), 255, dtype=np.uint8)
+        cv2.rectangle(image, (500, 300), (14500, 1200), (0, 165, 255), 3)
+        triage = ImageTriage(max_dimension=128)
+        thumb, _ = triage.thumbnail(image)
+        assert cv2.cvtColor(thumb, cv2.COLOR_BGR2HSV)[:, :, 1].max() < triage.colorless_saturation
+
+        result = triage.run(image)
+
+        assert result.max_saturation == 255
+        assert not result.colorless
+        assert not triage.is_decisive(result)
+
+    def test_coverage_approximates_full_resolution(self):
+        """Test thumbnail coverage is close to full-resolution coverage."""
+        image = _floorplan(2000, 2600)
+        result = ImageTriage().run(image)
+        full = ColorBoundaryDetector().detect(image)
+
+        assert result.scale < 1.0
+        assert abs(result.coverage_ratio - full.coverage_ratio) < 0.02
+        assert result.boundary_count == len(full.boundaries)
+
+    def test_to_dict(self):
+        """Test serialization."""
+        d = ImageTriage().run(_floorplan(300, 400)).to_dict()
+
+        assert d["scale"] == 1.0
+        assert d["complexity"] in [c.value for c in ImageComplexity]
+        assert "fast_track_likely" in d
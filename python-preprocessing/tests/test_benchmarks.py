@@ -0,0 +1,172 @@
+"""Tests for the stage microbenchmark suite and bench CLI."""
+
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from benchmarks.suite import (
+    STAGES,
+    StageResult,
+    compare_to_baseline,
+    load_baseline,
+    measure_stage,
+    run_benchmarks,
+    save_baseline,
+)
+from src.color_boundary.detector import ColorBoundaryDetector
+from tests.fixtures.color_boundary_fixtures import create_warehouse_floorplan
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
+
+
+def _result(stage="edges", mp=1.0, time_ms=100.0, peak=10.0):
+    return StageResult(
+        stage=stage, megapixels=mp, width=1000, height=1000,
+        time_ms=time_ms, peak_memory_mb=peak, repeats=3,
+    )
+
+
+class TestWarehouseFloorplan:
+    """Tests for the synthetic floorplan generator."""
+
+    def test_size_matches_megapixels(self):
+        """Test generated size is close to the requested megapixels."""
+        image = create_warehouse_floorplan(megapixels=2.0, aspect=1.5)
+        h, w = image.shape[:2]
+
+        assert image.dtype == np.uint8 and image.shape[2] == 3
+        assert abs(h * w / 1e6 - 2.0) < 0.01
+        assert abs(w / h - 1.5) < 0.01
+
+    def test_contains_colored_zones(self):
+        """Test Phase 0 finds orange racking outlines in the floorplan."""
+        result = ColorBoundaryDetector().detect(create_warehouse_floorplan(megapixels=1.0))
+
+        assert "orange" in {b.color for b in result.boundaries}
+
+    def test_deterministic(self):
+        """Test the same seed gives the same image."""
+        a = create_warehouse_floorplan(megapixels=0.5, seed=3)
+        b = create_warehouse_floorplan(megapixels=0.5, seed=3)
+
+        assert np.array_equal(a, b)
+
+
+class TestRunBenchmarks:
+    """Tests for measuring stages."""
+
+    def test_measure_stage(self):
+        """Test a measurement records time, memory and dimensions."""
+        image = create_warehouse_floorplan(megapixels=0.1)
+        result = measure_stage(STAGES["color_boundary"], image, 0.1, repeats=2)
+
+        assert result.stage == "color_boundary"
+        assert result.time_ms > 0
+        assert result.peak_memory_mb > 0
+        assert (result.height, result.width) == image.shape[:2]
+        assert result.key == "color_boundary@0.1MP"
+
+    def test_run_selected_stages(self):
+        """Test results are ordered by size then stage."""
+        results = run_benchmarks(sizes=[0.05, 0.1], stages=["tiling", "merging"], repeats=1)
+
+        assert [(r.megapixels, r.stage) for r in results] == [
+            (0.05, "tiling"), (0.05, "merging"), (0.1, "tiling"), (0.1, "merging"),
+        ]
+
+    def test_unknown_stage_raises(self):
+        """Test unknown stage names raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown stage"):
+            run_benchmarks(sizes=[0.05], stages=["nope"])
+
+
+class TestBaselines:
+    """Tests for baseline persistence and regression detection."""
+
+    def test_round_trip(self, tmp_path):
+        """Test baselines load back to equal results."""
+        results = [_result(), _result(stage="lines", mp=4.0)]
+        path = str(tmp_path / "baseline.json")
+        save_baseline(results, path)
+
+        loaded = load_baseline(path)
+
+        assert loaded == {r.key: r for r in results}
+        assert "meta" in json.load(open(path))
+
+    def test_regression_detected(self):
+        """Test slowdowns and memory growth beyond tolerance are reported."""
+        baseline = {_result().key: _result()}
+        current = [_result(time_ms=150.0, peak=20.0)]
+
+        regressions = compare_to_baseline(current, baseline, tolerance=0.25)
+
+        assert {r.metric for r in regressions} == {"time_ms", "peak_memory_mb"}
+        assert regressions[0].ratio == pytest.approx(1.5)
+
+    def test_within_tolerance_passes(self):
+        """Test changes within tolerance are not regressions."""
+        baseline = {_result().key: _result()}
+
+        assert compare_to_baseline([_result(time_ms=120.0)], baseline, 0.25) == []
+
+    def test_noise_floor(self):
+        """Test tiny absolute slowdowns on fast stages are ignored."""
+        baseline = {_result().key: _result(time_ms=1.0)}
+
+        assert compare_to_baseline([_result(time_ms=3.0)], baseline, 0.25) == []
+
+    def test_missing_baseline_entry_skipped(self):
+        """Test results without a baseline entry are ignored."""
+        assert compare_to_baseline([_result(stage="lines")], {}, 0.25) == []
+
+
+class TestBenchCLI:
+    """Tests for the bench CLI command."""
+
+    def _run(self, *args):
+        return subprocess.run(
+            [sys.executable, "-m", "src", "bench", "--sizes", "0.05",
+             "--stages", "tiling", "--repeats", "1", *args],
+            capture_output=True,
+            text=True,
+            cwd=PROJECT_ROOT,
+        )
+
+    def test_bench_json_and_save_baseline(self, tmp_path):
+        """Test bench emits JSON and writes a baseline."""
+        baseline = str(tmp_path / "baseline.json")
+        result = self._run("-o", "json", "--save-baseline", baseline)
+
+        assert result.returncode == 0
+        output = json.loads(result.stdout)
+        assert output["results"][0]["stage"] == "tiling"
+        assert output["regressions"] == []
+        assert "tiling@0.05MP" in load_baseline(baseline)
+
+    def test_bench_fails_on_regression(self, tmp_path):
+        """Test bench exits 1 when a stage regresses against the baseline."""
+        baseline = str(tmp_path / "baseline.json")
+        fast = StageResult("tiling", 0.05, 100, 100, time_ms=1e-6, peak_memory_mb=100.0, repeats=1)
+        save_baseline([fast], baseline)
+        result = self._run("--baseline", baseline, "--min-delta-ms", "0")
+
+        assert result.returncode == 1
+        assert "REGRESSION" in result.stdout
+
+    def test_bench_unknown_stage(self):
+        """Test unknown stages return an error code."""
+        result = subprocess.run(
+            [sys.executable, "-m", "src", "bench", "--stages", "nope"],
+            capture_output=True,
+            text=True,
+            cwd=PROJECT_ROOT,
+        )
+
+        assert result.returncode == 1
+        assert "Unknown stage" in result.stderr
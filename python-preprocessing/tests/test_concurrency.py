@@ -0,0 +1,114 @@
+"""Tests for the CPU concurrency governor."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+import pytest
+
+from src import concurrency
+from src.concurrency import ConcurrencyGovernor, configure_governor, get_governor
+from src.tiling.models import TilingConfig
+from src.tiling.processor import TileProcessor
+
+
+@pytest.fixture
+def governor():
+    """Install an 8-core governor and restore the previous one afterwards."""
+    previous = concurrency._governor
+    threads = cv2.getNumThreads()
+    yield configure_governor(core_budget=8)
+    concurrency._governor = previous
+    cv2.setNumThreads(threads)
+
+
+class TestConcurrencyGovernor:
+    """Tests for splitting the core budget."""
+
+    def test_processes_share_budget(self):
+        """Test the budget is divided across server processes."""
+        governor = ConcurrencyGovernor(core_budget=16, processes=4)
+
+        assert governor.cores_per_process == 4
+        assert governor.current_share() == 4
+
+    def test_region_clamps_to_share(self):
+        """Test a region never gets more workers than the caller's cores."""
+        governor = ConcurrencyGovernor(core_budget=4)
+
+        with governor.parallel_region("tiles", requested=16) as region:
+            assert region.workers == 4
+            assert region.threads_per_worker == 1
+        with governor.parallel_region("tiles", requested=2) as region:
+            assert region.workers == 2
+            assert region.threads_per_worker == 2
+
+    def test_nested_regions_shrink(self, governor):
+        """Test workers of an outer pool size inner pools and OpenCV from their share."""
+        seen = []
+
+        def inner(_):
+            seen.append(cv2.getNumThreads())
+
+        def outer(_):
+            with governor.parallel_region("inner", requested=8) as region:
+                inner_workers = region.workers
+                for item in range(2):
+                    region.wrap(inner)(item)
+            return inner_workers
+
+        with governor.parallel_region("outer", requested=4) as region:
+            assert region.threads_per_worker == 2
+            with ThreadPoolExecutor(max_workers=region.workers) as pool:
+                inner_workers = list(pool.map(region.wrap(outer), range(4)))
+
+        assert inner_workers == [2, 2, 2, 2]
+        assert seen and max(seen) == 1
+        assert cv2.getNumThreads() == 8
+        allocation = governor.allocation()
+        assert allocation["regions"]["outer"] == {"requested": 4, "workers": 4, "threads_per_worker": 2}
+        assert allocation["regions"]["inner"]["workers"] == 2
+
+    def test_share_restored_after_task(self):
+        """Test wrapped tasks leave the calling thread's share unchanged."""
+        governor = ConcurrencyGovernor(core_budget=6)
+
+        with governor.parallel_region("r", requested=3) as region:
+            assert region.wrap(governor.current_share)() == 2
+        assert governor.current_share() == 6
+
+    def test_validation(self):
+        """Test invalid budgets raise ValueError."""
+        with pytest.raises(ValueError):
+            ConcurrencyGovernor(core_budget=0)
+        with pytest.raises(ValueError):
+            ConcurrencyGovernor(core_budget=4, processes=0)
+
+    def test_from_env(self, monkeypatch):
+        """Test the budget and process count come from the environment."""
+        monkeypatch.setenv("PREPROCESS_CORE_BUDGET", "12")
+        monkeypatch.setenv("WEB_CONCURRENCY", "3")
+
+        governor = ConcurrencyGovernor.from_env()
+
+        assert (governor.core_budget, governor.cores_per_process) == (12, 4)
+
+
+class TestGovernedPools:
+    """Tests for pools sized by the process-wide governor."""
+
+    def test_tile_pool(self, governor):
+        """Test tile workers are capped by the budget and OpenCV by their share."""
+        threads = []
+        config = TilingConfig(dimension_threshold=500, tile_size=512, overlap=64, max_parallel_tiles=16)
+
+        def process(tile):
+            threads.append(cv2.getNumThreads())
+            return []
+
+        TileProcessor(config=config).process(np.zeros((1500, 1500, 3), np.uint8), process)
+
+        assert get_governor().allocation()["regions"]["tiles"] == {
+            "requested": 16, "workers": 8, "threads_per_worker": 1,
+        }
+        assert threads and set(threads) == {1}
@@ -0,0 +1,66 @@
+"""Tests for coverage boundary masks and clipping."""
+
+import numpy as np
+import pytest
+
+from src.coverage_input import (
+    CoverageBoundary,
+    coverage_bounding_box,
+    coverage_to_local_mask,
+    coverage_to_mask,
+    clip_image_to_coverage,
+)
+
+
+def _boundary(points, margin=0):
+    return CoverageBoundary(uid="c1", coverage_type="2D", shape="POLYGON", points=points, margin=margin)
+
+
+class TestCoverageToLocalMask:
+    """Tests for bounding-box-local coverage masks."""
+
+    @pytest.mark.parametrize("margin", [0, 7])
+    def test_matches_cropped_full_mask(self, margin):
+        """Test local mask equals the full-image mask cropped to the bbox."""
+        boundary = _boundary([(40, 30), (150, 45), (120, 160), (35, 140)], margin=margin)
+        shape = (200, 220)
+
+        local, (x0, y0) = coverage_to_local_mask(boundary, shape)
+        full = coverage_to_mask(boundary, shape)
+
+        x_min, y_min, x_max, y_max = coverage_bounding_box(boundary, shape)
+        assert (x0, y0) == (x_min, y_min)
+        np.testing.assert_array_equal(local, full[y_min:y_max, x_min:x_max])
+        # Nothing of the full mask lies outside the local window
+        assert full.sum() == local.astype(np.int64).sum()
+
+    def test_clipped_to_image(self):
+        """Test boundaries extending past the image are clipped."""
+        boundary = _boundary([(-20, -10), (50, -10), (50, 40), (-20, 40)], margin=5)
+
+        assert coverage_bounding_box(boundary, (100, 100)) == (0, 0, 56, 46)
+
+    def test_outside_image_is_empty(self):
+        """Test a boundary outside the image yields an empty mask."""
+        boundary = _boundary([(300, 300), (350, 300), (350, 350)])
+
+        local, _ = coverage_to_local_mask(boundary, (100, 100))
+
+        assert local.size == 0
+
+
+class TestClipImageToCoverage:
+    """Tests for clip_image_to_coverage."""
+
+    def test_view_and_copy(self):
+        """Test copy=False returns a view into the source image."""
+        image = np.zeros((100, 100, 3), dtype=np.uint8)
+        boundary = _boundary([(10, 20), (60, 20), (60, 70)])
+
+        view, offset = clip_image_to_coverage(image, boundary, copy=False)
+        copied, _ = clip_image_to_coverage(image, boundary)
+
+        assert offset == (10, 20)
+        assert view.shape == (51, 51, 3)
+        assert np.shares_memory(view, image)
+        assert not np.shares_memory(copied, image)
@@ -0,0 +1,83 @@
+"""Tests for request deadlines and graceful degradation."""
+
+import pytest
+
+from src.deadline import Deadline, LOW_VALUE_CUTOFF
+from src.pipeline import PreprocessingConfig, preprocess_floorplan, result_to_json
+from tests.fixtures.color_boundary_fixtures import create_warehouse_floorplan
+
+
+def _spent(budget_ms, fraction):
+    """Deadline with the given fraction of its budget already used."""
+    deadline = Deadline(budget_ms)
+    deadline._started -= budget_ms * fraction / 1000
+    return deadline
+
+
+class TestDeadline:
+    """Tests for the Deadline budget."""
+
+    def test_unlimited(self):
+        """Test a deadline without a budget allows everything."""
+        deadline = Deadline()
+
+        assert deadline.allows("lines")
+        assert deadline.allows("whitespace", low_value=True)
+        assert deadline.remaining_ms is None
+        assert not deadline.expired
+
+    def test_low_value_cutoff(self):
+        """Test low-value stages stop at the cutoff, others at the budget."""
+        deadline = _spent(1000, LOW_VALUE_CUTOFF + 0.1)
+
+        assert deadline.allows("lines")
+        assert not deadline.allows("whitespace", low_value=True)
+        assert deadline.skipped == ["whitespace"]
+        assert 0 < deadline.remaining_ms < 1000 * (1 - LOW_VALUE_CUTOFF)
+
+    def test_expired(self):
+        """Test every stage is skipped once the budget is spent, each recorded once."""
+        deadline = _spent(100, 1.5)
+
+        assert deadline.expired
+        assert not deadline.allows("lines")
+        assert not deadline.allows("lines")
+        assert deadline.remaining_ms == 0.0
+        report = deadline.to_dict()
+        assert report["skipped"] == ["lines"]
+        assert report["deadline_ms"] == 100
+
+    def test_validation(self):
+        """Test non-positive budgets raise ValueError."""
+        with pytest.raises(ValueError):
+            Deadline(0)
+        with pytest.raises(ValueError):
+            PreprocessingConfig(deadline_ms=-5)
+
+
+class TestPipelineDeadline:
+    """Tests for deadlines in preprocess_floorplan."""
+
+    def test_spent_budget_skips_optional_stages(self):
+        """Test an exhausted budget still returns edges and hints, listing skipped stages."""
+        image = create_warehouse_floorplan(megapixels=1.0)
+
+        result = preprocess_floorplan(image, PreprocessingConfig(deadline_ms=0.001))
+
+        assert result.deadline["skipped"] == ["segmentation", "lines", "travel_lanes"]
+        assert result.deadline["expired"]
+        assert result.segmentation_data["regions"] == []
+        assert result.line_data["line_clusters"] == []
+        assert "contours" in result.edge_data
+        assert result.gemini_hints["image_dimensions"]["width"] == image.shape[1]
+        assert result_to_json(result)["deadline"] == result.deadline
+
+    def test_generous_budget_skips_nothing(self):
+        """Test a budget that is never reached changes nothing."""
+        image = create_warehouse_floorplan(megapixels=1.0)
+
+        result = preprocess_floorplan(image, PreprocessingConfig(deadline_ms=600_000))
+
+        assert result.deadline["skipped"] == []
+        assert result.deadline["truncated"] == []
+        assert "deadline" not in result_to_json(preprocess_floorplan(image))
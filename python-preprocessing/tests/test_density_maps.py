@@ -0,0 +1,100 @@
+"""Tests for box-filter density map utilities."""
+
+import numpy as np
+import cv2
+import pytest
+
+from src.density_maps import (
+    box_mean,
+    normalize_density,
+    gradient_magnitude_max,
+    benchmark_box_mean,
+)
+from src.region_segmentation import compute_local_density, compute_line_density
+
+
+def _filter2d_reference(values: np.ndarray, window_size: int) -> np.ndarray:
+    """Dense-kernel implementation the box filter replaces."""
+    kernel = np.ones((window_size, window_size), np.float32) / (window_size * window_size)
+    return cv2.filter2D(values.astype(np.float32), -1, kernel)
+
+
+def _floorplan_like(size=(240, 320)) -> np.ndarray:
+    """White image with dark racking lines and an empty aisle."""
+    image = np.full((size[0], size[1], 3), 255, dtype=np.uint8)
+    for x in range(20, 140, 8):
+        cv2.line(image, (x, 20), (x, 220), (0, 0, 0), 2)
+    for x in range(200, 300, 8):
+        cv2.line(image, (x, 20), (x, 220), (0, 0, 0), 2)
+    return image
+
+
+class TestBoxMean:
+    """Tests for box_mean equivalence with filter2D."""
+
+    @pytest.mark.parametrize("window_size", [1, 3, 30, 50, 51, 100])
+    def test_matches_filter2d(self, window_size):
+        """Test box_mean matches the dense kernel for odd and even windows."""
+        rng = np.random.default_rng(42)
+        values = (rng.random((180, 220)) < 0.3).astype(np.uint8) * 255
+
+        expected = _filter2d_reference(values, window_size)
+        actual = box_mean(values, window_size)
+
+        assert actual.dtype == np.float32
+        assert actual.shape == values.shape
+        np.testing.assert_allclose(actual, expected, atol=1e-2)
+
+    def test_invalid_window(self):
+        """Test that non-positive windows are rejected."""
+        with pytest.raises(ValueError, match="window_size"):
+            box_mean(np.zeros((10, 10), np.float32), 0)
+
+
+class TestDensityMaps:
+    """Tests for segmentation density maps built on box_mean."""
+
+    def test_local_density_matches_reference(self):
+        """Test compute_local_density is unchanged by the box filter path."""
+        image = _floorplan_like()
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        _, binary = cv2.threshold(gray, 200, 255, cv2.THRESH_BINARY_INV)
+        expected = normalize_density(_filter2d_reference(binary, 50))
+
+        actual = compute_local_density(image, 50)
+
+        assert actual.dtype == np.uint8
+        assert np.max(np.abs(actual.astype(int) - expected.astype(int))) <= 1
+
+    def test_line_density_matches_float64_reference(self):
+        """Test float32 Sobel path matches the original CV_64F computation."""
+        image = _floorplan_like()
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        sobel_x = np.abs(cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=3))
+        sobel_y = np.abs(cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=3))
+        kernel = np.ones((50, 50), np.float32) / 2500
+        expected = cv2.normalize(
+            cv2.filter2D(np.maximum(sobel_x, sobel_y), -1, kernel),
+            None, 0, 255, cv2.NORM_MINMAX,
+        ).astype(np.uint8)
+
+        actual = compute_line_density(image, 50)
+
+        assert np.max(np.abs(actual.astype(int) - expected.astype(int))) <= 1
+
+    def test_gradient_magnitude_is_float32(self):
+        """Test gradient map stays in float32."""
+        gray = cv2.cvtColor(_floorplan_like(), cv2.COLOR_BGR2GRAY)
+        assert gradient_magnitude_max(gray).dtype == np.float32
+
+
+class TestBenchmark:
+    """Tests for the filter2D vs box filter benchmark."""
+
+    def test_benchmark_reports_equivalence(self):
+        """Test benchmark output shows both paths agree."""
+        result = benchmark_box_mean(shape=(200, 200), window_size=50, repeats=1)
+
+        assert set(result) == {"filter2d_ms", "box_filter_ms", "speedup", "max_abs_diff"}
+        assert result["max_abs_diff"] < 1e-2
+        assert result["filter2d_ms"] > 0
@@ -0,0 +1,138 @@
+"""Tests for drawing scale estimation and normalization."""
+
+import cv2
+import numpy as np
+import pytest
+
+from src.drawing_scale import (
+    CANONICAL_PIXELS_PER_METER,
+    DrawingScale,
+    estimate_pixels_per_meter,
+    estimate_stroke_width,
+    meters_to_pixels,
+    resolve_drawing_scale,
+    scale_kernel_size,
+)
+from src import pipeline
+from src.pipeline import PreprocessingConfig, analysis_scale, preprocess_floorplan, result_to_json
+from tests.fixtures.color_boundary_fixtures import create_warehouse_floorplan
+
+
+def _upscaled(image, factor):
+    """The same drawing exported at a higher DPI."""
+    return cv2.resize(image, None, fx=factor, fy=factor, interpolation=cv2.INTER_NEAREST)
+
+
+class TestDrawingScale:
+    """Tests for DrawingScale factors."""
+
+    def test_normalization_only_downsamples(self):
+        """Test finer drawings are resampled to canonical, coarser ones are not."""
+        assert DrawingScale(160.0, "input").normalization_scale == pytest.approx(0.25)
+        assert DrawingScale(20.0, "input").normalization_scale == 1.0
+        assert DrawingScale(None, "unknown").normalization_scale == 1.0
+
+    def test_parameter_scale_keeps_physical_size(self):
+        """Test pixel parameters follow the analysed resolution, not the resampling."""
+        assert DrawingScale(160.0, "input").parameter_scale(0.25) == pytest.approx(1.0)
+        assert DrawingScale(20.0, "input").parameter_scale(1.0) == pytest.approx(0.5)
+        assert DrawingScale(None, "unknown").parameter_scale(0.5) == 0.5
+
+    def test_meters_to_pixels(self):
+        """Test physical lengths convert at the given resolution."""
+        assert meters_to_pixels(1.0) == CANONICAL_PIXELS_PER_METER
+        assert meters_to_pixels(0.001, 40.0) == 1
+
+    def test_scale_kernel_size(self):
+        """Test kernels scale to odd sizes of at least 3 pixels."""
+        assert scale_kernel_size(15, 1.0) == 15
+        assert scale_kernel_size(15, 0.5) == 9
+        assert scale_kernel_size(10, 1.0) == 11
+        assert scale_kernel_size(5, 0.1) == 3
+
+
+class TestEstimation:
+    """Tests for stroke-width scale estimation."""
+
+    def test_stroke_width_tracks_export_resolution(self):
+        """Test strokes of a 4x export measure about four times as wide."""
+        image = create_warehouse_floorplan(megapixels=1.0)
+
+        base = estimate_stroke_width(image)
+        fine = estimate_stroke_width(_upscaled(image, 4))
+
+        assert fine / base == pytest.approx(4.0, rel=0.2)
+
+    def test_never_below_canonical(self):
+        """Test thin strokes never yield a resolution below canonical."""
+        image = np.full((400, 400), 255, dtype=np.uint8)
+        for y in range(20, 380, 10):
+            cv2.line(image, (20, y), (380, y), 0, 1)
+
+        assert estimate_pixels_per_meter(image) == CANONICAL_PIXELS_PER_METER
+
+    def test_blank_image_unknown(self):
+        """Test images without ink have no estimate."""
+        blank = np.full((300, 300, 3), 255, dtype=np.uint8)
+
+        assert resolve_drawing_scale(blank, estimate=True).source == "unknown"
+        assert resolve_drawing_scale(blank, pixels_per_meter=80.0).source == "input"
+
+
+class TestPipelineNormalization:
+    """Tests for scale-normalized preprocess_floorplan runs."""
+
+    def test_high_dpi_export_matches_base(self):
+        """Test a 4x export analysed at canonical resolution finds the same aisles."""
+        image = create_warehouse_floorplan(megapixels=1.0)
+        h, w = image.shape[:2]
+        base = preprocess_floorplan(image)
+
+        result = preprocess_floorplan(_upscaled(image, 4), PreprocessingConfig(pixels_per_meter=160.0))
+
+        assert result.analysis_scale == pytest.approx(0.25, abs=0.01)
+        assert len(result.line_data["aisle_candidates"]) == len(base.line_data["aisle_candidates"])
+        for aisle in result.line_data["aisle_candidates"]:
+            box = aisle["bounding_box"]
+            assert box["x"] + box["width"] <= 4 * w + 4
+            assert box["y"] + box["height"] <= 4 * h + 4
+        assert result.gemini_hints["image_dimensions"] == {"width": 4 * w, "height": 4 * h}
+        assert result_to_json(result)["scale"]["source"] == "input"
+
+    def test_estimated_scale(self):
+        """Test estimate_scale downsamples a high-DPI export without a given scale."""
+        image = _upscaled(create_warehouse_floorplan(megapixels=1.0), 4)
+
+        result = preprocess_floorplan(image, PreprocessingConfig(estimate_scale=True))
+
+        assert result.drawing_scale.source == "estimated"
+        assert result.analysis_scale < 0.5
+
+    def test_coarse_drawing_scales_aisle_widths(self, monkeypatch):
+        """Test a drawing below the canonical resolution shrinks the aisle width limits and kernels."""
+        calls = []
+        process_lines = pipeline.process_lines
+
+        def recording(*args, **kwargs):
+            calls.append(kwargs)
+            return process_lines(*args, **kwargs)
+
+        monkeypatch.setattr(pipeline, "process_lines", recording)
+
+        preprocess_floorplan(
+            create_warehouse_floorplan(megapixels=0.5),
+            PreprocessingConfig(pixels_per_meter=CANONICAL_PIXELS_PER_METER / 2),
+        )
+
+        assert (calls[0]["min_aisle_width"], calls[0]["max_aisle_width"]) == (10, 100)
+        assert calls[0]["min_line_length"] == 15
+        assert calls[0]["param_scale"] == pytest.approx(0.5)
+
+    def test_unknown_scale_unchanged(self):
+        """Test runs without a scale are analysed at full resolution."""
+        config = PreprocessingConfig()
+
+        assert analysis_scale((4000, 6000, 3), config) == 1.0
+        assert "scale" not in result_to_json(preprocess_floorplan(create_warehouse_floorplan(megapixels=1.0)))
+        with pytest.raises(ValueError):
+            PreprocessingConfig(pixels_per_meter=0)
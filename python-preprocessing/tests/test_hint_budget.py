@@ -0,0 +1,149 @@
+"""Tests for ranked, size-budgeted Gemini hints."""
+
+import json
+
+import cv2
+import numpy as np
+import pytest
+
+from src.hint_budget import HintBudget, apply_hint_budget, simplify_polygon
+from src.pipeline import PreprocessingConfig, preprocess_floorplan
+from tests.fixtures.color_boundary_fixtures import create_warehouse_floorplan
+
+
+def _circle(n, radius=500, as_dicts=True):
+    angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    points = [(int(1000 + radius * np.cos(a)), int(1000 + radius * np.sin(a))) for a in angles]
+    return [{"x": x, "y": y} for x, y in points] if as_dicts else points
+
+
+def _hints(polygons=5, aisles=10):
+    return {
+        "image_dimensions": {"width": 2000, "height": 2000},
+        "detected_boundaries": {
+            "contour_count": polygons,
+            "suggested_zone_polygons": [
+                {"id": i + 1, "vertices": _circle(200), "area": 10_000 * (i + 1)}
+                for i in range(polygons)
+            ],
+        },
+        "racking_analysis": {
+            "racking_sections": [],
+            "detected_aisles": [
+                {
+                    "id": i,
+                    "centerline": [{"x": 0, "y": i}, {"x": 100, "y": i}],
+                    "bounding_box": {"x": 0, "y": i, "width": 100, "height": 10},
+                    "confidence": i / aisles,
+                    "two_sided_validated": i == 0,
+                }
+                for i in range(aisles)
+            ],
+        },
+        "recommendations": [],
+    }
+
+
+class TestSimplifyPolygon:
+    """Tests for vertex-budget polygon simplification."""
+
+    def test_within_budget_unchanged(self):
+        """Test small polygons are returned as is."""
+        square = [{"x": 0, "y": 0}, {"x": 10, "y": 0}, {"x": 10, "y": 10}]
+        assert simplify_polygon(square, 8) is square
+
+    @pytest.mark.parametrize("as_dicts", [True, False])
+    def test_meets_budget_and_keeps_form(self, as_dicts):
+        """Test dense polygons are cut to the budget in their input form."""
+        points = _circle(400, as_dicts=as_dicts)
+
+        simplified = simplify_polygon(points, 16)
+
+        assert 3 <= len(simplified) <= 16
+        assert isinstance(simplified[0], dict if as_dicts else tuple)
+
+    def test_keeps_shape(self):
+        """Test the simplified polygon keeps roughly the same area."""
+        points = _circle(400, as_dicts=False)
+        simplified = simplify_polygon(points, 24)
+
+        original = cv2.contourArea(np.array(points, np.int32))
+        assert cv2.contourArea(np.array(simplified, np.int32)) == pytest.approx(original, rel=0.05)
+
+
+class TestApplyHintBudget:
+    """Tests for ranking and truncation."""
+
+    def test_top_k_by_significance(self):
+        """Test categories keep their most significant items first."""
+        hints = apply_hint_budget(_hints(), HintBudget(max_items_per_category=3, max_bytes=None))
+
+        polygons = hints["detected_boundaries"]["suggested_zone_polygons"]
+        assert [p["area"] for p in polygons] == [50_000, 40_000, 30_000]
+        aisles = hints["racking_analysis"]["detected_aisles"]
+        # Two-sided validated aisle outranks higher-confidence ones
+        assert [a["id"] for a in aisles] == [0, 9, 8]
+        report = hints["truncation"]
+        assert report["truncated"]
+        assert report["categories"]["detected_aisles"] == {"total": 10, "kept": 3}
+
+    def test_vertex_budget(self):
+        """Test polygons are simplified and counted."""
+        hints = apply_hint_budget(_hints(), HintBudget(max_vertices=12, max_bytes=None))
+
+        for polygon in hints["detected_boundaries"]["suggested_zone_polygons"]:
+            assert len(polygon["vertices"]) <= 12
+        assert hints["truncation"]["simplified_polygons"] == 5
+
+    @pytest.mark.parametrize("budget", [HintBudget(max_bytes=3000), HintBudget(max_tokens=700)])
+    def test_byte_budget(self, budget):
+        """Test the serialized hints fit the byte or token budget."""
+        hints = apply_hint_budget(_hints(polygons=20, aisles=50), budget)
+
+        size = len(json.dumps(hints, separators=(",", ":")))
+        assert size <= budget.byte_limit
+        assert hints["truncation"]["bytes"] == size
+        assert hints["racking_analysis"]["detected_aisles"][0]["id"] == 0
+
+    def test_unlimited_keeps_everything(self):
+        """Test the unlimited budget only ranks items and adds the report."""
+        original = _hints()
+
+        hints = apply_hint_budget(original, HintBudget.unlimited())
+
+        assert not hints["truncation"]["truncated"]
+        polygons = hints["detected_boundaries"]["suggested_zone_polygons"]
+        assert polygons == original["detected_boundaries"]["suggested_zone_polygons"][::-1]
+
+    def test_input_not_modified(self):
+        """Test the input hints are left untouched."""
+        original = _hints()
+
+        apply_hint_budget(original, HintBudget(max_items_per_category=1, max_vertices=8))
+
+        assert len(original["detected_boundaries"]["suggested_zone_polygons"]) == 5
+        assert len(original["detected_boundaries"]["suggested_zone_polygons"][0]["vertices"]) == 200
+
+    def test_from_dict(self):
+        """Test overrides are validated."""
+        assert HintBudget.from_dict({"max_bytes": 100}).max_bytes == 100
+        with pytest.raises(ValueError, match="Unknown hint budget fields"):
+            HintBudget.from_dict({"max_kb": 1})
+        with pytest.raises(ValueError):
+            HintBudget(max_vertices=2)
+
+
+class TestPipelineHintBudget:
+    """Tests for hint budgets in preprocess_floorplan."""
+
+    def test_pipeline_hints_fit_budget(self):
+        """Test pipeline hints respect the configured budget and report truncation."""
+        image = create_warehouse_floorplan(megapixels=1.0)
+
+        full = preprocess_floorplan(image, PreprocessingConfig(hint_budget=HintBudget.unlimited()))
+        small = preprocess_floorplan(image, PreprocessingConfig(hint_budget=HintBudget(max_bytes=3000)))
+
+        assert small.gemini_hints["truncation"]["bytes"] <= 3000
+        assert full.gemini_hints["truncation"]["bytes"] > 3000
+        aisles = small.gemini_hints["racking_analysis"]["detected_aisles"]
+        assert all("two_sided_validated" in a for a in aisles)
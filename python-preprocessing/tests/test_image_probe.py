@@ -0,0 +1,212 @@
+"""Tests for header-only image probing and reduced decoding."""
+
+import struct
+
+import cv2
+import numpy as np
+import pytest
+
+from src.image_probe import (
+    ImageTooLargeError,
+    check_pixel_limit,
+    choose_reduction,
+    decode_image,
+    probe_image_file,
+    probe_image_header,
+)
+from src.pipeline import PreprocessingConfig, decode_floorplan_image, preprocess_floorplan, result_to_json
+from src.warmup import synthetic_floorplan
+
+
+def encode(image, ext):
+    ok, buffer = cv2.imencode(ext, image)
+    assert ok
+    return buffer.tobytes()
+
+
+@pytest.fixture
+def image():
+    """Random BGR image with odd dimensions."""
+    return np.random.default_rng(0).integers(0, 255, (301, 403, 3), dtype=np.uint8)
+
+
+class TestProbeImageHeader:
+    """Tests for reading image headers."""
+
+    @pytest.mark.parametrize("ext,fmt", [(".png", "png"), (".jpg", "jpeg"), (".tif", "tiff")])
+    def test_formats(self, image, ext, fmt):
+        """Test dimensions, channels and bit depth come from the header."""
+        info = probe_image_header(encode(image, ext))
+
+        assert (info.format, info.width, info.height) == (fmt, 403, 301)
+        assert (info.channels, info.bit_depth) == (3, 8)
+
+    @pytest.mark.parametrize("ext", [".png", ".tif"])
+    def test_gray_alpha_and_16_bit(self, ext):
+        """Test channel count and bit depth of other sample layouts."""
+        gray = probe_image_header(encode(np.zeros((10, 20), np.uint8), ext))
+        bgra = probe_image_header(encode(np.zeros((10, 20, 4), np.uint8), ext))
+        deep = probe_image_header(encode(np.zeros((10, 20, 3), np.uint16), ext))
+
+        assert (gray.channels, bgra.channels, deep.bit_depth) == (1, 4, 16)
+
+    def test_big_endian_tiff(self):
+        """Test a Motorola-order TIFF with LONG dimensions."""
+        entries = [(256, 4, 1, 70000), (257, 4, 1, 50000), (277, 3, 1, 3 << 16)]
+        data = b"MM\x00*" + struct.pack(">I", 8) + struct.pack(">H", len(entries))
+        data += b"".join(struct.pack(">HHII", *entry) for entry in entries)
+
+        info = probe_image_header(data)
+
+        assert (info.width, info.height, info.channels) == (70000, 50000, 3)
+        assert info.pixels == 3_500_000_000
+
+    def test_jpeg_skips_metadata_segments(self, image):
+        """Test the frame header is found after large APP segments."""
+        data = encode(image, ".jpg")
+        app = b"\xff\xe1" + struct.pack(">H", 60002) + bytes(60000)
+        padded = data[:2] + app + app + data[2:]
+
+        assert probe_image_header(padded).width == 403
+        assert decode_image(padded).shape == image.shape
+
+    def test_unsupported_or_truncated(self, image):
+        """Test other formats and cut-off headers return None."""
+        assert probe_image_header(encode(image, ".webp")) is None
+        assert probe_image_header(encode(image, ".png")[:20]) is None
+        assert probe_image_header(b"\xff\xd8\xff\xe0") is None
+        assert probe_image_header(b"") is None
+
+    def test_probe_file(self, image, tmp_path):
+        """Test files are probed from their head and missing files give None."""
+        path = tmp_path / "plan.png"
+        cv2.imwrite(str(path), image)
+
+        assert probe_image_file(path).width == 403
+        assert probe_image_file(tmp_path / "missing.png") is None
+
+
+class TestReduction:
+    """Tests for the pixel ceiling and reduction choice."""
+
+    def test_check_pixel_limit(self, image):
+        """Test images above the ceiling raise ImageTooLargeError."""
+        info = probe_image_header(encode(image, ".png"))
+
+        check_pixel_limit(info, None)
+        check_pixel_limit(info, info.pixels)
+        with pytest.raises(ImageTooLargeError):
+            check_pixel_limit(info, info.pixels - 1)
+
+    def test_choose_reduction(self, image):
+        """Test the smallest factor meeting the ceiling, or what the analysis allows."""
+        info = probe_image_header(encode(image, ".jpg"))
+
+        assert choose_reduction(info) == 1
+        assert choose_reduction(info, max_pixels=info.pixels // 4) == 4
+        assert choose_reduction(info, analysis_scale=0.3) == 2
+        assert choose_reduction(info, max_pixels=info.pixels // 20, analysis_scale=0.3) == 8
+        with pytest.raises(ImageTooLargeError):
+            choose_reduction(info, max_pixels=100)
+
+    @pytest.mark.parametrize("ext", [".png", ".tif"])
+    def test_ceiling_needs_native_reduction(self, image, ext):
+        """Test PNG and TIFF above the ceiling are rejected, not decoded at full size."""
+        info = probe_image_header(encode(image, ext))
+
+        assert choose_reduction(info, max_pixels=info.pixels, analysis_scale=0.3) == 2
+        with pytest.raises(ImageTooLargeError):
+            choose_reduction(info, max_pixels=info.pixels // 4)
+
+    @pytest.mark.parametrize("ext", [".png", ".jpg", ".tif"])
+    def test_reduced_decode(self, image, ext):
+        """Test reduced decodes stay within the probed reduced size."""
+        data = encode(image, ext)
+        info = probe_image_header(data)
+
+        for factor in (2, 4, 8):
+            decoded = decode_image(data, factor)
+            width, height = info.reduced_size(factor)
+            assert height - 1 <= decoded.shape[0] <= height
+            assert width - 1 <= decoded.shape[1] <= width
+
+        with pytest.raises(ValueError):
+            decode_image(data, 3)
+
+
+class TestDecodeFloorplanImage:
+    """Tests for the pipeline's guarded decode."""
+
+    def test_rejects_before_decoding(self, image, monkeypatch):
+        """Test an oversized image is rejected without calling imdecode."""
+        monkeypatch.setattr(cv2, "imdecode", lambda *args: pytest.fail("decoded"))
+
+        with pytest.raises(ImageTooLargeError):
+            decode_floorplan_image(encode(image, ".png"), max_pixels=10_000)
+
+    def test_reduce_oversized(self, image):
+        """Test an oversized image is decoded at reduced resolution."""
+        decoded = decode_floorplan_image(
+            encode(image, ".jpg"), max_pixels=10_000, reduce_oversized=True,
+        )
+
+        assert decoded.reduction == 4
+        assert decoded.image.shape == (76, 101, 3)
+        assert decoded.to_dict()["original"]["width"] == 403
+
+    def test_reduce_oversized_png_rejected(self, image):
+        """Test an oversized PNG is rejected even with reduce_oversized."""
+        with pytest.raises(ImageTooLargeError):
+            decode_floorplan_image(encode(image, ".png"), max_pixels=10_000, reduce_oversized=True)
+
+    def test_reduce_follows_drawing_scale(self, image):
+        """Test a fine drawing is decoded at the resolution it would be analysed at."""
+        config = PreprocessingConfig(pixels_per_meter=100.0)
+
+        decoded = decode_floorplan_image(encode(image, ".png"), config, reduce_oversized=True)
+
+        assert decoded.reduction == 2
+
+    def test_unprobed_format_checked_after_decode(self, image):
+        """Test formats without a header probe still honour the ceiling."""
+        data = encode(image, ".webp")
+
+        assert decode_floorplan_image(data).info is None
+        with pytest.raises(ImageTooLargeError):
+            decode_floorplan_image(data, max_pixels=10_000)
+
+
+class TestReducedDecodeResults:
+    """Tests for mapping results of a reduced decode back to original pixels."""
+
+    def test_results_in_original_pixels(self):
+        """Test a 1/2 decode reports the same geometry as the full image."""
+        image = cv2.resize(synthetic_floorplan(), None, fx=2, fy=2, interpolation=cv2.INTER_NEAREST)
+        h, w = image.shape[:2]
+        decoded = decode_floorplan_image(
+            encode(image, ".jpg"), max_pixels=h * w // 4, reduce_oversized=True,
+        )
+        assert decoded.reduction == 2
+
+        result = preprocess_floorplan(decoded.image, decode_reduction=2)
+        full = preprocess_floorplan(image)
+
+        assert result.gemini_hints["image_dimensions"] == {"width": w, "height": h}
+        assert result.phase0_result.image_shape == (h, w)
+        for reduced, original in zip(result.phase0_result.boundaries, full.phase0_result.boundaries):
+            assert np.abs(np.subtract(reduced.polygon, original.polygon)).max() <= 4
+        boundary = result.content_boundary
+        assert boundary.x + boundary.width <= w and boundary.y + boundary.height <= h
+        assert boundary.width > w // 2
+        for lane in result.travel_lane_suggestions:
+            x, y, lane_w, lane_h = lane.bounding_box
+            assert x + lane_w <= w + 2 and y + lane_h <= h + 2
+        assert max(
+            a["bounding_box"]["x"] + a["bounding_box"]["width"]
+            for a in result_to_json(result)["line_detection"]["aisle_candidates"]
+        ) > w // 2
+
+    def test_invalid_reduction(self):
+        """Test decode_reduction must be at least 1."""
+        with pytest.raises(ValueError):
+            preprocess_floorplan(synthetic_floorplan(), decode_reduction=0)
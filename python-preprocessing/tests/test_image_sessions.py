@@ -0,0 +1,155 @@
+"""Tests for server-side image sessions."""
+
+import numpy as np
+import pytest
+
+from src.image_sessions import (
+    ImageSessionStore,
+    crop_roi,
+    estimate_nbytes,
+    roi_tuple,
+)
+from src.line_store import HoughLineStore
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _image(h=100, w=100):
+    return np.zeros((h, w, 3), dtype=np.uint8)
+
+
+class TestImageSessionStore:
+    """Tests for ImageSessionStore."""
+
+    def test_put_and_get(self):
+        """Test a stored image is returned by handle without copying."""
+        store = ImageSessionStore()
+        image = _image()
+        session = store.put(image)
+
+        assert store.get(session.handle).image is image
+        assert session.handle in store
+        assert store.get("missing") is None
+
+    def test_ttl_expiry_and_refresh(self):
+        """Test sessions expire after inactivity and get() refreshes the TTL."""
+        clock = FakeClock()
+        store = ImageSessionStore(ttl_seconds=10, clock=clock)
+        a = store.put(_image())
+        b = store.put(_image())
+
+        clock.now = 8
+        assert store.get(a.handle) is not None  # refresh a
+        clock.now = 12
+
+        assert store.get(b.handle) is None
+        assert store.get(a.handle) is not None
+        assert len(store) == 1
+
+    def test_memory_cap_evicts_least_recently_used(self):
+        """Test the oldest untouched session is evicted when over the cap."""
+        size = _image().nbytes
+        store = ImageSessionStore(max_bytes=2 * size)
+        a = store.put(_image())
+        b = store.put(_image())
+        store.get(a.handle)  # b is now least recently used
+        c = store.put(_image())
+
+        assert a.handle in store
+        assert b.handle not in store
+        assert c.handle in store
+        assert store.total_bytes <= 2 * size
+
+    def test_features_count_toward_cap(self):
+        """Test cached features are included in session memory."""
+        store = ImageSessionStore()
+        session = store.put(_image())
+        base = session.nbytes
+        session.feature("gray", lambda img: img[:, :, 0].copy())
+
+        assert session.nbytes == base + 100 * 100
+
+    def test_oversized_image_rejected(self):
+        """Test an image larger than the cap raises ValueError."""
+        store = ImageSessionStore(max_bytes=10)
+
+        with pytest.raises(ValueError):
+            store.put(_image())
+
+    def test_delete(self):
+        """Test delete removes a session and reports whether it existed."""
+        store = ImageSessionStore()
+        session = store.put(_image())
+
+        assert store.delete(session.handle) is True
+        assert store.delete(session.handle) is False
+        assert store.stats()["sessions"] == 0
+
+    def test_invalid_parameters(self):
+        """Test non-positive TTL or cap raise ValueError."""
+        with pytest.raises(ValueError):
+            ImageSessionStore(ttl_seconds=0)
+        with pytest.raises(ValueError):
+            ImageSessionStore(max_bytes=0)
+
+
+class TestImageSessionFeatures:
+    """Tests for lazily computed session features."""
+
+    def test_feature_computed_once(self):
+        """Test the factory runs only on the first request for a key."""
+        store = ImageSessionStore()
+        session = store.put(_image())
+        calls = []
+
+        def factory(img):
+            calls.append(1)
+            return HoughLineStore.from_image(img)
+
+        first = session.feature(("line_store", None, 30), factory)
+        second = session.feature(("line_store", None, 30), factory)
+
+        assert first is second
+        assert len(calls) == 1
+
+    def test_estimate_nbytes(self):
+        """Test array attributes of objects are counted."""
+        segments = np.zeros((10, 4), dtype=np.int32)
+        line_store = HoughLineStore(segments=segments, image_shape=(10, 10))
+
+        assert estimate_nbytes(segments) == 160
+        assert estimate_nbytes(line_store) >= 160
+        assert estimate_nbytes("text") == 0
+
+
+class TestRoi:
+    """Tests for ROI parsing and cropping."""
+
+    def test_roi_tuple(self):
+        """Test ROI dicts parse to tuples and bad input raises."""
+        assert roi_tuple(None) is None
+        assert roi_tuple({"x": 1, "y": 2, "width": 3, "height": 4}) == (1, 2, 3, 4)
+        with pytest.raises(ValueError):
+            roi_tuple({"x": 1})
+
+    def test_crop_is_clipped_view(self):
+        """Test crops are clipped views into the stored image."""
+        image = _image(50, 80)
+        view, offset = crop_roi(image, (-10, 20, 40, 100))
+
+        assert offset == (0, 20)
+        assert view.shape[:2] == (30, 30)
+        assert np.shares_memory(view, image)
+
+    def test_crop_outside_raises(self):
+        """Test a non-overlapping ROI raises ValueError."""
+        with pytest.raises(ValueError):
+            crop_roi(_image(50, 50), (60, 0, 10, 10))
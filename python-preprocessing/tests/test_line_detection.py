@@ -0,0 +1,367 @@
+"""Tests for columnar line storage and vectorized clustering."""
+
+import math
+import time
+
+import numpy as np
+import cv2
+import pytest
+
+from src.line_detection import (
+    LINE_DTYPE,
+    LineSegment,
+    lines_to_array,
+    array_to_line_segments,
+    line_segments_to_array,
+    cluster_parallel_lines,
+    create_orientation_map,
+    detect_line_array,
+    detect_lines,
+    AISLE_DETECTORS,
+    detect_aisles,
+    detect_aisles_with_stats,
+    detect_aisles_from_brightness_profile,
+    detect_aisles_from_gradient_edges,
+    resolve_aisle_detectors,
+    process_lines,
+    line_result_to_dict,
+)
+from src import concurrency, line_detection
+from src.concurrency import configure_governor
+from src.deadline import Deadline, LOW_VALUE_AISLE_DETECTORS
+
+
+def _racking_image():
+    """White floorplan with dark racking columns separated by narrow aisles."""
+    image = np.full((400, 500, 3), 255, dtype=np.uint8)
+    for x in range(40, 460, 45):
+        cv2.rectangle(image, (x, 40), (x + 25, 360), (40, 40, 40), -1)
+    return image
+
+
+def _random_segments(n, seed=0):
+    """Random mostly axis-aligned segments in a 2000x2000 image."""
+    rng = np.random.default_rng(seed)
+    x1 = rng.integers(0, 2000, n)
+    y1 = rng.integers(0, 2000, n)
+    length = rng.integers(30, 300, n)
+    kind = rng.integers(0, 3, n)
+    x2 = np.where(kind == 0, x1 + length, np.where(kind == 1, x1 + rng.integers(-5, 6, n), x1 + length))
+    y2 = np.where(kind == 0, y1 + rng.integers(-5, 6, n), np.where(kind == 1, y1 + length, y1 + length))
+    return np.stack([x1, y1, x2, y2], axis=1).astype(np.int32)
+
+
+def _reference_segments(segments):
+    """Per-line math computation the columnar path replaces."""
+    out = []
+    for x1, y1, x2, y2 in segments.tolist():
+        angle = math.degrees(math.atan2(y2 - y1, x2 - x1))
+        if angle < 0:
+            angle += 180
+        out.append(LineSegment(
+            start=(x1, y1),
+            end=(x2, y2),
+            angle=angle,
+            length=math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2),
+            midpoint=((x1 + x2) // 2, (y1 + y2) // 2),
+        ))
+    return out
+
+
+def _reference_clusters(lines, distance_threshold):
+    """Original list-based clustering with per-step np.mean."""
+    groups = {"horizontal": [], "vertical": []}
+    for line in lines:
+        norm = line.angle if line.angle <= 90 else 180 - line.angle
+        if norm < 20:
+            groups["horizontal"].append(line)
+        elif norm > 70:
+            groups["vertical"].append(line)
+
+    result = []
+    for orientation in ("horizontal", "vertical"):
+        members = groups[orientation]
+        if not members:
+            continue
+        idx = 1 if orientation == "horizontal" else 0
+        ordered = sorted(members, key=lambda l: l.midpoint[idx])
+        current = [ordered[0]]
+        for line in ordered[1:]:
+            if abs(line.midpoint[idx] - np.mean([l.midpoint[idx] for l in current])) < distance_threshold:
+                current.append(line)
+            else:
+                if len(current) >= 3:
+                    result.append((orientation, current))
+                current = [line]
+        if len(current) >= 3:
+            result.append((orientation, current))
+    return result
+
+
+class TestLineArray:
+    """Tests for the LINE_DTYPE representation."""
+
+    def test_matches_per_line_math(self):
+        """Test vectorized angle/length/midpoint equal the per-line math."""
+        segments = _random_segments(500)
+
+        arr = lines_to_array(segments)
+        expected = _reference_segments(segments)
+
+        assert arr.dtype == LINE_DTYPE
+        for actual, ref in zip(array_to_line_segments(arr), expected):
+            assert actual.start == ref.start and actual.end == ref.end
+            assert actual.midpoint == ref.midpoint
+            assert actual.angle == pytest.approx(ref.angle)
+            assert actual.length == pytest.approx(ref.length)
+
+    def test_round_trip(self):
+        """Test LineSegment list <-> array conversion is lossless."""
+        arr = lines_to_array(_random_segments(50, seed=3))
+
+        np.testing.assert_array_equal(line_segments_to_array(array_to_line_segments(arr)), arr)
+
+    def test_segment_views_are_python_types(self):
+        """Test LineSegment views hold plain ints and floats."""
+        segment = array_to_line_segments(lines_to_array([[0, 0, 10, 10]]))[0]
+
+        assert type(segment.start[0]) is int
+        assert type(segment.angle) is float
+
+
+class TestClusterParallelLines:
+    """Tests for vectorized clustering."""
+
+    @pytest.mark.parametrize("seed", [0, 1])
+    def test_matches_reference_clustering(self, seed):
+        """Test running-mean clustering equals the original per-step mean."""
+        segments = _random_segments(3000, seed=seed)
+        arr = lines_to_array(segments)
+
+        clusters = cluster_parallel_lines(arr, distance_threshold=40.0)
+        expected = _reference_clusters(_reference_segments(segments), 40.0)
+
+        assert len(clusters) == len(expected)
+        for cluster, (orientation, members) in zip(clusters, expected):
+            assert cluster.orientation == orientation
+            assert cluster.line_count == len(members)
+            assert [(l.start, l.end) for l in cluster.lines] == [(l.start, l.end) for l in members]
+            assert cluster.dominant_angle == pytest.approx(np.mean([l.angle for l in members]))
+
+    def test_accepts_line_segment_list(self):
+        """Test list input gives the same clusters as array input."""
+        arr = lines_to_array(_random_segments(400, seed=2))
+
+        from_list = cluster_parallel_lines(array_to_line_segments(arr))
+        from_array = cluster_parallel_lines(arr)
+
+        assert [c.bounding_box for c in from_list] == [c.bounding_box for c in from_array]
+
+    def test_empty(self):
+        """Test empty input yields no clusters."""
+        assert cluster_parallel_lines([]) == []
+        assert cluster_parallel_lines(np.empty(0, dtype=LINE_DTYPE)) == []
+
+    def test_orientation_map_matches_line_drawing(self):
+        """Test batched polyline drawing equals drawing lines one by one."""
+        arr = lines_to_array(_random_segments(300, seed=4))
+        clusters = cluster_parallel_lines(arr, distance_threshold=40.0)
+
+        vis = create_orientation_map((2400, 2400), clusters)
+
+        expected = np.zeros((2400, 2400, 3), dtype=np.uint8)
+        for cluster in clusters:
+            color = (0, 255, 0) if cluster.orientation == "horizontal" else (255, 0, 0)
+            x, y, cw, ch = cluster.bounding_box
+            cv2.rectangle(expected, (x, y), (x + cw, y + ch), color, 2)
+            for line in cluster.lines:
+                cv2.line(expected, line.start, line.end, color, 1)
+        np.testing.assert_array_equal(vis, expected)
+
+
+class TestDetectLineArray:
+    """Tests for detect_line_array / detect_lines."""
+
+    def test_detect_lines_is_view_of_array(self):
+        """Test detect_lines returns views of detect_line_array records."""
+        image = np.full((200, 300), 255, dtype=np.uint8)
+        for x in range(20, 280, 30):
+            cv2.line(image, (x, 20), (x, 180), 0, 2)
+
+        arr = detect_line_array(image)
+        lines = detect_lines(image)
+
+        assert len(arr) == len(lines) > 0
+        assert [(l.start, l.end) for l in lines] == list(
+            zip(zip(arr["x1"].tolist(), arr["y1"].tolist()), zip(arr["x2"].tolist(), arr["y2"].tolist()))
+        )
+
+    def test_blank_image(self):
+        """Test a blank image yields an empty LINE_DTYPE array."""
+        arr = detect_line_array(np.full((50, 50), 255, dtype=np.uint8))
+
+        assert arr.dtype == LINE_DTYPE
+        assert len(arr) == 0
+
+
+class TestAisleDetectorRegistry:
+    """Tests for the aisle detector registry and detect_aisles_with_stats."""
+
+    def test_registry_order(self):
+        """Test detectors are registered in the historical merge order."""
+        assert list(AISLE_DETECTORS) == [
+            "cluster_gaps",
+            "brightness_profile",
+            "gradient_edges",
+            "line_pair",
+            "whitespace",
+            "travel_lane_morph",
+        ]
+
+    def test_resolve_toggles(self):
+        """Test unlisted detectors stay enabled and unknown names raise."""
+        assert resolve_aisle_detectors(None) == list(AISLE_DETECTORS)
+        enabled = resolve_aisle_detectors({"line_pair": False, "whitespace": False})
+        assert "line_pair" not in enabled and "whitespace" not in enabled
+        assert len(enabled) == len(AISLE_DETECTORS) - 2
+
+        with pytest.raises(ValueError, match="Unknown aisle detector"):
+            resolve_aisle_detectors({"nope": True})
+
+    def test_parallel_matches_serial(self):
+        """Test concurrent execution yields the same aisles as serial."""
+        image = _racking_image()
+        serial = detect_aisles(image, [], max_workers=1)
+        parallel = detect_aisles(image, [], max_workers=6)
+
+        assert len(serial) > 0
+        assert [(a.id, a.detection_method, a.centerline, a.width) for a in serial] == [
+            (a.id, a.detection_method, a.centerline, a.width) for a in parallel
+        ]
+
+    def test_stats_per_detector(self):
+        """Test stats report time and candidate count for enabled detectors only."""
+        image = _racking_image()
+        aisles, stats = detect_aisles_with_stats(
+            image, [], detectors={"travel_lane_morph": False}
+        )
+
+        assert "travel_lane_morph" not in stats
+        assert set(stats) == set(AISLE_DETECTORS) - {"travel_lane_morph"}
+        for entry in stats.values():
+            assert entry["time_ms"] >= 0
+            assert entry["candidates"] >= 0
+        assert all(a.detection_method != "travel_lane_morph" for a in aisles)
+
+    def test_disable_all_but_one(self):
+        """Test only the enabled detector contributes aisles."""
+        image = _racking_image()
+        toggles = {name: name == "brightness_profile" for name in AISLE_DETECTORS}
+        aisles, stats = detect_aisles_with_stats(image, [], detectors=toggles)
+
+        assert list(stats) == ["brightness_profile"]
+        assert {a.detection_method for a in aisles} <= {"brightness_profile"}
+
+    def test_param_scale_reaches_detector_constants(self, monkeypatch):
+        """Test detectors taking param_scale get it and scale their width bands."""
+        calls = {}
+
+        def recording(gray, clusters, min_width, max_width, param_scale=1.0):
+            calls["param_scale"] = param_scale
+            return []
+
+        def brightness_profile(gray, **kwargs):
+            calls["brightness"] = kwargs
+            return []
+
+        monkeypatch.setitem(AISLE_DETECTORS, "travel_lane_morph", recording)
+        monkeypatch.setattr(line_detection, "detect_aisles_from_brightness_profile", brightness_profile)
+
+        detect_aisles_with_stats(_racking_image(), [], max_workers=1, param_scale=0.5)
+
+        assert calls["param_scale"] == 0.5
+        assert calls["brightness"]["min_aisle_width"] == 4
+        assert calls["brightness"]["max_aisle_width"] == 40
+        assert calls["brightness"]["min_racking_band_height"] == 40
+
+    def test_process_lines_reports_stats(self):
+        """Test detector stats surface in the serialized line result."""
+        result = process_lines(_racking_image(), aisle_detectors={"line_pair": False})
+        data = line_result_to_dict(result)
+
+        assert set(data["stats"]["aisle_detectors"]) == set(AISLE_DETECTORS) - {"line_pair"}
+
+
+class TestAisleDetectorDeadline:
+    """Tests for aisle detection under a request deadline."""
+
+    @pytest.fixture
+    def governor(self):
+        """Allow detectors to run in parallel on any machine."""
+        previous = concurrency._governor
+        threads = cv2.getNumThreads()
+        yield configure_governor(core_budget=8)
+        concurrency._governor = previous
+        cv2.setNumThreads(threads)
+
+    def test_low_value_detectors_skipped(self):
+        """Test low-value detectors are dropped once half the budget is spent."""
+        deadline = Deadline(60_000)
+        deadline._started -= 40  # 40 of 60 seconds spent
+
+        _, stats = detect_aisles_with_stats(_racking_image(), [], deadline=deadline)
+
+        for name in LOW_VALUE_AISLE_DETECTORS:
+            assert stats[name] == {"skipped": True}
+            assert f"aisle_detectors.{name}" in deadline.skipped
+        assert stats["line_pair"]["candidates"] >= 0
+        assert deadline.truncated == ["aisle_detectors"]
+
+    def test_slow_detector_stops_at_deadline(self, governor, monkeypatch):
+        """Test a detector taking the deadline stops early and others' aisles are kept."""
+        def slow(gray, clusters, min_width, max_width, deadline=None):
+            while not deadline.expired:
+                time.sleep(0.01)
+            deadline.truncate("aisle_detectors.travel_lane_morph")
+            return []
+
+        monkeypatch.setitem(AISLE_DETECTORS, "travel_lane_morph", slow)
+        deadline = Deadline(300)
+
+        start = time.perf_counter()
+        aisles, stats = detect_aisles_with_stats(_racking_image(), [], max_workers=6, deadline=deadline)
+
+        assert time.perf_counter() - start < 0.9
+        assert stats["travel_lane_morph"]["truncated"]
+        assert stats["brightness_profile"]["candidates"] > 0
+        assert len(aisles) > 0
+        assert "aisle_detectors.travel_lane_morph" in deadline.truncated
+
+    def test_no_detector_outlives_call(self, governor, monkeypatch):
+        """Test detectors without a deadline are waited for, not left running."""
+        finished = []
+
+        def slow(gray, clusters, min_width, max_width):
+            time.sleep(0.5)
+            finished.append(True)
+            return []
+
+        monkeypatch.setitem(AISLE_DETECTORS, "travel_lane_morph", slow)
+
+        _, stats = detect_aisles_with_stats(_racking_image(), [], max_workers=6, deadline=Deadline(100))
+
+        assert finished == [True]
+        assert stats["travel_lane_morph"]["candidates"] == 0
+
+    @pytest.mark.parametrize("name,detect", [
+        ("brightness_profile", detect_aisles_from_brightness_profile),
+        ("gradient_edges", detect_aisles_from_gradient_edges),
+    ])
+    def test_band_loop_stops_when_expired(self, name, detect):
+        """Test an expired deadline stops the band loop with partial results."""
+        deadline = Deadline(1)
+        deadline._started -= 1
+
+        assert detect(_racking_image(), deadline=deadline) == []
+        assert detect(_racking_image(), deadline=Deadline(60_000))
+        assert deadline.truncated == [f"aisle_detectors.{name}"]
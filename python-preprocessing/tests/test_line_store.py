@@ -0,0 +1,124 @@
+"""Tests for the Hough line store and line detection from it."""
+
+import numpy as np
+import cv2
+import pytest
+
+from src.line_store import HoughLineStore
+from src.line_detection import detect_lines
+from src.pipeline import PreprocessingConfig, build_line_store, preprocess_floorplan
+from tests.fixtures.color_boundary_fixtures import create_warehouse_floorplan
+
+
+def _racking_image() -> np.ndarray:
+    """White image with vertical racking on the left, a grid on the right and short ticks."""
+    image = np.full((400, 600, 3), 255, dtype=np.uint8)
+    for x in range(40, 260, 20):
+        cv2.line(image, (x, 40), (x, 360), (0, 0, 0), 2)
+    for v in range(320, 580, 40):
+        cv2.line(image, (v, 40), (v, 360), (0, 0, 0), 2)
+    for y in range(40, 380, 40):
+        cv2.line(image, (320, y), (580, y), (0, 0, 0), 2)
+    # Short labels/ticks along the bottom edge
+    for x in range(40, 560, 100):
+        cv2.line(image, (x, 385), (x + 60, 385), (0, 0, 0), 2)
+    return image
+
+
+@pytest.fixture(scope="module")
+def image():
+    return _racking_image()
+
+
+@pytest.fixture(scope="module")
+def store(image):
+    return HoughLineStore.from_image(image)
+
+
+class TestHoughLineStore:
+    """Tests for HoughLineStore."""
+
+    def test_from_image(self, store, image):
+        """Test segments, lengths and angles are populated consistently."""
+        assert len(store) > 10
+        assert store.segments.shape == (len(store), 4)
+        assert store.segments.dtype == np.int32
+        assert store.image_shape == image.shape[:2]
+        assert np.all((store.angles >= 0) & (store.angles <= 180))
+        assert np.all(store.lengths >= store.min_line_length - 1)
+
+    def test_empty_image(self):
+        """Test a blank image yields an empty store."""
+        store = HoughLineStore.from_image(np.full((100, 100), 255, dtype=np.uint8))
+
+        assert len(store) == 0
+        assert store.filter(min_length=10).shape == (0, 4)
+
+    def test_filter_min_length(self, store):
+        """Test length filtering keeps only long segments."""
+        long_segments = store.filter(min_length=200)
+
+        assert 0 < len(long_segments) < len(store)
+        lengths = np.hypot(long_segments[:, 2] - long_segments[:, 0], long_segments[:, 3] - long_segments[:, 1])
+        assert np.all(lengths >= 200)
+
+    def test_covers(self, store):
+        """Test parameter coverage check."""
+        assert store.covers(50, 30, 10)
+        assert store.covers(100, 100, 5)
+        assert not store.covers(40, 30, 10)
+        assert not store.covers(50, 20, 10)
+        assert not store.covers(50, 30, 20)
+
+
+class TestLineStoreConsumers:
+    """Tests that line detection gives the same answers from a store."""
+
+    def test_detect_lines_same_parameters(self, image, store):
+        """Test detect_lines with a store equals its own Hough pass."""
+        direct = detect_lines(image)
+        shared = detect_lines(image, line_store=store)
+
+        assert [(l.start, l.end) for l in shared] == [(l.start, l.end) for l in direct]
+        assert [l.angle for l in shared] == pytest.approx([l.angle for l in direct])
+
+    def test_detect_lines_falls_back_when_store_too_strict(self, image):
+        """Test a store stricter than requested is not used."""
+        strict = HoughLineStore.from_image(image, min_line_length=200)
+
+        lines = detect_lines(image, min_line_length=30, line_store=strict)
+
+        assert any(l.length < 200 for l in lines)
+
+
+class TestPipelineLineStore:
+    """Tests for line stores built lazily by preprocess_floorplan."""
+
+    def test_factory_gets_analysed_image(self):
+        """Test a store factory is called with the downscaled image it serves."""
+        image = cv2.resize(
+            create_warehouse_floorplan(megapixels=1.0), None, fx=4, fy=4,
+            interpolation=cv2.INTER_NEAREST,
+        )
+        shapes = []
+
+        def factory(analysed, config):
+            shapes.append(analysed.shape[:2])
+            return build_line_store(analysed, config)
+
+        result = preprocess_floorplan(image, PreprocessingConfig(estimate_scale=True), line_store=factory)
+
+        assert result.analysis_scale < 0.5
+        assert len(shapes) == 1
+        assert max(shapes[0]) == pytest.approx(max(image.shape[:2]) * result.analysis_scale, abs=1)
+
+    def test_factory_skipped_past_deadline(self):
+        """Test no store is built once the deadline skips line detection."""
+        image = create_warehouse_floorplan(megapixels=1.0)
+
+        def factory(analysed, config):
+            pytest.fail("line store built past the deadline")
+
+        result = preprocess_floorplan(image, PreprocessingConfig(deadline_ms=0.001), line_store=factory)
+
+        assert "lines" in result.deadline["skipped"]
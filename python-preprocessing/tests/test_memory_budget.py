@@ -0,0 +1,239 @@
+"""Tests for peak-memory accounting and memory-budget coarse-to-fine processing."""
+
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from src.memory_budget import (
+    MB,
+    MIN_ANALYSIS_SCALE,
+    PIPELINE_STAGES,
+    MemoryEstimator,
+    PeakMemory,
+    StageMemoryCost,
+    measure_peak_memory,
+)
+from src.pipeline import (
+    PreprocessingConfig,
+    analysis_scale,
+    preprocess_floorplan,
+    result_to_json,
+    scale_result_coordinates,
+)
+from src.travel_lane_detection import TravelLaneSuggestion
+from tests.fixtures.color_boundary_fixtures import create_warehouse_floorplan
+
+
+class TestMeasurePeakMemory:
+    """Tests for tracemalloc measurement."""
+
+    def test_peak_includes_numpy_temporaries(self):
+        """Test a freed 8 MB temporary shows in the peak but not as retained."""
+        def work():
+            tmp = np.ones((1024, 1024), dtype=np.float64)
+            return float(tmp.sum())
+
+        result, memory = measure_peak_memory(work)
+
+        assert result == 1024 * 1024
+        assert memory.peak_bytes >= 8 * MB
+        assert memory.retained_numpy_bytes < MB
+        assert not tracemalloc.is_tracing()
+
+    def test_retained_arrays(self):
+        """Test returned arrays count as retained NumPy bytes."""
+        result, memory = measure_peak_memory(np.zeros, (512, 1024), dtype=np.float32)
+
+        assert result.nbytes == 2 * MB
+        assert memory.retained_numpy_bytes == pytest.approx(2 * MB, rel=0.01)
+
+    def test_nested_keeps_outer_tracing(self):
+        """Test measuring inside an active trace leaves tracing on."""
+        tracemalloc.start()
+        try:
+            _, memory = measure_peak_memory(np.ones, 1000)
+            assert tracemalloc.is_tracing()
+        finally:
+            tracemalloc.stop()
+
+        assert memory.retained_numpy_bytes >= 8000
+
+    def test_concurrent_measurements_serialized(self):
+        """Test one thread finishing does not stop tracing under another."""
+        def work():
+            tmp = np.ones((1024, 1024), dtype=np.float64)
+            time.sleep(0.05)
+            return float(tmp.sum())
+
+        memories = []
+        threads = [
+            threading.Thread(target=lambda: memories.append(measure_peak_memory(work)[1]))
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(memories) == 2
+        assert all(memory.peak_bytes >= 8 * MB for memory in memories)
+        assert not tracemalloc.is_tracing()
+
+
+class TestMemoryEstimator:
+    """Tests for the per-megapixel peak estimator."""
+
+    def test_estimate_grows_with_size(self):
+        """Test the estimate is roughly linear in megapixels."""
+        estimator = MemoryEstimator()
+        small = estimator.estimate_peak_mb(1000, 1000)
+        large = estimator.estimate_peak_mb(4000, 4000)
+
+        assert large == pytest.approx(16 * small, rel=0.01)
+
+    def test_peak_is_heaviest_stage_over_resident(self):
+        """Test the peak adds the heaviest stage to image and retained outputs."""
+        estimator = MemoryEstimator(stage_costs={
+            "a": StageMemoryCost(10.0, 5.0),
+            "b": StageMemoryCost(8.0, 0.0),
+        }, stages=("a", "b"), full_resolution_stages=())
+
+        # 1 MP: image 3 bytes/px, then a peaks at 10 MB, b at 5 + 8 MB
+        expected = 3e6 + 13 * MB
+        assert estimator.estimate_peak_bytes(1000, 1000) == int(expected)
+
+    def test_scale_for_budget(self):
+        """Test the chosen scale fits the budget and a fitting run is full scale."""
+        estimator = MemoryEstimator()
+        full = estimator.estimate_peak_mb(4000, 3000)
+
+        assert estimator.scale_for_budget(4000, 3000, full + 1) == 1.0
+
+        scale = estimator.scale_for_budget(4000, 3000, full / 2)
+        assert MIN_ANALYSIS_SCALE < scale < 1.0
+        assert estimator.estimate_peak_mb(4000, 3000, scale) <= full / 2
+
+    def test_unreachable_budget_uses_minimum_scale(self):
+        """Test budgets below the full-resolution floor clamp to the minimum scale."""
+        assert MemoryEstimator().scale_for_budget(4000, 3000, 1) == MIN_ANALYSIS_SCALE
+
+    def test_calibrate(self):
+        """Test calibration fits per-megapixel costs from profiles."""
+        profiles = [
+            (1.0, {"lines": PeakMemory(int(20 * MB), int(2 * MB))}),
+            (4.0, {"lines": PeakMemory(int(80 * MB), int(8 * MB))}),
+        ]
+        calibrated = MemoryEstimator().calibrate(profiles)
+
+        assert calibrated.stage_costs["lines"].peak_mb_per_mp == pytest.approx(20.0)
+        assert calibrated.stage_costs["lines"].retained_mb_per_mp == pytest.approx(2.0)
+        assert calibrated.stage_costs["edges"] == MemoryEstimator().stage_costs["edges"]
+
+    def test_round_trip(self):
+        """Test stage costs survive to_dict/from_dict."""
+        estimator = MemoryEstimator(stage_costs={"lines": StageMemoryCost(1.0, 2.0)})
+
+        loaded = MemoryEstimator.from_dict(estimator.to_dict())
+
+        assert loaded.stage_costs["lines"] == StageMemoryCost(1.0, 2.0)
+        assert set(PIPELINE_STAGES) <= set(loaded.stage_costs)
+
+
+class TestScaleResultCoordinates:
+    """Tests for mapping coarse results back to full resolution."""
+
+    def test_scales_coordinates_lengths_and_areas(self):
+        """Test points, lengths and areas scale while scores do not."""
+        data = {
+            "regions": [{
+                "bounding_box": {"x": 10, "y": 5, "width": 20, "height": 8},
+                "centroid": {"x": 20, "y": 9},
+                "area": 100,
+                "density_score": 0.5,
+                "vertices": [{"x": 1, "y": 2}],
+            }],
+            "stats": {"total_regions": 1, "total_dense_area": 100},
+        }
+
+        scaled = scale_result_coordinates(data, 2.0)
+        region = scaled["regions"][0]
+
+        assert region["bounding_box"] == {"x": 20, "y": 10, "width": 40, "height": 16}
+        assert region["vertices"] == [{"x": 2, "y": 4}]
+        assert region["area"] == 400
+        assert region["density_score"] == 0.5
+        assert scaled["stats"] == {"total_regions": 1, "total_dense_area": 400}
+
+    def test_travel_lane_scale(self):
+        """Test travel lane suggestions scale in place."""
+        lane = TravelLaneSuggestion(
+            id=0, coverage_uid="", centerline=[(10, 20)], width_profile=[4.0],
+            average_width=4.0, bounding_box=(5, 10, 20, 30), confidence=0.9,
+            detection_method="skeletonization", orientation="vertical",
+        )
+
+        lane.scale(2.0)
+
+        assert lane.centerline == [(20, 40)]
+        assert lane.average_width == 8.0
+        assert lane.bounding_box == (10, 20, 40, 60)
+
+
+class TestPipelineMemoryBudget:
+    """Tests for memory budgets and profiling in preprocess_floorplan."""
+
+    @pytest.fixture(scope="class")
+    def floorplan(self):
+        return create_warehouse_floorplan(megapixels=1.0)
+
+    def test_profile_records_every_stage(self, floorplan):
+        """Test profiling records a peak for each pipeline stage."""
+        config = PreprocessingConfig(profile_memory=True)
+        result = preprocess_floorplan(floorplan, config)
+
+        assert set(result.memory_profile) == set(PIPELINE_STAGES)
+        assert result.memory_profile["lines"].peak_bytes > 0
+        output = result_to_json(result)
+        assert output["memory"]["analysis_scale"] == 1.0
+        assert set(output["memory"]["stages"]) == set(PIPELINE_STAGES)
+
+    def test_generous_budget_runs_full_resolution(self, floorplan):
+        """Test a budget above the estimate changes nothing."""
+        baseline = preprocess_floorplan(floorplan)
+        result = preprocess_floorplan(floorplan, PreprocessingConfig(memory_budget_mb=10_000))
+
+        assert result.analysis_scale == 1.0
+        assert result.estimated_peak_mb is not None
+        assert result.line_data["aisle_candidates"] == baseline.line_data["aisle_candidates"]
+        assert "memory" not in result_to_json(baseline)
+
+    def test_tight_budget_runs_coarse_in_full_resolution_coordinates(self, floorplan):
+        """Test an over-budget run analyses a downscaled copy and maps results back."""
+        h, w = floorplan.shape[:2]
+        config = PreprocessingConfig(memory_budget_mb=25)
+        scale = analysis_scale(floorplan.shape, config)
+
+        result = preprocess_floorplan(floorplan, config)
+
+        assert scale < 1.0
+        assert result.analysis_scale == scale
+        assert result.estimated_peak_mb <= 25
+        assert result.gemini_hints["image_dimensions"] == {"width": w, "height": h}
+        assert result.content_boundary.width == pytest.approx(w, abs=2 / scale)
+        assert result.visualizations["density_map"].shape[0] < h
+        for aisle in result.line_data["aisle_candidates"]:
+            box = aisle["bounding_box"]
+            assert box["x"] + box["width"] <= w + 2 / scale
+            assert box["y"] + box["height"] <= h + 2 / scale
+
+    def test_tight_budget_lowers_measured_peak(self, floorplan):
+        """Test the coarse run actually uses less memory."""
+        _, full = measure_peak_memory(preprocess_floorplan, floorplan)
+        _, coarse = measure_peak_memory(
+            preprocess_floorplan, floorplan, PreprocessingConfig(memory_budget_mb=25)
+        )
+
+        assert coarse.peak_bytes < full.peak_bytes * 0.7
@@ -11,6 +11,8 @@ from src.orientation.correction import (
     rotate_polygon,
     get_rotated_dimensions,
     transform_coordinates_after_rotation,
+    correct_orientation_view,
+    OrientationTransform,
 )
 
 
@@ -242,3 +244,77 @@ class TestTransformCoordinatesAfterRotation:
         # Should be close to original (may differ by 1 due to rounding)
         assert abs(recovered[0] - original[0]) <= 1
         assert abs(recovered[1] - original[1]) <= 1
+
+
+class TestOrientationTransform:
+    """Tests for the affine orientation transform."""
+
+    @pytest.mark.parametrize("degrees", [90, 180, 270])
+    def test_apply_is_view_matching_rotate_image(self, degrees):
+        """Test quarter turns are views with the same pixels as rotate_image."""
+        image = np.random.default_rng(0).integers(0, 255, (30, 50, 3), dtype=np.uint8)
+        transform = OrientationTransform(degrees, 50, 30)
+
+        view = transform.apply(image)
+
+        assert np.shares_memory(view, image)
+        np.testing.assert_array_equal(view, rotate_image(image, degrees))
+        assert view.shape[1::-1] == transform.oriented_size
+
+    def test_identity_returns_image(self):
+        """Test 0 degrees neither copies nor moves points."""
+        image = np.zeros((10, 20), dtype=np.uint8)
+        transform = OrientationTransform(0, 20, 10)
+
+        assert transform.apply(image) is image
+        assert transform.is_identity
+        np.testing.assert_array_equal(transform.to_original([[3, 4]]), [[3, 4]])
+
+    @pytest.mark.parametrize("degrees", [90, 180, 270])
+    def test_points_match_rotate_point(self, degrees):
+        """Test batch mapping agrees with the point-by-point functions."""
+        size = (100, 60)
+        points = np.array([[0, 0], [10, 20], [99, 59], [42, 7]])
+        transform = OrientationTransform(degrees, *size)
+
+        oriented = transform.to_oriented(points)
+
+        assert oriented.dtype == points.dtype
+        assert [tuple(p) for p in oriented] == [rotate_point(tuple(p), degrees, size) for p in points]
+        assert [tuple(p) for p in transform.to_original(oriented)] == [
+            transform_coordinates_after_rotation(tuple(p), size, degrees) for p in oriented
+        ]
+        np.testing.assert_array_equal(transform.to_original(oriented), points)
+
+    def test_polygons_to_original(self):
+        """Test polygons of different lengths map back in one batch."""
+        transform = OrientationTransform(90, 100, 60)
+        polygons = [[(0, 0), (10, 0), (10, 10)], [], [(5, 5), (6, 6)]]
+        oriented = [transform.to_oriented(np.array(p)) if p else [] for p in polygons]
+
+        restored = transform.polygons_to_original(oriented)
+
+        assert [r.tolist() for r in restored] == [[list(p) for p in poly] for poly in polygons]
+        assert transform.polygons_to_original([]) == []
+
+    def test_general_angle_matches_expanded_rotation(self):
+        """Test arbitrary angles use rotate_image's expanded canvas."""
+        image = np.zeros((40, 80), dtype=np.uint8)
+        transform = OrientationTransform(30, 80, 40)
+
+        rotated = transform.apply(image)
+
+        assert rotated.shape == rotate_image(image, 30).shape
+        center = transform.to_original(transform.to_oriented(np.array([[40.0, 20.0]])))
+        np.testing.assert_allclose(center, [[40.0, 20.0]])
+
+    def test_correct_orientation_view(self):
+        """Test correction returns a view and the transform back."""
+        image = np.zeros((100, 200, 3), dtype=np.uint8)
+        result = OrientationResult(detected_orientation=Orientation.EAST, confidence=0.9)
+
+        corrected, transform = correct_orientation_view(image, result)
+
+        assert corrected.shape == correct_orientation(image, result).shape
+        assert np.shares_memory(corrected, image)
+        assert transform.degrees == 270
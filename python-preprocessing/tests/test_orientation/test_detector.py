@@ -150,6 +150,32 @@ class TestOrientationDetectorLineDetection:
 
         assert isinstance(result, OrientationResult)
 
+    def test_large_image_uses_downsampled_edges(self):
+        """Test a large drawing's line directions survive downsampling."""
+        image = np.full((3000, 4000, 3), 255, dtype=np.uint8)
+        for i in range(10):
+            cv2.line(image, (200, 200 + i * 250), (1600, 200 + i * 250), (0, 0, 0), 8)
+            cv2.line(image, (2200 + i * 160, 200), (2200 + i * 160, 2800), (0, 0, 0), 8)
+
+        detector = OrientationDetector(use_text_detection=False, use_boundary_analysis=False)
+        hint = detector._detect_from_lines(image)
+
+        assert hint.orientation == Orientation.NORTH
+        assert hint.details["horizontal_ratio"] == pytest.approx(0.5)
+        assert hint.details["vertical_ratio"] == pytest.approx(0.5)
+
+    def test_large_image_vertical_lines(self):
+        """Test mostly vertical lines on a large drawing suggest rotation."""
+        image = np.full((3000, 4000, 3), 255, dtype=np.uint8)
+        for i in range(20):
+            cv2.line(image, (200 + i * 180, 200), (200 + i * 180, 2800), (0, 0, 0), 8)
+
+        detector = OrientationDetector(use_text_detection=False, use_boundary_analysis=False)
+        hint = detector._detect_from_lines(image)
+
+        assert hint.orientation == Orientation.EAST
+        assert hint.details["vertical_ratio"] == 1.0
+
     def test_detect_no_lines(self):
         """Test detection on image with no lines."""
         # Plain gray image
@@ -60,3 +60,40 @@ class TestPreprocessingConfigWithPhase0:
         config = PreprocessingConfig(phase0_config=Phase0Config.disabled())
 
         assert config.phase0_config.enabled is False
+
+
+class TestPreprocessingConfigAisleDetectors:
+    """Tests for aisle detector toggles on PreprocessingConfig."""
+
+    def test_default_enables_all(self):
+        """Test detectors default to None (all enabled)."""
+        config = PreprocessingConfig()
+
+        assert config.aisle_detectors is None
+        assert config.aisle_detector_workers == 4
+
+    def test_unknown_detector_raises(self):
+        """Test unknown detector names are rejected."""
+        with pytest.raises(ValueError):
+            PreprocessingConfig(aisle_detectors={"not_a_detector": True})
+
+    def test_invalid_workers_raises(self):
+        """Test worker count must be positive."""
+        with pytest.raises(ValueError):
+            PreprocessingConfig(aisle_detector_workers=0)
+
+
+class TestPreprocessingConfigMemoryBudget:
+    """Tests for the memory budget on PreprocessingConfig."""
+
+    def test_default_has_no_budget(self):
+        """Test the budget and profiling are off by default."""
+        config = PreprocessingConfig()
+
+        assert config.memory_budget_mb is None
+        assert config.profile_memory is False
+
+    def test_non_positive_budget_raises(self):
+        """Test a zero or negative budget is rejected."""
+        with pytest.raises(ValueError, match="memory_budget_mb"):
+            PreprocessingConfig(memory_budget_mb=0)
@@ -2,6 +2,7 @@
 
 import pytest
 import time
+import numpy as np
 import tempfile
 from pathlib import Path
 
@@ -83,6 +84,28 @@ class TestCacheKey:
         assert len(key.image_hash) == 64
         assert len(key.config_hash) == 32
 
+    def test_from_pixels_view_matches_copy(self):
+        """Test a non-contiguous crop hashes like its contiguous copy."""
+        image = np.random.default_rng(0).integers(0, 255, (64, 64, 3), dtype=np.uint8)
+        view = image[10:40, 5:50]
+
+        key_view = CacheKey.from_pixels(view, {"param": "value"})
+        key_copy = CacheKey.from_pixels(view.copy(), {"param": "value"})
+
+        assert not view.flags.c_contiguous
+        assert key_view.image_hash == key_copy.image_hash
+
+    def test_from_pixels_changed_pixel(self):
+        """Test one changed pixel or a different shape changes the key."""
+        image = np.zeros((32, 32), dtype=np.uint8)
+        key = CacheKey.from_pixels(image, {})
+
+        changed = image.copy()
+        changed[31, 31] = 1
+
+        assert CacheKey.from_pixels(changed, {}).image_hash != key.image_hash
+        assert CacheKey.from_pixels(image.reshape(16, 64), {}).image_hash != key.image_hash
+
 
 class TestCacheEntry:
     """Tests for CacheEntry dataclass."""
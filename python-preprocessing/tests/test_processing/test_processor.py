@@ -284,6 +284,21 @@ class TestFloorplanProcessorFile:
 
         result = processor.process_file(str(image_path))
         assert result.success is True
+        assert result.metrics["probe"]["width"] == 300
+
+    def test_process_file_over_pixel_ceiling(self, tmp_path, monkeypatch):
+        """Test an oversized file is rejected from its header, without decoding."""
+        image_path = tmp_path / "large.png"
+        cv2.imwrite(str(image_path), np.full((6000, 5000, 3), 255, dtype=np.uint8))
+        monkeypatch.setattr(cv2, "imread", lambda *args: pytest.fail("decoded"))
+
+        result = FloorplanProcessor(max_pixels=20_000_000).process_file(str(image_path))
+
+        assert result.success is False
+        assert "20 MP limit" in result.errors[0]
+        assert result.processing_mode == ProcessingMode.TILED
+        assert result.metrics["probe"]["height"] == 6000
+        assert result.metrics["decision"]["tile_count"] > 1
 
 
 class TestFloorplanProcessorValidation:
@@ -358,3 +373,71 @@ class TestFloorplanProcessorCustomProcessor:
         assert result.success is True
         # Custom processor should have been called
         assert call_count[0] >= 0  # May not be called if fast-track is used
+
+
+class TestFloorplanProcessorTriage:
+    """Tests for triage before full-resolution Phase 0."""
+
+    def test_colorless_image_skips_phase0(self):
+        """Test a colorless large image never runs full-resolution Phase 0."""
+        processor = FloorplanProcessor()
+        calls = []
+        original = processor.color_detector.detect
+        processor.color_detector.detect = lambda img: calls.append(img.shape) or original(img)
+
+        img = np.ones((1500, 2000, 3), dtype=np.uint8) * 255
+        cv2.rectangle(img, (100, 100), (1900, 1400), (20, 20, 20), 4)
+        result = processor.process(img)
+
+        assert result.success is True
+        assert result.metrics["phase0_skipped"] is True
+        assert all(max(shape[:2]) <= processor.triage.max_dimension for shape in calls)
+
+    def test_decision_metrics_include_prediction(self):
+        """Test decision metrics carry the cost prediction and triage."""
+        img = np.ones((200, 300, 3), dtype=np.uint8) * 255
+        cv2.rectangle(img, (50, 50), (150, 100), (0, 165, 255), -1)
+        result = FloorplanProcessor().process(img)
+
+        assert "predicted_time_ms" in result.metrics["decision"]
+        assert "triage" in result.metrics["decision"]
+        assert "triage_time_ms" in result.metrics
+
+    def test_ambiguous_triage_runs_full_analysis(self):
+        """Test non-decisive triage falls back to full-resolution analysis."""
+        img = np.ones((1500, 2000, 3), dtype=np.uint8) * 255
+        cv2.rectangle(img, (100, 100), (900, 1000), (0, 165, 255), -1)
+        result = FloorplanProcessor().process(img)
+
+        assert result.success is True
+        assert "phase0_skipped" not in result.metrics
+        assert result.metrics["decision"]["boundary_count"] >= 1
+
+
+class TestFloorplanProcessorMemoryBudget:
+    """Tests for the memory budget in AdaptiveConfig."""
+
+    def test_budget_forces_tiling_with_smaller_tiles(self):
+        """Test an image under the dimension threshold is tiled when over budget."""
+        processor = FloorplanProcessor()
+        tile_sizes = []
+        original = processor._tiled_process
+        processor._tiled_process = lambda image, phase0, config, tile_size=None, **kwargs: (
+            tile_sizes.append(tile_size) or original(image, phase0, config, tile_size, **kwargs)
+        )
+
+        img = np.ones((1500, 2000, 3), dtype=np.uint8) * 255
+        cv2.rectangle(img, (100, 100), (1900, 1400), (20, 20, 20), 4)
+        result = processor.process(img, config_override=AdaptiveConfig(memory_budget_mb=40))
+
+        assert result.success is True
+        assert result.processing_mode == ProcessingMode.TILED
+        assert result.metrics["decision"]["estimated_peak_memory_mb"] > 40
+        assert tile_sizes and tile_sizes[0] < 2048
+        assert result.metrics["tiles"] > 1
+
+    def test_config_round_trip(self):
+        """Test the budget survives AdaptiveConfig serialization."""
+        config = AdaptiveConfig.from_dict(AdaptiveConfig(memory_budget_mb=512).to_dict())
+
+        assert config.memory_budget_mb == 512
@@ -0,0 +1,175 @@
+"""Tests for negotiated compact result encodings."""
+
+import gzip
+import io
+import json
+
+import numpy as np
+import pytest
+
+from src import result_encoding
+from src.pipeline import preprocess_floorplan, result_to_json
+from src.result_encoding import (
+    COMPACT_JSON_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    NPZ_MEDIA_TYPE,
+    PointList,
+    brotli,
+    compact_result,
+    decode_npz,
+    encode_npz,
+    encode_result,
+    expand_compact,
+    negotiate_encoding,
+    negotiate_format,
+)
+from tests.fixtures.color_boundary_fixtures import create_warehouse_floorplan
+
+
+SAMPLE = {
+    "contours": [
+        {"id": 0, "points": [{"x": 10, "y": 20}, {"x": 12, "y": 25}, {"x": 9, "y": 30}]},
+        {"id": 1, "points": [{"x": 100, "y": 5}, {"x": 101, "y": 5}]},
+    ],
+    "centerline": [[4, 8], [5, 10], [6, 12]],
+    "boundary_lines": [
+        {"start": {"x": 1, "y": 2}, "end": {"x": 3, "y": 4}, "angle": 45.0},
+        {"start": {"x": 5, "y": 6}, "end": {"x": 7, "y": 8}, "angle": 0.0},
+    ],
+    "float_points": [{"x": 1.5, "y": 2.0}],
+    "empty": [],
+    "stats": {"count": np.int64(2), "score": np.float32(0.5), "ok": np.bool_(True)},
+}
+
+
+def _plain(data):
+    return json.loads(encode_result(data)[0])
+
+
+class TestPointList:
+    """Tests for point lists that keep their coordinate array."""
+
+    def test_is_plain_point_list(self):
+        """Test a PointList equals and serializes as the point dicts."""
+        points = PointList(np.array([[[10, 20]], [[12, 25]]], dtype=np.int32))
+
+        assert points == [{"x": 10, "y": 20}, {"x": 12, "y": 25}]
+        assert points.array.dtype == np.int32
+        assert _plain({"p": points}) == {"p": [{"x": 10, "y": 20}, {"x": 12, "y": 25}]}
+        assert PointList([]) == [] and PointList([]).array.shape == (0, 2)
+
+    def test_encoders_read_array(self, monkeypatch):
+        """Test compact and .npz encoders take coordinates from the array, not the dicts."""
+        monkeypatch.setattr(result_encoding, "_point_list_kind", lambda value: pytest.fail("scanned"))
+        data = {"id": 0, "points": PointList([(10, 20), (12, 25), (9, 30)])}
+
+        assert compact_result(data)["points"] == {"$xy": [10, 20, 2, 5, -3, 5]}
+        with np.load(io.BytesIO(encode_npz(data))) as archive:
+            assert archive["coords"].tolist() == [[10, 20], [12, 25], [9, 30]]
+
+
+class TestNegotiation:
+    """Tests for Accept / Accept-Encoding negotiation."""
+
+    @pytest.mark.parametrize("accept, expected", [
+        (None, JSON_MEDIA_TYPE),
+        ("*/*", JSON_MEDIA_TYPE),
+        ("text/html", JSON_MEDIA_TYPE),
+        (COMPACT_JSON_MEDIA_TYPE, COMPACT_JSON_MEDIA_TYPE),
+        (f"application/json;q=0.5, {NPZ_MEDIA_TYPE}", NPZ_MEDIA_TYPE),
+        (f"{NPZ_MEDIA_TYPE};q=0.2, application/json", JSON_MEDIA_TYPE),
+        (f"{COMPACT_JSON_MEDIA_TYPE};q=0", JSON_MEDIA_TYPE),
+    ])
+    def test_format(self, accept, expected):
+        """Test JSON is the default and q-values order preferences."""
+        assert negotiate_format(accept) == expected
+
+    def test_encoding(self):
+        """Test gzip is chosen when offered; identity otherwise."""
+        assert negotiate_encoding(None) is None
+        assert negotiate_encoding("identity") is None
+        assert negotiate_encoding("gzip, deflate") == "gzip"
+        assert negotiate_encoding("gzip;q=0") is None
+        expected_br = "br" if brotli is not None else "gzip"
+        assert negotiate_encoding("br, gzip") == expected_br
+
+
+class TestCompactJson:
+    """Tests for the delta-encoded compact JSON format."""
+
+    def test_point_lists_are_delta_encoded(self):
+        """Test integer point lists become flat delta lists."""
+        compact = compact_result(_plain(SAMPLE))
+
+        keys, first, _ = compact["contours"]["$rows"]
+        assert keys == ["id", "points"]
+        assert first[1] == {"$xy": [10, 20, 2, 5, -3, 5]}
+        assert compact["centerline"] == {"$pairs": [4, 8, 1, 2, 1, 2]}
+        assert compact["float_points"] == [{"x": 1.5, "y": 2.0}]
+
+    def test_round_trip(self):
+        """Test expand_compact restores the plain document."""
+        plain = _plain(SAMPLE)
+        body, encoding = encode_result(SAMPLE, COMPACT_JSON_MEDIA_TYPE)
+
+        assert encoding is None
+        assert expand_compact(json.loads(body)) == plain
+
+
+class TestNpz:
+    """Tests for the .npz container format."""
+
+    def test_round_trip(self):
+        """Test decode_npz restores the plain document."""
+        assert decode_npz(encode_npz(SAMPLE)) == _plain(SAMPLE)
+
+    def test_flat_coordinate_arrays(self):
+        """Test all point lists share one int32 coords array with offsets."""
+        with np.load(io.BytesIO(encode_npz(SAMPLE))) as archive:
+            assert archive["coords"].dtype == np.int32
+            assert archive["coords"].shape == (8, 2)
+            assert archive["offsets"].tolist() == [0, 3, 5, 8]
+
+    def test_not_recompressed(self):
+        """Test .npz bodies are never content-encoded."""
+        assert encode_result(SAMPLE, NPZ_MEDIA_TYPE, "gzip")[1] is None
+
+
+class TestEncodeResult:
+    """Tests for encode_result."""
+
+    def test_small_bodies_are_not_compressed(self):
+        """Test bodies under the threshold are sent as is."""
+        assert encode_result({"a": 1}, JSON_MEDIA_TYPE, "gzip") == (b'{"a":1}', None)
+
+    def test_unknown_format(self):
+        """Test unsupported formats raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported response format"):
+            encode_result(SAMPLE, "application/xml")
+
+    def test_pipeline_result(self):
+        """Test a real result round-trips and shrinks in every format."""
+        output = result_to_json(preprocess_floorplan(create_warehouse_floorplan(megapixels=1.0)))
+        plain_body, _ = encode_result(output)
+        plain = json.loads(plain_body)
+
+        compact_body, _ = encode_result(output, COMPACT_JSON_MEDIA_TYPE)
+        gzip_body, encoding = encode_result(output, COMPACT_JSON_MEDIA_TYPE, "gzip")
+        npz_body, _ = encode_result(output, NPZ_MEDIA_TYPE)
+
+        assert encoding == "gzip"
+        assert expand_compact(json.loads(gzip.decompress(gzip_body))) == plain
+        assert decode_npz(npz_body) == plain
+        assert len(compact_body) < len(plain_body) * 0.7
+        assert len(gzip_body) < len(plain_body) * 0.15
+        assert len(npz_body) < len(plain_body) * 0.25
+
+    def test_unconverted_pipeline_result(self):
+        """Test compact formats encode a result without NumPy conversion identically."""
+        result = preprocess_floorplan(create_warehouse_floorplan(megapixels=1.0))
+        converted = result_to_json(result)
+        raw = result_to_json(result, native_types=False)
+
+        assert isinstance(raw["edge_detection"]["contours"][0]["vertices"], PointList)
+        for media_type in (COMPACT_JSON_MEDIA_TYPE, NPZ_MEDIA_TYPE):
+            assert encode_result(raw, media_type)[0] == encode_result(converted, media_type)[0]
@@ -1,9 +1,11 @@
 """Tests for TileProcessor class."""
 
 import pytest
+import cv2
 import numpy as np
 from typing import List
 
+from src.processing.cache import ResultCache
 from src.tiling.processor import TileProcessor, ProcessingProgress
 from src.tiling.models import TilingConfig, ImageTile, Zone
 
@@ -302,3 +304,174 @@ class TestTileProcessorErrorHandling:
 
         # Should still get results from tiles that didn't fail
         assert len(results) >= 0
+
+
+class TestTileProcessorStreaming:
+    """Tests for streaming tiles through the processor."""
+
+    def test_in_flight_tiles_bounded(self, monkeypatch):
+        """Test tiles are pulled from the stream only as workers free up."""
+        from src.concurrency import ConcurrencyGovernor
+
+        monkeypatch.setattr(
+            "src.tiling.processor.get_governor", lambda: ConcurrencyGovernor(core_budget=2)
+        )
+        config = TilingConfig(dimension_threshold=500, tile_size=300, overlap=50, max_parallel_tiles=8)
+        processor = TileProcessor(config=config)
+        counts = {"yielded": 0, "done": 0, "max_pending": 0}
+        stream = processor.tiler.iter_tiles
+
+        def counting_stream(image, copy=False, order=None):
+            for tile in stream(image, copy, order):
+                counts["yielded"] += 1
+                yield tile
+
+        def process(tile):
+            counts["max_pending"] = max(counts["max_pending"], counts["yielded"] - counts["done"])
+            counts["done"] += 1
+            return []
+
+        monkeypatch.setattr(processor.tiler, "iter_tiles", counting_stream)
+        processor.process(np.zeros((1200, 1200, 3), dtype=np.uint8), process)
+
+        assert counts["done"] == processor.tiler.get_tile_count(1200, 1200) == 25
+        assert counts["max_pending"] <= 2
+
+
+class TestTileProcessorCache:
+    """Tests for per-tile result caching across drawing revisions."""
+
+    @staticmethod
+    def _image():
+        # Noise, so no two tiles share content (identical tiles share a key)
+        return np.random.default_rng(0).integers(0, 255, (1000, 1000, 3), dtype=np.uint8)
+
+    @staticmethod
+    def _processor(cache):
+        config = TilingConfig(dimension_threshold=500, tile_size=400, overlap=50)
+        return TileProcessor(config=config, cache=cache)
+
+    def test_revision_reprocesses_changed_tiles(self):
+        """Test only tiles whose pixels changed are processed again."""
+        cache = ResultCache(persist=False)
+        image = self._image()
+        processed = []
+
+        def process(tile):
+            processed.append(tile.grid_index)
+            return dummy_process_fn(tile)
+
+        first = self._processor(cache).process(image, process, parallel=False)
+        assert len(processed) == 9
+
+        revised = image.copy()
+        revised[100:120, 100:120] = 0  # Inside the top-left tile only
+        processed.clear()
+        processor = self._processor(cache)
+        second = processor.process(revised, process, parallel=False)
+
+        assert processed == [(0, 0)]
+        assert processor.tile_stats == {
+            "tiles": 9, "tiles_reused": 8, "tiles_blank": 0, "tiles_processed": 1,
+        }
+        assert len(second) == len(first)
+
+    def test_overlap_change_invalidates_neighbours(self):
+        """Test a change inside an overlap band reprocesses every tile covering it."""
+        cache = ResultCache(persist=False)
+        image = self._image()
+        self._processor(cache).process(image, dummy_process_fn, parallel=False)
+
+        revised = image.copy()
+        revised[100:110, 360:370] = 0  # Overlap of the first two tiles in row 0
+        processor = self._processor(cache)
+        processor.process(revised, dummy_process_fn, parallel=False)
+
+        assert processor.tile_stats["tiles_processed"] == 2
+
+    def test_failed_tiles_not_cached(self):
+        """Test tiles that raised are retried on the next run."""
+        cache = ResultCache(persist=False)
+        image = self._image()
+
+        def failing(tile):
+            if tile.grid_index == (1, 1):
+                raise RuntimeError("boom")
+            return dummy_process_fn(tile)
+
+        self._processor(cache).process(image, failing, parallel=False)
+        processor = self._processor(cache)
+        processor.process(image, dummy_process_fn, parallel=False)
+
+        assert processor.tile_stats["tiles_processed"] == 1
+
+
+class TestTileProcessorScheduling:
+    """Tests for cost-ordered tile scheduling."""
+
+    @staticmethod
+    def _image():
+        # Dense lines in the bottom-right tile only, everything else blank
+        image = np.full((1000, 1000, 3), 255, dtype=np.uint8)
+        for x in range(760, 980, 10):
+            cv2.line(image, (x, 760), (x, 980), (0, 0, 0), 2)
+        return image
+
+    def test_heaviest_tile_first(self):
+        """Test tiles run in descending cost order but merge in index order."""
+        config = TilingConfig(dimension_threshold=500, tile_size=400, overlap=50)
+        processor = TileProcessor(config=config)
+        started = []
+
+        def process(tile):
+            started.append(tile.grid_index)
+            return dummy_process_fn(tile)
+
+        zones = processor.process(self._image(), process, parallel=False)
+
+        assert started[0] == (2, 2)
+        assert len(started) == 9
+        assert len(zones) > 0
+        costs = list(processor.tile_costs.values())
+        assert max(costs) == costs[-1]
+
+    def test_grid_order_when_disabled(self):
+        """Test cost_ordering=False keeps grid order."""
+        config = TilingConfig(dimension_threshold=500, tile_size=400, overlap=50, cost_ordering=False)
+        started = []
+
+        TileProcessor(config=config).process(
+            self._image(), lambda t: started.append(t.grid_index) or [], parallel=False
+        )
+
+        assert started == [(r, c) for r in range(3) for c in range(3)]
+
+    def test_blank_tiles_skipped(self):
+        """Test nearly blank tiles return no zones without processing."""
+        config = TilingConfig(dimension_threshold=500, tile_size=400, overlap=50, skip_blank_tiles=True)
+        processor = TileProcessor(config=config)
+        started = []
+
+        def process(tile):
+            started.append(tile.grid_index)
+            return dummy_process_fn(tile)
+
+        processor.process(self._image(), process)
+
+        assert started == [(2, 2)]
+        assert processor.tile_stats["tiles_blank"] == 8
+        assert processor.tile_stats["tiles_processed"] == 1
+
+    def test_progress_reports_eta(self):
+        """Test processing updates carry an estimated time remaining."""
+        updates = []
+        config = TilingConfig(dimension_threshold=500, tile_size=400, overlap=50)
+        processor = TileProcessor(config=config, progress_callback=updates.append)
+
+        processor.process(self._image(), empty_process_fn, parallel=False)
+
+        processing = [u for u in updates if u.status == "processing"]
+        # Before the first tile finishes there is nothing to extrapolate from
+        assert processing[0].eta_seconds is None
+        assert all(u.eta_seconds is not None for u in processing[2:])
+        assert "eta_seconds" in updates[-1].to_dict()
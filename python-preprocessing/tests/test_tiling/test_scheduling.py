@@ -0,0 +1,82 @@
+"""Tests for cost-aware tile scheduling."""
+
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from src.tiling.scheduling import CostProgress, TileCostModel
+
+
+def _drawing(width=4000, height=2000):
+    """White page with dense racking lines in the left half only."""
+    image = np.full((height, width, 3), 255, dtype=np.uint8)
+    for x in range(100, width // 2 - 100, 20):
+        cv2.line(image, (x, 100), (x, height - 100), (0, 0, 0), 2)
+    return image
+
+
+class TestTileCostModel:
+    """Tests for thumbnail-based cost estimates."""
+
+    def test_dense_region_costs_more(self):
+        """Test line work raises the ink fraction and cost of a region."""
+        costs = TileCostModel(_drawing())
+
+        dense, empty = (0, 0, 2000, 2000), (2000, 0, 4000, 2000)
+
+        assert costs.ink_fraction(dense) > 0.2
+        assert costs.ink_fraction(empty) == 0.0
+        assert costs.cost(dense) > 10 * costs.cost(empty)
+
+    def test_cost_scales_with_area(self):
+        """Test blank regions still cost in proportion to their area."""
+        costs = TileCostModel(np.full((1000, 1000), 255, dtype=np.uint8))
+
+        assert costs.cost((0, 0, 1000, 1000)) == pytest.approx(4 * costs.cost((0, 0, 500, 500)))
+
+    def test_thumbnail_is_bounded(self):
+        """Test the ink map has at most max_side cells per side."""
+        costs = TileCostModel(_drawing(), max_side=256)
+
+        assert costs.scale == pytest.approx(1 / 16)
+        assert max(costs._integral.shape) - 1 <= 256
+        assert costs.ink_fraction((3990, 1990, 4000, 2000)) == 0.0
+
+    def test_thin_colored_line_is_ink(self):
+        """Test a 1 px light colored line is not averaged away on a large page."""
+        image = np.full((3000, 12000, 3), 255, dtype=np.uint8)
+        cv2.line(image, (100, 1500), (5900, 1500), (130, 255, 255), 1)
+        costs = TileCostModel(image)
+
+        assert costs.ink_fraction((0, 1000, 6000, 2000)) > 0
+        assert costs.ink_fraction((6000, 0, 12000, 3000)) == 0.0
+
+    def test_uniform_dark_page_is_blank(self):
+        """Test ink is measured against the page background, not white."""
+        costs = TileCostModel(np.zeros((500, 500, 3), dtype=np.uint8))
+
+        assert costs.ink_fraction((0, 0, 500, 500)) == 0.0
+
+
+class TestCostProgress:
+    """Tests for time-remaining estimates."""
+
+    def test_eta_from_completed_cost(self):
+        """Test remaining time scales with outstanding cost."""
+        progress = CostProgress([1.0, 3.0])
+        assert progress.eta_seconds is None
+
+        time.sleep(0.02)
+        progress.complete(1.0)
+
+        assert progress.eta_seconds >= 3 * 0.02 * 0.9
+
+    def test_skipped_cost_not_remaining(self):
+        """Test skipped tiles leave the outstanding total."""
+        progress = CostProgress([1.0, 1.0])
+        progress.skip(1.0)
+        progress.complete(1.0)
+
+        assert progress.eta_seconds == 0.0
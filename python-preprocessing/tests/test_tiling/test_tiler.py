@@ -246,3 +246,54 @@ class TestGetTileCount:
             predicted = tiler.get_tile_count(width, height)
             actual = len(tiler.create_tiles(image))
             assert predicted == actual, f"Mismatch for {width}x{height}"
+
+
+class TestIterTiles:
+    """Tests for lazy, zero-copy tile iteration."""
+
+    def test_yields_views_lazily(self):
+        """Test tiles are generated on demand and share the source pixels."""
+        tiler = ImageTiler(tile_size=500, overlap=50, max_dimension=500)
+        image = np.zeros((800, 1200, 3), dtype=np.uint8)
+
+        tiles = tiler.iter_tiles(image)
+        first = next(tiles)
+
+        assert first.grid_index == (0, 0)
+        assert np.shares_memory(first.image, image)
+        assert 1 + sum(1 for _ in tiles) == tiler.get_tile_count(1200, 800)
+
+    def test_matches_create_tiles(self):
+        """Test iter_tiles yields the same tiles create_tiles copies."""
+        tiler = ImageTiler(tile_size=500, overlap=100, max_dimension=500)
+        image = np.random.default_rng(0).integers(0, 255, (1000, 1300, 3), dtype=np.uint8)
+
+        for lazy, eager in zip(tiler.iter_tiles(image), tiler.create_tiles(image)):
+            assert (lazy.id, lazy.bounds, lazy.overlap_regions) == (eager.id, eager.bounds, eager.overlap_regions)
+            np.testing.assert_array_equal(lazy.image, eager.image)
+            assert not np.shares_memory(eager.image, image)
+
+    @pytest.mark.parametrize("tile_size, overlap", [(500, 100), (500, 300), (300, 250)])
+    def test_grid_neighbors_match_brute_force(self, tile_size, overlap):
+        """Test grid-indexed overlaps equal an all-pairs intersection scan."""
+        tiler = ImageTiler(tile_size=tile_size, overlap=overlap, max_dimension=500)
+        boundaries = tiler._calculate_grid_boundaries(1400, 900)
+
+        for tile in tiler.iter_tiles(np.zeros((900, 1400), dtype=np.uint8)):
+            x1, y1, x2, y2 = tile.bounds
+            expected = [
+                f"tile_{i}"
+                for i, (ox1, oy1, ox2, oy2) in enumerate(boundaries)
+                if (ox1, oy1, ox2, oy2) != tile.bounds
+                and max(x1, ox1) < min(x2, ox2) and max(y1, oy1) < min(y2, oy2)
+            ]
+            assert [r.adjacent_tile_id for r in tile.overlap_regions] == expected
+
+    def test_grid_shape(self):
+        """Test rows and columns match the boundary list."""
+        tiler = ImageTiler(tile_size=500, overlap=50, max_dimension=500)
+
+        rows, cols = tiler.grid_shape(1200, 800)
+
+        assert (rows, cols) == (2, 3)
+        assert tiler.tile_bounds(1, 2, 1200, 800) == tiler._calculate_grid_boundaries(1200, 800)[5]
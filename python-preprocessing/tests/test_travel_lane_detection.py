@@ -0,0 +1,127 @@
+"""Tests for travel lane detection helpers."""
+
+import numpy as np
+import cv2
+
+from src.coverage_input import CoverageBoundary, coverage_to_mask
+from src.travel_lane_detection import (
+    detect_via_morphological,
+    detect_via_skeletonization,
+    detect_travel_lanes_in_coverage_areas,
+    detect_travel_lanes_within_coverage,
+)
+
+
+def _corridor_image() -> np.ndarray:
+    """Dark floorplan with one horizontal and one vertical white corridor."""
+    image = np.zeros((400, 600, 3), dtype=np.uint8)
+    cv2.rectangle(image, (50, 60), (450, 119), (255, 255, 255), -1)  # 60px tall
+    cv2.rectangle(image, (500, 150), (549, 390), (255, 255, 255), -1)  # 50px wide
+    return image
+
+
+def _reference_widths(image, lane):
+    """Width profile from a full-frame distance transform of the lane's component."""
+    # Corridors are rectangles, so the (opened) component is its bounding box
+    x, y, bw, bh = lane.bounding_box
+    comp_mask = np.zeros(image.shape[:2], dtype=np.uint8)
+    comp_mask[y:y + bh, x:x + bw] = 255
+    dist = cv2.distanceTransform(comp_mask, cv2.DIST_L2, 5)
+    return [dist[py, px] * 2 for px, py in lane.centerline]
+
+
+class TestDetectViaSkeletonization:
+    """Tests for ROI-local skeletonization."""
+
+    def test_detects_both_corridors(self):
+        """Test both corridors are found with correct orientation and bbox."""
+        lanes = detect_via_skeletonization(_corridor_image(), None, min_width=40, min_length=100)
+
+        by_orientation = {lane.orientation: lane for lane in lanes}
+        assert set(by_orientation) == {"horizontal", "vertical"}
+        assert tuple(by_orientation["horizontal"].bounding_box[2:]) == (401, 60)
+        assert tuple(by_orientation["vertical"].bounding_box[2:]) == (50, 241)
+
+    def test_centerline_in_image_coordinates(self):
+        """Test ROI-local points are offset back into the component bbox."""
+        for lane in detect_via_skeletonization(_corridor_image(), None):
+            x, y, bw, bh = lane.bounding_box
+            for px, py in lane.centerline:
+                assert x <= px < x + bw
+                assert y <= py < y + bh
+
+    def test_width_profile_matches_full_frame(self):
+        """Test ROI distance transform equals a full-frame computation."""
+        image = _corridor_image()
+        for lane in detect_via_skeletonization(image, None):
+            np.testing.assert_allclose(
+                lane.width_profile, _reference_widths(image, lane), atol=1e-4
+            )
+
+    def test_mask_excludes_regions(self):
+        """Test the coverage mask removes corridors outside it."""
+        mask = np.zeros((400, 600), dtype=np.uint8)
+        mask[:, :480] = 255
+
+        lanes = detect_via_skeletonization(_corridor_image(), mask)
+
+        assert [lane.orientation for lane in lanes] == ["horizontal"]
+
+
+class TestDetectViaMorphological:
+    """Tests for morphological travel lane detection."""
+
+    def test_kernels_follow_param_scale(self, monkeypatch):
+        """Test the close and open kernels shrink with the parameter scale."""
+        sizes = []
+        structuring_element = cv2.getStructuringElement
+
+        def recording(shape, ksize):
+            sizes.append(ksize)
+            return structuring_element(shape, ksize)
+
+        monkeypatch.setattr(cv2, "getStructuringElement", recording)
+        image = cv2.resize(_corridor_image(), None, fx=0.5, fy=0.5, interpolation=cv2.INTER_NEAREST)
+
+        lanes = detect_via_morphological(image, min_width=20, min_length=50, param_scale=0.5)
+
+        assert sizes == [(9, 9), (5, 5)]
+        assert {lane.orientation for lane in lanes} == {"horizontal", "vertical"}
+
+
+class TestCoverageAreas:
+    """Tests for per-coverage ROI travel lane detection."""
+
+    def _boundaries(self):
+        return [
+            CoverageBoundary("left", "2D", "POLYGON", [(20, 20), (480, 20), (480, 160), (20, 160)], 0),
+            CoverageBoundary("right", "2D", "POLYGON", [(480, 130), (580, 130), (580, 399), (480, 399)], 0),
+        ]
+
+    def test_matches_full_frame_masks(self):
+        """Test ROI-clipped detection matches detection on full-size masks."""
+        image = _corridor_image()
+        expected = []
+        for boundary in self._boundaries():
+            mask = coverage_to_mask(boundary, image.shape)
+            expected.extend(detect_travel_lanes_within_coverage(image, mask, boundary.uid))
+
+        actual = detect_travel_lanes_in_coverage_areas(image, self._boundaries())
+
+        def key(lane):
+            return (lane.coverage_uid, lane.orientation, tuple(int(v) for v in lane.bounding_box))
+
+        assert sorted(map(key, actual)) == sorted(map(key, expected))
+        assert {lane.coverage_uid for lane in actual} == {"left", "right"}
+
+    def test_sequential_equals_parallel(self):
+        """Test worker count does not change results or ordering."""
+        image = _corridor_image()
+        serial = detect_travel_lanes_in_coverage_areas(image, self._boundaries(), max_workers=1)
+        parallel = detect_travel_lanes_in_coverage_areas(image, self._boundaries(), max_workers=4)
+
+        assert [l.to_dict() for l in serial] == [l.to_dict() for l in parallel]
+
+    def test_empty_boundaries(self):
+        """Test no boundaries yields no lanes."""
+        assert detect_travel_lanes_in_coverage_areas(_corridor_image(), []) == []
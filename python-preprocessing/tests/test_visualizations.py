@@ -0,0 +1,145 @@
+"""Tests for lazy visualization planes and image encoding."""
+
+import base64
+
+import cv2
+import numpy as np
+import pytest
+
+from src.line_detection import cluster_parallel_lines, create_orientation_map, lines_to_array
+from src.pipeline import PreprocessingResult, numpy_to_base64, preprocess_floorplan, result_to_json
+from src.visualizations import LazyVisualizations, encode_image, pack_mask, unpack_mask
+from tests.fixtures.color_boundary_fixtures import create_warehouse_floorplan
+
+
+def _decode(b64: str) -> np.ndarray:
+    return cv2.imdecode(np.frombuffer(base64.b64decode(b64), np.uint8), cv2.IMREAD_UNCHANGED)
+
+
+def _clusters():
+    segments = [(100, y, 900, y) for y in range(100, 600, 20)]
+    return cluster_parallel_lines(lines_to_array(segments), distance_threshold=40.0)
+
+
+class TestMaskPacking:
+    """Tests for bit-packed masks."""
+
+    def test_round_trip(self):
+        """Test packing keeps every nonzero pixel at 1/8 of the size."""
+        rng = np.random.default_rng(0)
+        mask = (rng.random((123, 77)) > 0.7).astype(np.uint8) * 255
+
+        bits = pack_mask(mask)
+
+        assert bits.nbytes == (123 * 77 + 7) // 8
+        np.testing.assert_array_equal(unpack_mask(bits, mask.shape), mask)
+
+
+class TestLazyVisualizations:
+    """Tests for rendering on access."""
+
+    def test_renders_full_resolution_planes(self):
+        """Test planes match the stage outputs they were built from."""
+        mask = np.zeros((600, 1000), dtype=np.uint8)
+        mask[100:200, 300:400] = 255
+        density = np.full((600, 1000), 7, dtype=np.uint8)
+        clusters = _clusters()
+
+        vis = LazyVisualizations((600, 1000), pack_mask(mask), density, clusters)
+
+        assert list(vis) == ["boundary_mask", "density_map", "orientation_map"]
+        np.testing.assert_array_equal(vis["boundary_mask"], mask)
+        assert vis["density_map"] is density
+        np.testing.assert_array_equal(
+            vis["orientation_map"], create_orientation_map((600, 1000), clusters)
+        )
+        assert vis.nbytes == mask.size // 8 + density.nbytes
+
+    def test_preview(self):
+        """Test previews fit max_dimension and keep the aspect ratio."""
+        vis = LazyVisualizations(
+            (600, 1000),
+            pack_mask(np.full((600, 1000), 255, np.uint8)),
+            np.zeros((600, 1000), np.uint8),
+            _clusters(),
+        )
+
+        for name in vis:
+            assert vis.render(name, max_dimension=250).shape[:2] == (150, 250)
+        assert vis.render("orientation_map", max_dimension=250).any()
+
+    def test_missing_plane(self):
+        """Test unavailable planes raise KeyError."""
+        vis = LazyVisualizations((10, 10), density_map=np.zeros((10, 10), np.uint8))
+
+        assert "orientation_map" not in vis
+        with pytest.raises(KeyError):
+            vis["orientation_map"]
+
+
+class TestEncoding:
+    """Tests for PNG/JPEG/WebP encoding."""
+
+    @pytest.mark.parametrize("fmt", ["png", "jpeg", "webp"])
+    def test_formats_decode(self, fmt):
+        """Test every format decodes back to the image size."""
+        image = np.zeros((40, 60, 3), dtype=np.uint8)
+        image[:, :30] = (0, 128, 255)
+
+        decoded = _decode(numpy_to_base64(image, format=fmt, quality=90))
+
+        assert decoded.shape[:2] == (40, 60)
+
+    def test_png_is_lossless(self):
+        """Test PNG round-trips exactly."""
+        image = np.random.default_rng(1).integers(0, 255, (30, 20, 3), dtype=np.uint8)
+
+        np.testing.assert_array_equal(_decode(numpy_to_base64(image)), image)
+
+    def test_max_dimension(self):
+        """Test numpy_to_base64 downscales to max_dimension."""
+        image = np.zeros((400, 800), dtype=np.uint8)
+
+        assert _decode(numpy_to_base64(image, max_dimension=200)).shape == (100, 200)
+
+    def test_unknown_format(self):
+        """Test unsupported formats raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported image format"):
+            encode_image(np.zeros((4, 4), np.uint8), format="bmp")
+
+
+class TestPipelineVisualizations:
+    """Tests for visualizations in pipeline results."""
+
+    @pytest.fixture(scope="class")
+    def result(self):
+        return preprocess_floorplan(create_warehouse_floorplan(megapixels=0.5))
+
+    def test_result_holds_lazy_planes(self, result):
+        """Test the result keeps compact sources, not rendered planes."""
+        assert isinstance(result.visualizations, LazyVisualizations)
+        h, w = result.visualizations.image_shape
+        assert result.visualizations.nbytes < h * w * 1.2
+
+    def test_json_previews(self, result):
+        """Test result_to_json embeds downscaled WebP previews on request."""
+        output = result_to_json(
+            result,
+            include_visualizations=True,
+            visualization_format="webp",
+            visualization_max_dimension=256,
+        )
+
+        assert set(output["visualizations"]) == {"boundary_mask", "density_map", "orientation_map"}
+        for b64 in output["visualizations"].values():
+            assert max(_decode(b64).shape[:2]) == 256
+        assert "visualizations" not in result_to_json(result)
+
+    def test_empty_visualizations(self):
+        """Test results without planes (fast-track) encode an empty set."""
+        result = PreprocessingResult(
+            edge_data={}, segmentation_data={}, line_data={}, gemini_hints={},
+            visualizations={}, fast_track=True,
+        )
+
+        assert result_to_json(result, include_visualizations=True)["visualizations"] == {}
@@ -0,0 +1,82 @@
+"""Tests for service warm-up and the startup profile."""
+
+import os
+import subprocess
+import sys
+import time
+
+import src
+from src import warmup
+from src.pipeline import preprocess_floorplan
+from src.warmup import StartupProfile, synthetic_floorplan, warm_up
+
+
+class TestSyntheticFloorplan:
+    """Tests for the warm-up image."""
+
+    def test_exercises_detection_stages(self):
+        """Test the image yields aisles, travel lanes and a Phase 0 boundary."""
+        image = synthetic_floorplan()
+
+        result = preprocess_floorplan(image)
+
+        assert image.shape == (warmup.WARMUP_HEIGHT, warmup.WARMUP_WIDTH, 3)
+        assert not result.fast_track
+        assert result.line_data["aisle_candidates"]
+        assert result.travel_lane_suggestions
+        assert result.phase0_result.boundaries
+
+
+class TestWarmUp:
+    """Tests for the warm-up routine."""
+
+    def test_marks_ready_with_timings(self):
+        """Test every step is timed and the profile becomes ready."""
+        profile = StartupProfile(started=time.monotonic() - 1.0)
+        profile.imports_done()
+        assert not profile.to_dict()["ready"]
+
+        warm_up(profile)
+
+        data = profile.to_dict()
+        assert data["ready"] and data["error"] is None
+        assert data["import_ms"] >= 1000
+        assert data["warmup_ms"] > 0
+        assert set(data["stages"]) == {
+            "decode_png", "decode_jpeg", "drawing_scale", "pipeline", "pipeline_coverage", "visualizations",
+            "encode_json", "encode_compact+json", "encode_npz",
+        }
+
+    def test_failure_still_ready(self, monkeypatch):
+        """Test a failing warm-up is reported but does not block readiness."""
+        def fail(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(warmup, "preprocess_floorplan", fail)
+
+        profile = warm_up()
+
+        assert profile.ready
+        assert profile.error == "boom"
+        assert "pipeline" not in profile.stages
+
+
+class TestLazyPackageExports:
+    """Tests for the lazily imported package re-exports."""
+
+    def test_light_import_skips_pipeline(self):
+        """Test importing the CLI does not load the pipeline or SciPy."""
+        code = "import sys, src.cli; print('scipy' in sys.modules, 'src.pipeline' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.dirname(__file__)),
+        )
+
+        assert result.stdout.split() == ["False", "False"]
+
+    def test_exports_resolve_on_access(self):
+        """Test package re-exports still resolve."""
+        assert src.preprocess_floorplan is preprocess_floorplan
+        assert "PreprocessingConfig" in dir(src)
@@ -195,3 +195,99 @@ class TestZoneClassifierFeatureExtraction:
         features = classifier._extract_color_features(image)
 
         assert features.get("color_valid", False) is False
+
+
+class TestZoneClassifierBatch:
+    """Tests for classify_batch."""
+
+    @pytest.fixture
+    def classifier(self):
+        """Create classifier instance."""
+        return ZoneClassifier()
+
+    @pytest.fixture
+    def image_and_rects(self):
+        """Image with colored rectangles; rects are (x1, y1, x2, y2) inclusive."""
+        rng = np.random.default_rng(7)
+        image = rng.integers(0, 256, size=(300, 400, 3), dtype=np.uint8)
+        rects = [(10, 10, 109, 59), (150, 20, 389, 79), (30, 120, 79, 289), (200, 150, 349, 279)]
+        colors = [(0, 128, 255), (200, 100, 0), (0, 200, 0), (0, 0, 200)]
+        for (x1, y1, x2, y2), color in zip(rects, colors):
+            image[y1:y2 + 1, x1:x2 + 1] = color
+        # Some texture so hue std is non-trivial
+        image[200:230, 200:260] = rng.integers(0, 256, size=(30, 60, 3), dtype=np.uint8)
+        return image, rects
+
+    @staticmethod
+    def _rect_polygon(rect):
+        x1, y1, x2, y2 = rect
+        return [(x1, y1), (x2, y1), (x2, y2), (x1, y2)]
+
+    def test_matches_per_zone_classify(self, classifier, image_and_rects):
+        """Test batch results equal classify() on exact polygon crops."""
+        image, rects = image_and_rects
+        polygons = [self._rect_polygon(r) for r in rects]
+        contexts = [None, {"near_edge": True}, None, {"adjacent_to_racking": True}]
+
+        batch = classifier.classify_batch(image, polygons, contexts)
+
+        for rect, polygon, context, result in zip(rects, polygons, contexts, batch):
+            x1, y1, x2, y2 = rect
+            single = classifier.classify(image[y1:y2 + 1, x1:x2 + 1], polygon, context)
+            assert result.zone_type == single.zone_type
+            assert result.confidence == pytest.approx(single.confidence)
+            assert result.features.keys() == single.features.keys()
+            for key, value in single.features.items():
+                if isinstance(value, float):
+                    assert result.features[key] == pytest.approx(value, abs=1e-6), key
+                else:
+                    assert result.features[key] == value, key
+
+    def test_geometry_matches_opencv(self, classifier):
+        """Test vectorized shoelace/perimeter math matches OpenCV."""
+        polygons = [
+            [(0, 0), (100, 0), (50, 80)],
+            [(10, 10), (60, 12), (70, 50), (40, 70), (5, 40)],
+            [(3, 4), (300, 4), (300, 30), (3, 30)],
+            [(1, 1), (2, 2)],
+        ]
+
+        batch = classifier._extract_geometry_features_batch(polygons)
+
+        for polygon, features in zip(polygons, batch):
+            assert features == pytest.approx(classifier._extract_geometry_features(polygon))
+
+    def test_overlapping_polygons(self, classifier, image_and_rects):
+        """Test nested polygons each get their own full masked statistics."""
+        image, rects = image_and_rects
+        outer = [(0, 0), (399, 0), (399, 299), (0, 299)]
+        inner = self._rect_polygon(rects[0])
+
+        outer_result, inner_result = classifier.classify_batch(image, [outer, inner])
+
+        single_outer = classifier.classify(image, outer)
+        assert outer_result.features["mean_hue"] == pytest.approx(
+            single_outer.features["mean_hue"]
+        )
+        assert inner_result.features["dominant_color"] == "orange"
+
+    def test_polygon_outside_image(self, classifier, image_and_rects):
+        """Test polygons with no pixels get geometry only."""
+        image, _ = image_and_rects
+        result = classifier.classify_batch(image, [[(500, 500), (600, 500), (600, 600)]])[0]
+
+        assert result.features["valid"] is True
+        assert "color_valid" not in result.features
+
+    def test_without_image(self, classifier):
+        """Test batch classification without an image uses geometry only."""
+        results = classifier.classify_batch(None, [[(0, 0), (100, 0), (100, 20), (0, 20)], []])
+
+        assert len(results) == 2
+        assert "color_valid" not in results[0].features
+        assert results[1].features == {}
+
+    def test_contexts_length_mismatch(self, classifier):
+        """Test mismatched contexts raise ValueError."""
+        with pytest.raises(ValueError, match="contexts length"):
+            classifier.classify_batch(None, [[(0, 0), (1, 0), (1, 1)]], [None, None])
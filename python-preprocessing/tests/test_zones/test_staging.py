@@ -204,6 +204,96 @@ class TestStagingAreaDetectorDetect:
                 assert result.candidates[i].confidence >= result.candidates[i + 1].confidence
 
 
+class TestStagingFeatureBatch:
+    """Tests for bounding-box-local, batched feature extraction."""
+
+    @pytest.fixture
+    def image(self):
+        """Image with several colored regions, one touching the border."""
+        image = np.ones((300, 400, 3), dtype=np.uint8) * 255
+        cv2.rectangle(image, (10, 10), (120, 90), (0, 200, 255), -1)
+        cv2.rectangle(image, (200, 150), (399, 299), (0, 128, 255), -1)
+        cv2.circle(image, (150, 220), 40, (255, 0, 0), -1)
+        return image
+
+    @pytest.fixture
+    def polygons(self):
+        """Candidate polygons, including one partly outside the image."""
+        return [
+            [(10, 10), (120, 10), (120, 90), (10, 90)],
+            [(200, 150), (420, 150), (420, 320), (200, 320)],
+            [(110, 180), (190, 180), (190, 260), (110, 260)],
+        ]
+
+    @staticmethod
+    def _full_frame_features(polygon, area, image):
+        """Original full-image mask computation used as reference."""
+        h, w = image.shape[:2]
+        pts = np.array(polygon, dtype=np.float32)
+        bx, by, bw, bh = cv2.boundingRect(pts)
+        mask = np.zeros((h, w), dtype=np.uint8)
+        cv2.fillPoly(mask, [pts.astype(np.int32)], 255)
+        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+        min_edge = min(bx, w - (bx + bw), by, h - (by + bh))
+        return {
+            "width": bw,
+            "height": bh,
+            "min_edge_distance": min_edge,
+            "rectangularity": area / (bw * bh),
+            "mean_hue": cv2.mean(hsv[:, :, 0], mask=mask)[0],
+            "mean_saturation": cv2.mean(hsv[:, :, 1], mask=mask)[0],
+        }
+
+    def test_batch_matches_full_frame(self, image, polygons):
+        """Test batch features equal the full-image mask computation."""
+        detector = StagingAreaDetector()
+        areas = [cv2.contourArea(np.array(p, dtype=np.float32)) for p in polygons]
+        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+
+        batch = detector._calculate_features_batch(polygons, areas, 400, 300, hsv)
+
+        for polygon, area, features in zip(polygons, areas, batch):
+            expected = self._full_frame_features(polygon, area, image)
+            for key, value in expected.items():
+                assert features[key] == pytest.approx(value, abs=1e-6), key
+
+    def test_single_without_hsv_matches_batch(self, image, polygons):
+        """Test the single-candidate path converts only its bbox but agrees."""
+        detector = StagingAreaDetector()
+        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+
+        for polygon in polygons:
+            area = cv2.contourArea(np.array(polygon, dtype=np.float32))
+            single = detector._calculate_features(polygon, area, 400, 300, image)
+            batch = detector._calculate_features_batch([polygon], [area], 400, 300, hsv)[0]
+            assert single == pytest.approx(batch)
+
+    def test_single_outside_image(self):
+        """Test a polygon entirely outside the image has no color, not an error."""
+        detector = StagingAreaDetector()
+        image = np.ones((100, 100, 3), dtype=np.uint8) * 255
+        polygon = [(200, 200), (250, 200), (250, 250), (200, 250)]
+        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+
+        single = detector._calculate_features(polygon, 2500.0, 100, 100, image)
+        batch = detector._calculate_features_batch([polygon], [2500.0], 100, 100, hsv)[0]
+
+        assert single == pytest.approx(batch)
+        assert single["mean_hue"] == single["mean_saturation"] == 0.0
+
+    def test_degenerate_polygon_invalid(self, image):
+        """Test polygons with fewer than 3 points are marked invalid."""
+        detector = StagingAreaDetector()
+        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+
+        features = detector._calculate_features_batch(
+            [[(0, 0), (5, 5)], [(10, 10), (50, 10), (50, 50)]], [0.0, 800.0], 400, 300, hsv
+        )
+
+        assert features[0] == {"valid": False}
+        assert features[1]["valid"] is True
+
+
 class TestDetectStagingFromBoundaries:
     """Tests for detect_staging_from_boundaries function."""
 
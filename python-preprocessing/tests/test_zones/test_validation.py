@@ -1,5 +1,7 @@
 """Tests for zone validation."""
 
+import random
+
 import pytest
 
 from src.zones.types import ZoneType
@@ -259,6 +261,102 @@ class TestZoneValidatorValidate:
         assert not any(i.code == "MISSING_PARENT" for i in result.issues)
 
 
+class TestZoneValidatorCrossZone:
+    """Tests for sweep-based cross-zone and batched hierarchy checks."""
+
+    @staticmethod
+    def _random_zones(n, seed):
+        rng = random.Random(seed)
+        types = [ZoneType.RACKING, ZoneType.TRAVEL_LANE, ZoneType.STAGING_AREA]
+        zones = []
+        for i in range(n):
+            x, y = rng.randint(0, 900), rng.randint(0, 900)
+            w, h = rng.randint(5, 150), rng.randint(5, 150)
+            zones.append(ZoneData(
+                id=f"z{i}",
+                zone_type=rng.choice(types),
+                polygon=[(x, y), (x + w, y), (x + w, y + h), (x, y + h)],
+                parent_id=f"z{rng.randrange(n)}" if rng.random() < 0.1 else None,
+            ))
+        # Exact duplicates and touching edges exercise boundary cases
+        zones.append(ZoneData("dup_a", ZoneType.RACKING, [(10, 10), (60, 10), (60, 60), (10, 60)]))
+        zones.append(ZoneData("dup_b", ZoneType.RACKING, [(10, 10), (60, 10), (60, 60), (10, 60)]))
+        zones.append(ZoneData("touch", ZoneType.RACKING, [(60, 10), (90, 10), (90, 60), (60, 60)]))
+        return zones
+
+    @staticmethod
+    def _brute_force_overlaps(validator, zones):
+        """All-pairs reference for EXCESSIVE_OVERLAP issues."""
+        found = []
+        for i, z1 in enumerate(zones):
+            for z2 in zones[i + 1:]:
+                if z1.zone_type != z2.zone_type:
+                    continue
+                if z1.parent_id == z2.id or z2.parent_id == z1.id:
+                    continue
+                ratio = validator._calculate_overlap_ratio(z1, z2)
+                if ratio > validator.max_overlap_ratio:
+                    found.append((z1.id, z2.id, ratio))
+        return found
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_sweep_matches_all_pairs(self, seed):
+        """Test sweep finds exactly the all-pairs overlaps, in the same order."""
+        validator = ZoneValidator(max_overlap_ratio=0.3)
+        zones = self._random_zones(300, seed)
+
+        issues = validator._validate_cross_zone(zones)
+
+        actual = [
+            (i.details["zone1_id"], i.details["zone2_id"], i.details["overlap_ratio"])
+            for i in issues
+        ]
+        expected = self._brute_force_overlaps(validator, zones)
+        assert [a[:2] for a in actual] == [e[:2] for e in expected]
+        assert [a[2] for a in actual] == pytest.approx([e[2] for e in expected])
+        assert ("dup_a", "dup_b") in [a[:2] for a in actual]
+
+    def test_parent_child_overlap_skipped(self):
+        """Test overlapping parent and child of the same type are not flagged."""
+        validator = ZoneValidator()
+        zones = [
+            ZoneData("p", ZoneType.RACKING, [(0, 0), (100, 0), (100, 100), (0, 100)]),
+            ZoneData("c", ZoneType.RACKING, [(0, 0), (90, 0), (90, 90), (0, 90)], parent_id="p"),
+        ]
+
+        assert validator._validate_cross_zone(zones) == []
+
+    def test_hierarchy_batch_matches_is_contained(self):
+        """Test batched containment agrees with _is_contained per zone."""
+        validator = ZoneValidator()
+        zones = self._random_zones(200, 5)
+        zone_map = {z.id: z for z in zones}
+
+        issues = validator._validate_hierarchy(zones)
+
+        outside = {i.zone_id for i in issues if i.code == "CHILD_OUTSIDE_PARENT"}
+        expected = {
+            z.id for z in zones
+            if z.parent_id is not None
+            and not validator._is_contained(z, zone_map[z.parent_id])
+        }
+        assert outside == expected
+
+    def test_child_outside_parent_details(self):
+        """Test reported bounds are the zones' integer bounds."""
+        validator = ZoneValidator()
+        zones = [
+            ZoneData("p", ZoneType.RACKING_AREA, [(0, 0), (100, 0), (100, 100), (0, 100)]),
+            ZoneData("c", ZoneType.RACKING, [(50, 50), (150, 50), (150, 90), (50, 90)], parent_id="p"),
+        ]
+
+        issues = validator._validate_hierarchy(zones)
+
+        assert [i.code for i in issues] == ["CHILD_OUTSIDE_PARENT"]
+        assert issues[0].details["child_bounds"] == (50, 50, 150, 90)
+        assert issues[0].details["parent_bounds"] == (0, 0, 100, 100)
+
+
 class TestValidateZonesQuick:
     """Tests for validate_zones_quick function."""
 
@@ -64,6 +64,7 @@ export interface PreprocessingHints {
       bounding_box: { x: number; y: number; width: number; height: number }
       suggestion: string
       confidence?: number
+      two_sided_validated?: boolean
       detection_method?: string
       line_density?: {
         left_or_top: number
@@ -72,6 +73,15 @@ export interface PreprocessingHints {
     }>
   }
   recommendations: string[]
+  /** What the server's hint budget cut (items ranked by significance) */
+  truncation?: {
+    truncated: boolean
+    categories: Record<string, { total: number; kept: number }>
+    simplified_polygons: number
+    max_vertices: number | null
+    byte_limit: number | null
+    bytes: number
+  }
 }
 
 /**
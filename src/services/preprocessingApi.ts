@@ -21,6 +21,38 @@ export interface PreprocessingConfig {
   minLineLength?: number
   lineClusterDistance?: number
   includeVisualizations?: boolean
+  /** Encoding of returned visualizations (default png) */
+  visualizationFormat?: 'png' | 'jpeg' | 'webp'
+  /** Longer-side limit for visualization previews */
+  visualizationMaxDimension?: number
+  /** JPEG/WebP quality 1-100 */
+  visualizationQuality?: number
+  /** Peak-memory budget; larger images are analysed at reduced resolution */
+  memoryBudgetMb?: number
+  /** Limits on the size of the returned Gemini hints (server defaults apply) */
+  hintBudget?: {
+    maxItemsPerCategory?: number | null
+    maxVertices?: number | null
+    maxBytes?: number | null
+    maxTokens?: number | null
+  }
+  /** Request the delta-encoded compact JSON format (expanded client-side) */
+  compactResponse?: boolean
+  /** Time budget; optional stages are skipped once it is spent */
+  deadlineMs?: number
+  /**
+   * Drawing scale in pixels per meter (1000 / (image_scale * 100) for RDB
+   * floorplan configs); finer drawings are analysed at a canonical resolution
+   */
+  pixelsPerMeter?: number
+  /** Estimate the drawing scale from stroke width when pixelsPerMeter is unknown */
+  estimateScale?: boolean
+  /**
+   * Decode JPEGs above the server's pixel ceiling at 1/2, 1/4 or 1/8
+   * resolution instead of failing with 413 (see `decode` in the response);
+   * PNG and TIFF above the ceiling still fail with 413
+   */
+  reduceOversized?: boolean
 }
 
 /**
@@ -79,6 +111,27 @@ export interface CoverageBoundary {
   margin: number
 }
 
+/**
+ * Server-side image session created by POST /images
+ */
+export interface ImageSession {
+  handle: string
+  width: number
+  height: number
+  bytes: number
+  ttl_seconds: number
+}
+
+/**
+ * Region of interest in full-image pixels
+ */
+export interface RegionOfInterest {
+  x: number
+  y: number
+  width: number
+  height: number
+}
+
 /**
  * Full preprocessing response from the Python backend
  */
@@ -146,6 +199,46 @@ export interface PreprocessingResponse {
   travel_lane_suggestions?: TravelLaneSuggestion[]
   gemini_hints: PreprocessingHints
   content_boundary?: ContentBoundary
+  /** Present when an ROI was requested; results are relative to its top-left corner */
+  roi?: RegionOfInterest
+  /** Present when a memory budget is set; analysis_scale < 1 means coarse analysis */
+  memory?: {
+    analysis_scale: number
+    estimated_peak_mb: number | null
+    stages: Record<string, { peak_mb: number; retained_numpy_mb: number }>
+  }
+  /** Present when the drawing scale is known or estimated */
+  scale?: {
+    pixels_per_meter: number
+    source: 'input' | 'estimated'
+    canonical_pixels_per_meter: number
+    analysis_scale: number
+  }
+  /**
+   * Present when the image was decoded at reduced resolution; results are
+   * already mapped back to the original image's pixels
+   */
+  decode?: {
+    reduction: 2 | 4 | 8
+    width: number
+    height: number
+    original: {
+      format: 'png' | 'jpeg' | 'tiff'
+      width: number
+      height: number
+      channels: number
+      bit_depth: number
+      decoded_mb: number
+    } | null
+  }
+  /** Present when deadlineMs was set: stages skipped or cut short */
+  deadline?: {
+    deadline_ms: number
+    elapsed_ms: number
+    expired: boolean
+    skipped: string[]
+    truncated: string[]
+  }
   aisle_visualization_path?: string
   visualizations?: {
     boundary_mask: string // base64
@@ -182,35 +275,106 @@ export async function checkPreprocessingHealth(): Promise<boolean> {
 }
 
 /**
- * Send an image for preprocessing
- *
- * @param imageDataUrl - The image as a data URL (data:image/jpeg;base64,...)
- * @param config - Optional preprocessing configuration
- * @returns Preprocessing response with hints for Gemini
+ * Check if the preprocessing server has finished warming up
+ * (first requests after startup are otherwise slower)
  */
-export async function preprocessImage(
-  imageDataUrl: string,
-  config: PreprocessingConfig = {}
-): Promise<PreprocessingResponse> {
-  const requestBody = {
-    image: imageDataUrl,
+export async function checkPreprocessingReady(): Promise<boolean> {
+  try {
+    const response = await fetch(`${PREPROCESSING_API_URL}/ready`, {
+      method: 'GET',
+    })
+    return response.ok
+  } catch {
+    return false
+  }
+}
+
+function configToRequestBody(config: PreprocessingConfig) {
+  return {
     include_visualizations: config.includeVisualizations ?? false,
+    visualization_format: config.visualizationFormat ?? 'png',
+    visualization_max_dimension: config.visualizationMaxDimension ?? null,
+    visualization_quality: config.visualizationQuality ?? null,
     use_color_detection: config.useColorDetection ?? true,
     use_canny: config.useCanny ?? true,
     density_window: config.densityWindow ?? 50,
     min_region_area: config.minRegionArea ?? 5000,
     min_line_length: config.minLineLength ?? 30,
     line_cluster_distance: config.lineClusterDistance ?? 100.0,
+    memory_budget_mb: config.memoryBudgetMb ?? null,
+    deadline_ms: config.deadlineMs ?? null,
+    pixels_per_meter: config.pixelsPerMeter ?? null,
+    estimate_scale: config.estimateScale ?? false,
+    reduce_oversized: config.reduceOversized ?? false,
+    hint_budget: config.hintBudget
+      ? {
+          ...(config.hintBudget.maxItemsPerCategory !== undefined && {
+            max_items_per_category: config.hintBudget.maxItemsPerCategory,
+          }),
+          ...(config.hintBudget.maxVertices !== undefined && {
+            max_vertices: config.hintBudget.maxVertices,
+          }),
+          ...(config.hintBudget.maxBytes !== undefined && {
+            max_bytes: config.hintBudget.maxBytes,
+          }),
+          ...(config.hintBudget.maxTokens !== undefined && {
+            max_tokens: config.hintBudget.maxTokens,
+          }),
+        }
+      : null,
   }
+}
+
+const COMPACT_JSON_MEDIA_TYPE = 'application/vnd.floorplan.compact+json'
 
+/**
+ * Restore a compact JSON response to the plain JSON document:
+ * {"$xy": [x0, y0, dx1, dy1, ...]} becomes a list of {x, y} points,
+ * {"$pairs": [...]} a list of [x, y] pairs and
+ * {"$rows": [keys, row, ...]} a list of records.
+ */
+export function expandCompact(data: unknown): unknown {
+  if (Array.isArray(data)) {
+    return data.map(expandCompact)
+  }
+  if (data === null || typeof data !== 'object') {
+    return data
+  }
+  const entries = Object.entries(data as Record<string, unknown>)
+  if (entries.length === 1) {
+    const [kind, value] = entries[0]
+    if (kind === '$xy' || kind === '$pairs') {
+      const flat = value as number[]
+      const points: [number, number][] = []
+      let x = 0
+      let y = 0
+      for (let i = 0; i < flat.length; i += 2) {
+        x += flat[i]
+        y += flat[i + 1]
+        points.push([x, y])
+      }
+      return kind === '$xy' ? points.map(([px, py]) => ({ x: px, y: py })) : points
+    }
+    if (kind === '$rows') {
+      const [keys, ...rows] = value as [string[], ...unknown[][]]
+      return rows.map((row) =>
+        Object.fromEntries(keys.map((key, i) => [key, expandCompact(row[i])]))
+      )
+    }
+  }
+  return Object.fromEntries(entries.map(([key, value]) => [key, expandCompact(value)]))
+}
+
+async function postJson<T>(path: string, body: unknown, compact = false): Promise<T> {
   let response: Response
   try {
-    response = await fetch(`${PREPROCESSING_API_URL}/preprocess`, {
+    response = await fetch(`${PREPROCESSING_API_URL}${path}`, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
+        ...(compact ? { Accept: COMPACT_JSON_MEDIA_TYPE } : {}),
       },
-      body: JSON.stringify(requestBody),
+      body: JSON.stringify(body),
     })
   } catch (error) {
     throw new PreprocessingError(
@@ -226,9 +390,75 @@ export async function preprocessImage(
     )
   }
 
+  if (response.headers.get('Content-Type')?.startsWith(COMPACT_JSON_MEDIA_TYPE)) {
+    return expandCompact(await response.json()) as T
+  }
   return response.json()
 }
 
+/**
+ * Send an image for preprocessing
+ *
+ * @param imageDataUrl - The image as a data URL (data:image/jpeg;base64,...)
+ * @param config - Optional preprocessing configuration
+ * @returns Preprocessing response with hints for Gemini
+ */
+export async function preprocessImage(
+  imageDataUrl: string,
+  config: PreprocessingConfig = {}
+): Promise<PreprocessingResponse> {
+  return postJson<PreprocessingResponse>('/preprocess', {
+    image: imageDataUrl,
+    ...configToRequestBody(config),
+  }, config.compactResponse)
+}
+
+/**
+ * Upload an image once and get a handle for later preprocessing calls.
+ * Handles expire after ttl_seconds of inactivity.
+ *
+ * @param imageDataUrl - The image as a data URL (data:image/jpeg;base64,...)
+ */
+export async function createImageSession(
+  imageDataUrl: string
+): Promise<ImageSession> {
+  return postJson<ImageSession>('/images', { image: imageDataUrl })
+}
+
+/**
+ * Preprocess a previously uploaded image by handle, optionally restricted
+ * to a region of interest (e.g. a cropped racking region) and constrained
+ * by coverage boundaries. Nothing but the handle is re-sent.
+ *
+ * Throws a PreprocessingError with statusCode 404 if the handle expired;
+ * callers should then re-create the session.
+ */
+export async function preprocessImageSession(
+  handle: string,
+  config: PreprocessingConfig = {},
+  options: { roi?: RegionOfInterest; coverageBoundaries?: CoverageBoundary[] } = {}
+): Promise<PreprocessingResponse> {
+  return postJson<PreprocessingResponse>('/preprocess', {
+    image_handle: handle,
+    roi: options.roi,
+    coverage_boundaries: options.coverageBoundaries,
+    ...configToRequestBody(config),
+  }, config.compactResponse)
+}
+
+/**
+ * Release a server-side image session (best effort)
+ */
+export async function deleteImageSession(handle: string): Promise<void> {
+  try {
+    await fetch(`${PREPROCESSING_API_URL}/images/${encodeURIComponent(handle)}`, {
+      method: 'DELETE',
+    })
+  } catch {
+    // Session will expire on its own
+  }
+}
+
 /**
  * Extract just the Gemini hints from a full preprocessing response
  */